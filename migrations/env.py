@@ -17,7 +17,8 @@ from src.infrastructure.config.settings import get_settings
 # Import des modèles pour que Alembic les détecte
 from src.infrastructure.persistence.sqlalchemy.database import Base
 from src.infrastructure.persistence.sqlalchemy.models import (
-    UserModel, ColliModel, MembershipModel
+    UserModel, ColliModel, MembershipModel, LetterModel, CommentModel,
+    SearchDocumentModel, ExportJobModel, NotificationModel
 )
 
 # Configuration Alembic
@@ -31,8 +32,20 @@ if config.config_file_name is not None:
 target_metadata = Base.metadata
 
 
+# Objets créés par le DDL spécifique au SGBD de search_documents, absents de la metadata
+_UNMANAGED_PREFIXES = ("search_documents_fts", "search_vector", "ix_search_documents_search_vector")
+
+
+def include_object(obj, name, type_, reflected, compare_to):
+    """Exclut de l'autogenerate les objets de l'index plein texte."""
+    return not (reflected and name and name.startswith(_UNMANAGED_PREFIXES))
+
+
 def get_url():
-    """Récupère l'URL de la base de données."""
+    """Récupère l'URL de la base de données (sqlalchemy.url si fourni, sinon la configuration)."""
+    url = config.get_main_option("sqlalchemy.url")
+    if url:
+        return url
     try:
         settings = get_settings()
         return settings.DATABASE_URL
@@ -46,6 +59,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -56,7 +70,7 @@ def run_migrations_offline() -> None:
 
 def run_migrations_online() -> None:
     """Exécute les migrations en mode 'online'."""
-    configuration = config.get_section(config.config_ini_section)
+    configuration = config.get_section(config.config_ini_section, {})
     configuration["sqlalchemy.url"] = get_url()
     
     connectable = engine_from_config(
@@ -68,7 +82,8 @@ def run_migrations_online() -> None:
     with connectable.connect() as connection:
         context.configure(
             connection=connection,
-            target_metadata=target_metadata
+            target_metadata=target_metadata,
+            include_object=include_object
         )
 
         with context.begin_transaction():
@@ -0,0 +1,50 @@
+"""Index des COLLIs d'un utilisateur
+
+- collis(creator_id) : COLLIs créés par l'utilisateur ;
+- memberships(user_id, status) : adhésions d'un utilisateur par statut,
+  index inverse de la requête find_by_member.
+
+Créés CONCURRENTLY sur PostgreSQL, hors transaction, pour ne pas
+bloquer les écritures d'une base en service.
+
+Revision ID: 0002_user_collis_indexes
+Revises: 0001_baseline
+Create Date: 2026-10-17 00:00:01
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002_user_collis_indexes'
+down_revision: Union[str, None] = '0001_baseline'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (nom, table, colonnes)
+INDEXES = [
+    ('ix_collis_creator_id', 'collis', ['creator_id']),
+    ('ix_memberships_user_id_status', 'memberships', ['user_id', 'status']),
+]
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY est interdit dans une transaction
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name, table, columns,
+                postgresql_concurrently=True, if_not_exists=True
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in INDEXES:
+            op.drop_index(
+                name, table_name=table,
+                postgresql_concurrently=True, if_exists=True
+            )
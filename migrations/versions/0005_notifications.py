@@ -0,0 +1,45 @@
+"""Table notifications et index partiel des non-lues
+
+Revision ID: 0005_notifications
+Revises: 0004_export_jobs
+Create Date: 2026-10-17 00:00:04
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005_notifications'
+down_revision: Union[str, None] = '0004_export_jobs'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('notifications',
+    sa.Column('id', sa.Uuid(), nullable=False),
+    sa.Column('user_id', sa.Uuid(), nullable=False),
+    sa.Column('type', sa.String(length=30), nullable=False),
+    sa.Column('title', sa.String(length=255), nullable=False),
+    sa.Column('message', sa.Text(), nullable=False),
+    sa.Column('data', sa.JSON(), nullable=True),
+    sa.Column('related_entity_id', sa.Uuid(), nullable=True),
+    sa.Column('related_entity_type', sa.String(length=30), nullable=True),
+    sa.Column('read', sa.Boolean(), server_default=sa.false(), nullable=False),
+    sa.Column('read_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_notifications_user_id_created_at', 'notifications', ['user_id', sa.text('created_at DESC')], unique=False)
+    op.create_index(
+        'ix_notifications_user_id_unread', 'notifications', ['user_id'], unique=False,
+        postgresql_where=sa.text('read IS false'), sqlite_where=sa.text('read IS 0')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('notifications')
@@ -0,0 +1,38 @@
+"""Index memberships(colli_id, user_id, status)
+
+Sert le contrôle d'appartenance (EXISTS) et le comptage des membres
+d'un COLLI.
+
+Créé CONCURRENTLY sur PostgreSQL, comme 0002_user_collis_indexes.
+
+Revision ID: 0006_membership_exists_index
+Revises: 0005_notifications
+Create Date: 2026-10-17 00:00:05
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0006_membership_exists_index'
+down_revision: Union[str, None] = '0005_notifications'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_memberships_colli_id_user_id_status', 'memberships', ['colli_id', 'user_id', 'status'],
+            postgresql_concurrently=True, if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_memberships_colli_id_user_id_status', table_name='memberships',
+            postgresql_concurrently=True, if_exists=True
+        )
@@ -0,0 +1,42 @@
+"""Compteurs d'activité dénormalisés
+
+collis.member_count, collis.letter_count, collis.last_activity_at et
+letters.comment_count, tenus à jour par l'application.
+
+Les colonnes sont ajoutées à 0 (server_default constant : pas de
+réécriture de la table sur PostgreSQL 11+). Relancer ensuite
+scripts/repair_counters.py, qui les recalcule par lots depuis les
+tables sources.
+
+Revision ID: 0007_activity_counters
+Revises: 0006_membership_exists_index
+Create Date: 2026-10-17 00:00:06
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0007_activity_counters'
+down_revision: Union[str, None] = '0006_membership_exists_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('collis', sa.Column('member_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('collis', sa.Column('letter_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('collis', sa.Column('last_activity_at', sa.DateTime(timezone=True), nullable=True))
+    op.add_column('letters', sa.Column('comment_count', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('letters') as batch_op:
+        batch_op.drop_column('comment_count')
+    with op.batch_alter_table('collis') as batch_op:
+        batch_op.drop_column('last_activity_at')
+        batch_op.drop_column('letter_count')
+        batch_op.drop_column('member_count')
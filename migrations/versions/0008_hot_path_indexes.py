@@ -0,0 +1,74 @@
+"""Index composites des chemins de lecture fréquents
+
+- letters(colli_id, created_at, id) : lettres d'un COLLI, paginées ;
+- comments(letter_id, created_at, id) : commentaires d'une lettre, paginés ;
+- collis(status, created_at, id) : listes de COLLIs par statut, paginées.
+
+L'id termine les index de liste parce que la pagination trie sur
+(created_at, id) : l'index sert alors l'ORDER BY sans tri. Les index
+simples letters(colli_id), comments(letter_id) et collis(status),
+préfixes des nouveaux, sont supprimés.
+
+Sur PostgreSQL, les index sont créés et supprimés CONCURRENTLY, hors
+transaction, pour ne pas bloquer les écritures d'une base en service.
+Une création concurrente interrompue laisse un index INVALID : le
+supprimer (DROP INDEX CONCURRENTLY) avant de relancer la migration.
+
+Revision ID: 0008_hot_path_indexes
+Revises: 0007_activity_counters
+Create Date: 2026-10-17 00:00:07
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0008_hot_path_indexes'
+down_revision: Union[str, None] = '0007_activity_counters'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (nom, table, colonnes)
+NEW_INDEXES = [
+    ('ix_letters_colli_id_created_at', 'letters', ['colli_id', 'created_at', 'id']),
+    ('ix_comments_letter_id_created_at', 'comments', ['letter_id', 'created_at', 'id']),
+    ('ix_collis_status_created_at', 'collis', ['status', 'created_at', 'id']),
+]
+
+SUPERSEDED_INDEXES = [
+    ('ix_letters_colli_id', 'letters', ['colli_id']),
+    ('ix_comments_letter_id', 'comments', ['letter_id']),
+    ('ix_collis_status', 'collis', ['status']),
+]
+
+
+def upgrade() -> None:
+    # CREATE/DROP INDEX CONCURRENTLY est interdit dans une transaction
+    with op.get_context().autocommit_block():
+        for name, table, columns in NEW_INDEXES:
+            op.create_index(
+                name, table, columns,
+                postgresql_concurrently=True, if_not_exists=True
+            )
+        for name, table, _ in SUPERSEDED_INDEXES:
+            op.drop_index(
+                name, table_name=table,
+                postgresql_concurrently=True, if_exists=True
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in SUPERSEDED_INDEXES:
+            op.create_index(
+                name, table, columns,
+                postgresql_concurrently=True, if_not_exists=True
+            )
+        for name, table, _ in NEW_INDEXES:
+            op.drop_index(
+                name, table_name=table,
+                postgresql_concurrently=True, if_exists=True
+            )
@@ -0,0 +1,39 @@
+"""Index comments(parent_comment_id) pour le chargement des fils
+
+La CTE récursive de SQLAlchemyCommentRepository.find_thread descend
+d'un niveau par jointure sur parent_comment_id : sans index, chaque
+niveau parcourt la table comments.
+
+Créé CONCURRENTLY sur PostgreSQL, comme 0008_hot_path_indexes.
+
+Revision ID: 0009_comment_parent_index
+Revises: 0008_hot_path_indexes
+Create Date: 2026-10-17 00:00:08
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0009_comment_parent_index'
+down_revision: Union[str, None] = '0008_hot_path_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_comments_parent_comment_id', 'comments', ['parent_comment_id'],
+            postgresql_concurrently=True, if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_comments_parent_comment_id', table_name='comments',
+            postgresql_concurrently=True, if_exists=True
+        )
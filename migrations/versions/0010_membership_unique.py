@@ -0,0 +1,59 @@
+"""Unicité memberships(colli_id, user_id)
+
+Les écritures d'adhésion passent par SQLAlchemyMembershipRepository,
+une ligne à la fois : l'invariant « une adhésion par utilisateur et par
+COLLI », jusqu'ici vérifié sur l'agrégat chargé en entier, est désormais
+garanti par un index unique. Deux demandes simultanées ne créent plus
+de doublon : la seconde échoue en 409.
+
+Les doublons existants sont supprimés avant la création de l'index, en
+gardant l'adhésion la plus ancienne (joined_at, puis id). Relancer
+ensuite scripts/repair_counters.py pour recaler member_count.
+
+Créé CONCURRENTLY sur PostgreSQL, comme 0008_hot_path_indexes.
+
+Revision ID: 0010_membership_unique
+Revises: 0009_comment_parent_index
+Create Date: 2026-10-17 00:00:09
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0010_membership_unique'
+down_revision: Union[str, None] = '0009_comment_parent_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+DELETE_DUPLICATES = sa.text("""
+    DELETE FROM memberships
+    WHERE EXISTS (
+        SELECT 1 FROM memberships AS kept
+        WHERE kept.colli_id = memberships.colli_id
+          AND kept.user_id = memberships.user_id
+          AND (kept.joined_at < memberships.joined_at
+               OR (kept.joined_at = memberships.joined_at AND kept.id < memberships.id))
+    )
+""")
+
+
+def upgrade() -> None:
+    op.execute(DELETE_DUPLICATES)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'uq_memberships_colli_id_user_id', 'memberships', ['colli_id', 'user_id'],
+            unique=True, postgresql_concurrently=True, if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'uq_memberships_colli_id_user_id', table_name='memberships',
+            postgresql_concurrently=True, if_exists=True
+        )
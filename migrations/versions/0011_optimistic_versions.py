@@ -0,0 +1,44 @@
+"""Colonne version pour le verrouillage optimiste
+
+collis, letters, comments et memberships reçoivent une colonne
+version (version_id_col côté ORM) : chaque UPDATE porte
+`WHERE version = <version lue>` et l'incrémente. Une écriture
+concurrente fait échouer la seconde en 409 au lieu d'écraser la
+première, sans verrou de ligne.
+
+Les lignes existantes démarrent à 1 (server_default) : ajouter une
+colonne avec défaut constant ne réécrit pas la table sur PostgreSQL 11+.
+
+Revision ID: 0011_optimistic_versions
+Revises: 0010_membership_unique
+Create Date: 2026-10-17 00:00:10
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0011_optimistic_versions'
+down_revision: Union[str, None] = '0010_membership_unique'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+VERSIONED_TABLES = ['collis', 'letters', 'comments', 'memberships']
+
+
+def upgrade() -> None:
+    for table in VERSIONED_TABLES:
+        op.add_column(
+            table,
+            sa.Column('version', sa.Integer(), nullable=False, server_default='1')
+        )
+
+
+def downgrade() -> None:
+    for table in VERSIONED_TABLES:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_column('version')
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark des repositories SQLAlchemy : API Query historique
+contre select()/lambda_stmt.
+
+Mesure le coût par appel (construction de la requête, compilation ou
+cache, exécution, mapping) sur une base SQLite en mémoire, pour
+find_by_id, find_by_colli et count_by_letter. Le SGBD étant local et
+les données petites, l'écart mesuré est surtout celui du côté Python.
+
+Chaque appel part d'une session vide (modèles retenus et identity map
+vidés) : sans cela, find_by_id (session.get + retain) ne ferait plus
+de requête après le premier appel et la comparaison serait biaisée.
+
+Usage:
+    PYTHONPATH=. python scripts/bench_repositories.py [--number 2000]
+"""
+
+import sys
+import argparse
+import timeit
+from uuid import uuid4
+
+sys.path.insert(0, '.')
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from src.domain.collaboration.entities.colli import Colli
+from src.domain.collaboration.entities.comment import Comment
+from src.domain.collaboration.entities.letter import Letter
+from src.infrastructure.persistence.sqlalchemy.database import init_db
+from src.infrastructure.persistence.sqlalchemy.mappers.letter_mapper import LetterMapper
+from src.infrastructure.persistence.sqlalchemy.models.comment_model import CommentModel
+from src.infrastructure.persistence.sqlalchemy.models.letter_model import LetterModel
+from src.infrastructure.persistence.sqlalchemy.repositories.colli_repository import SQLAlchemyColliRepository
+from src.infrastructure.persistence.sqlalchemy.repositories.comment_repository import SQLAlchemyCommentRepository
+from src.infrastructure.persistence.sqlalchemy.repositories.letter_repository import SQLAlchemyLetterRepository
+
+
+def _seed(session: Session):
+    """Un COLLI, 50 lettres, 10 commentaires sur la première."""
+    sender_id = uuid4()
+    colli = Colli.create(name="COLLI de benchmark", theme="Benchmark", creator_id=sender_id)
+    SQLAlchemyColliRepository(session).save(colli)
+
+    letters = SQLAlchemyLetterRepository(session)
+    comments = SQLAlchemyCommentRepository(session)
+    created = [
+        letters.save(Letter.create_text_letter(
+            colli_id=colli.id, sender_id=sender_id, content=f"Lettre de benchmark {i}"
+        ))
+        for i in range(50)
+    ]
+    for i in range(10):
+        comments.save(Comment.create(
+            letter_id=created[0].id, sender_id=sender_id, content=f"Commentaire de benchmark {i}"
+        ))
+    session.commit()
+    return colli.id, created[0].id
+
+
+class LegacyQueries:
+    """Les mêmes lectures écrites avec l'API Query (implémentation précédente)."""
+
+    def __init__(self, session: Session):
+        self._session = session
+
+    def find_by_id(self, letter_id):
+        model = self._session.query(LetterModel).filter_by(id=letter_id).first()
+        return LetterMapper.to_entity(model) if model else None
+
+    def find_by_colli(self, colli_id):
+        models = self._session.query(LetterModel)\
+            .filter_by(colli_id=colli_id)\
+            .order_by(LetterModel.created_at.desc(), LetterModel.id.desc())\
+            .offset(0)\
+            .limit(20)\
+            .all()
+        return [LetterMapper.to_entity(m) for m in models]
+
+    def count_by_letter(self, letter_id):
+        return self._session.query(CommentModel).filter_by(letter_id=letter_id).count()
+
+
+def _cold(session: Session, call):
+    """Exécute `call` sur une session vidée, comme au début d'une requête."""
+    def run():
+        # Modèles gardés par identity_map.retain()
+        session.info.pop("retained_models", None)
+        session.expunge_all()
+        return call()
+    return run
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--number', type=int, default=2000, help="Appels par mesure")
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://")
+    init_db(engine)
+    session = Session(engine)
+    colli_id, letter_id = _seed(session)
+
+    legacy = LegacyQueries(session)
+    letters = SQLAlchemyLetterRepository(session)
+    comments = SQLAlchemyCommentRepository(session)
+
+    cases = [
+        ("find_by_id", lambda: legacy.find_by_id(letter_id), lambda: letters.find_by_id(letter_id)),
+        ("find_by_colli", lambda: legacy.find_by_colli(colli_id), lambda: letters.find_by_colli(colli_id)),
+        ("count_by_letter", lambda: legacy.count_by_letter(letter_id), lambda: comments.count_by_letter(letter_id)),
+    ]
+
+    print(f"{'méthode':<18}{'Query (µs)':>12}{'select (µs)':>14}{'gain':>8}")
+    for name, before, after in cases:
+        before, after = _cold(session, before), _cold(session, after)
+        # Un appel de chauffe remplit les caches de compilation
+        before(), after()
+        before_us = min(timeit.repeat(before, number=args.number, repeat=3)) / args.number * 1e6
+        after_us = min(timeit.repeat(after, number=args.number, repeat=3)) / args.number * 1e6
+        print(f"{name:<18}{before_us:>12.1f}{after_us:>14.1f}{(1 - after_us / before_us):>8.0%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Reconstruit l'index de recherche plein texte (COLLIs, lettres, utilisateurs).
+
+A lancer apres la creation de la table search_documents, ou pour corriger
+un index desynchronise. Les donnees sont lues et ecrites par lots, avec un
+commit par lot pour ne pas garder une transaction ouverte sur toute la base.
+
+Usage:
+    PYTHONPATH=. python scripts/reindex.py [--chunk-size 500]
+"""
+
+import sys
+import logging
+
+sys.path.insert(0, '.')
+
+from src.infrastructure.web.app import create_app
+from src.infrastructure.container import container
+from src.infrastructure.search.search_indexer import SearchIndexer
+
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s | %(levelname)s | %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def reindex(chunk_size: int = SearchIndexer.CHUNK_SIZE) -> None:
+    """Reconstruit l'index par lots de `chunk_size` entites."""
+    app = create_app()
+
+    with app.app_context():
+        session = container.db_session()
+        indexer = container.search_indexer()
+
+        def commit_chunk(kind: str, count: int) -> None:
+            session.commit()
+            logger.info(f"{count} {kind} indexes")
+
+        totals = indexer.reindex_all(chunk_size=chunk_size, on_chunk=commit_chunk)
+        logger.info(
+            f"Reindexation terminee - {totals['collis']} COLLIs, "
+            f"{totals['letters']} lettres, {totals['users']} utilisateurs"
+        )
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Reconstruire l'index de recherche")
+    parser.add_argument(
+        "--chunk-size", type=int, default=SearchIndexer.CHUNK_SIZE,
+        help="Nombre d'entites lues et indexees par lot"
+    )
+
+    args = parser.parse_args()
+    reindex(args.chunk_size)
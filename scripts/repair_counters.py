@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Recalcule les compteurs denormalises des COLLIs et des lettres.
+
+member_count, letter_count, last_activity_at (collis) et comment_count
+(letters) sont tenus a jour par l'application ; ce script les recalcule
+depuis les tables sources, apres l'ajout des colonnes ou pour corriger
+une derive. Un commit par lot, comme scripts/reindex.py.
+
+Usage:
+    PYTHONPATH=. python scripts/repair_counters.py [--chunk-size 500]
+"""
+
+import sys
+import logging
+
+sys.path.insert(0, '.')
+
+from src.infrastructure.web.app import create_app
+from src.infrastructure.container import container
+from src.infrastructure.persistence.sqlalchemy.counter_repair import CounterRepairer
+
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s | %(levelname)s | %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def repair_counters(chunk_size: int = CounterRepairer.CHUNK_SIZE) -> None:
+    """Recalcule les compteurs par lots de `chunk_size` lignes."""
+    app = create_app()
+
+    with app.app_context():
+        session = container.db_session()
+        repairer = CounterRepairer(session)
+
+        def commit_chunk(kind: str, count: int) -> None:
+            session.commit()
+            logger.info(f"{count} {kind} recalcules")
+
+        totals = repairer.repair_all(chunk_size=chunk_size, on_chunk=commit_chunk)
+        logger.info(
+            f"Compteurs recalcules - {totals['collis']} COLLIs, {totals['letters']} lettres"
+        )
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Recalculer les compteurs denormalises")
+    parser.add_argument(
+        "--chunk-size", type=int, default=CounterRepairer.CHUNK_SIZE,
+        help="Nombre de COLLIs ou de lettres recalcules par lot"
+    )
+
+    args = parser.parse_args()
+    repair_counters(args.chunk_size)
@@ -0,0 +1,35 @@
+# src/application/dtos/admin_stats_dto.py
+"""DTO pour les statistiques du tableau de bord admin."""
+
+from dataclasses import dataclass, field
+from typing import Dict
+
+
+@dataclass(frozen=True)
+class AdminStatsDTO:
+    """Compteurs globaux de la plateforme."""
+    users_by_role: Dict[str, int] = field(default_factory=dict)
+    collis_by_status: Dict[str, int] = field(default_factory=dict)
+    total_letters: int = 0
+    total_comments: int = 0
+
+    @property
+    def total_users(self) -> int:
+        return sum(self.users_by_role.values())
+
+    @property
+    def total_collis(self) -> int:
+        return sum(self.collis_by_status.values())
+
+    def to_dict(self) -> dict:
+        """Convertit en dictionnaire (clés historiques conservées)."""
+        return {
+            'total_users': self.total_users,
+            'total_collis': self.total_collis,
+            'active_collis': self.collis_by_status.get('active', 0),
+            'pending_collis': self.collis_by_status.get('pending', 0),
+            'total_letters': self.total_letters,
+            'total_comments': self.total_comments,
+            'users_by_role': dict(self.users_by_role),
+            'collis_by_status': dict(self.collis_by_status),
+        }
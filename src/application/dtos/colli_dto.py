@@ -3,11 +3,12 @@
 
 from dataclasses import dataclass, asdict
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Union
 from uuid import UUID
 
 from src.domain.collaboration.entities.colli import Colli
 from src.domain.collaboration.value_objects.colli_status import ColliStatus
+from src.domain.collaboration.value_objects.colli_summary import ColliSummary
 
 
 @dataclass
@@ -31,10 +32,12 @@ class ColliResponseDTO:
     member_count: int
     created_at: str
     updated_at: str
+    letter_count: int = 0
+    last_activity_at: Optional[str] = None
 
     @classmethod
-    def from_entity(cls, colli: Colli) -> "ColliResponseDTO":
-        """Construit le DTO depuis une entité du domaine."""
+    def from_entity(cls, colli: Union[Colli, ColliSummary]) -> "ColliResponseDTO":
+        """Construit le DTO depuis une entité du domaine ou sa projection de liste."""
         return cls(
             id=str(colli.id),
             name=colli.name,
@@ -45,7 +48,9 @@ class ColliResponseDTO:
             rejection_reason=colli.rejection_reason,
             member_count=colli.member_count,
             created_at=colli.created_at.isoformat(),
-            updated_at=colli.updated_at.isoformat()
+            updated_at=colli.updated_at.isoformat(),
+            letter_count=colli.letter_count,
+            last_activity_at=colli.last_activity_at.isoformat() if colli.last_activity_at else None
         )
     
     def to_dict(self) -> dict:
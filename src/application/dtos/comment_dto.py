@@ -1,11 +1,12 @@
 # src/application/dtos/comment_dto.py
 """DTOs pour les Comments."""
 
-from dataclasses import dataclass, asdict
-from typing import Optional
+from dataclasses import dataclass, asdict, field
+from typing import Iterator, List, Optional
 from uuid import UUID
 
 from src.domain.collaboration.entities.comment import Comment
+from src.domain.collaboration.value_objects.comment_thread import CommentNode
 
 
 @dataclass
@@ -67,6 +68,7 @@ class CommentListResponseDTO:
     page: int
     per_page: int
     has_more: bool
+    next_cursor: Optional[str] = None
     
     def to_dict(self) -> dict:
         """Convertit en dictionnaire."""
@@ -75,5 +77,53 @@ class CommentListResponseDTO:
             'total': self.total,
             'page': self.page,
             'per_page': self.per_page,
-            'has_more': self.has_more
+            'has_more': self.has_more,
+            'next_cursor': self.next_cursor
+        }
+
+
+@dataclass
+class CommentThreadDTO(CommentResponseDTO):
+    """DTO d'un commentaire avec ses réponses imbriquées."""
+    depth: int = 0
+    has_more_replies: bool = False
+    replies: List["CommentThreadDTO"] = field(default_factory=list)
+
+    @classmethod
+    def from_node(cls, node: CommentNode) -> "CommentThreadDTO":
+        """Construit le DTO d'un fil depuis son nœud racine."""
+        base = CommentResponseDTO.from_entity(node.comment)
+        return cls(
+            **asdict(base),
+            depth=node.depth,
+            has_more_replies=node.has_more_replies,
+            replies=[cls.from_node(reply) for reply in node.replies]
+        )
+
+    def walk(self) -> Iterator["CommentThreadDTO"]:
+        """Parcourt le commentaire puis toutes ses réponses."""
+        stack = [self]
+        while stack:
+            item = stack.pop()
+            yield item
+            stack.extend(item.replies)
+
+
+@dataclass
+class CommentThreadListResponseDTO:
+    """DTO pour une page de fils de commentaires."""
+    items: List[CommentThreadDTO]
+    page: int
+    per_page: int
+    has_more: bool
+    next_cursor: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        """Convertit en dictionnaire."""
+        return {
+            'items': [item.to_dict() for item in self.items],
+            'page': self.page,
+            'per_page': self.per_page,
+            'has_more': self.has_more,
+            'next_cursor': self.next_cursor
         }
@@ -0,0 +1,48 @@
+# src/application/dtos/export_dto.py
+"""DTOs pour les exports RGPD en arrière-plan."""
+
+from dataclasses import dataclass, asdict
+from typing import Optional
+
+from src.domain.export.entities.export_job import ExportJob
+
+
+@dataclass(frozen=True)
+class ExportArchive:
+    """Archive produite par un job d'export."""
+    path: str
+    size: int
+
+
+@dataclass
+class ExportJobResponseDTO:
+    """DTO de réponse pour un job d'export."""
+    id: str
+    status: str
+    created_at: str
+    started_at: Optional[str]
+    completed_at: Optional[str]
+    archive_size: Optional[int]
+    error: Optional[str]
+    download_url: Optional[str]
+    
+    @classmethod
+    def from_entity(cls, job: ExportJob) -> "ExportJobResponseDTO":
+        """Construit le DTO depuis une entité."""
+        return cls(
+            id=str(job.id),
+            status=job.status.value,
+            created_at=job.created_at.isoformat(),
+            started_at=job.started_at.isoformat() if job.started_at else None,
+            completed_at=job.completed_at.isoformat() if job.completed_at else None,
+            archive_size=job.archive_size,
+            error=job.error,
+            download_url=(
+                f"/api/v1/export/my-data/jobs/{job.id}/download"
+                if job.is_downloadable else None
+            )
+        )
+    
+    def to_dict(self) -> dict:
+        """Convertit en dictionnaire."""
+        return asdict(self)
@@ -53,8 +53,8 @@ class LetterResponseDTO:
     sender: Optional[dict] = None
 
     @classmethod
-    def from_entity(cls, letter: Letter, comment_count: int = 0, sender_data: Optional[dict] = None) -> "LetterResponseDTO":
-        """Construit le DTO depuis une entité."""
+    def from_entity(cls, letter: Letter, sender_data: Optional[dict] = None) -> "LetterResponseDTO":
+        """Construit le DTO depuis une entité (comment_count : compteur de la lettre)."""
         return cls(
             id=str(letter.id),
             letter_type=letter.letter_type.value,
@@ -66,7 +66,7 @@ class LetterResponseDTO:
             sender_id=str(letter.sender_id),
             created_at=letter.created_at.isoformat(),
             updated_at=letter.updated_at.isoformat(),
-            comment_count=comment_count,
+            comment_count=letter.comment_count,
             sender=sender_data
         )
 
@@ -83,6 +83,7 @@ class LetterListResponseDTO:
     page: int
     per_page: int
     has_more: bool
+    next_cursor: Optional[str] = None
     
     def to_dict(self) -> dict:
         """Convertit en dictionnaire."""
@@ -91,5 +92,6 @@ class LetterListResponseDTO:
             'total': self.total,
             'page': self.page,
             'per_page': self.per_page,
-            'has_more': self.has_more
+            'has_more': self.has_more,
+            'next_cursor': self.next_cursor
         }
@@ -0,0 +1,52 @@
+# src/application/dtos/pagination.py
+"""Utilitaires de pagination par curseur pour les use cases de listing."""
+
+from typing import Callable, Optional, Sequence, Tuple
+
+from src.domain.shared.page_cursor import PageCursor
+from src.application.exceptions import ValidationException
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[PageCursor]:
+    """Décode le curseur reçu du client, ou lève une erreur de validation."""
+    if not cursor:
+        return None
+    try:
+        return PageCursor.decode(cursor)
+    except ValueError:
+        raise ValidationException(
+            "Curseur de pagination invalide",
+            errors={'cursor': ["Curseur invalide ou expiré"]}
+        )
+
+
+def fetch_page(
+    fetch: Callable[..., Sequence],
+    page: int,
+    per_page: int,
+    cursor: Optional[str] = None
+) -> Tuple[list, Optional[str]]:
+    """
+    Récupère une page via `fetch(page=..., per_page=..., cursor=...)`.
+
+    Avec un curseur, on demande `per_page + 1` éléments pour savoir s'il
+    existe une page suivante sans requête de comptage supplémentaire.
+    Sans curseur, la pagination par page est conservée et le curseur
+    retourné permet au client de basculer en mode keyset.
+
+    Returns:
+        Tuple[list, Optional[str]]: Les éléments de la page et le curseur
+        de la page suivante (None s'il n'y en a pas).
+    """
+    after = decode_cursor(cursor)
+    if after is not None:
+        items = list(fetch(page=1, per_page=per_page + 1, cursor=after))
+        page_items = items[:per_page]
+        has_next = len(items) > per_page
+    else:
+        page_items = list(fetch(page=page, per_page=per_page, cursor=None))
+        has_next = len(page_items) == per_page
+
+    if has_next and page_items:
+        return page_items, PageCursor.from_entity(page_items[-1]).encode()
+    return page_items, None
@@ -0,0 +1,118 @@
+# src/application/dtos/search_dto.py
+"""DTOs pour la recherche plein texte."""
+
+import base64
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import List, Optional, Sequence, Union
+from uuid import UUID
+
+from src.domain.collaboration.entities.colli import Colli
+from src.domain.collaboration.entities.letter import Letter
+from src.domain.collaboration.value_objects.colli_summary import ColliSummary
+from src.domain.identity.entities.user import User
+from src.domain.identity.value_objects.user_summary import UserSummary
+
+
+class SearchDocumentType(Enum):
+    """Types de documents indexés."""
+    COLLI = "colli"
+    LETTER = "letter"
+    USER = "user"
+
+
+@dataclass(frozen=True)
+class SearchDocument:
+    """
+    Document de l'index de recherche.
+
+    `title` est pondéré plus fortement que `body` au classement.
+    `colli_id` et `status` servent au filtrage par appartenance.
+    """
+    doc_type: SearchDocumentType
+    doc_id: UUID
+    title: str
+    body: str
+    created_at: datetime
+    colli_id: Optional[UUID] = None
+    status: Optional[str] = None
+
+    @classmethod
+    def from_colli(cls, colli: Union[Colli, ColliSummary]) -> "SearchDocument":
+        """Document pour un COLLI (nom, thème, description)."""
+        return cls(
+            doc_type=SearchDocumentType.COLLI,
+            doc_id=colli.id,
+            title=colli.name,
+            body=" ".join(filter(None, [colli.theme, colli.description])),
+            created_at=colli.created_at,
+            colli_id=colli.id,
+            status=colli.status.value
+        )
+
+    @classmethod
+    def from_letter(cls, letter: Letter, comments: Sequence[str] = ()) -> "SearchDocument":
+        """Document pour une lettre (titre, contenu, nom de fichier, commentaires)."""
+        return cls(
+            doc_type=SearchDocumentType.LETTER,
+            doc_id=letter.id,
+            title=letter.title or "",
+            body=" ".join(filter(None, [letter.content, letter.file_name, *comments])),
+            created_at=letter.created_at,
+            colli_id=letter.colli_id
+        )
+
+    @classmethod
+    def from_user(cls, user: Union[User, UserSummary]) -> "SearchDocument":
+        """Document pour un utilisateur (nom complet, email)."""
+        return cls(
+            doc_type=SearchDocumentType.USER,
+            doc_id=user.id,
+            title=user.full_name,
+            body=str(user.email),
+            created_at=user.created_at
+        )
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    """Résultat classé : plus `rank` est petit, plus le document est pertinent."""
+    doc_type: SearchDocumentType
+    doc_id: UUID
+    rank: float
+
+
+@dataclass(frozen=True)
+class SearchCursor:
+    """Position (rank, doc_id) du dernier résultat retourné."""
+    rank: float
+    doc_id: UUID
+
+    def encode(self) -> str:
+        """Sérialise le curseur en jeton URL-safe."""
+        raw = f"{self.rank!r}|{self.doc_id}"
+        return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "SearchCursor":
+        """
+        Reconstruit un curseur depuis un jeton.
+
+        Raises:
+            ValueError: Si le jeton est malformé.
+        """
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            raw = base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8")
+            rank, doc_id = raw.split("|", 1)
+            return cls(rank=float(rank), doc_id=UUID(doc_id))
+        except (ValueError, UnicodeError) as e:
+            raise ValueError(f"Curseur invalide: {token}") from e
+
+
+@dataclass
+class SearchPage:
+    """Page de résultats classés."""
+    hits: List[SearchHit] = field(default_factory=list)
+    next_cursor: Optional[str] = None
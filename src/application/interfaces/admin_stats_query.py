@@ -0,0 +1,25 @@
+# src/application/interfaces/admin_stats_query.py
+"""Interface pour le calcul des statistiques admin."""
+
+from abc import ABC, abstractmethod
+
+from src.application.dtos.admin_stats_dto import AdminStatsDTO
+
+
+class IAdminStatsQuery(ABC):
+    """
+    Query service (lecture seule) pour le tableau de bord admin.
+    
+    Les compteurs sont agrégés côté base plutôt que reconstruits à partir
+    des entités chargées par les repositories.
+    """
+    
+    @abstractmethod
+    def get_stats(self) -> AdminStatsDTO:
+        """
+        Calcule les statistiques globales.
+        
+        Returns:
+            AdminStatsDTO: Compteurs par rôle, par statut et totaux.
+        """
+        pass
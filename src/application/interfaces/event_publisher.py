@@ -2,7 +2,7 @@
 """Interface pour la publication d'événements domaine."""
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Callable, List, Type
 
 from src.domain.collaboration.events import DomainEvent
 
@@ -15,6 +15,21 @@ class IEventPublisher(ABC):
     (notifications, webhooks, synchronisation, etc.).
     """
     
+    @abstractmethod
+    def subscribe(
+        self,
+        event_type: Type[DomainEvent],
+        handler: Callable[[DomainEvent], None]
+    ) -> None:
+        """
+        Abonne un handler à un type d'événement.
+        
+        Args:
+            event_type: Le type d'événement à écouter.
+            handler: La fonction à appeler quand l'événement est publié.
+        """
+        pass
+    
     @abstractmethod
     def publish(self, event: DomainEvent) -> None:
         """
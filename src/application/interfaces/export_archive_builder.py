@@ -0,0 +1,36 @@
+# src/application/interfaces/export_archive_builder.py
+"""Interface pour la production des archives d'export."""
+
+from abc import ABC, abstractmethod
+
+from src.application.dtos.export_dto import ExportArchive
+from src.domain.export.entities.export_job import ExportJob
+
+
+class IExportArchiveBuilder(ABC):
+    """
+    Interface pour écrire l'archive d'export d'un utilisateur.
+    """
+    
+    @abstractmethod
+    def build(self, job: ExportJob) -> ExportArchive:
+        """
+        Écrit l'archive du job et retourne son emplacement.
+        
+        Args:
+            job: Le job en cours d'exécution.
+            
+        Returns:
+            ExportArchive: Chemin et taille de l'archive écrite.
+        """
+        pass
+    
+    @abstractmethod
+    def delete(self, archive_path: str) -> None:
+        """
+        Supprime une archive expirée (sans erreur si elle n'existe plus).
+        
+        Args:
+            archive_path: Chemin retourné par build().
+        """
+        pass
@@ -0,0 +1,34 @@
+# src/application/interfaces/export_job_queue.py
+"""Interface pour la mise en file des jobs d'export."""
+
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+
+class IExportJobQueue(ABC):
+    """
+    Interface pour déclencher l'exécution d'un job d'export.
+    
+    L'implémentation peut exécuter le job dans un worker (Celery) ou
+    immédiatement dans le processus courant (tests, développement).
+    Une file hors processus ne transmet les jobs qu'à `flush()`, appelé
+    après le commit de la requête : le worker trouve alors le job en base.
+    """
+    
+    @abstractmethod
+    def enqueue(self, job_id: UUID) -> None:
+        """
+        Planifie l'exécution d'un job déjà persisté.
+        
+        Args:
+            job_id: ID du job à exécuter.
+        """
+        pass
+    
+    def flush(self) -> None:
+        """Transmet les jobs mis en file par la requête, une fois celle-ci validée."""
+        pass
+    
+    def discard(self) -> None:
+        """Abandonne les jobs mis en file par la requête (requête en échec)."""
+        pass
@@ -0,0 +1,69 @@
+# src/application/interfaces/search_index.py
+"""Interface pour l'index de recherche plein texte."""
+
+from abc import ABC, abstractmethod
+from typing import Iterable, Optional
+from uuid import UUID
+
+from src.application.dtos.search_dto import SearchDocument, SearchDocumentType, SearchPage
+
+
+class ISearchIndex(ABC):
+    """
+    Index de recherche plein texte (COLLIs, lettres, utilisateurs).
+    
+    Les documents sont dénormalisés dans l'index : la recherche ne
+    parcourt jamais les tables métier.
+    """
+    
+    @abstractmethod
+    def upsert_many(self, documents: Iterable[SearchDocument]) -> None:
+        """
+        Ajoute ou remplace des documents dans l'index.
+        
+        Args:
+            documents: Documents à indexer.
+        """
+        pass
+    
+    @abstractmethod
+    def delete_many(self, doc_type: SearchDocumentType, doc_ids: Iterable[UUID]) -> None:
+        """
+        Retire des documents de l'index.
+        
+        Args:
+            doc_type: Type des documents.
+            doc_ids: Identifiants des entités indexées.
+        """
+        pass
+    
+    @abstractmethod
+    def search(
+        self,
+        query: str,
+        doc_type: SearchDocumentType,
+        user_id: UUID,
+        limit: int = 10,
+        cursor: Optional[str] = None
+    ) -> SearchPage:
+        """
+        Recherche classée par pertinence.
+        
+        Les lettres ne sont visibles que dans les COLLIs dont l'appelant
+        est membre accepté ou créateur ; les COLLIs, s'ils sont actifs
+        ou si l'appelant en fait partie.
+        
+        Args:
+            query: Termes recherchés (préfixes, tous requis).
+            doc_type: Type de documents recherchés.
+            user_id: Utilisateur qui effectue la recherche.
+            limit: Nombre maximum de résultats.
+            cursor: Curseur de la page précédente.
+        
+        Returns:
+            SearchPage: Résultats et curseur de la page suivante.
+        
+        Raises:
+            ValueError: Si le curseur est invalide.
+        """
+        pass
@@ -6,6 +6,7 @@ from uuid import UUID
 
 from src.domain.collaboration.entities.colli import Colli
 from src.domain.collaboration.repositories.colli_repository import IColliRepository
+from src.application.interfaces.event_publisher import IEventPublisher
 from src.application.dtos.colli_dto import CreateColliDTO, ColliResponseDTO
 
 
@@ -28,8 +29,13 @@ class CreateColliUseCase:
     - Le créateur sera automatiquement ajouté comme MANAGER à l'approbation
     """
     
-    def __init__(self, colli_repository: IColliRepository):
+    def __init__(
+        self,
+        colli_repository: IColliRepository,
+        event_publisher: IEventPublisher = None
+    ):
         self._colli_repo = colli_repository
+        self._event_publisher = event_publisher
     
     def execute(self, command: CreateColliCommand) -> ColliResponseDTO:
         """
@@ -50,7 +56,12 @@ class CreateColliUseCase:
         )
         
         # Persister
-        saved_colli = self._colli_repo.save(colli)
+        saved_colli = self._colli_repo.add(colli)
+        
+        # Publier ColliCreated
+        events = colli.collect_events()
+        if self._event_publisher:
+            self._event_publisher.publish_all(events)
         
         # Retourner le DTO
         return ColliResponseDTO.from_entity(saved_colli)
@@ -7,6 +7,7 @@ from typing import List, Optional
 from src.domain.collaboration.repositories.colli_repository import IColliRepository
 from src.domain.collaboration.value_objects.colli_status import ColliStatus
 from src.application.dtos.colli_dto import ColliResponseDTO
+from src.application.dtos.pagination import fetch_page
 from src.application.exceptions import NotFoundException, ForbiddenException
 
 
@@ -31,22 +32,37 @@ class ListCollisUseCase:
     def __init__(self, colli_repository: IColliRepository):
         self._colli_repo = colli_repository
 
-    def execute(self, page: int = 1, per_page: int = 20, status: Optional[str] = None) -> dict:
-        """Liste les COLLIs paginés, avec filtre par statut optionnel."""
-        if status:
-            colli_status = ColliStatus(status)
-            collis = self._colli_repo.find_by_status(colli_status, page, per_page)
+    def execute(
+        self,
+        page: int = 1,
+        per_page: int = 20,
+        status: Optional[str] = None,
+        cursor: Optional[str] = None
+    ) -> dict:
+        """
+        Liste les COLLIs paginés (par page ou après `cursor`), avec filtre par statut optionnel.
+        
+        Les cartes de liste n'ont besoin que du nombre de membres : les
+        projections évitent de charger les adhésions.
+        """
+        colli_status = ColliStatus(status) if status else None
+        collis, next_cursor = fetch_page(
+            lambda **kwargs: self._colli_repo.find_summaries(colli_status, **kwargs),
+            page, per_page, cursor
+        )
+        if colli_status:
             total = self._colli_repo.count_by_status(colli_status)
         else:
-            collis = self._colli_repo.find_all(page, per_page)
             total = self._colli_repo.count()
+        has_more = next_cursor is not None if cursor else (page * per_page) < total
 
         return {
             'items': [ColliResponseDTO.from_entity(c).to_dict() for c in collis],
             'total': total,
             'page': page,
             'per_page': per_page,
-            'has_more': (page * per_page) < total
+            'has_more': has_more,
+            'next_cursor': next_cursor if has_more else None
         }
 
 
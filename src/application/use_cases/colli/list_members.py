@@ -40,21 +40,22 @@ class ListMembersUseCase:
 
         is_manager = colli.is_manager(user_id) or colli.creator_id == user_id
 
-        members = []
-        for membership in colli.members:
-            # Les non-managers ne voient que les membres acceptés
-            if not is_manager and not membership.is_accepted:
-                continue
+        # Les non-managers ne voient que les membres acceptés
+        visible = [m for m in colli.members if is_manager or m.is_accepted]
+
+        # Récupérer les détails de tous les utilisateurs en une requête
+        users = self._user_repo.find_by_ids(m.user_id for m in visible)
 
-            # Récupérer les détails de l'utilisateur
+        members = []
+        for membership in visible:
             user_details = None
-            user = self._user_repo.find_by_id(membership.user_id)
+            user = users.get(membership.user_id)
             if user:
                 user_details = {
                     'id': str(user.id),
                     'first_name': user.first_name,
                     'last_name': user.last_name,
-                    'email': str(user.email),
+                    'email': user.email,
                 }
 
             members.append(MemberDTO(
@@ -1,12 +1,75 @@
 # src/application/use_cases/colli/membership.py
-"""Use Cases: Gestion des membres d'un COLLI."""
-
+"""
+Use Cases: Gestion des membres d'un COLLI.
+
+Chaque action ne modifie qu'une adhésion : elle passe par
+IMembershipRepository (une ligne lue, une ligne écrite) et par la
+projection ColliSummary, sans charger l'agrégat avec tous ses membres.
+member_count suit par un UPDATE relatif.
+
+Les écritures sont optimistes : une adhésion modifiée par une requête
+concurrente lève ConflictException. L'action est alors rejouée sur
+l'état relu (MAX_ATTEMPTS fois au plus), ce qui transforme la course
+en réponse métier (« demande déjà en attente », « n'est pas en
+attente »…) ; le conflit ne remonte en 409 qu'au-delà.
+"""
+
+from dataclasses import replace
+from functools import wraps
 from uuid import UUID
 
+from src.domain.collaboration.entities.colli import UserNotMemberException
+from src.domain.collaboration.entities.membership import Membership
 from src.domain.collaboration.repositories.colli_repository import IColliRepository
+from src.domain.collaboration.repositories.membership_repository import IMembershipRepository
+from src.domain.collaboration.value_objects.colli_summary import ColliSummary
 from src.domain.collaboration.value_objects.member_role import MemberRole
+from src.domain.collaboration.value_objects.membership_status import MembershipStatus
 from src.application.dtos.colli_dto import ColliResponseDTO
-from src.application.exceptions import NotFoundException, ForbiddenException, ValidationException
+from src.application.exceptions import (
+    ConflictException,
+    ForbiddenException,
+    NotFoundException,
+    ValidationException,
+)
+
+
+MAX_ATTEMPTS = 3
+
+
+def _retry_on_conflict(execute):
+    """Rejoue execute() sur ConflictException, MAX_ATTEMPTS fois au plus."""
+    @wraps(execute)
+    def wrapper(*args, **kwargs):
+        for attempt in range(1, MAX_ATTEMPTS + 1):
+            try:
+                return execute(*args, **kwargs)
+            except ConflictException:
+                if attempt == MAX_ATTEMPTS:
+                    raise
+    return wrapper
+
+
+def _find_summary(colli_repo: IColliRepository, colli_id: UUID) -> ColliSummary:
+    """Projection du COLLI, ou NotFoundException."""
+    summary = colli_repo.find_summaries_by_ids([colli_id]).get(colli_id)
+    if not summary:
+        raise NotFoundException(f"COLLI {colli_id} introuvable")
+    return summary
+
+
+def _find_request(
+    membership_repo: IMembershipRepository,
+    colli_id: UUID,
+    user_id: UUID
+) -> Membership:
+    """Adhésion (quel que soit son statut) visée par une décision du manager."""
+    membership = membership_repo.find(colli_id, user_id)
+    if not membership:
+        raise UserNotMemberException(
+            f"L'utilisateur {user_id} n'a pas de demande d'adhésion au COLLI {colli_id}"
+        )
+    return membership
 
 
 class JoinColliUseCase:
@@ -19,28 +82,40 @@ class JoinColliUseCase:
     - La demande est créée en statut PENDING (nécessite approbation du manager)
     """
 
-    def __init__(self, colli_repository: IColliRepository):
+    def __init__(
+        self,
+        colli_repository: IColliRepository,
+        membership_repository: IMembershipRepository
+    ):
         self._colli_repo = colli_repository
+        self._membership_repo = membership_repository
 
+    @_retry_on_conflict
     def execute(self, colli_id: UUID, user_id: UUID) -> dict:
         """Demander à rejoindre un COLLI."""
-        colli = self._colli_repo.find_by_id(colli_id)
-        if not colli:
-            raise NotFoundException(f"COLLI {colli_id} introuvable")
+        colli = _find_summary(self._colli_repo, colli_id)
 
         if not colli.is_active:
             raise ForbiddenException("Le COLLI n'est pas actif")
 
-        if colli.has_membership(user_id):
-            if colli.is_member(user_id):
+        if colli.creator_id == user_id:
+            raise ValidationException("Vous êtes déjà membre de ce COLLI")
+
+        existing = self._membership_repo.find(colli_id, user_id)
+        if existing:
+            if existing.is_accepted:
                 raise ValidationException("Vous êtes déjà membre de ce COLLI")
-            if colli.is_pending_member(user_id):
+            if existing.is_pending:
                 raise ValidationException("Vous avez déjà une demande en attente")
             raise ValidationException("Votre demande a déjà été traitée")
 
-        # Créer une demande PENDING
-        colli.add_member(user_id, MemberRole.MEMBER)
-        self._colli_repo.save(colli)
+        # Créer une demande PENDING (une demande concurrente lève un conflit)
+        self._membership_repo.add(Membership.create(
+            user_id=user_id,
+            colli_id=colli_id,
+            role=MemberRole.MEMBER,
+            status=MembershipStatus.PENDING
+        ))
 
         return {'message': 'Demande d\'adhésion envoyée', 'status': 'pending'}
 
@@ -54,22 +129,28 @@ class AcceptMemberUseCase:
     - La demande doit être en statut PENDING
     """
 
-    def __init__(self, colli_repository: IColliRepository):
+    def __init__(
+        self,
+        colli_repository: IColliRepository,
+        membership_repository: IMembershipRepository
+    ):
         self._colli_repo = colli_repository
+        self._membership_repo = membership_repository
 
+    @_retry_on_conflict
     def execute(self, colli_id: UUID, target_user_id: UUID, requester_id: UUID) -> ColliResponseDTO:
         """Accepte un membre en attente."""
-        colli = self._colli_repo.find_by_id(colli_id)
-        if not colli:
-            raise NotFoundException(f"COLLI {colli_id} introuvable")
+        colli = _find_summary(self._colli_repo, colli_id)
 
-        if not colli.is_manager(requester_id):
+        if not self._colli_repo.is_accepted_member(colli_id, requester_id, role=MemberRole.MANAGER):
             raise ForbiddenException("Seul un manager peut accepter les demandes d'adhésion")
 
-        colli.accept_member(target_user_id)
-        saved = self._colli_repo.save(colli)
+        membership = _find_request(self._membership_repo, colli_id, target_user_id)
+        membership.accept()
+        self._membership_repo.save(membership)
+        self._colli_repo.update_activity(colli_id, member_delta=1)
 
-        return ColliResponseDTO.from_entity(saved)
+        return ColliResponseDTO.from_entity(replace(colli, member_count=colli.member_count + 1))
 
 
 class RejectMemberUseCase:
@@ -81,22 +162,27 @@ class RejectMemberUseCase:
     - La demande doit être en statut PENDING
     """
 
-    def __init__(self, colli_repository: IColliRepository):
+    def __init__(
+        self,
+        colli_repository: IColliRepository,
+        membership_repository: IMembershipRepository
+    ):
         self._colli_repo = colli_repository
+        self._membership_repo = membership_repository
 
+    @_retry_on_conflict
     def execute(self, colli_id: UUID, target_user_id: UUID, requester_id: UUID) -> ColliResponseDTO:
         """Rejette un membre en attente."""
-        colli = self._colli_repo.find_by_id(colli_id)
-        if not colli:
-            raise NotFoundException(f"COLLI {colli_id} introuvable")
+        colli = _find_summary(self._colli_repo, colli_id)
 
-        if not colli.is_manager(requester_id):
+        if not self._colli_repo.is_accepted_member(colli_id, requester_id, role=MemberRole.MANAGER):
             raise ForbiddenException("Seul un manager peut rejeter les demandes d'adhésion")
 
-        colli.reject_member(target_user_id)
-        saved = self._colli_repo.save(colli)
+        membership = _find_request(self._membership_repo, colli_id, target_user_id)
+        membership.reject()
+        self._membership_repo.save(membership)
 
-        return ColliResponseDTO.from_entity(saved)
+        return ColliResponseDTO.from_entity(colli)
 
 
 class LeaveColliUseCase:
@@ -108,24 +194,29 @@ class LeaveColliUseCase:
     - Le créateur ne peut pas quitter son propre COLLI
     """
 
-    def __init__(self, colli_repository: IColliRepository):
+    def __init__(
+        self,
+        colli_repository: IColliRepository,
+        membership_repository: IMembershipRepository
+    ):
         self._colli_repo = colli_repository
+        self._membership_repo = membership_repository
 
+    @_retry_on_conflict
     def execute(self, colli_id: UUID, user_id: UUID) -> bool:
         """Quitter un COLLI."""
-        colli = self._colli_repo.find_by_id(colli_id)
-        if not colli:
-            raise NotFoundException(f"COLLI {colli_id} introuvable")
-
-        if not colli.is_member(user_id):
-            raise ValidationException("Vous n'êtes pas membre de ce COLLI")
+        colli = _find_summary(self._colli_repo, colli_id)
 
         if colli.creator_id == user_id:
             raise ForbiddenException("Le créateur ne peut pas quitter son COLLI")
 
+        membership = self._membership_repo.find(colli_id, user_id)
+        if not membership or not membership.is_accepted:
+            raise ValidationException("Vous n'êtes pas membre de ce COLLI")
+
         # Retirer le membre
-        colli.remove_member(user_id)
-        self._colli_repo.save(colli)
+        if self._membership_repo.delete(membership):
+            self._colli_repo.update_activity(colli_id, member_delta=-1)
 
         return True
 
@@ -139,9 +230,15 @@ class AddManagerUseCase:
     - L'utilisateur ajouté doit être membre accepté
     """
 
-    def __init__(self, colli_repository: IColliRepository):
+    def __init__(
+        self,
+        colli_repository: IColliRepository,
+        membership_repository: IMembershipRepository
+    ):
         self._colli_repo = colli_repository
+        self._membership_repo = membership_repository
 
+    @_retry_on_conflict
     def execute(
         self,
         colli_id: UUID,
@@ -149,20 +246,19 @@ class AddManagerUseCase:
         target_user_id: UUID
     ) -> ColliResponseDTO:
         """Ajoute un manager."""
-        colli = self._colli_repo.find_by_id(colli_id)
-        if not colli:
-            raise NotFoundException(f"COLLI {colli_id} introuvable")
+        colli = _find_summary(self._colli_repo, colli_id)
 
         # Vérifier les droits
-        if not colli.is_manager(requester_id):
+        if not self._colli_repo.is_accepted_member(colli_id, requester_id, role=MemberRole.MANAGER):
             raise ForbiddenException("Vous devez être manager pour cette action")
 
         # Vérifier que la cible est membre accepté
-        if not colli.is_member(target_user_id):
+        membership = self._membership_repo.find(colli_id, target_user_id)
+        if not membership or not membership.is_accepted:
             raise ValidationException("L'utilisateur doit d'abord être membre accepté")
 
         # Changer le rôle
-        colli.promote_member(target_user_id, MemberRole.MANAGER)
-        saved = self._colli_repo.save(colli)
+        membership.promote_to(MemberRole.MANAGER)
+        self._membership_repo.save(membership)
 
-        return ColliResponseDTO.from_entity(saved)
+        return ColliResponseDTO.from_entity(colli)
@@ -7,6 +7,7 @@ from typing import Optional
 
 from src.domain.collaboration.repositories.colli_repository import IColliRepository
 from src.domain.collaboration.value_objects.colli_status import ColliStatus
+from src.application.interfaces.event_publisher import IEventPublisher
 from src.application.dtos.colli_dto import ColliResponseDTO
 from src.application.exceptions import NotFoundException, ValidationException
 
@@ -27,8 +28,13 @@ class RejectColliUseCase:
     Le COLLI passe au statut 'rejected'.
     """
     
-    def __init__(self, colli_repository: IColliRepository):
+    def __init__(
+        self,
+        colli_repository: IColliRepository,
+        event_publisher: IEventPublisher = None
+    ):
         self._colli_repo = colli_repository
+        self._event_publisher = event_publisher
     
     def execute(self, command: RejectColliCommand) -> ColliResponseDTO:
         """Execute le rejet du COLLI."""
@@ -47,4 +53,9 @@ class RejectColliUseCase:
         
         self._colli_repo.save(colli)
         
+        # Publier les événements domaine (ColliRejected)
+        events = colli.collect_events()
+        if self._event_publisher:
+            self._event_publisher.publish_all(events)
+        
         return ColliResponseDTO.from_entity(colli)
@@ -6,6 +6,8 @@ from uuid import UUID
 from typing import Optional
 
 from src.domain.collaboration.repositories.colli_repository import IColliRepository
+from src.domain.collaboration.events import ColliUpdated
+from src.application.interfaces.event_publisher import IEventPublisher
 from src.application.dtos.colli_dto import ColliResponseDTO
 from src.application.exceptions import NotFoundException, ForbiddenException
 
@@ -27,8 +29,13 @@ class UpdateColliUseCase:
     Seul le createur ou un admin peut modifier un COLLI.
     """
     
-    def __init__(self, colli_repository: IColliRepository):
+    def __init__(
+        self,
+        colli_repository: IColliRepository,
+        event_publisher: IEventPublisher = None
+    ):
         self._colli_repo = colli_repository
+        self._event_publisher = event_publisher
     
     def execute(self, command: UpdateColliCommand) -> ColliResponseDTO:
         """Execute la mise a jour du COLLI."""
@@ -52,4 +59,7 @@ class UpdateColliUseCase:
         
         self._colli_repo.save(colli)
         
+        if self._event_publisher:
+            self._event_publisher.publish(ColliUpdated(colli_id=colli.id))
+        
         return ColliResponseDTO.from_entity(colli)
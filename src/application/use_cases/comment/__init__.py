@@ -3,10 +3,12 @@
 
 from src.application.use_cases.comment.create_comment import CreateCommentUseCase
 from src.application.use_cases.comment.get_comments import GetCommentsForLetterUseCase
+from src.application.use_cases.comment.get_comment_thread import GetCommentThreadUseCase
 from src.application.use_cases.comment.delete_comment import DeleteCommentUseCase
 
 __all__ = [
     'CreateCommentUseCase',
     'GetCommentsForLetterUseCase',
+    'GetCommentThreadUseCase',
     'DeleteCommentUseCase'
 ]
@@ -7,6 +7,8 @@ from src.domain.collaboration.entities.comment import Comment
 from src.domain.collaboration.repositories.comment_repository import ICommentRepository
 from src.domain.collaboration.repositories.letter_repository import ILetterRepository
 from src.domain.collaboration.repositories.colli_repository import IColliRepository
+from src.domain.collaboration.events import CommentAdded
+from src.application.interfaces.event_publisher import IEventPublisher
 from src.application.dtos.comment_dto import CreateCommentCommand, CommentResponseDTO
 from src.application.exceptions import (
     NotFoundException,
@@ -29,11 +31,13 @@ class CreateCommentUseCase:
         self,
         comment_repository: ICommentRepository,
         letter_repository: ILetterRepository,
-        colli_repository: IColliRepository
+        colli_repository: IColliRepository,
+        event_publisher: IEventPublisher = None
     ):
         self._comment_repo = comment_repository
         self._letter_repo = letter_repository
         self._colli_repo = colli_repository
+        self._event_publisher = event_publisher
     
     def execute(self, command: CreateCommentCommand) -> CommentResponseDTO:
         """Exécute la création d'un commentaire."""
@@ -42,13 +46,8 @@ class CreateCommentUseCase:
         if not letter:
             raise NotFoundException(f"Lettre {command.letter_id} introuvable")
         
-        # Vérifier que le COLLI de la lettre est accessible
-        colli = self._colli_repo.find_by_id(letter.colli_id)
-        if not colli:
-            raise NotFoundException("COLLI de la lettre introuvable")
-        
-        # Vérifier que l'utilisateur est membre du COLLI
-        if not colli.is_member(command.sender_id):
+        # Vérifier que l'utilisateur est membre du COLLI de la lettre
+        if not self._colli_repo.is_accepted_member(letter.colli_id, command.sender_id):
             raise ForbiddenException("Vous devez être membre du COLLI pour commenter")
         
         # Créer le commentaire
@@ -63,7 +62,16 @@ class CreateCommentUseCase:
         except Exception as e:
             raise ValidationException(str(e))
         
-        # Persister
-        saved_comment = self._comment_repo.save(comment)
+        # Persister, avec les compteurs de la lettre et du COLLI dans la même transaction
+        saved_comment = self._comment_repo.add(comment)
+        self._letter_repo.update_comment_count(letter.id, 1)
+        self._colli_repo.update_activity(letter.colli_id, active_at=saved_comment.created_at)
+        
+        if self._event_publisher:
+            self._event_publisher.publish(CommentAdded(
+                comment_id=saved_comment.id,
+                letter_id=saved_comment.letter_id,
+                author_id=saved_comment.sender_id
+            ))
         
         return CommentResponseDTO.from_entity(saved_comment)
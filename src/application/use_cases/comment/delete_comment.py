@@ -6,6 +6,7 @@ from uuid import UUID
 from src.domain.collaboration.repositories.comment_repository import ICommentRepository
 from src.domain.collaboration.repositories.letter_repository import ILetterRepository
 from src.domain.collaboration.repositories.colli_repository import IColliRepository
+from src.domain.collaboration.value_objects.member_role import MemberRole
 from src.application.exceptions import NotFoundException, ForbiddenException
 
 
@@ -34,16 +35,20 @@ class DeleteCommentUseCase:
         if not comment:
             raise NotFoundException(f"Commentaire {comment_id} introuvable")
         
-        # Récupérer la lettre et le COLLI pour vérifier les droits
-        letter = self._letter_repo.find_by_id(comment.letter_id)
-        colli = self._colli_repo.find_by_id(letter.colli_id) if letter else None
-        
-        is_author = comment.sender_id == user_id
-        is_moderator = colli and colli.is_manager(user_id) if colli else False
+        # Le rôle dans le COLLI n'est interrogé que pour un non-auteur
+        is_moderator = False
+        if comment.sender_id != user_id:
+            letter = self._letter_repo.find_by_id(comment.letter_id)
+            is_moderator = letter is not None and self._colli_repo.is_accepted_member(
+                letter.colli_id, user_id, role=MemberRole.MANAGER
+            )
         
         if not comment.can_user_delete(user_id, is_moderator):
             raise ForbiddenException(
                 "Seul l'auteur ou un modérateur peut supprimer ce commentaire"
             )
         
-        return self._comment_repo.delete(comment)
+        deleted = self._comment_repo.delete(comment)
+        if deleted:
+            self._letter_repo.update_comment_count(comment.letter_id, -1)
+        return deleted
@@ -0,0 +1,81 @@
+"""Use Case: Récupérer les fils de commentaires d'une lettre."""
+
+from uuid import UUID
+from typing import Optional
+
+from src.domain.collaboration.repositories.comment_repository import ICommentRepository
+from src.domain.collaboration.repositories.letter_repository import ILetterRepository
+from src.domain.collaboration.repositories.colli_repository import IColliRepository
+from src.domain.collaboration.value_objects.comment_thread import build_comment_threads
+from src.application.dtos.comment_dto import CommentThreadDTO, CommentThreadListResponseDTO
+from src.application.dtos.pagination import fetch_page
+from src.application.exceptions import NotFoundException, ForbiddenException
+
+
+class GetCommentThreadUseCase:
+    """
+    Use Case: Lister les fils de commentaires d'une lettre, réponses imbriquées.
+
+    Les fils de tête sont paginés ; chacun arrive avec ses réponses sur
+    `max_depth` niveaux, chargées par une seule requête du repository.
+    Un nœud dont les réponses sont coupées par la limite est marqué
+    `has_more_replies` : le client les charge avec `parent_comment_id`.
+    """
+
+    MAX_DEPTH = 10
+
+    def __init__(
+        self,
+        comment_repository: ICommentRepository,
+        letter_repository: ILetterRepository,
+        colli_repository: IColliRepository
+    ):
+        self._comment_repo = comment_repository
+        self._letter_repo = letter_repository
+        self._colli_repo = colli_repository
+
+    def execute(
+        self,
+        letter_id: UUID,
+        user_id: UUID,
+        parent_comment_id: Optional[UUID] = None,
+        max_depth: Optional[int] = None,
+        page: int = 1,
+        per_page: int = 20,
+        cursor: Optional[str] = None
+    ) -> CommentThreadListResponseDTO:
+        """Récupère une page de fils (de la lettre, ou sous `parent_comment_id`)."""
+        letter = self._letter_repo.find_by_id(letter_id)
+        if not letter:
+            raise NotFoundException(f"Lettre {letter_id} introuvable")
+
+        if not self._colli_repo.is_accepted_member(letter.colli_id, user_id):
+            raise ForbiddenException("Vous n'êtes pas membre de ce COLLI")
+
+        if parent_comment_id is not None:
+            parent = self._comment_repo.find_by_id(parent_comment_id)
+            if not parent or parent.letter_id != letter_id:
+                raise NotFoundException(f"Commentaire {parent_comment_id} introuvable")
+
+        if max_depth is None:
+            max_depth = self.MAX_DEPTH
+        max_depth = max(0, min(max_depth, self.MAX_DEPTH))
+
+        # Un niveau de plus que demandé : sa seule présence indique has_more_replies
+        threads, next_cursor = fetch_page(
+            lambda **kwargs: build_comment_threads(
+                self._comment_repo.find_thread(
+                    letter_id, parent_comment_id, max_depth=max_depth + 1, **kwargs
+                ),
+                max_depth=max_depth
+            ),
+            page, per_page, cursor
+        )
+
+        return CommentThreadListResponseDTO(
+            items=[CommentThreadDTO.from_node(node) for node in threads],
+            page=page,
+            per_page=per_page,
+            has_more=next_cursor is not None,
+            next_cursor=next_cursor
+        )
@@ -2,11 +2,13 @@
 """Use Case: Récupérer les commentaires d'une lettre."""
 
 from uuid import UUID
+from typing import Optional
 
 from src.domain.collaboration.repositories.comment_repository import ICommentRepository
 from src.domain.collaboration.repositories.letter_repository import ILetterRepository
 from src.domain.collaboration.repositories.colli_repository import IColliRepository
 from src.application.dtos.comment_dto import CommentResponseDTO, CommentListResponseDTO
+from src.application.dtos.pagination import fetch_page
 from src.application.exceptions import NotFoundException, ForbiddenException
 
 
@@ -28,22 +30,26 @@ class GetCommentsForLetterUseCase:
         letter_id: UUID,
         user_id: UUID,
         page: int = 1,
-        per_page: int = 50
+        per_page: int = 50,
+        cursor: Optional[str] = None
     ) -> CommentListResponseDTO:
-        """Récupère les commentaires paginés."""
+        """Récupère les commentaires paginés (par page, ou après `cursor`)."""
         # Vérifier que la lettre existe
         letter = self._letter_repo.find_by_id(letter_id)
         if not letter:
             raise NotFoundException(f"Lettre {letter_id} introuvable")
         
         # Vérifier l'accès au COLLI
-        colli = self._colli_repo.find_by_id(letter.colli_id)
-        if colli and not colli.is_member(user_id):
+        if not self._colli_repo.is_accepted_member(letter.colli_id, user_id):
             raise ForbiddenException("Vous n'êtes pas membre de ce COLLI")
         
         # Récupérer les commentaires
-        comments = self._comment_repo.find_by_letter(letter_id, page, per_page)
+        comments, next_cursor = fetch_page(
+            lambda **kwargs: self._comment_repo.find_by_letter(letter_id, **kwargs),
+            page, per_page, cursor
+        )
         total = self._comment_repo.count_by_letter(letter_id)
+        has_more = next_cursor is not None if cursor else (page * per_page) < total
         
         items = [CommentResponseDTO.from_entity(c) for c in comments]
         
@@ -52,5 +58,6 @@ class GetCommentsForLetterUseCase:
             total=total,
             page=page,
             per_page=per_page,
-            has_more=(page * per_page) < total
+            has_more=has_more,
+            next_cursor=next_cursor if has_more else None
         )
@@ -0,0 +1,61 @@
+# src/application/use_cases/export/get_export_job.py
+"""Use Cases: Suivre un job d'export et récupérer son archive."""
+
+from datetime import timedelta
+from uuid import UUID
+
+from src.domain.export.entities.export_job import ExportJob
+from src.domain.export.repositories.export_job_repository import IExportJobRepository
+from src.application.dtos.export_dto import ExportArchive, ExportJobResponseDTO
+from src.application.exceptions import NotFoundException, ConflictException
+
+
+def _find_own_job(job_repo: IExportJobRepository, job_id: UUID, user_id: UUID) -> ExportJob:
+    """Retourne le job s'il appartient à l'utilisateur (404 sinon, sans divulguer son existence)."""
+    job = job_repo.find_by_id(job_id)
+    if not job or job.user_id != user_id:
+        raise NotFoundException(f"Export {job_id} introuvable")
+    return job
+
+
+class GetExportJobUseCase:
+    """
+    Use Case: Récupérer l'état d'un job d'export.
+    """
+    
+    def __init__(self, export_job_repository: IExportJobRepository):
+        self._job_repo = export_job_repository
+    
+    def execute(self, job_id: UUID, user_id: UUID) -> ExportJobResponseDTO:
+        """Retourne l'état du job de l'utilisateur."""
+        return ExportJobResponseDTO.from_entity(_find_own_job(self._job_repo, job_id, user_id))
+
+
+class GetExportArchiveUseCase:
+    """
+    Use Case: Récupérer l'archive d'un job terminé.
+    
+    Règles métier:
+    - Seul le propriétaire du job y a accès
+    - L'archive n'est disponible qu'une fois le job terminé avec succès,
+      et pendant `archive_ttl` secondes
+    """
+    
+    def __init__(self, export_job_repository: IExportJobRepository, archive_ttl: int = 7 * 86400):
+        self._job_repo = export_job_repository
+        self._archive_ttl = timedelta(seconds=archive_ttl)
+    
+    def execute(self, job_id: UUID, user_id: UUID) -> ExportArchive:
+        """
+        Retourne l'archive du job.
+        
+        Raises:
+            NotFoundException: Si le job n'existe pas ou appartient à un autre utilisateur.
+            ConflictException: Si l'archive n'est pas (ou plus) disponible.
+        """
+        job = _find_own_job(self._job_repo, job_id, user_id)
+        if not job.is_downloadable:
+            raise ConflictException(f"Export non disponible (statut: {job.status.value})")
+        if job.is_archive_expired(self._archive_ttl):
+            raise ConflictException("Export expiré : relancer une demande")
+        return ExportArchive(path=job.archive_path, size=job.archive_size)
@@ -0,0 +1,63 @@
+# src/application/use_cases/export/purge_export_jobs.py
+"""Use Case: Solder les jobs d'export perdus et purger les archives expirées."""
+
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from src.domain.export.repositories.export_job_repository import IExportJobRepository
+from src.application.interfaces.export_archive_builder import IExportArchiveBuilder
+
+
+logger = logging.getLogger(__name__)
+
+
+class PurgeExportJobsUseCase:
+    """
+    Use Case: Maintenance périodique des jobs d'export (tâche Celery beat).
+    
+    - Un job en attente ou en cours depuis plus de `job_timeout` secondes
+      est passé en échec : son worker s'est arrêté ou sa tâche est perdue.
+    - L'archive d'un job terminé depuis plus de `archive_ttl` secondes est
+      supprimée et le job passe à l'état EXPIRED.
+    """
+    
+    def __init__(
+        self,
+        export_job_repository: IExportJobRepository,
+        archive_builder: IExportArchiveBuilder,
+        job_timeout: int = 3600,
+        archive_ttl: int = 7 * 86400
+    ):
+        self._job_repo = export_job_repository
+        self._archive_builder = archive_builder
+        self._job_timeout = timedelta(seconds=job_timeout)
+        self._archive_ttl = timedelta(seconds=archive_ttl)
+    
+    def execute(self, now: Optional[datetime] = None) -> Dict[str, int]:
+        """
+        Solde les jobs perdus et purge les archives expirées.
+        
+        Returns:
+            Dict[str, int]: Nombre de jobs passés en échec (`failed`) et
+                d'archives supprimées (`expired`).
+        """
+        now = now or datetime.utcnow()
+        
+        stale = self._job_repo.find_stale(now - self._job_timeout)
+        for job in stale:
+            job.time_out()
+            self._job_repo.save(job)
+        
+        expired = 0
+        for job in self._job_repo.find_completed_before(now - self._archive_ttl):
+            try:
+                self._archive_builder.delete(job.archive_path)
+            except OSError:
+                logger.exception(f"Suppression de l'archive de l'export {job.id} en echec")
+                continue
+            job.expire()
+            self._job_repo.save(job)
+            expired += 1
+        
+        return {"failed": len(stale), "expired": expired}
@@ -0,0 +1,66 @@
+# src/application/use_cases/export/request_export_job.py
+"""Use Case: Demander un export RGPD en arrière-plan."""
+
+from datetime import timedelta
+from uuid import UUID
+
+from src.domain.export.entities.export_job import ExportJob
+from src.domain.export.repositories.export_job_repository import IExportJobRepository
+from src.domain.identity.repositories.user_repository import IUserRepository
+from src.application.interfaces.export_job_queue import IExportJobQueue
+from src.application.dtos.export_dto import ExportJobResponseDTO
+from src.application.exceptions import NotFoundException
+
+
+class RequestExportJobUseCase:
+    """
+    Use Case: Créer un job d'export et le mettre en file.
+    
+    Règles métier:
+    - L'utilisateur doit exister
+    - Un seul export actif (en attente ou en cours) par utilisateur :
+      une nouvelle demande retourne le job existant
+    - Un job actif depuis plus de `job_timeout` secondes (worker arrêté,
+      tâche perdue) est passé en échec et remplacé
+    """
+    
+    def __init__(
+        self,
+        export_job_repository: IExportJobRepository,
+        user_repository: IUserRepository,
+        job_queue: IExportJobQueue,
+        job_timeout: int = 3600
+    ):
+        self._job_repo = export_job_repository
+        self._user_repo = user_repository
+        self._job_queue = job_queue
+        self._job_timeout = timedelta(seconds=job_timeout)
+    
+    def execute(self, user_id: UUID) -> ExportJobResponseDTO:
+        """
+        Crée (ou retrouve) le job d'export de l'utilisateur.
+        
+        Args:
+            user_id: ID de l'utilisateur qui demande l'export.
+            
+        Returns:
+            ExportJobResponseDTO: Le job, dans son état après mise en file.
+            
+        Raises:
+            NotFoundException: Si l'utilisateur n'existe pas.
+        """
+        if not self._user_repo.find_by_id(user_id):
+            raise NotFoundException(f"Utilisateur {user_id} introuvable")
+        
+        active = self._job_repo.find_active_for_user(user_id)
+        if active and not active.is_stale(self._job_timeout):
+            return ExportJobResponseDTO.from_entity(active)
+        if active:
+            active.time_out()
+            self._job_repo.save(active)
+        
+        job = self._job_repo.save(ExportJob.create(user_id))
+        self._job_queue.enqueue(job.id)
+        
+        # Un exécuteur en processus a pu terminer le job entre-temps
+        return ExportJobResponseDTO.from_entity(self._job_repo.find_by_id(job.id) or job)
@@ -0,0 +1,64 @@
+# src/application/use_cases/export/run_export_job.py
+"""Use Case: Exécuter un job d'export (côté worker)."""
+
+import logging
+from datetime import datetime
+from typing import Callable
+from uuid import UUID
+
+from src.domain.export.repositories.export_job_repository import IExportJobRepository
+from src.application.interfaces.export_archive_builder import IExportArchiveBuilder
+
+
+logger = logging.getLogger(__name__)
+
+
+class RunExportJobUseCase:
+    """
+    Use Case: Produire l'archive d'un job d'export.
+    
+    Le job est d'abord réservé (PENDING -> RUNNING en une mise à jour
+    conditionnelle) et ce passage validé avant de construire l'archive :
+    le statut RUNNING est visible des clients pendant la construction,
+    et une seconde livraison de la même tâche ne refait pas l'export.
+    
+    Un échec est enregistré sur le job (statut FAILED) plutôt que propagé,
+    afin que le client qui interroge le statut en soit informé.
+    """
+    
+    def __init__(
+        self,
+        export_job_repository: IExportJobRepository,
+        archive_builder: IExportArchiveBuilder
+    ):
+        self._job_repo = export_job_repository
+        self._archive_builder = archive_builder
+    
+    def execute(self, job_id: UUID, commit: Callable[[], None] = lambda: None) -> bool:
+        """
+        Exécute le job.
+        
+        Args:
+            job_id: ID du job à exécuter.
+            commit: Valide la réservation du job avant la construction
+                de l'archive (sans effet par défaut, pour l'exécution
+                dans la transaction de la requête).
+            
+        Returns:
+            bool: False si le job est introuvable ou déjà pris en charge.
+        """
+        if not self._job_repo.claim(job_id, datetime.utcnow()):
+            return False
+        commit()
+        job = self._job_repo.find_by_id(job_id)
+        
+        try:
+            archive = self._archive_builder.build(job)
+        except Exception as e:
+            logger.exception(f"Export {job_id} en echec")
+            job.fail(str(e))
+        else:
+            job.complete(archive.path, archive.size)
+        
+        self._job_repo.save(job)
+        return True
@@ -7,6 +7,8 @@ from uuid import UUID
 from src.domain.collaboration.entities.letter import Letter
 from src.domain.collaboration.repositories.letter_repository import ILetterRepository
 from src.domain.collaboration.repositories.colli_repository import IColliRepository
+from src.domain.collaboration.events import LetterCreated
+from src.application.interfaces.event_publisher import IEventPublisher
 from src.application.dtos.letter_dto import (
     CreateTextLetterCommand,
     CreateFileLetterCommand,
@@ -19,6 +21,16 @@ from src.application.exceptions import (
 )
 
 
+def _publish_created(event_publisher: IEventPublisher, letter: Letter) -> None:
+    """Publie LetterCreated si un publisher est configuré."""
+    if event_publisher:
+        event_publisher.publish(LetterCreated(
+            letter_id=letter.id,
+            colli_id=letter.colli_id,
+            sender_id=letter.sender_id
+        ))
+
+
 class CreateTextLetterUseCase:
     """
     Use Case: Créer une lettre texte.
@@ -32,15 +44,17 @@ class CreateTextLetterUseCase:
     def __init__(
         self,
         letter_repository: ILetterRepository,
-        colli_repository: IColliRepository
+        colli_repository: IColliRepository,
+        event_publisher: IEventPublisher = None
     ):
         self._letter_repo = letter_repository
         self._colli_repo = colli_repository
+        self._event_publisher = event_publisher
     
     def execute(self, command: CreateTextLetterCommand) -> LetterResponseDTO:
         """Exécute la création d'une lettre texte."""
         # Vérifier que le COLLI existe
-        colli = self._colli_repo.find_by_id(command.colli_id)
+        colli = self._colli_repo.find_summaries_by_ids([command.colli_id]).get(command.colli_id)
         if not colli:
             raise NotFoundException(f"COLLI {command.colli_id} introuvable")
         
@@ -49,7 +63,7 @@ class CreateTextLetterUseCase:
             raise ForbiddenException("Le COLLI n'est pas actif")
         
         # Vérifier que l'utilisateur est membre
-        if not colli.is_member(command.sender_id):
+        if not self._colli_repo.is_accepted_member(command.colli_id, command.sender_id):
             raise ForbiddenException("Vous n'êtes pas membre de ce COLLI")
         
         # Créer la lettre
@@ -63,8 +77,12 @@ class CreateTextLetterUseCase:
         except Exception as e:
             raise ValidationException(str(e))
         
-        # Persister
-        saved_letter = self._letter_repo.save(letter)
+        # Persister, avec les compteurs du COLLI dans la même transaction
+        saved_letter = self._letter_repo.add(letter)
+        self._colli_repo.update_activity(
+            command.colli_id, letter_delta=1, active_at=saved_letter.created_at
+        )
+        _publish_created(self._event_publisher, saved_letter)
         
         return LetterResponseDTO.from_entity(saved_letter)
 
@@ -82,15 +100,17 @@ class CreateFileLetterUseCase:
     def __init__(
         self,
         letter_repository: ILetterRepository,
-        colli_repository: IColliRepository
+        colli_repository: IColliRepository,
+        event_publisher: IEventPublisher = None
     ):
         self._letter_repo = letter_repository
         self._colli_repo = colli_repository
+        self._event_publisher = event_publisher
     
     def execute(self, command: CreateFileLetterCommand) -> LetterResponseDTO:
         """Exécute la création d'une lettre fichier."""
         # Vérifier que le COLLI existe
-        colli = self._colli_repo.find_by_id(command.colli_id)
+        colli = self._colli_repo.find_summaries_by_ids([command.colli_id]).get(command.colli_id)
         if not colli:
             raise NotFoundException(f"COLLI {command.colli_id} introuvable")
         
@@ -99,7 +119,7 @@ class CreateFileLetterUseCase:
             raise ForbiddenException("Le COLLI n'est pas actif")
         
         # Vérifier que l'utilisateur est membre
-        if not colli.is_member(command.sender_id):
+        if not self._colli_repo.is_accepted_member(command.colli_id, command.sender_id):
             raise ForbiddenException("Vous n'êtes pas membre de ce COLLI")
         
         # Créer la lettre
@@ -115,7 +135,11 @@ class CreateFileLetterUseCase:
         except Exception as e:
             raise ValidationException(str(e))
         
-        # Persister
-        saved_letter = self._letter_repo.save(letter)
+        # Persister, avec les compteurs du COLLI dans la même transaction
+        saved_letter = self._letter_repo.add(letter)
+        self._colli_repo.update_activity(
+            command.colli_id, letter_delta=1, active_at=saved_letter.created_at
+        )
+        _publish_created(self._event_publisher, saved_letter)
         
         return LetterResponseDTO.from_entity(saved_letter)
@@ -5,7 +5,10 @@ from uuid import UUID
 
 from src.domain.collaboration.repositories.letter_repository import ILetterRepository
 from src.domain.collaboration.repositories.colli_repository import IColliRepository
+from src.domain.collaboration.value_objects.member_role import MemberRole
 from src.domain.identity.repositories.user_repository import IUserRepository
+from src.domain.collaboration.events import LetterDeleted
+from src.application.interfaces.event_publisher import IEventPublisher
 from src.application.exceptions import NotFoundException, ForbiddenException
 
 
@@ -21,11 +24,13 @@ class DeleteLetterUseCase:
         self,
         letter_repository: ILetterRepository,
         colli_repository: IColliRepository,
-        user_repository: IUserRepository = None
+        user_repository: IUserRepository = None,
+        event_publisher: IEventPublisher = None
     ):
         self._letter_repo = letter_repository
         self._colli_repo = colli_repository
         self._user_repo = user_repository
+        self._event_publisher = event_publisher
 
     def execute(self, letter_id: UUID, user_id: UUID) -> bool:
         """Supprime une lettre."""
@@ -34,10 +39,11 @@ class DeleteLetterUseCase:
         if not letter:
             raise NotFoundException(f"Lettre {letter_id} introuvable")
 
-        # Vérifier les droits
-        colli = self._colli_repo.find_by_id(letter.colli_id)
+        # Vérifier les droits (le rôle n'est interrogé que pour un non-auteur)
         is_author = letter.sender_id == user_id
-        is_manager = colli and colli.is_manager(user_id) if colli else False
+        is_manager = not is_author and self._colli_repo.is_accepted_member(
+            letter.colli_id, user_id, role=MemberRole.MANAGER
+        )
 
         # Vérifier si l'utilisateur est admin
         is_admin = False
@@ -50,4 +56,11 @@ class DeleteLetterUseCase:
                 "Seul l'auteur, un manager ou un admin peut supprimer cette lettre"
             )
 
-        return self._letter_repo.delete(letter)
+        deleted = self._letter_repo.delete(letter)
+        if deleted:
+            self._colli_repo.update_activity(letter.colli_id, letter_delta=-1)
+        if deleted and self._event_publisher:
+            self._event_publisher.publish(
+                LetterDeleted(letter_id=letter.id, colli_id=letter.colli_id)
+            )
+        return deleted
@@ -2,26 +2,26 @@
 """Use Case: Récupérer les lettres d'un COLLI."""
 
 from uuid import UUID
-from typing import List
+from typing import Iterable, List, Optional
 
 from src.domain.collaboration.repositories.letter_repository import ILetterRepository
-from src.domain.collaboration.repositories.comment_repository import ICommentRepository
 from src.domain.collaboration.repositories.colli_repository import IColliRepository
 from src.domain.identity.repositories.user_repository import IUserRepository
 from src.application.dtos.letter_dto import LetterResponseDTO, LetterListResponseDTO
+from src.application.dtos.pagination import fetch_page
 from src.application.exceptions import NotFoundException, ForbiddenException
 
 
-def _build_sender_data(user_repository: IUserRepository, sender_id: UUID) -> dict | None:
-    """Récupère les données du sender pour le DTO."""
-    user = user_repository.find_by_id(sender_id)
-    if user:
-        return {
+def _build_senders_data(user_repository: IUserRepository, sender_ids: Iterable[UUID]) -> dict[UUID, dict]:
+    """Récupère en une requête les données des senders pour le DTO."""
+    return {
+        user_id: {
             'id': str(user.id),
             'first_name': user.first_name,
             'last_name': user.last_name,
         }
-    return None
+        for user_id, user in user_repository.find_by_ids(sender_ids).items()
+    }
 
 
 class GetLettersForColliUseCase:
@@ -30,12 +30,10 @@ class GetLettersForColliUseCase:
     def __init__(
         self,
         letter_repository: ILetterRepository,
-        comment_repository: ICommentRepository,
         colli_repository: IColliRepository,
         user_repository: IUserRepository
     ):
         self._letter_repo = letter_repository
-        self._comment_repo = comment_repository
         self._colli_repo = colli_repository
         self._user_repo = user_repository
 
@@ -44,39 +42,41 @@ class GetLettersForColliUseCase:
         colli_id: UUID,
         user_id: UUID,
         page: int = 1,
-        per_page: int = 20
+        per_page: int = 20,
+        cursor: Optional[str] = None
     ) -> LetterListResponseDTO:
-        """Récupère les lettres paginées."""
-        # Vérifier que le COLLI existe
-        colli = self._colli_repo.find_by_id(colli_id)
-        if not colli:
-            raise NotFoundException(f"COLLI {colli_id} introuvable")
-
-        # Vérifier que l'utilisateur est membre
-        if not colli.is_member(user_id):
+        """Récupère les lettres paginées (par page, ou après `cursor`)."""
+        # Vérifier l'appartenance (un EXISTS, sans charger le COLLI) ;
+        # en cas de refus seulement, distinguer 404 et 403
+        if not self._colli_repo.is_accepted_member(colli_id, user_id):
+            if colli_id not in self._colli_repo.find_summaries_by_ids([colli_id]):
+                raise NotFoundException(f"COLLI {colli_id} introuvable")
             raise ForbiddenException("Vous n'êtes pas membre de ce COLLI")
 
         # Récupérer les lettres
-        letters = self._letter_repo.find_by_colli(colli_id, page, per_page)
+        letters, next_cursor = fetch_page(
+            lambda **kwargs: self._letter_repo.find_by_colli(colli_id, **kwargs),
+            page, per_page, cursor
+        )
         total = self._letter_repo.count_by_colli(colli_id)
+        has_more = next_cursor is not None if cursor else (page * per_page) < total
 
-        # Cache des senders pour éviter les requêtes dupliquées
-        sender_cache: dict[UUID, dict | None] = {}
+        # Une seule requête pour tous les senders distincts de la page
+        senders = _build_senders_data(self._user_repo, {l.sender_id for l in letters})
 
-        # Convertir avec le nombre de commentaires et les données sender
-        items = []
-        for letter in letters:
-            comment_count = self._comment_repo.count_by_letter(letter.id)
-            if letter.sender_id not in sender_cache:
-                sender_cache[letter.sender_id] = _build_sender_data(self._user_repo, letter.sender_id)
-            items.append(LetterResponseDTO.from_entity(letter, comment_count, sender_cache[letter.sender_id]))
+        # Le nombre de commentaires est lu sur le compteur de chaque lettre
+        items = [
+            LetterResponseDTO.from_entity(letter, senders.get(letter.sender_id))
+            for letter in letters
+        ]
 
         return LetterListResponseDTO(
             items=items,
             total=total,
             page=page,
             per_page=per_page,
-            has_more=(page * per_page) < total
+            has_more=has_more,
+            next_cursor=next_cursor if has_more else None
         )
 
 
@@ -86,12 +86,10 @@ class GetLetterByIdUseCase:
     def __init__(
         self,
         letter_repository: ILetterRepository,
-        comment_repository: ICommentRepository,
         colli_repository: IColliRepository,
         user_repository: IUserRepository
     ):
         self._letter_repo = letter_repository
-        self._comment_repo = comment_repository
         self._colli_repo = colli_repository
         self._user_repo = user_repository
 
@@ -102,10 +100,8 @@ class GetLetterByIdUseCase:
             raise NotFoundException(f"Lettre {letter_id} introuvable")
 
         # Vérifier l'accès au COLLI
-        colli = self._colli_repo.find_by_id(letter.colli_id)
-        if colli and not colli.is_member(user_id):
+        if not self._colli_repo.is_accepted_member(letter.colli_id, user_id):
             raise ForbiddenException("Vous n'êtes pas membre de ce COLLI")
 
-        comment_count = self._comment_repo.count_by_letter(letter.id)
-        sender_data = _build_sender_data(self._user_repo, letter.sender_id)
-        return LetterResponseDTO.from_entity(letter, comment_count, sender_data)
+        sender_data = _build_senders_data(self._user_repo, [letter.sender_id]).get(letter.sender_id)
+        return LetterResponseDTO.from_entity(letter, sender_data)
@@ -6,6 +6,8 @@ from uuid import UUID
 from typing import Optional
 
 from src.domain.collaboration.repositories.letter_repository import ILetterRepository
+from src.domain.collaboration.events import LetterUpdated
+from src.application.interfaces.event_publisher import IEventPublisher
 from src.application.dtos.letter_dto import LetterResponseDTO
 from src.application.exceptions import NotFoundException, ForbiddenException
 
@@ -26,8 +28,13 @@ class UpdateLetterUseCase:
     Seul l'auteur peut modifier sa lettre.
     """
     
-    def __init__(self, letter_repository: ILetterRepository):
+    def __init__(
+        self,
+        letter_repository: ILetterRepository,
+        event_publisher: IEventPublisher = None
+    ):
         self._letter_repo = letter_repository
+        self._event_publisher = event_publisher
     
     def execute(self, command: UpdateLetterCommand) -> LetterResponseDTO:
         """Execute la mise a jour de la lettre."""
@@ -48,4 +55,9 @@ class UpdateLetterUseCase:
         
         self._letter_repo.save(letter)
         
+        if self._event_publisher:
+            self._event_publisher.publish(
+                LetterUpdated(letter_id=letter.id, colli_id=letter.colli_id)
+            )
+        
         return LetterResponseDTO.from_entity(letter)
@@ -0,0 +1,118 @@
+# src/application/use_cases/search/global_search.py
+"""Use Case: Recherche globale (COLLIs, lettres, utilisateurs)."""
+
+from uuid import UUID
+from typing import Optional
+
+from src.domain.collaboration.repositories.colli_repository import IColliRepository
+from src.domain.collaboration.repositories.letter_repository import ILetterRepository
+from src.domain.identity.repositories.user_repository import IUserRepository
+from src.application.interfaces.search_index import ISearchIndex
+from src.application.dtos.search_dto import SearchDocumentType
+from src.application.dtos.colli_dto import ColliResponseDTO
+from src.application.dtos.letter_dto import LetterResponseDTO
+from src.application.dtos.user_dto import UserResponseDTO
+from src.application.exceptions import ValidationException
+
+
+class GlobalSearchUseCase:
+    """
+    Use Case: Rechercher dans l'index plein texte.
+    
+    L'index renvoie des identifiants classés ; seules les entités de la
+    page (au plus `limit` par type) sont ensuite chargées.
+    """
+    
+    MIN_QUERY_LENGTH = 2
+    
+    # Clé de réponse -> type de document
+    _SECTIONS = {
+        'collis': SearchDocumentType.COLLI,
+        'letters': SearchDocumentType.LETTER,
+        'users': SearchDocumentType.USER,
+    }
+    
+    def __init__(
+        self,
+        search_index: ISearchIndex,
+        colli_repository: IColliRepository,
+        letter_repository: ILetterRepository,
+        user_repository: IUserRepository
+    ):
+        self._search_index = search_index
+        self._colli_repo = colli_repository
+        self._letter_repo = letter_repository
+        self._user_repo = user_repository
+    
+    def execute(
+        self,
+        query: str,
+        user_id: UUID,
+        search_type: str = 'all',
+        limit: int = 10,
+        cursor: Optional[str] = None
+    ) -> dict:
+        """
+        Exécute la recherche.
+        
+        Args:
+            query: Terme de recherche.
+            user_id: Utilisateur qui recherche (filtrage par appartenance).
+            search_type: all, collis, letters ou users.
+            limit: Nombre de résultats par type.
+            cursor: Curseur de page suivante (uniquement avec un seul type).
+        
+        Returns:
+            Dict {query, collis, letters, users}, plus next_cursor si un
+            seul type est demandé.
+        """
+        query = query.strip().lower()
+        if len(query) < self.MIN_QUERY_LENGTH:
+            raise ValidationException(
+                "Le terme de recherche doit contenir au moins 2 caracteres",
+                errors={"q": ["Minimum 2 caracteres"]}
+            )
+        if cursor and search_type == 'all':
+            raise ValidationException(
+                "Le curseur nécessite un type de recherche",
+                errors={"cursor": ["Préciser type=collis, letters ou users"]}
+            )
+        
+        results = {'query': query}
+        for section, doc_type in self._SECTIONS.items():
+            if search_type not in ('all', section):
+                continue
+            try:
+                page = self._search_index.search(query, doc_type, user_id, limit, cursor)
+            except ValueError:
+                raise ValidationException(
+                    "Curseur de pagination invalide",
+                    errors={'cursor': ["Curseur invalide ou expiré"]}
+                )
+            results[section] = self._hydrate(doc_type, [hit.doc_id for hit in page.hits])
+            if search_type == section:
+                results['next_cursor'] = page.next_cursor
+        
+        return results
+    
+    def _hydrate(self, doc_type: SearchDocumentType, ids: list) -> list:
+        """Charge les entités de la page dans l'ordre du classement."""
+        if doc_type == SearchDocumentType.COLLI:
+            summaries = self._colli_repo.find_summaries_by_ids(ids)
+            return [
+                ColliResponseDTO.from_entity(summaries[colli_id]).to_dict()
+                for colli_id in ids if colli_id in summaries
+            ]
+        
+        if doc_type == SearchDocumentType.LETTER:
+            letters = self._letter_repo.find_by_ids(ids)
+            return [
+                LetterResponseDTO.from_entity(letters[letter_id]).to_dict()
+                for letter_id in ids if letter_id in letters
+            ]
+        
+        users = self._user_repo.find_entities_by_ids(ids)
+        return [
+            UserResponseDTO.from_entity(users[user_id]).to_dict()
+            for user_id in ids if user_id in users
+        ]
@@ -0,0 +1,178 @@
+# src/application/use_cases/user/export_user_data.py
+"""Use Case: Export RGPD des données d'un utilisateur."""
+
+import json
+from datetime import datetime
+from typing import Any, Dict, Generator, Iterable, Iterator
+from uuid import UUID
+
+from src.domain.identity.entities.user import User
+from src.domain.identity.repositories.user_repository import IUserRepository
+from src.domain.collaboration.repositories.colli_repository import IColliRepository
+from src.domain.collaboration.repositories.letter_repository import ILetterRepository
+from src.domain.collaboration.repositories.comment_repository import ICommentRepository
+from src.domain.collaboration.value_objects.colli_role_filter import ColliRoleFilter
+from src.domain.shared.page_cursor import PageCursor
+from src.application.dtos.user_dto import UserResponseDTO
+from src.application.dtos.colli_dto import ColliResponseDTO
+from src.application.dtos.letter_dto import LetterResponseDTO
+from src.application.dtos.comment_dto import CommentResponseDTO
+from src.application.exceptions import NotFoundException
+
+
+class ExportUserDataUseCase:
+    """
+    Use Case: Exporter toutes les données d'un utilisateur (RGPD Art. 20).
+    
+    Le document JSON est produit morceau par morceau : seules les lignes de
+    l'utilisateur sont lues, par lots de CHUNK_SIZE, et chaque lot est
+    sérialisé puis libéré avant de lire le suivant. La mémoire reste
+    constante quel que soit le volume de correspondance.
+    """
+    
+    CHUNK_SIZE = 500
+    FLUSH_ITEMS = 50
+    NOTIFICATIONS_LIMIT = 1000
+    RGPD_NOTICE = 'Export conforme au RGPD Article 20 - Droit a la portabilite des donnees'
+    
+    def __init__(
+        self,
+        user_repository: IUserRepository,
+        colli_repository: IColliRepository,
+        letter_repository: ILetterRepository,
+        comment_repository: ICommentRepository,
+        notification_repository
+    ):
+        self._user_repo = user_repository
+        self._colli_repo = colli_repository
+        self._letter_repo = letter_repository
+        self._comment_repo = comment_repository
+        self._notification_repo = notification_repository
+    
+    def execute(self, user_id: UUID) -> Iterator[str]:
+        """
+        Prépare l'export de l'utilisateur.
+        
+        L'existence de l'utilisateur est vérifiée immédiatement ; le reste
+        est lu au fil de la consommation du générateur retourné.
+        
+        Args:
+            user_id: ID de l'utilisateur exporté.
+            
+        Returns:
+            Iterator[str]: Fragments successifs du document JSON.
+            
+        Raises:
+            NotFoundException: Si l'utilisateur n'existe pas.
+        """
+        user = self._user_repo.find_by_id(user_id)
+        if not user:
+            raise NotFoundException(f"Utilisateur {user_id} introuvable")
+        return self._stream(user)
+    
+    def _stream(self, user: User) -> Iterator[str]:
+        """Génère le document JSON, tableau par tableau."""
+        yield '{\n'
+        yield self._field('export_date', datetime.utcnow().isoformat())
+        yield self._field('rgpd_notice', self.RGPD_NOTICE)
+        yield self._field('user', {
+            **UserResponseDTO.from_entity(user).to_dict(),
+            'avatar_url': getattr(user, 'avatar_url', None)
+        })
+        
+        yield '  "collis": {\n    "created": '
+        created = yield from self._array(self._collis(user.id, ColliRoleFilter.CREATOR), indent='    ')
+        yield ',\n    "member_of": '
+        member_of = yield from self._array(self._collis(user.id, ColliRoleFilter.MEMBER), indent='    ')
+        yield '\n  },\n'
+        
+        yield '  "letters": '
+        letters = yield from self._array(self._letters(user.id))
+        yield ',\n  "comments": '
+        comments = yield from self._array(self._comments(user.id))
+        yield ',\n  "notifications": '
+        notifications = yield from self._array(
+            n.to_dict() for n in
+            self._notification_repo.find_by_user(user.id, limit=self.NOTIFICATIONS_LIMIT)
+        )
+        yield ',\n'
+        
+        yield self._field('statistics', {
+            'total_collis': created + member_of,
+            'total_letters': letters,
+            'total_comments': comments,
+            'total_notifications': notifications
+        }, last=True)
+        yield '}\n'
+    
+    # =========================================================================
+    # LECTURE PAR LOTS
+    # =========================================================================
+    
+    def _collis(self, user_id: UUID, role_filter: ColliRoleFilter) -> Iterator[dict]:
+        """COLLIs de l'utilisateur pour un rôle, page par page."""
+        page = 1
+        while True:
+            collis = self._colli_repo.find_by_member(user_id, role_filter, page, self.CHUNK_SIZE)
+            for colli in collis:
+                yield ColliResponseDTO.from_entity(colli).to_dict()
+            if len(collis) < self.CHUNK_SIZE:
+                return
+            page += 1
+    
+    def _letters(self, user_id: UUID) -> Iterator[dict]:
+        """Lettres envoyées par l'utilisateur, par lots keyset."""
+        cursor = None
+        while True:
+            letters = self._letter_repo.find_by_sender(user_id, limit=self.CHUNK_SIZE, cursor=cursor)
+            for letter in letters:
+                yield LetterResponseDTO.from_entity(letter).to_dict()
+            if len(letters) < self.CHUNK_SIZE:
+                return
+            cursor = PageCursor.from_entity(letters[-1])
+    
+    def _comments(self, user_id: UUID) -> Iterator[dict]:
+        """Commentaires écrits par l'utilisateur, par lots keyset."""
+        cursor = None
+        while True:
+            comments = self._comment_repo.find_by_sender(user_id, limit=self.CHUNK_SIZE, cursor=cursor)
+            for comment in comments:
+                yield CommentResponseDTO.from_entity(comment).to_dict()
+            if len(comments) < self.CHUNK_SIZE:
+                return
+            cursor = PageCursor.from_entity(comments[-1])
+    
+    # =========================================================================
+    # SÉRIALISATION
+    # =========================================================================
+    
+    @staticmethod
+    def _dumps(value: Any) -> str:
+        return json.dumps(value, ensure_ascii=False, default=str)
+    
+    def _field(self, key: str, value: Any, last: bool = False) -> str:
+        """Ligne `"clé": valeur` du document racine."""
+        return f'  {self._dumps(key)}: {self._dumps(value)}{"" if last else ","}\n'
+    
+    def _array(
+        self,
+        items: Iterable[Dict[str, Any]],
+        indent: str = '  '
+    ) -> Generator[str, None, int]:
+        """
+        Sérialise un tableau élément par élément ; retourne sa taille.
+        
+        Les éléments sont regroupés par FLUSH_ITEMS pour éviter un fragment
+        HTTP par élément.
+        """
+        count = 0
+        buffer = []
+        for item in items:
+            buffer.append(('[\n' if count == 0 else ',\n') + indent + '  ' + self._dumps(item))
+            count += 1
+            if len(buffer) >= self.FLUSH_ITEMS:
+                yield ''.join(buffer)
+                buffer = []
+        buffer.append(f'\n{indent}]' if count else '[]')
+        yield ''.join(buffer)
+        return count
@@ -7,6 +7,8 @@ from uuid import UUID
 from src.domain.identity.entities.user import User
 from src.domain.identity.value_objects.user_role import UserRole
 from src.domain.identity.repositories.user_repository import IUserRepository
+from src.domain.identity.events import UserRegistered
+from src.application.interfaces.event_publisher import IEventPublisher
 from src.application.dtos.user_dto import UserResponseDTO
 from src.application.exceptions import ConflictException, ValidationException
 
@@ -30,8 +32,13 @@ class RegisterUserUseCase:
     - Le nouvel utilisateur a le rôle MEMBER par défaut
     """
     
-    def __init__(self, user_repository: IUserRepository):
+    def __init__(
+        self,
+        user_repository: IUserRepository,
+        event_publisher: IEventPublisher = None
+    ):
         self._user_repo = user_repository
+        self._event_publisher = event_publisher
     
     def execute(self, command: RegisterUserCommand) -> UserResponseDTO:
         """
@@ -67,6 +74,9 @@ class RegisterUserUseCase:
             raise ValidationException(str(e))
         
         # Persister
-        saved_user = self._user_repo.save(user)
+        saved_user = self._user_repo.add(user)
+        
+        if self._event_publisher:
+            self._event_publisher.publish(UserRegistered(user_id=saved_user.id))
         
         return UserResponseDTO.from_entity(saved_user)
@@ -6,6 +6,8 @@ from uuid import UUID
 from typing import Optional
 
 from src.domain.identity.repositories.user_repository import IUserRepository
+from src.domain.identity.events import UserProfileUpdated
+from src.application.interfaces.event_publisher import IEventPublisher
 from src.application.dtos.user_dto import UserResponseDTO
 from src.application.exceptions import NotFoundException
 
@@ -26,8 +28,13 @@ class UpdateUserProfileUseCase:
     Seuls les champs fournis sont mis a jour.
     """
     
-    def __init__(self, user_repository: IUserRepository):
+    def __init__(
+        self,
+        user_repository: IUserRepository,
+        event_publisher: IEventPublisher = None
+    ):
         self._user_repo = user_repository
+        self._event_publisher = event_publisher
     
     def execute(self, command: UpdateProfileCommand) -> UserResponseDTO:
         """Execute la mise a jour du profil."""
@@ -47,4 +54,7 @@ class UpdateUserProfileUseCase:
         
         self._user_repo.save(user)
         
+        if self._event_publisher:
+            self._event_publisher.publish(UserProfileUpdated(user_id=user.id))
+        
         return UserResponseDTO.from_entity(user)
@@ -18,6 +18,7 @@ from src.domain.collaboration.value_objects.membership_status import MembershipS
 from src.domain.collaboration.entities.membership import Membership
 from src.domain.collaboration.events import (
     DomainEvent,
+    ColliCreated,
     ColliApproved,
     ColliRejected,
     MemberAdded,
@@ -67,6 +68,10 @@ class Colli:
     created_at: datetime = field(default_factory=datetime.utcnow)
     updated_at: datetime = field(default_factory=datetime.utcnow)
 
+    # Compteurs d'activité dénormalisés, tenus à jour par le repository
+    letter_count: int = 0
+    last_activity_at: Optional[datetime] = None
+
     # Relations internes à l'agrégat
     _members: List[Membership] = field(default_factory=list)
 
@@ -101,13 +106,15 @@ class Colli:
         if not theme or len(theme.strip()) < 2:
             raise ValueError("Le thème du COLLI est obligatoire")
 
-        return cls(
+        colli = cls(
             id=uuid4(),
             name=name.strip(),
             theme=theme.strip(),
             description=description.strip() if description else None,
             creator_id=creator_id
         )
+        colli._domain_events.append(ColliCreated(colli_id=colli.id, creator_id=creator_id))
+        return colli
 
     # =========================================================================
     # WORKFLOW D'APPROBATION
@@ -47,6 +47,9 @@ class Letter:
     created_at: datetime = field(default_factory=datetime.utcnow)
     updated_at: datetime = field(default_factory=datetime.utcnow)
     
+    # Compteur dénormalisé, tenu à jour par le repository
+    comment_count: int = 0
+    
     # Events (pour publication après commit)
     _events: List = field(default_factory=list, repr=False)
     
@@ -5,6 +5,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from uuid import UUID, uuid4
 
+from src.domain.shared.domain_exception import DomainException
 from src.domain.collaboration.value_objects.member_role import MemberRole
 from src.domain.collaboration.value_objects.membership_status import MembershipStatus
 
@@ -22,6 +23,7 @@ class Membership:
     role: MemberRole
     status: MembershipStatus = MembershipStatus.PENDING
     joined_at: datetime = field(default_factory=datetime.utcnow)
+    version: int = 1
 
     @classmethod
     def create(
@@ -41,13 +43,21 @@ class Membership:
         )
 
     def accept(self) -> None:
-        """Accepte la demande d'adhésion."""
+        """Accepte la demande d'adhésion (qui doit être en attente)."""
+        self._ensure_pending()
         self.status = MembershipStatus.ACCEPTED
 
     def reject(self) -> None:
-        """Rejette la demande d'adhésion."""
+        """Rejette la demande d'adhésion (qui doit être en attente)."""
+        self._ensure_pending()
         self.status = MembershipStatus.REJECTED
 
+    def _ensure_pending(self) -> None:
+        if not self.is_pending:
+            raise DomainException(
+                f"La demande de l'utilisateur {self.user_id} n'est pas en attente"
+            )
+
     @property
     def is_accepted(self) -> bool:
         """Vérifie si le membre est accepté."""
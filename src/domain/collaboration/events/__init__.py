@@ -13,6 +13,27 @@ class DomainEvent:
     occurred_at: datetime = field(default_factory=datetime.utcnow)
 
 
+@dataclass(frozen=True)
+class ColliCreated(DomainEvent):
+    """Événement émis quand un COLLI est créé (en attente d'approbation)."""
+    colli_id: UUID = field(default=None)  # type: ignore
+    creator_id: UUID = field(default=None)  # type: ignore
+    
+    def __post_init__(self):
+        if self.colli_id is None or self.creator_id is None:
+            raise ValueError("colli_id and creator_id are required")
+
+
+@dataclass(frozen=True)
+class ColliUpdated(DomainEvent):
+    """Événement émis quand le nom, le thème ou la description d'un COLLI change."""
+    colli_id: UUID = field(default=None)  # type: ignore
+    
+    def __post_init__(self):
+        if self.colli_id is None:
+            raise ValueError("colli_id is required")
+
+
 @dataclass(frozen=True)
 class ColliApproved(DomainEvent):
     """Événement émis quand un COLLI est approuvé."""
@@ -81,3 +102,25 @@ class CommentAdded(DomainEvent):
     def __post_init__(self):
         if self.comment_id is None or self.letter_id is None or self.author_id is None:
             raise ValueError("comment_id, letter_id and author_id are required")
+
+
+@dataclass(frozen=True)
+class LetterUpdated(DomainEvent):
+    """Événement émis quand une lettre est modifiée."""
+    letter_id: UUID = field(default=None)  # type: ignore
+    colli_id: UUID = field(default=None)  # type: ignore
+    
+    def __post_init__(self):
+        if self.letter_id is None or self.colli_id is None:
+            raise ValueError("letter_id and colli_id are required")
+
+
+@dataclass(frozen=True)
+class LetterDeleted(DomainEvent):
+    """Événement émis quand une lettre est supprimée."""
+    letter_id: UUID = field(default=None)  # type: ignore
+    colli_id: UUID = field(default=None)  # type: ignore
+    
+    def __post_init__(self):
+        if self.letter_id is None or self.colli_id is None:
+            raise ValueError("letter_id and colli_id are required")
@@ -2,11 +2,16 @@
 """Interface (Port) pour le repository Colli."""
 
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from datetime import datetime
+from typing import Optional, List, Dict, Iterable
 from uuid import UUID
 
+from src.domain.shared.page_cursor import PageCursor
 from src.domain.collaboration.entities.colli import Colli
 from src.domain.collaboration.value_objects.colli_status import ColliStatus
+from src.domain.collaboration.value_objects.colli_summary import ColliSummary
+from src.domain.collaboration.value_objects.member_role import MemberRole
+from src.domain.collaboration.value_objects.colli_role_filter import ColliRoleFilter
 
 
 class IColliRepository(ABC):
@@ -22,6 +27,16 @@ class IColliRepository(ABC):
     - Les méthodes retournent des entités, jamais des modèles ORM
     """
     
+    @abstractmethod
+    def add(self, colli: Colli) -> Colli:
+        """
+        Persiste un nouveau Colli.
+        
+        À préférer à `save` quand l'entité vient d'être créée : l'insertion
+        se fait sans vérifier au préalable si elle existe.
+        """
+        pass
+    
     @abstractmethod
     def save(self, colli: Colli) -> Colli:
         """
@@ -49,13 +64,19 @@ class IColliRepository(ABC):
         pass
     
     @abstractmethod
-    def find_all(self, page: int = 1, per_page: int = 20) -> List[Colli]:
+    def find_all(
+        self,
+        page: int = 1,
+        per_page: int = 20,
+        cursor: Optional[PageCursor] = None
+    ) -> List[Colli]:
         """
-        Récupère tous les Collis avec pagination.
+        Récupère tous les Collis avec pagination, plus récents d'abord.
         
         Args:
-            page: Numéro de page (1-indexed).
+            page: Numéro de page (1-indexed), ignoré si un curseur est fourni.
             per_page: Nombre d'éléments par page.
+            cursor: Position (created_at, id) après laquelle reprendre.
         
         Returns:
             List[Colli]: Liste des Collis.
@@ -63,20 +84,67 @@ class IColliRepository(ABC):
         pass
     
     @abstractmethod
-    def find_by_status(self, status: ColliStatus, page: int = 1, per_page: int = 20) -> List[Colli]:
+    def find_by_status(
+        self,
+        status: ColliStatus,
+        page: int = 1,
+        per_page: int = 20,
+        cursor: Optional[PageCursor] = None
+    ) -> List[Colli]:
         """
         Récupère les Collis ayant un statut donné, avec pagination.
 
         Args:
             status: Le statut à filtrer.
-            page: Numéro de page (1-indexed).
+            page: Numéro de page (1-indexed), ignoré si un curseur est fourni.
             per_page: Nombre d'éléments par page.
+            cursor: Position (created_at, id) après laquelle reprendre.
 
         Returns:
             List[Colli]: Liste des Collis correspondants.
         """
         pass
     
+    @abstractmethod
+    def find_summaries(
+        self,
+        status: Optional[ColliStatus] = None,
+        page: int = 1,
+        per_page: int = 20,
+        cursor: Optional[PageCursor] = None
+    ) -> List[ColliSummary]:
+        """
+        Récupère une page de Collis sous forme de projections de liste.
+        
+        Même ordre et même pagination que `find_all` / `find_by_status`,
+        sans charger les adhésions : le nombre de membres acceptés est
+        calculé par la base.
+        
+        Args:
+            status: Le statut à filtrer (None : tous).
+            page: Numéro de page (1-indexed), ignoré si un curseur est fourni.
+            per_page: Nombre d'éléments par page.
+            cursor: Position (created_at, id) après laquelle reprendre.
+        
+        Returns:
+            List[ColliSummary]: Les projections, plus récentes d'abord.
+        """
+        pass
+    
+    @abstractmethod
+    def find_summaries_by_ids(self, colli_ids: Iterable[UUID]) -> Dict[UUID, ColliSummary]:
+        """
+        Récupère les projections de liste de plusieurs Collis.
+        
+        Args:
+            colli_ids: Les identifiants recherchés.
+        
+        Returns:
+            Dict[UUID, ColliSummary]: Projections indexées par ID (les
+            identifiants inconnus sont absents).
+        """
+        pass
+    
     @abstractmethod
     def find_by_creator(self, creator_id: UUID) -> List[Colli]:
         """
@@ -90,6 +158,91 @@ class IColliRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    def find_by_member(
+        self,
+        user_id: UUID,
+        role_filter: ColliRoleFilter = ColliRoleFilter.ALL,
+        page: int = 1,
+        per_page: int = 20
+    ) -> List[Colli]:
+        """
+        Récupère les Collis auxquels un utilisateur participe, avec pagination.
+        
+        Args:
+            user_id: L'identifiant de l'utilisateur.
+            role_filter: Créateur, membre (adhésion quel que soit le statut,
+                hors créateur) ou les deux.
+            page: Numéro de page (1-indexed).
+            per_page: Nombre d'éléments par page.
+        
+        Returns:
+            List[Colli]: Liste des Collis, plus récents d'abord.
+        """
+        pass
+    
+    @abstractmethod
+    def is_accepted_member(
+        self,
+        colli_id: UUID,
+        user_id: UUID,
+        role: Optional[MemberRole] = None
+    ) -> bool:
+        """
+        Vérifie l'appartenance d'un utilisateur sans charger l'agrégat.
+        
+        Équivaut à `colli.is_member(user_id)` (créateur ou adhésion
+        ACCEPTED) ; avec `role`, à une adhésion ACCEPTED de ce rôle
+        (`role=MemberRole.MANAGER` équivaut à `colli.is_manager`).
+        
+        Args:
+            colli_id: L'identifiant du Colli (False s'il n'existe pas).
+            user_id: L'identifiant de l'utilisateur.
+            role: Rôle exigé, ou None.
+        
+        Returns:
+            bool: True si l'utilisateur remplit la condition.
+        """
+        pass
+    
+    @abstractmethod
+    def find_accepted_member_ids(self, colli_ids: Iterable[UUID]) -> Dict[UUID, List[UUID]]:
+        """
+        Récupère les identifiants des membres ACCEPTED de plusieurs Collis.
+        
+        Ne lit que la colonne user_id des adhésions, sans hydrater les
+        agrégats (équivaut à `colli.accepted_members` pour chaque Colli).
+        
+        Returns:
+            Dict[UUID, List[UUID]]: Membres par Colli (liste vide pour un
+                Colli sans membre ou inconnu).
+        """
+        pass
+    
+    @abstractmethod
+    def update_activity(
+        self,
+        colli_id: UUID,
+        letter_delta: int = 0,
+        active_at: Optional[datetime] = None,
+        member_delta: int = 0
+    ) -> None:
+        """
+        Ajuste les compteurs d'activité dénormalisés d'un Colli.
+        
+        Appelé dans la transaction qui crée ou supprime une lettre ou un
+        commentaire, ou qui modifie une adhésion hors de l'agrégat
+        (IMembershipRepository). save() recalcule aussi member_count
+        depuis l'agrégat chargé.
+        
+        Args:
+            colli_id: L'identifiant du Colli.
+            letter_delta: Variation de letter_count (+1 création, -1 suppression).
+            active_at: Nouvelle date de dernière activité, ou None pour la garder.
+            member_delta: Variation de member_count (+1 acceptation, -1 départ).
+        """
+        pass
+    
     @abstractmethod
     def delete(self, colli: Colli) -> bool:
         """
@@ -112,3 +265,12 @@ class IColliRepository(ABC):
     def count_by_status(self, status: ColliStatus) -> int:
         """Retourne le nombre de Collis ayant un statut donné."""
         pass
+    
+    @abstractmethod
+    def count_by_member(
+        self,
+        user_id: UUID,
+        role_filter: ColliRoleFilter = ColliRoleFilter.ALL
+    ) -> int:
+        """Retourne le nombre de Collis d'un utilisateur pour un filtre de rôle."""
+        pass
@@ -2,15 +2,26 @@
 """Interface (Port) pour le repository Comment."""
 
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Dict, Iterable
 from uuid import UUID
 
+from src.domain.shared.page_cursor import PageCursor
 from src.domain.collaboration.entities.comment import Comment
 
 
 class ICommentRepository(ABC):
     """Interface pour le repository Comment."""
     
+    @abstractmethod
+    def add(self, comment: Comment) -> Comment:
+        """
+        Persiste un nouveau commentaire.
+        
+        À préférer à `save` quand l'entité vient d'être créée : l'insertion
+        se fait sans vérifier au préalable si elle existe.
+        """
+        pass
+    
     @abstractmethod
     def save(self, comment: Comment) -> Comment:
         """Persiste un commentaire."""
@@ -26,14 +37,60 @@ class ICommentRepository(ABC):
         self,
         letter_id: UUID,
         page: int = 1,
-        per_page: int = 50
+        per_page: int = 50,
+        cursor: Optional[PageCursor] = None
     ) -> List[Comment]:
-        """Récupère les commentaires d'une lettre avec pagination."""
+        """Récupère les commentaires d'une lettre (plus anciens d'abord), par page ou après un curseur."""
         pass
     
     @abstractmethod
-    def find_by_sender(self, sender_id: UUID) -> List[Comment]:
-        """Récupère les commentaires d'un utilisateur."""
+    def find_by_letters(
+        self,
+        letter_ids: Iterable[UUID],
+        per_letter: int = 50
+    ) -> Dict[UUID, List[Comment]]:
+        """
+        Récupère les `per_letter` premiers commentaires de plusieurs lettres.
+        
+        Équivaut à `find_by_letter(letter_id, per_page=per_letter)` pour chaque
+        lettre, en une requête. Les lettres sans commentaire ont une liste vide.
+        """
+        pass
+    
+    @abstractmethod
+    def find_thread(
+        self,
+        letter_id: UUID,
+        parent_comment_id: Optional[UUID] = None,
+        max_depth: Optional[int] = None,
+        page: int = 1,
+        per_page: int = 20,
+        cursor: Optional[PageCursor] = None
+    ) -> List[Comment]:
+        """
+        Récupère une page de fils de discussion d'une lettre, en liste plate.
+        
+        Les têtes de fil sont les réponses directes de `parent_comment_id`
+        (les commentaires de premier niveau s'il est None), paginées comme
+        `find_by_letter`. Leurs descendants suivent, jusqu'à `max_depth`
+        niveaux sous les têtes (0 : les têtes seules ; None : sans limite).
+        Le tout est trié par (created_at, id).
+        """
+        pass
+    
+    @abstractmethod
+    def find_by_sender(
+        self,
+        sender_id: UUID,
+        limit: Optional[int] = None,
+        cursor: Optional[PageCursor] = None
+    ) -> List[Comment]:
+        """
+        Récupère les commentaires d'un utilisateur, plus récents d'abord.
+        
+        Sans `limit`, tous sont retournés. Avec `limit` et `cursor`, permet de
+        parcourir l'historique par lots (pagination keyset).
+        """
         pass
     
     @abstractmethod
@@ -45,3 +102,8 @@ class ICommentRepository(ABC):
     def count_by_letter(self, letter_id: UUID) -> int:
         """Compte les commentaires d'une lettre."""
         pass
+    
+    @abstractmethod
+    def count_by_letters(self, letter_ids: Iterable[UUID]) -> Dict[UUID, int]:
+        """Compte les commentaires de plusieurs lettres (0 pour les lettres sans commentaire)."""
+        pass
@@ -2,15 +2,26 @@
 """Interface (Port) pour le repository Letter."""
 
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Dict, Iterable, Optional, List
 from uuid import UUID
 
+from src.domain.shared.page_cursor import PageCursor
 from src.domain.collaboration.entities.letter import Letter
 
 
 class ILetterRepository(ABC):
     """Interface pour le repository Letter."""
     
+    @abstractmethod
+    def add(self, letter: Letter) -> Letter:
+        """
+        Persiste une nouvelle lettre.
+        
+        À préférer à `save` quand l'entité vient d'être créée : l'insertion
+        se fait sans vérifier au préalable si elle existe.
+        """
+        pass
+    
     @abstractmethod
     def save(self, letter: Letter) -> Letter:
         """Persiste une lettre."""
@@ -21,19 +32,44 @@ class ILetterRepository(ABC):
         """Récupère une lettre par ID."""
         pass
     
+    @abstractmethod
+    def find_by_ids(self, letter_ids: Iterable[UUID]) -> Dict[UUID, Letter]:
+        """Récupère plusieurs lettres (ids inconnus absents du dict)."""
+        pass
+    
     @abstractmethod
     def find_by_colli(
         self,
         colli_id: UUID,
         page: int = 1,
-        per_page: int = 20
+        per_page: int = 20,
+        cursor: Optional[PageCursor] = None
+    ) -> List[Letter]:
+        """Récupère les lettres d'un COLLI (plus récentes d'abord), par page ou après un curseur."""
+        pass
+    
+    @abstractmethod
+    def find_by_sender(
+        self,
+        sender_id: UUID,
+        limit: Optional[int] = None,
+        cursor: Optional[PageCursor] = None
     ) -> List[Letter]:
-        """Récupère les lettres d'un COLLI avec pagination."""
+        """
+        Récupère les lettres d'un utilisateur, plus récentes d'abord.
+        
+        Sans `limit`, toutes sont retournées. Avec `limit` et `cursor`, permet de
+        parcourir l'historique par lots (pagination keyset).
+        """
         pass
     
     @abstractmethod
-    def find_by_sender(self, sender_id: UUID) -> List[Letter]:
-        """Récupère les lettres d'un utilisateur."""
+    def update_comment_count(self, letter_id: UUID, delta: int) -> None:
+        """
+        Ajuste le compteur dénormalisé de commentaires d'une lettre.
+        
+        Appelé dans la transaction qui crée (+1) ou supprime (-1) le commentaire.
+        """
         pass
     
     @abstractmethod
@@ -0,0 +1,49 @@
+# src/domain/collaboration/repositories/membership_repository.py
+"""Interface (Port) pour le repository Membership."""
+
+from abc import ABC, abstractmethod
+from typing import Optional
+from uuid import UUID
+
+from src.domain.collaboration.entities.membership import Membership
+
+
+class IMembershipRepository(ABC):
+    """
+    Interface pour les adhésions, une ligne à la fois.
+
+    Rejoindre, accepter, rejeter ou quitter ne touche qu'une adhésion :
+    ces écritures passent par ce repository plutôt que par l'agrégat
+    Colli, qui charge et réécrit tous ses membres. Un utilisateur a au
+    plus une adhésion par COLLI, ce que garantit le stockage.
+    """
+
+    @abstractmethod
+    def find(self, colli_id: UUID, user_id: UUID) -> Optional[Membership]:
+        """Récupère l'adhésion d'un utilisateur à un COLLI (quel que soit le statut)."""
+        pass
+
+    @abstractmethod
+    def add(self, membership: Membership) -> Membership:
+        """
+        Persiste une nouvelle adhésion.
+
+        Raises:
+            ConflictException: Si l'utilisateur a déjà une adhésion à ce COLLI.
+        """
+        pass
+
+    @abstractmethod
+    def save(self, membership: Membership) -> Membership:
+        """
+        Met à jour le statut et le rôle d'une adhésion existante.
+
+        Raises:
+            ConflictException: Si l'adhésion a changé depuis sa lecture.
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, membership: Membership) -> bool:
+        """Supprime une adhésion."""
+        pass
@@ -0,0 +1,11 @@
+# src/domain/collaboration/value_objects/colli_role_filter.py
+"""Value Object pour filtrer les COLLIs selon le rôle d'un utilisateur."""
+
+from enum import Enum
+
+
+class ColliRoleFilter(Enum):
+    """Filtre par role dans le COLLI."""
+    CREATOR = "creator"   # COLLIs créés par l'utilisateur
+    MEMBER = "member"     # COLLIs où il a une adhésion (hors créateur)
+    ALL = "all"           # Les deux
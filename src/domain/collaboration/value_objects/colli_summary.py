@@ -0,0 +1,54 @@
+# src/domain/collaboration/value_objects/colli_summary.py
+"""Value Object pour l'affichage d'un COLLI dans une liste."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from src.domain.collaboration.value_objects.colli_status import ColliStatus
+
+
+@dataclass(frozen=True)
+class ColliSummary:
+    """
+    Projection en lecture seule d'un COLLI.
+
+    Colonnes du COLLI et compteurs d'activité, sans les adhésions :
+    de quoi afficher une carte de liste ou un résultat de recherche.
+    """
+    id: UUID
+    name: str
+    theme: str
+    description: Optional[str]
+    creator_id: UUID
+    status: ColliStatus
+    rejection_reason: Optional[str]
+    member_count: int
+    created_at: datetime
+    updated_at: datetime
+    letter_count: int = 0
+    last_activity_at: Optional[datetime] = None
+
+    @property
+    def is_active(self) -> bool:
+        """Vérifie si le COLLI est actif."""
+        return self.status == ColliStatus.ACTIVE
+
+    @classmethod
+    def from_entity(cls, colli) -> "ColliSummary":
+        """Construit la projection depuis l'agrégat complet."""
+        return cls(
+            id=colli.id,
+            name=colli.name,
+            theme=colli.theme,
+            description=colli.description,
+            creator_id=colli.creator_id,
+            status=colli.status,
+            rejection_reason=colli.rejection_reason,
+            member_count=colli.member_count,
+            created_at=colli.created_at,
+            updated_at=colli.updated_at,
+            letter_count=colli.letter_count,
+            last_activity_at=colli.last_activity_at
+        )
@@ -0,0 +1,82 @@
+# src/domain/collaboration/value_objects/comment_thread.py
+"""Value Object pour un fil de commentaires (commentaire et ses réponses)."""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+from uuid import UUID
+
+from src.domain.collaboration.entities.comment import Comment
+
+
+@dataclass
+class CommentNode:
+    """
+    Un commentaire et ses réponses, dans l'ordre chronologique.
+
+    `depth` vaut 0 pour les commentaires de tête du fil. `has_more_replies`
+    signale un nœud dont les réponses n'ont pas été chargées (limite de
+    profondeur atteinte) : le client les demande avec parent_comment_id.
+    """
+    comment: Comment
+    depth: int = 0
+    replies: List["CommentNode"] = field(default_factory=list)
+    has_more_replies: bool = False
+
+    @property
+    def id(self) -> UUID:
+        return self.comment.id
+
+    @property
+    def created_at(self) -> datetime:
+        return self.comment.created_at
+
+    def walk(self) -> Iterable["CommentNode"]:
+        """Parcourt le nœud puis ses descendants (en profondeur)."""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.replies))
+
+
+def build_comment_threads(
+    comments: Iterable[Comment],
+    max_depth: Optional[int] = None
+) -> List[CommentNode]:
+    """
+    Assemble une liste plate de commentaires en arbres, en O(n).
+
+    Un commentaire dont le parent n'est pas dans la liste est une tête de
+    fil. L'ordre relatif des commentaires est conservé : triés par
+    (created_at, id) en entrée, les têtes et les réponses de chaque nœud
+    le restent. Les nœuds au-delà de `max_depth` sont écartés et leur
+    parent marqué `has_more_replies`.
+    """
+    comments = list(comments)
+    nodes: Dict[UUID, CommentNode] = {c.id: CommentNode(comment=c) for c in comments}
+
+    roots: List[CommentNode] = []
+    for comment in comments:
+        node = nodes[comment.id]
+        parent = nodes.get(comment.parent_comment_id) if comment.parent_comment_id else None
+        if parent is None:
+            roots.append(node)
+        else:
+            parent.replies.append(node)
+
+    # Profondeurs en largeur depuis les têtes : chaque nœud visité une fois
+    level = roots
+    depth = 0
+    while level:
+        next_level = []
+        for node in level:
+            node.depth = depth
+            if max_depth is not None and depth >= max_depth and node.replies:
+                node.has_more_replies = True
+                node.replies = []
+            next_level.extend(node.replies)
+        level = next_level
+        depth += 1
+
+    return roots
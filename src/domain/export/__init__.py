@@ -0,0 +1,2 @@
+# src/domain/export/__init__.py
+"""Module d'export RGPD du domaine."""
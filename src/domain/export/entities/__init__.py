@@ -0,0 +1,5 @@
+# src/domain/export/entities/__init__.py
+"""Entites du domaine export."""
+from src.domain.export.entities.export_job import ExportJob, ExportJobStatus
+
+__all__ = ['ExportJob', 'ExportJobStatus']
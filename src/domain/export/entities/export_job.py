@@ -0,0 +1,119 @@
+# src/domain/export/entities/export_job.py
+"""Entite ExportJob : export RGPD genere en arriere-plan."""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import Optional
+from uuid import UUID, uuid4
+
+from src.domain.shared.domain_exception import DomainException
+
+
+class ExportJobStatus(Enum):
+    """Etats d'un export."""
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    EXPIRED = "expired"
+
+
+class InvalidExportJobTransition(DomainException):
+    """Exception pour un changement d'etat impossible."""
+    pass
+
+
+@dataclass
+class ExportJob:
+    """
+    Demande d'export des donnees d'un utilisateur.
+    
+    Cycle de vie: PENDING -> RUNNING -> COMPLETED | FAILED, puis
+    COMPLETED -> EXPIRED quand l'archive est purgee.
+    L'archive produite n'est telechargeable qu'a l'etat COMPLETED.
+    """
+    user_id: UUID
+    status: ExportJobStatus = ExportJobStatus.PENDING
+    archive_path: Optional[str] = None
+    archive_size: Optional[int] = None
+    error: Optional[str] = None
+    id: UUID = field(default_factory=uuid4)
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    
+    @classmethod
+    def create(cls, user_id: UUID) -> "ExportJob":
+        """Factory pour une nouvelle demande d'export."""
+        return cls(user_id=user_id)
+    
+    def start(self, now: Optional[datetime] = None) -> None:
+        """Passe le job a l'etat RUNNING."""
+        if self.status != ExportJobStatus.PENDING:
+            raise InvalidExportJobTransition(
+                f"Impossible de demarrer un export au statut {self.status.value}"
+            )
+        self.status = ExportJobStatus.RUNNING
+        self.started_at = now or datetime.utcnow()
+    
+    def complete(self, archive_path: str, archive_size: int) -> None:
+        """Enregistre l'archive produite."""
+        if self.status != ExportJobStatus.RUNNING:
+            raise InvalidExportJobTransition(
+                f"Impossible de terminer un export au statut {self.status.value}"
+            )
+        self.status = ExportJobStatus.COMPLETED
+        self.archive_path = archive_path
+        self.archive_size = archive_size
+        self.completed_at = datetime.utcnow()
+    
+    def fail(self, error: str) -> None:
+        """Marque le job en echec."""
+        self.status = ExportJobStatus.FAILED
+        self.error = error
+        self.completed_at = datetime.utcnow()
+    
+    def time_out(self) -> None:
+        """Marque en echec un job qui a depasse son delai (voir is_stale)."""
+        self.fail("Delai d'execution depasse")
+    
+    def expire(self) -> None:
+        """Constate la suppression de l'archive."""
+        if self.status != ExportJobStatus.COMPLETED:
+            raise InvalidExportJobTransition(
+                f"Impossible d'expirer un export au statut {self.status.value}"
+            )
+        self.status = ExportJobStatus.EXPIRED
+        self.archive_path = None
+        self.archive_size = None
+    
+    def is_stale(self, timeout: timedelta, now: Optional[datetime] = None) -> bool:
+        """
+        Vrai si le job, en attente ou en cours, a depasse son delai.
+        
+        Un worker arrete en cours d'execution laisse le job RUNNING :
+        passe ce delai, il est tenu pour perdu.
+        """
+        if self.is_finished:
+            return False
+        since = self.started_at or self.created_at
+        return since < (now or datetime.utcnow()) - timeout
+    
+    def is_archive_expired(self, ttl: timedelta, now: Optional[datetime] = None) -> bool:
+        """Vrai si l'archive d'un job termine a depasse sa duree de conservation."""
+        if self.status != ExportJobStatus.COMPLETED or self.completed_at is None:
+            return False
+        return self.completed_at < (now or datetime.utcnow()) - ttl
+    
+    @property
+    def is_finished(self) -> bool:
+        """Vrai si le job ne changera plus d'etat."""
+        return self.status in (
+            ExportJobStatus.COMPLETED, ExportJobStatus.FAILED, ExportJobStatus.EXPIRED
+        )
+    
+    @property
+    def is_downloadable(self) -> bool:
+        """Vrai si l'archive est disponible."""
+        return self.status == ExportJobStatus.COMPLETED and self.archive_path is not None
@@ -0,0 +1,53 @@
+# src/domain/export/repositories/export_job_repository.py
+"""Interface (Port) pour le repository ExportJob."""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from src.domain.export.entities.export_job import ExportJob
+
+
+class IExportJobRepository(ABC):
+    """
+    Interface pour le repository ExportJob.
+    
+    Partagé entre l'API (création, suivi) et le worker (exécution).
+    """
+    
+    @abstractmethod
+    def save(self, job: ExportJob) -> ExportJob:
+        """Persiste un job d'export."""
+        pass
+    
+    @abstractmethod
+    def find_by_id(self, job_id: UUID) -> Optional[ExportJob]:
+        """Récupère un job par son ID."""
+        pass
+    
+    @abstractmethod
+    def claim(self, job_id: UUID, started_at: datetime) -> bool:
+        """
+        Passe un job de PENDING à RUNNING de façon atomique.
+        
+        Returns:
+            bool: False si le job est introuvable ou n'est plus en attente
+                (déjà pris par une autre exécution de la tâche).
+        """
+        pass
+    
+    @abstractmethod
+    def find_active_for_user(self, user_id: UUID) -> Optional[ExportJob]:
+        """Récupère le job en attente ou en cours d'un utilisateur, s'il existe."""
+        pass
+    
+    @abstractmethod
+    def find_stale(self, before: datetime) -> List[ExportJob]:
+        """Récupère les jobs en attente ou en cours démarrés (ou créés) avant `before`."""
+        pass
+    
+    @abstractmethod
+    def find_completed_before(self, before: datetime) -> List[ExportJob]:
+        """Récupère les jobs terminés avec succès avant `before`."""
+        pass
@@ -0,0 +1,27 @@
+# src/domain/identity/events/__init__.py
+"""Domain Events pour le contexte Identity."""
+
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from src.domain.collaboration.events import DomainEvent
+
+
+@dataclass(frozen=True)
+class UserRegistered(DomainEvent):
+    """Événement émis quand un utilisateur s'inscrit."""
+    user_id: UUID = field(default=None)  # type: ignore
+    
+    def __post_init__(self):
+        if self.user_id is None:
+            raise ValueError("user_id is required")
+
+
+@dataclass(frozen=True)
+class UserProfileUpdated(DomainEvent):
+    """Événement émis quand le nom d'un utilisateur change."""
+    user_id: UUID = field(default=None)  # type: ignore
+    
+    def __post_init__(self):
+        if self.user_id is None:
+            raise ValueError("user_id is required")
@@ -2,11 +2,12 @@
 """Interface (Port) pour le repository User."""
 
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Dict, Iterable
 from uuid import UUID
 
 from src.domain.identity.entities.user import User
 from src.domain.identity.value_objects.email import Email
+from src.domain.identity.value_objects.user_summary import UserSummary
 
 
 class IUserRepository(ABC):
@@ -16,6 +17,16 @@ class IUserRepository(ABC):
     Définit le contrat pour la persistance des utilisateurs.
     """
     
+    @abstractmethod
+    def add(self, user: User) -> User:
+        """
+        Persiste un nouvel utilisateur.
+        
+        À préférer à `save` quand l'entité vient d'être créée : l'insertion
+        se fait sans vérifier au préalable si elle existe.
+        """
+        pass
+    
     @abstractmethod
     def save(self, user: User) -> User:
         """Persiste un utilisateur."""
@@ -26,6 +37,16 @@ class IUserRepository(ABC):
         """Récupère un utilisateur par son ID."""
         pass
     
+    @abstractmethod
+    def find_by_ids(self, user_ids: Iterable[UUID]) -> Dict[UUID, UserSummary]:
+        """Récupère les données d'affichage de plusieurs utilisateurs (ids inconnus absents du dict)."""
+        pass
+    
+    @abstractmethod
+    def find_entities_by_ids(self, user_ids: Iterable[UUID]) -> Dict[UUID, User]:
+        """Récupère plusieurs utilisateurs complets, rôle et statut inclus (ids inconnus absents du dict)."""
+        pass
+    
     @abstractmethod
     def find_by_email(self, email: Email) -> Optional[User]:
         """Récupère un utilisateur par son email."""
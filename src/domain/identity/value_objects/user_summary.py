@@ -0,0 +1,27 @@
+# src/domain/identity/value_objects/user_summary.py
+"""Value Object pour l'affichage d'un utilisateur."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class UserSummary:
+    """
+    Projection en lecture seule d'un utilisateur.
+
+    Ne contient que les colonnes d'affichage (pas de mot de passe ni de
+    rôle), pour enrichir les listes de lettres, commentaires et membres.
+    """
+    id: UUID
+    first_name: str
+    last_name: str
+    email: str
+    created_at: Optional[datetime] = None
+
+    @property
+    def full_name(self) -> str:
+        """Retourne le nom complet."""
+        return f"{self.first_name} {self.last_name}"
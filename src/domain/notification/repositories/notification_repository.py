@@ -0,0 +1,63 @@
+# src/domain/notification/repositories/notification_repository.py
+"""Interface (Port) pour le repository Notification."""
+
+from abc import ABC, abstractmethod
+from typing import List, Optional, Sequence
+from uuid import UUID
+
+from src.domain.notification.entities.notification import Notification
+
+
+class INotificationRepository(ABC):
+    """
+    Interface pour le repository Notification.
+    
+    Toutes les lectures sont bornées à un utilisateur : les
+    implémentations doivent éviter de parcourir les notifications
+    des autres utilisateurs.
+    """
+    
+    @abstractmethod
+    def save(self, notification: Notification) -> None:
+        """Persiste une notification."""
+        pass
+    
+    @abstractmethod
+    def save_many(self, notifications: Sequence[Notification]) -> None:
+        """Persiste des notifications nouvelles en une seule écriture."""
+        pass
+    
+    @abstractmethod
+    def find_by_id(self, notification_id: UUID) -> Optional[Notification]:
+        """Récupère une notification par son ID."""
+        pass
+    
+    @abstractmethod
+    def find_by_user(
+        self,
+        user_id: UUID,
+        unread_only: bool = False,
+        limit: int = 50
+    ) -> List[Notification]:
+        """Récupère les notifications d'un utilisateur, les plus récentes en premier."""
+        pass
+    
+    @abstractmethod
+    def count_unread(self, user_id: UUID) -> int:
+        """Compte les notifications non lues d'un utilisateur."""
+        pass
+    
+    @abstractmethod
+    def mark_as_read(self, notification_id: UUID) -> bool:
+        """Marque une notification comme lue. Retourne False si elle n'existe pas."""
+        pass
+    
+    @abstractmethod
+    def mark_all_as_read(self, user_id: UUID) -> int:
+        """Marque toutes les notifications non lues comme lues. Retourne leur nombre."""
+        pass
+    
+    @abstractmethod
+    def delete(self, notification_id: UUID) -> bool:
+        """Supprime une notification. Retourne False si elle n'existe pas."""
+        pass
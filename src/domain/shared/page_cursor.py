@@ -0,0 +1,51 @@
+# src/domain/shared/page_cursor.py
+"""Curseur opaque pour la pagination par clé (keyset)."""
+
+import base64
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class PageCursor:
+    """
+    Value Object représentant une position dans une liste triée.
+
+    Encode le couple (created_at, id) du dernier élément retourné :
+    la page suivante reprend strictement après cette position, ce qui
+    évite les OFFSET coûteux sur les pages profondes.
+    """
+    created_at: datetime
+    id: UUID
+
+    _SEPARATOR = "|"
+
+    @classmethod
+    def from_entity(cls, entity) -> "PageCursor":
+        """Construit le curseur pointant sur une entité (created_at, id)."""
+        return cls(created_at=entity.created_at, id=entity.id)
+
+    def encode(self) -> str:
+        """Sérialise le curseur en jeton URL-safe."""
+        raw = f"{self.created_at.isoformat()}{self._SEPARATOR}{self.id}"
+        return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "PageCursor":
+        """
+        Reconstruit un curseur depuis un jeton.
+
+        Raises:
+            ValueError: Si le jeton est malformé.
+        """
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            raw = base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8")
+            created_at, entity_id = raw.split(cls._SEPARATOR, 1)
+            return cls(created_at=datetime.fromisoformat(created_at), id=UUID(entity_id))
+        except (ValueError, UnicodeError) as e:
+            raise ValueError(f"Curseur invalide: {token}") from e
+
+    def __str__(self) -> str:
+        return self.encode()
@@ -0,0 +1,25 @@
+# src/infrastructure/cache/cached_admin_stats_query.py
+"""Décorateur de cache pour les statistiques admin."""
+
+from src.application.dtos.admin_stats_dto import AdminStatsDTO
+from src.application.interfaces.admin_stats_query import IAdminStatsQuery
+from src.infrastructure.cache.ttl_cache import TTLCache
+
+
+class CachedAdminStatsQuery(IAdminStatsQuery):
+    """
+    Met en cache le résultat d'un IAdminStatsQuery pendant le TTL du cache.
+    
+    Plusieurs admins qui gardent le tableau de bord ouvert ne déclenchent
+    qu'un calcul par période.
+    """
+    
+    CACHE_KEY = "admin:stats"
+    
+    def __init__(self, inner: IAdminStatsQuery, cache: TTLCache):
+        self._inner = inner
+        self._cache = cache
+    
+    def get_stats(self) -> AdminStatsDTO:
+        """Retourne les statistiques en cache ou les recalcule."""
+        return self._cache.get_or_set(self.CACHE_KEY, self._inner.get_stats)
@@ -0,0 +1,90 @@
+# src/infrastructure/cache/counted_notification_repository.py
+"""Décorateur maintenant les compteurs Redis de notifications non lues."""
+
+from collections import Counter
+from typing import List, Optional, Sequence
+from uuid import UUID
+
+from src.domain.notification.entities.notification import Notification
+from src.domain.notification.repositories.notification_repository import INotificationRepository
+from src.infrastructure.cache.unread_counter import RedisUnreadCounter
+
+
+class CountedNotificationRepository(INotificationRepository):
+    """
+    Sert `count_unread` depuis Redis et tient le compteur à jour.
+    
+    Le badge de notifications est interrogé en continu par le frontend ;
+    seule la première lecture (ou celle qui suit une expiration) compte
+    en base. Les écritures sont déléguées au repository décoré puis
+    répercutées sur le compteur (INCRBY/DECRBY atomiques).
+    """
+    
+    def __init__(self, inner: INotificationRepository, counter: RedisUnreadCounter):
+        self._inner = inner
+        self._counter = counter
+    
+    def save(self, notification: Notification) -> None:
+        """Persiste une notification et ajuste le compteur."""
+        if not self._counter.enabled:
+            self._inner.save(notification)
+            return
+        
+        existing = self._inner.find_by_id(notification.id)
+        self._inner.save(notification)
+        if existing is None:
+            if not notification.read:
+                self._counter.adjust(notification.user_id, 1)
+        elif existing.read != notification.read or existing.user_id != notification.user_id:
+            self._counter.invalidate(existing.user_id)
+            self._counter.invalidate(notification.user_id)
+    
+    def save_many(self, notifications: Sequence[Notification]) -> None:
+        """Persiste des notifications nouvelles, un ajustement par destinataire."""
+        self._inner.save_many(notifications)
+        unread = Counter(n.user_id for n in notifications if not n.read)
+        for user_id, count in unread.items():
+            self._counter.adjust(user_id, count)
+    
+    def find_by_id(self, notification_id: UUID) -> Optional[Notification]:
+        return self._inner.find_by_id(notification_id)
+    
+    def find_by_user(
+        self,
+        user_id: UUID,
+        unread_only: bool = False,
+        limit: int = 50
+    ) -> List[Notification]:
+        return self._inner.find_by_user(user_id, unread_only, limit)
+    
+    def count_unread(self, user_id: UUID) -> int:
+        """Compteur Redis, ou comptage en base (qui réamorce le compteur)."""
+        cached = self._counter.get(user_id)
+        if cached is not None:
+            return cached
+        count = self._inner.count_unread(user_id)
+        self._counter.prime(user_id, count)
+        return count
+    
+    def mark_as_read(self, notification_id: UUID) -> bool:
+        """Marque une notification comme lue et décrémente si elle ne l'était pas."""
+        notification = self._inner.find_by_id(notification_id) if self._counter.enabled else None
+        was_unread = notification is not None and not notification.read
+        marked = self._inner.mark_as_read(notification_id)
+        if marked and was_unread:
+            self._counter.adjust(notification.user_id, -1)
+        return marked
+    
+    def mark_all_as_read(self, user_id: UUID) -> int:
+        """Marque tout comme lu et retire du compteur le nombre de lignes modifiées."""
+        count = self._inner.mark_all_as_read(user_id)
+        self._counter.adjust(user_id, -count)
+        return count
+    
+    def delete(self, notification_id: UUID) -> bool:
+        """Supprime une notification et décrémente si elle était non lue."""
+        notification = self._inner.find_by_id(notification_id) if self._counter.enabled else None
+        deleted = self._inner.delete(notification_id)
+        if deleted and notification is not None and not notification.read:
+            self._counter.adjust(notification.user_id, -1)
+        return deleted
@@ -0,0 +1,125 @@
+# src/infrastructure/cache/unread_counter.py
+"""Compteurs Redis de notifications non lues."""
+
+import logging
+from typing import Callable, Iterator, Optional
+from uuid import UUID
+
+import redis
+
+
+logger = logging.getLogger(__name__)
+
+
+# INCRBY appliqué seulement à un compteur existant (créé à partir de 0,
+# sa valeur serait fausse), borné à 0. Retourne la nouvelle valeur ou nil.
+_ADJUST_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return nil
+end
+local value = redis.call('INCRBY', KEYS[1], ARGV[1])
+if value < 0 then
+    redis.call('SET', KEYS[1], 0, 'KEEPTTL')
+    value = 0
+end
+return value
+"""
+
+
+class RedisUnreadCounter:
+    """
+    Compteur de notifications non lues par utilisateur, stocké dans Redis.
+    
+    Le compteur est un cache de `count_unread` :
+    - absent, il est recalculé depuis la base puis posé (SET NX) ;
+    - les créations, lectures et suppressions l'ajustent atomiquement ;
+    - il expire après `ttl` secondes et la réconciliation corrige la
+      dérive (ajustements d'une transaction annulée, course entre deux
+      lectures de la même notification).
+    
+    Sans client, ou si Redis est indisponible, le compteur se comporte
+    comme absent : les appelants retombent sur la base.
+    """
+    
+    KEY_PREFIX = "notifications:unread:"
+    DEFAULT_TTL = 3600
+    
+    def __init__(self, client: Optional[redis.Redis], ttl: int = DEFAULT_TTL):
+        self._client = client
+        self._ttl = ttl
+        self._adjust = client.register_script(_ADJUST_SCRIPT) if client is not None else None
+    
+    @property
+    def enabled(self) -> bool:
+        return self._client is not None
+    
+    def get(self, user_id: UUID) -> Optional[int]:
+        """Valeur du compteur, ou None s'il est absent ou Redis indisponible."""
+        if not self.enabled:
+            return None
+        try:
+            value = self._client.get(self._key(user_id))
+        except redis.RedisError as e:
+            logger.warning(f"Compteur de non-lues indisponible: {e}")
+            return None
+        return int(value) if value is not None else None
+    
+    def prime(self, user_id: UUID, count: int) -> None:
+        """Pose le compteur s'il est absent (un ajustement concurrent l'emporte)."""
+        self._safely(lambda: self._client.set(self._key(user_id), count, ex=self._ttl, nx=True))
+    
+    def adjust(self, user_id: UUID, delta: int) -> None:
+        """Ajoute `delta` (négatif pour décrémenter) à un compteur existant."""
+        if delta:
+            self._safely(lambda: self._adjust(keys=[self._key(user_id)], args=[delta]))
+    
+    def invalidate(self, user_id: UUID) -> None:
+        """Supprime le compteur : il sera recalculé à la prochaine lecture."""
+        self._safely(lambda: self._client.delete(self._key(user_id)))
+    
+    def reconcile(self, count_unread: Callable[[UUID], int]) -> int:
+        """
+        Recalcule depuis la source de vérité chaque compteur présent.
+        
+        Args:
+            count_unread: Comptage de référence (repository SQL).
+            
+        Returns:
+            Nombre de compteurs corrigés.
+        """
+        fixed = 0
+        for user_id in self._user_ids():
+            expected = count_unread(user_id)
+            if self.get(user_id) != expected:
+                self._safely(lambda: self._client.set(self._key(user_id), expected, ex=self._ttl))
+                fixed += 1
+        return fixed
+    
+    def _user_ids(self) -> Iterator[UUID]:
+        """Utilisateurs ayant un compteur en cache."""
+        if not self.enabled:
+            return
+        try:
+            for key in self._client.scan_iter(match=f"{self.KEY_PREFIX}*", count=500):
+                key = key.decode() if isinstance(key, bytes) else key
+                yield UUID(key[len(self.KEY_PREFIX):])
+        except redis.RedisError as e:
+            logger.warning(f"Réconciliation des compteurs interrompue: {e}")
+    
+    def _key(self, user_id: UUID) -> str:
+        return f"{self.KEY_PREFIX}{user_id}"
+    
+    def _safely(self, operation: Callable[[], object]) -> None:
+        """Exécute une écriture Redis ; une erreur n'interrompt pas l'appelant."""
+        if not self.enabled:
+            return
+        try:
+            operation()
+        except redis.RedisError as e:
+            logger.warning(f"Mise à jour du compteur de non-lues échouée: {e}")
+
+
+def create_unread_counter(redis_url: Optional[str]) -> RedisUnreadCounter:
+    """Crée le compteur (désactivé sans REDIS_URL)."""
+    client = redis.from_url(redis_url, socket_timeout=0.5) if redis_url else None
+    return RedisUnreadCounter(client)
@@ -0,0 +1,67 @@
+# src/infrastructure/cache/write_stickiness.py
+"""Fenêtre de lecture sur le primaire après une écriture."""
+
+import logging
+from typing import Optional
+from uuid import UUID
+
+import redis
+
+from src.infrastructure.cache.ttl_cache import TTLCache
+
+
+logger = logging.getLogger(__name__)
+
+
+class WriteStickiness:
+    """
+    Mémorise les utilisateurs ayant écrit il y a moins de `window` secondes.
+
+    Pendant cette fenêtre, leurs lectures restent sur le primaire : un
+    réplica en retard ne doit pas leur cacher ce qu'ils viennent d'écrire.
+
+    Avec Redis, la fenêtre est partagée entre les workers ; sans Redis
+    (ou s'il est indisponible), elle est locale au processus.
+    """
+
+    KEY_PREFIX = "db:primary:"
+
+    def __init__(self, window: int, client: Optional[redis.Redis] = None):
+        self._window = window
+        self._client = client
+        self._local = TTLCache(ttl=window)
+
+    def mark(self, user_id: UUID) -> None:
+        """Ouvre (ou prolonge) la fenêtre d'un utilisateur."""
+        if self._window <= 0:
+            return
+        self._local.set(user_id, True)
+        if self._client is None:
+            return
+        try:
+            self._client.set(self._key(user_id), 1, ex=self._window)
+        except redis.RedisError as e:
+            logger.warning(f"Fenêtre de lecture sur le primaire non partagée: {e}")
+
+    def is_sticky(self, user_id: UUID) -> bool:
+        """True si les lectures de l'utilisateur doivent rester sur le primaire."""
+        if self._window <= 0:
+            return False
+        if self._local.get(user_id):
+            return True
+        if self._client is None:
+            return False
+        try:
+            return bool(self._client.exists(self._key(user_id)))
+        except redis.RedisError as e:
+            logger.warning(f"Fenêtre de lecture sur le primaire indisponible: {e}")
+            return True
+
+    def _key(self, user_id: UUID) -> str:
+        return f"{self.KEY_PREFIX}{user_id}"
+
+
+def create_write_stickiness(window: int, redis_url: Optional[str]) -> WriteStickiness:
+    """Crée la fenêtre (partagée via Redis si REDIS_URL est défini)."""
+    client = redis.from_url(redis_url, socket_timeout=0.5) if redis_url else None
+    return WriteStickiness(window, client)
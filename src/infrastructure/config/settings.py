@@ -3,6 +3,7 @@
 
 import os
 import secrets
+import tempfile
 from dataclasses import dataclass
 from typing import Optional
 
@@ -18,6 +19,17 @@ class Config:
     
     # Database
     DATABASE_URL: str = "sqlite:///./data/alvs.db"
+    DATABASE_REPLICA_URLS: tuple = ()  # Réplicas en lecture (vide = tout sur le primaire)
+    REPLICA_STICKINESS_SECONDS: int = 5  # Lectures sur le primaire après une écriture de l'utilisateur
+    
+    # Pool de connexions (par processus : workers gunicorn × (size + overflow) ≤ max_connections)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30  # secondes d'attente d'une connexion libre
+    DB_POOL_RECYCLE: int = 1800  # secondes avant recyclage d'une connexion (-1 = jamais)
+    DB_POOL_PRE_PING: bool = True
+    DB_QUERY_REPEAT_THRESHOLD: int = 10  # Alerte N+1 au-delà de N exécutions d'une requête (0 = désactivé)
+    DB_CREATE_TABLES: bool = True  # create_all au démarrage ; sinon `alembic upgrade head`
     
     # Redis
     REDIS_URL: Optional[str] = None
@@ -50,12 +62,41 @@ class Config:
     MAX_CONTENT_LENGTH: int = 16 * 1024 * 1024  # 16 MB
     ALLOWED_EXTENSIONS: frozenset = frozenset({'png', 'jpg', 'jpeg', 'gif', 'mp3', 'wav', 'm4a', 'pdf'})
     
+    # Cache
+    ADMIN_STATS_CACHE_TTL: int = 60  # secondes (0 = désactivé)
+    
+    # Jobs d'export RGPD
+    CELERY_BROKER_URL: Optional[str] = None  # Défaut: REDIS_URL
+    EXPORT_JOB_EXECUTOR: str = "inline"  # "celery" (worker) ou "inline" (dans la requête)
+    EXPORT_FOLDER: str = "data/exports"
+    EXPORT_JOB_TIMEOUT: int = 3600  # secondes ; au-delà, un job actif est tenu pour perdu
+    EXPORT_ARCHIVE_TTL: int = 7 * 86400  # secondes de conservation des archives
+    EXPORT_PURGE_INTERVAL: int = 3600  # secondes, tâche Celery beat
+    
+    # Notifications
+    NOTIFICATION_STORE: str = "sql"  # "sql" (table notifications) ou "memory" (mono-processus)
+    NOTIFICATION_RETENTION_PER_USER: int = 500  # Plafond du store "memory" (0 = illimité)
+    UNREAD_COUNTER_RECONCILE_INTERVAL: int = 600  # secondes, tâche Celery beat
+    
     def validate(self) -> None:
         """Valide la configuration au démarrage."""
         if not self.SECRET_KEY:
             raise ValueError("SECRET_KEY ne peut pas être vide")
         if not self.JWT_SECRET_KEY:
             raise ValueError("JWT_SECRET_KEY ne peut pas être vide")
+        if self.EXPORT_JOB_EXECUTOR not in ("celery", "inline"):
+            raise ValueError("EXPORT_JOB_EXECUTOR doit valoir 'celery' ou 'inline'")
+        if self.NOTIFICATION_STORE not in ("sql", "memory"):
+            raise ValueError("NOTIFICATION_STORE doit valoir 'sql' ou 'memory'")
+        if self.DB_POOL_SIZE < 1 or self.DB_MAX_OVERFLOW < 0:
+            raise ValueError("DB_POOL_SIZE doit être ≥ 1 et DB_MAX_OVERFLOW ≥ 0")
+
+
+def _split_urls(value: Optional[str]) -> tuple:
+    """Découpe une liste d'URLs séparées par des virgules."""
+    if not value:
+        return ()
+    return tuple(url.strip() for url in value.split(",") if url.strip())
 
 
 class DevelopmentConfig(Config):
@@ -82,6 +123,15 @@ class DevelopmentConfig(Config):
             SECRET_KEY=secret_key,
             DEBUG=os.getenv("FLASK_DEBUG", "1") == "1",
             DATABASE_URL=os.getenv("DATABASE_URL", "sqlite:///./data/alvs.db"),
+            DATABASE_REPLICA_URLS=_split_urls(os.getenv("DATABASE_REPLICA_URLS")),
+            REPLICA_STICKINESS_SECONDS=int(os.getenv("REPLICA_STICKINESS_SECONDS", "5")),
+            DB_POOL_SIZE=int(os.getenv("DB_POOL_SIZE", "5")),
+            DB_MAX_OVERFLOW=int(os.getenv("DB_MAX_OVERFLOW", "10")),
+            DB_POOL_TIMEOUT=int(os.getenv("DB_POOL_TIMEOUT", "30")),
+            DB_POOL_RECYCLE=int(os.getenv("DB_POOL_RECYCLE", "1800")),
+            DB_POOL_PRE_PING=os.getenv("DB_POOL_PRE_PING", "1") == "1",
+            DB_QUERY_REPEAT_THRESHOLD=int(os.getenv("DB_QUERY_REPEAT_THRESHOLD", "10")),
+            DB_CREATE_TABLES=os.getenv("DB_CREATE_TABLES", "1") == "1",
             REDIS_URL=os.getenv("REDIS_URL"),
             JWT_SECRET_KEY=jwt_secret,
             JWT_ACCESS_TOKEN_EXPIRES=int(os.getenv("JWT_ACCESS_TOKEN_EXPIRES", "900")),
@@ -93,6 +143,16 @@ class DevelopmentConfig(Config):
             RATELIMIT_STORAGE_URL=os.getenv("REDIS_URL"),
             UPLOAD_FOLDER=os.getenv("UPLOAD_FOLDER", "static/uploads"),
             MAX_CONTENT_LENGTH=int(os.getenv("MAX_CONTENT_LENGTH", str(16 * 1024 * 1024))),
+            ADMIN_STATS_CACHE_TTL=int(os.getenv("ADMIN_STATS_CACHE_TTL", "60")),
+            CELERY_BROKER_URL=os.getenv("CELERY_BROKER_URL"),
+            EXPORT_JOB_EXECUTOR=os.getenv("EXPORT_JOB_EXECUTOR", "inline"),
+            EXPORT_FOLDER=os.getenv("EXPORT_FOLDER", "data/exports"),
+            EXPORT_JOB_TIMEOUT=int(os.getenv("EXPORT_JOB_TIMEOUT", "3600")),
+            EXPORT_ARCHIVE_TTL=int(os.getenv("EXPORT_ARCHIVE_TTL", str(7 * 86400))),
+            EXPORT_PURGE_INTERVAL=int(os.getenv("EXPORT_PURGE_INTERVAL", "3600")),
+            NOTIFICATION_STORE=os.getenv("NOTIFICATION_STORE", "sql"),
+            NOTIFICATION_RETENTION_PER_USER=int(os.getenv("NOTIFICATION_RETENTION_PER_USER", "500")),
+            UNREAD_COUNTER_RECONCILE_INTERVAL=int(os.getenv("UNREAD_COUNTER_RECONCILE_INTERVAL", "600")),
         )
 
 
@@ -123,6 +183,9 @@ class TestConfig(Config):
             RATELIMIT_STORAGE_URL=None,
             UPLOAD_FOLDER="test_uploads",
             MAX_CONTENT_LENGTH=int(os.getenv("MAX_CONTENT_LENGTH", str(16 * 1024 * 1024))),
+            ADMIN_STATS_CACHE_TTL=int(os.getenv("ADMIN_STATS_CACHE_TTL", "0")),  # Pas de cache entre tests
+            EXPORT_JOB_EXECUTOR="inline",  # Exports exécutés dans la requête
+            EXPORT_FOLDER=os.getenv("EXPORT_FOLDER", os.path.join(tempfile.gettempdir(), "alvs_test_exports")),
         )
 
 
@@ -143,6 +206,15 @@ class ProductionConfig(Config):
             SECRET_KEY=secret_key,
             DEBUG=False,
             DATABASE_URL=os.getenv("DATABASE_URL", "sqlite:///./data/alvs.db"),
+            DATABASE_REPLICA_URLS=_split_urls(os.getenv("DATABASE_REPLICA_URLS")),
+            REPLICA_STICKINESS_SECONDS=int(os.getenv("REPLICA_STICKINESS_SECONDS", "5")),
+            DB_POOL_SIZE=int(os.getenv("DB_POOL_SIZE", "5")),
+            DB_MAX_OVERFLOW=int(os.getenv("DB_MAX_OVERFLOW", "10")),
+            DB_POOL_TIMEOUT=int(os.getenv("DB_POOL_TIMEOUT", "30")),
+            DB_POOL_RECYCLE=int(os.getenv("DB_POOL_RECYCLE", "1800")),
+            DB_POOL_PRE_PING=os.getenv("DB_POOL_PRE_PING", "1") == "1",
+            DB_QUERY_REPEAT_THRESHOLD=int(os.getenv("DB_QUERY_REPEAT_THRESHOLD", "10")),
+            DB_CREATE_TABLES=os.getenv("DB_CREATE_TABLES", "0") == "1",  # Schéma géré par Alembic
             REDIS_URL=os.getenv("REDIS_URL"),
             JWT_SECRET_KEY=jwt_secret,
             JWT_ACCESS_TOKEN_EXPIRES=int(os.getenv("JWT_ACCESS_TOKEN_EXPIRES", "900")),
@@ -152,6 +224,16 @@ class ProductionConfig(Config):
             RATELIMIT_STORAGE_URL=os.getenv("REDIS_URL"),
             UPLOAD_FOLDER=os.getenv("UPLOAD_FOLDER", "static/uploads"),
             MAX_CONTENT_LENGTH=int(os.getenv("MAX_CONTENT_LENGTH", str(16 * 1024 * 1024))),
+            ADMIN_STATS_CACHE_TTL=int(os.getenv("ADMIN_STATS_CACHE_TTL", "60")),
+            CELERY_BROKER_URL=os.getenv("CELERY_BROKER_URL"),
+            EXPORT_JOB_EXECUTOR=os.getenv("EXPORT_JOB_EXECUTOR", "celery"),
+            EXPORT_FOLDER=os.getenv("EXPORT_FOLDER", "data/exports"),
+            EXPORT_JOB_TIMEOUT=int(os.getenv("EXPORT_JOB_TIMEOUT", "3600")),
+            EXPORT_ARCHIVE_TTL=int(os.getenv("EXPORT_ARCHIVE_TTL", str(7 * 86400))),
+            EXPORT_PURGE_INTERVAL=int(os.getenv("EXPORT_PURGE_INTERVAL", "3600")),
+            NOTIFICATION_STORE=os.getenv("NOTIFICATION_STORE", "sql"),
+            NOTIFICATION_RETENTION_PER_USER=int(os.getenv("NOTIFICATION_RETENTION_PER_USER", "500")),
+            UNREAD_COUNTER_RECONCILE_INTERVAL=int(os.getenv("UNREAD_COUNTER_RECONCILE_INTERVAL", "600")),
         )
     
     def _validate_required_secrets(self):
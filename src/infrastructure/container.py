@@ -13,7 +13,7 @@ from src.infrastructure.config.settings import Settings, get_settings
 
 # Database
 from src.infrastructure.persistence.sqlalchemy.database import (
-    create_engine_from_config, create_session_factory, get_scoped_session
+    create_engine_from_config, create_replica_set, create_session_factory, get_scoped_session
 )
 
 # Repositories SQLAlchemy
@@ -21,6 +21,7 @@ from src.infrastructure.persistence.sqlalchemy.repositories.user_repository impo
 from src.infrastructure.persistence.sqlalchemy.repositories.colli_repository import SQLAlchemyColliRepository
 from src.infrastructure.persistence.sqlalchemy.repositories.letter_repository import SQLAlchemyLetterRepository
 from src.infrastructure.persistence.sqlalchemy.repositories.comment_repository import SQLAlchemyCommentRepository
+from src.infrastructure.persistence.sqlalchemy.repositories.membership_repository import SQLAlchemyMembershipRepository
 
 # Use Cases
 from src.application.use_cases.colli.create_colli import CreateColliUseCase
@@ -54,7 +55,8 @@ class Container(containers.DeclarativeContainer):
     # =========================================================================
 
     engine = providers.Singleton(create_engine_from_config)
-    session_factory = providers.Singleton(create_session_factory, engine=engine)
+    replica_set = providers.Singleton(create_replica_set)
+    session_factory = providers.Singleton(create_session_factory, engine=engine, replicas=replica_set)
     db_session = providers.Singleton(get_scoped_session, session_factory=session_factory)
 
     # =========================================================================
@@ -65,10 +67,66 @@ class Container(containers.DeclarativeContainer):
     colli_repository = providers.Factory(SQLAlchemyColliRepository, session=db_session)
     letter_repository = providers.Factory(SQLAlchemyLetterRepository, session=db_session)
     comment_repository = providers.Factory(SQLAlchemyCommentRepository, session=db_session)
+    membership_repository = providers.Factory(SQLAlchemyMembershipRepository, session=db_session)
 
-    # Notification (pas de table SQLAlchemy — reste in-memory)
-    notification_repository = providers.Singleton(
-        "src.infrastructure.persistence.in_memory.notification_repository.InMemoryNotificationRepository"
+    # Notifications : table SQL (compteurs de non-lues dans Redis si configuré),
+    # ou store mémoire pour un déploiement mono-processus
+    sql_notification_repository = providers.Factory(
+        "src.infrastructure.persistence.sqlalchemy.repositories.notification_repository.SQLAlchemyNotificationRepository",
+        session=db_session
+    )
+    
+    unread_counter = providers.Singleton(
+        "src.infrastructure.cache.unread_counter.create_unread_counter",
+        redis_url=config.provided.REDIS_URL
+    )
+    
+    write_stickiness = providers.Singleton(
+        "src.infrastructure.cache.write_stickiness.create_write_stickiness",
+        window=config.provided.REPLICA_STICKINESS_SECONDS,
+        redis_url=config.provided.REDIS_URL
+    )
+    
+    notification_repository = providers.Selector(
+        config.provided.NOTIFICATION_STORE,
+        sql=providers.Factory(
+            "src.infrastructure.cache.counted_notification_repository.CountedNotificationRepository",
+            inner=sql_notification_repository,
+            counter=unread_counter
+        ),
+        memory=providers.Singleton(
+            "src.infrastructure.persistence.in_memory.notification_repository.InMemoryNotificationRepository",
+            max_per_user=config.provided.NOTIFICATION_RETENTION_PER_USER
+        )
+    )
+
+    export_job_repository = providers.Factory(
+        "src.infrastructure.persistence.sqlalchemy.repositories.export_job_repository.SQLAlchemyExportJobRepository",
+        session=db_session
+    )
+    
+    # =========================================================================
+    # QUERY SERVICES (lecture seule)
+    # =========================================================================
+
+    admin_stats_cache = providers.Singleton(
+        "src.infrastructure.cache.ttl_cache.TTLCache",
+        ttl=config.provided.ADMIN_STATS_CACHE_TTL
+    )
+
+    admin_stats_query = providers.Factory(
+        "src.infrastructure.cache.cached_admin_stats_query.CachedAdminStatsQuery",
+        inner=providers.Factory(
+            "src.infrastructure.persistence.sqlalchemy.queries.admin_stats_query.SQLAlchemyAdminStatsQuery",
+            session=db_session
+        ),
+        cache=admin_stats_cache
+    )
+    
+    # Index de recherche plein texte (FTS5 / tsvector)
+    search_index = providers.Factory(
+        "src.infrastructure.search.sqlalchemy_search_index.SQLAlchemySearchIndex",
+        session=db_session
     )
     
     # =========================================================================
@@ -86,6 +144,38 @@ class Container(containers.DeclarativeContainer):
         "src.infrastructure.event_handlers.in_memory_publisher.InMemoryEventPublisher"
     )
     
+    # Indexation de recherche (handler abonné au publisher dans create_app)
+    search_indexer = providers.Factory(
+        "src.infrastructure.search.search_indexer.SearchIndexer",
+        search_index=search_index,
+        colli_repository=colli_repository,
+        letter_repository=letter_repository,
+        comment_repository=comment_repository,
+        user_repository=user_repository
+    )
+    
+    search_index_handler = providers.Singleton(
+        "src.infrastructure.event_handlers.search_index_handler.SearchIndexHandler",
+        indexer_factory=search_indexer.provider
+    )
+    
+    notification_service = providers.Factory(
+        "src.infrastructure.services.notification_service.NotificationService",
+        notification_repo=notification_repository
+    )
+    
+    # Notifications de nouvelle lettre (handler abonné au publisher dans create_app)
+    letter_notification_handler = providers.Singleton(
+        "src.infrastructure.event_handlers.letter_notification_handler.LetterNotificationHandler",
+        notification_service_factory=notification_service.provider,
+        colli_repository_factory=colli_repository.provider,
+        user_repository_factory=user_repository.provider
+    )
+    
+    file_storage = providers.Callable(
+        "src.infrastructure.storage.file_storage.get_file_storage"
+    )
+    
     # =========================================================================
     # USE CASES
     # =========================================================================
@@ -93,7 +183,8 @@ class Container(containers.DeclarativeContainer):
     # Colli Use Cases
     create_colli_use_case = providers.Factory(
         CreateColliUseCase,
-        colli_repository=colli_repository
+        colli_repository=colli_repository,
+        event_publisher=event_publisher
     )
     
     approve_colli_use_case = providers.Factory(
@@ -119,22 +210,26 @@ class Container(containers.DeclarativeContainer):
     
     join_colli_use_case = providers.Factory(
         "src.application.use_cases.colli.membership.JoinColliUseCase",
-        colli_repository=colli_repository
+        colli_repository=colli_repository,
+        membership_repository=membership_repository
     )
     
     leave_colli_use_case = providers.Factory(
         "src.application.use_cases.colli.membership.LeaveColliUseCase",
-        colli_repository=colli_repository
+        colli_repository=colli_repository,
+        membership_repository=membership_repository
     )
 
     accept_member_use_case = providers.Factory(
         "src.application.use_cases.colli.membership.AcceptMemberUseCase",
-        colli_repository=colli_repository
+        colli_repository=colli_repository,
+        membership_repository=membership_repository
     )
 
     reject_member_use_case = providers.Factory(
         "src.application.use_cases.colli.membership.RejectMemberUseCase",
-        colli_repository=colli_repository
+        colli_repository=colli_repository,
+        membership_repository=membership_repository
     )
 
     list_members_use_case = providers.Factory(
@@ -145,12 +240,14 @@ class Container(containers.DeclarativeContainer):
     
     update_colli_use_case = providers.Factory(
         "src.application.use_cases.colli.update_colli.UpdateColliUseCase",
-        colli_repository=colli_repository
+        colli_repository=colli_repository,
+        event_publisher=event_publisher
     )
     
     reject_colli_use_case = providers.Factory(
         "src.application.use_cases.colli.reject_colli.RejectColliUseCase",
-        colli_repository=colli_repository
+        colli_repository=colli_repository,
+        event_publisher=event_publisher
     )
     
     get_user_collis_use_case = providers.Factory(
@@ -161,7 +258,8 @@ class Container(containers.DeclarativeContainer):
     # User Use Cases
     register_user_use_case = providers.Factory(
         "src.application.use_cases.user.register_user.RegisterUserUseCase",
-        user_repository=user_repository
+        user_repository=user_repository,
+        event_publisher=event_publisher
     )
     
     authenticate_user_use_case = providers.Factory(
@@ -177,7 +275,8 @@ class Container(containers.DeclarativeContainer):
     
     update_profile_use_case = providers.Factory(
         "src.application.use_cases.user.update_profile.UpdateUserProfileUseCase",
-        user_repository=user_repository
+        user_repository=user_repository,
+        event_publisher=event_publisher
     )
     
     change_password_use_case = providers.Factory(
@@ -185,23 +284,86 @@ class Container(containers.DeclarativeContainer):
         user_repository=user_repository
     )
     
+    export_user_data_use_case = providers.Factory(
+        "src.application.use_cases.user.export_user_data.ExportUserDataUseCase",
+        user_repository=user_repository,
+        colli_repository=colli_repository,
+        letter_repository=letter_repository,
+        comment_repository=comment_repository,
+        notification_repository=notification_repository
+    )
+    
+    # Export Use Cases (jobs en arrière-plan)
+    export_archive_builder = providers.Factory(
+        "src.infrastructure.export.zip_archive_builder.ZipExportArchiveBuilder",
+        export_data_use_case=export_user_data_use_case,
+        letter_repository=letter_repository,
+        comment_repository=comment_repository,
+        file_storage=file_storage,
+        export_folder=config.provided.EXPORT_FOLDER
+    )
+    
+    run_export_job_use_case = providers.Factory(
+        "src.application.use_cases.export.run_export_job.RunExportJobUseCase",
+        export_job_repository=export_job_repository,
+        archive_builder=export_archive_builder
+    )
+    
+    export_job_queue = providers.Selector(
+        config.provided.EXPORT_JOB_EXECUTOR,
+        # Singleton : les jobs notés pendant la requête sont envoyés après son commit
+        celery=providers.Singleton("src.infrastructure.export.job_queues.CeleryExportJobQueue"),
+        inline=providers.Factory(
+            "src.infrastructure.export.job_queues.InlineExportJobQueue",
+            run_export_job_use_case=run_export_job_use_case
+        )
+    )
+    
+    request_export_job_use_case = providers.Factory(
+        "src.application.use_cases.export.request_export_job.RequestExportJobUseCase",
+        export_job_repository=export_job_repository,
+        user_repository=user_repository,
+        job_queue=export_job_queue,
+        job_timeout=config.provided.EXPORT_JOB_TIMEOUT
+    )
+    
+    get_export_job_use_case = providers.Factory(
+        "src.application.use_cases.export.get_export_job.GetExportJobUseCase",
+        export_job_repository=export_job_repository
+    )
+    
+    get_export_archive_use_case = providers.Factory(
+        "src.application.use_cases.export.get_export_job.GetExportArchiveUseCase",
+        export_job_repository=export_job_repository,
+        archive_ttl=config.provided.EXPORT_ARCHIVE_TTL
+    )
+    
+    purge_export_jobs_use_case = providers.Factory(
+        "src.application.use_cases.export.purge_export_jobs.PurgeExportJobsUseCase",
+        export_job_repository=export_job_repository,
+        archive_builder=export_archive_builder,
+        job_timeout=config.provided.EXPORT_JOB_TIMEOUT,
+        archive_ttl=config.provided.EXPORT_ARCHIVE_TTL
+    )
+    
     # Letter Use Cases
     create_text_letter_use_case = providers.Factory(
         "src.application.use_cases.letter.create_letter.CreateTextLetterUseCase",
         letter_repository=letter_repository,
-        colli_repository=colli_repository
+        colli_repository=colli_repository,
+        event_publisher=event_publisher
     )
     
     create_file_letter_use_case = providers.Factory(
         "src.application.use_cases.letter.create_letter.CreateFileLetterUseCase",
         letter_repository=letter_repository,
-        colli_repository=colli_repository
+        colli_repository=colli_repository,
+        event_publisher=event_publisher
     )
     
     get_letters_use_case = providers.Factory(
         "src.application.use_cases.letter.get_letters.GetLettersForColliUseCase",
         letter_repository=letter_repository,
-        comment_repository=comment_repository,
         colli_repository=colli_repository,
         user_repository=user_repository
     )
@@ -209,7 +371,6 @@ class Container(containers.DeclarativeContainer):
     get_letter_use_case = providers.Factory(
         "src.application.use_cases.letter.get_letters.GetLetterByIdUseCase",
         letter_repository=letter_repository,
-        comment_repository=comment_repository,
         colli_repository=colli_repository,
         user_repository=user_repository
     )
@@ -217,12 +378,14 @@ class Container(containers.DeclarativeContainer):
     delete_letter_use_case = providers.Factory(
         "src.application.use_cases.letter.delete_letter.DeleteLetterUseCase",
         letter_repository=letter_repository,
-        colli_repository=colli_repository
+        colli_repository=colli_repository,
+        event_publisher=event_publisher
     )
     
     update_letter_use_case = providers.Factory(
         "src.application.use_cases.letter.update_letter.UpdateLetterUseCase",
-        letter_repository=letter_repository
+        letter_repository=letter_repository,
+        event_publisher=event_publisher
     )
     
     # Comment Use Cases
@@ -230,7 +393,8 @@ class Container(containers.DeclarativeContainer):
         "src.application.use_cases.comment.create_comment.CreateCommentUseCase",
         comment_repository=comment_repository,
         letter_repository=letter_repository,
-        colli_repository=colli_repository
+        colli_repository=colli_repository,
+        event_publisher=event_publisher
     )
     
     get_comments_use_case = providers.Factory(
@@ -240,6 +404,13 @@ class Container(containers.DeclarativeContainer):
         colli_repository=colli_repository
     )
     
+    get_comment_thread_use_case = providers.Factory(
+        "src.application.use_cases.comment.get_comment_thread.GetCommentThreadUseCase",
+        comment_repository=comment_repository,
+        letter_repository=letter_repository,
+        colli_repository=colli_repository
+    )
+    
     delete_comment_use_case = providers.Factory(
         "src.application.use_cases.comment.delete_comment.DeleteCommentUseCase",
         comment_repository=comment_repository,
@@ -251,6 +422,15 @@ class Container(containers.DeclarativeContainer):
         "src.application.use_cases.comment.update_comment.UpdateCommentUseCase",
         comment_repository=comment_repository
     )
+    
+    # Search Use Cases
+    global_search_use_case = providers.Factory(
+        "src.application.use_cases.search.global_search.GlobalSearchUseCase",
+        search_index=search_index,
+        colli_repository=colli_repository,
+        letter_repository=letter_repository,
+        user_repository=user_repository
+    )
 
 
 
@@ -35,13 +35,15 @@ class InMemoryEventPublisher(IEventPublisher):
         """
         Abonne un handler à un type d'événement.
         
+        Un même handler n'est enregistré qu'une fois par type.
+        
         Args:
             event_type: Le type d'événement à écouter.
             handler: La fonction à appeler quand l'événement est publié.
         """
-        if event_type not in self._handlers:
-            self._handlers[event_type] = []
-        self._handlers[event_type].append(handler)
+        handlers = self._handlers.setdefault(event_type, [])
+        if handler not in handlers:
+            handlers.append(handler)
     
     def publish(self, event: DomainEvent) -> None:
         """
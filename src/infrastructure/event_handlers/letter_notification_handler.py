@@ -0,0 +1,107 @@
+# src/infrastructure/event_handlers/letter_notification_handler.py
+"""Handler d'événements notifiant les membres d'un COLLI des nouvelles lettres."""
+
+import threading
+from typing import Callable, List, Tuple
+from uuid import UUID
+
+from src.application.interfaces.event_publisher import IEventPublisher
+from src.domain.collaboration.events import LetterCreated
+from src.domain.collaboration.repositories.colli_repository import IColliRepository
+from src.domain.identity.repositories.user_repository import IUserRepository
+from src.domain.notification.entities.notification import Notification
+from src.infrastructure.services.notification_service import NotificationService
+
+
+class LetterNotificationHandler:
+    """
+    Abonné à LetterCreated.
+    
+    Le handler note les lettres créées pendant la requête ; `flush()`
+    écrit les notifications de chaque lettre en une insertion
+    multi-lignes, valide, puis diffuse une seule fois sur la room du
+    COLLI. Il est appelé dans le teardown de l'app context, après le
+    commit de la lettre : les notifications sont hors de la transaction
+    de la lettre (un échec ne l'annule pas), mais la requête attend
+    toujours ces écritures et ces emits avant de se terminer.
+    """
+    
+    DEFAULT_AUTHOR_NAME = "Un membre"
+    
+    def __init__(
+        self,
+        notification_service_factory: Callable[[], NotificationService],
+        colli_repository_factory: Callable[[], IColliRepository],
+        user_repository_factory: Callable[[], IUserRepository]
+    ):
+        self._notification_service_factory = notification_service_factory
+        self._colli_repository_factory = colli_repository_factory
+        self._user_repository_factory = user_repository_factory
+        self._local = threading.local()
+    
+    def subscribe(self, publisher: IEventPublisher) -> None:
+        """Abonne le handler aux créations de lettres."""
+        publisher.subscribe(LetterCreated, self.on_letter_created)
+    
+    def on_letter_created(self, event: LetterCreated) -> None:
+        """Lettre créée : notification différée."""
+        self._pending().append(event)
+    
+    def flush(self, commit: Callable[[], None]) -> None:
+        """
+        Écrit les notifications en attente, appelle `commit`, puis les diffuse.
+        
+        Args:
+            commit: Valide la transaction portant les notifications
+                (la diffusion n'a lieu qu'une fois les lignes visibles).
+        """
+        pending = self._pending()
+        if not pending:
+            return
+        self._local.pending = []
+        
+        service = self._notification_service_factory()
+        colli_repo = self._colli_repository_factory()
+        user_repo = self._user_repository_factory()
+        
+        # Noms des COLLIs, membres et auteurs en une requête chacun,
+        # sans hydrater les agrégats ni leurs adhésions
+        colli_ids = {event.colli_id for event in pending}
+        collis = colli_repo.find_summaries_by_ids(colli_ids)
+        members = colli_repo.find_accepted_member_ids(colli_ids)
+        senders = user_repo.find_by_ids({event.sender_id for event in pending})
+        
+        batches: List[Tuple[UUID, UUID, List[Notification]]] = []
+        for event in pending:
+            colli = collis.get(event.colli_id)
+            if not colli:
+                continue
+            sender = senders.get(event.sender_id)
+            member_ids = [
+                user_id for user_id in members[colli.id]
+                if user_id != event.sender_id
+            ]
+            notifications = service.notify_new_letter(
+                colli_id=colli.id,
+                colli_name=colli.name,
+                letter_id=event.letter_id,
+                author_name=sender.full_name if sender else self.DEFAULT_AUTHOR_NAME,
+                member_ids=member_ids,
+                push=False
+            )
+            batches.append((colli.id, event.sender_id, notifications))
+        
+        commit()
+        
+        for colli_id, author_id, notifications in batches:
+            service.push_new_letter(colli_id, notifications, author_id=author_id)
+    
+    def discard(self) -> None:
+        """Abandonne les notifications en attente (requête en échec)."""
+        self._local.pending = []
+    
+    def _pending(self) -> List[LetterCreated]:
+        """Lettres créées par le thread courant."""
+        if not hasattr(self._local, 'pending'):
+            self._local.pending = []
+        return self._local.pending
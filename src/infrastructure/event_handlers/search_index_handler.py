@@ -0,0 +1,107 @@
+# src/infrastructure/event_handlers/search_index_handler.py
+"""Handler d'événements maintenant l'index de recherche à jour."""
+
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Set
+from uuid import UUID
+
+from src.application.interfaces.event_publisher import IEventPublisher
+from src.domain.collaboration.events import (
+    ColliApproved,
+    ColliCreated,
+    ColliRejected,
+    ColliUpdated,
+    CommentAdded,
+    DomainEvent,
+    LetterCreated,
+    LetterDeleted,
+    LetterUpdated,
+)
+from src.domain.identity.events import UserProfileUpdated, UserRegistered
+from src.infrastructure.search.search_indexer import SearchIndexer
+
+
+@dataclass
+class _PendingChanges:
+    """Identifiants à réindexer, dédupliqués sur la durée d'une requête."""
+    collis: Set[UUID] = field(default_factory=set)
+    letters: Set[UUID] = field(default_factory=set)
+    deleted_letters: Set[UUID] = field(default_factory=set)
+    users: Set[UUID] = field(default_factory=set)
+    
+    def __bool__(self) -> bool:
+        return bool(self.collis or self.letters or self.deleted_letters or self.users)
+
+
+class SearchIndexHandler:
+    """
+    Abonné aux événements domaine qui modifient le contenu indexé.
+    
+    Les handlers se contentent de noter les identifiants modifiés ;
+    `flush()` (appelé en fin de requête) réindexe uniquement ces
+    documents, en un lot par type. Plusieurs événements sur la même
+    lettre (création puis commentaires) ne produisent qu'une écriture.
+    """
+    
+    def __init__(self, indexer_factory: Callable[[], SearchIndexer]):
+        self._indexer_factory = indexer_factory
+        self._local = threading.local()
+    
+    def subscribe(self, publisher: IEventPublisher) -> None:
+        """Abonne le handler aux événements concernés."""
+        publisher.subscribe(LetterCreated, self.on_letter_changed)
+        publisher.subscribe(LetterUpdated, self.on_letter_changed)
+        publisher.subscribe(CommentAdded, self.on_letter_changed)
+        publisher.subscribe(LetterDeleted, self.on_letter_deleted)
+        publisher.subscribe(ColliCreated, self.on_colli_changed)
+        publisher.subscribe(ColliUpdated, self.on_colli_changed)
+        publisher.subscribe(ColliApproved, self.on_colli_changed)
+        publisher.subscribe(ColliRejected, self.on_colli_changed)
+        publisher.subscribe(UserRegistered, self.on_user_changed)
+        publisher.subscribe(UserProfileUpdated, self.on_user_changed)
+    
+    def on_letter_changed(self, event: DomainEvent) -> None:
+        """Lettre créée, modifiée ou commentée."""
+        self._pending().letters.add(event.letter_id)
+    
+    def on_letter_deleted(self, event: LetterDeleted) -> None:
+        """Lettre supprimée."""
+        pending = self._pending()
+        pending.letters.discard(event.letter_id)
+        pending.deleted_letters.add(event.letter_id)
+    
+    def on_colli_changed(self, event: DomainEvent) -> None:
+        """COLLI créé, modifié, approuvé ou rejeté (le statut conditionne sa visibilité)."""
+        self._pending().collis.add(event.colli_id)
+    
+    def on_user_changed(self, event: DomainEvent) -> None:
+        """Utilisateur inscrit ou profil modifié."""
+        self._pending().users.add(event.user_id)
+    
+    def flush(self) -> None:
+        """Applique les modifications en attente à l'index."""
+        pending = self._pending()
+        if not pending:
+            return
+        self._local.pending = _PendingChanges()
+        
+        indexer = self._indexer_factory()
+        if pending.deleted_letters:
+            indexer.remove_letters(pending.deleted_letters)
+        if pending.collis:
+            indexer.index_collis(pending.collis)
+        if pending.letters:
+            indexer.index_letters(pending.letters)
+        if pending.users:
+            indexer.index_users(pending.users)
+    
+    def discard(self) -> None:
+        """Abandonne les modifications en attente (requête en échec)."""
+        self._local.pending = _PendingChanges()
+    
+    def _pending(self) -> _PendingChanges:
+        """Modifications en attente du thread courant."""
+        if not hasattr(self._local, 'pending'):
+            self._local.pending = _PendingChanges()
+        return self._local.pending
@@ -0,0 +1,59 @@
+# src/infrastructure/export/job_queues.py
+"""Implémentations de la file des jobs d'export."""
+
+import threading
+from typing import Callable, List
+from uuid import UUID
+
+from src.application.interfaces.export_job_queue import IExportJobQueue
+from src.application.use_cases.export.run_export_job import RunExportJobUseCase
+
+
+class InlineExportJobQueue(IExportJobQueue):
+    """
+    Exécute le job immédiatement, dans la requête et la session courantes.
+    
+    Pour les tests et le développement : aucun broker ni worker requis.
+    """
+    
+    def __init__(self, run_export_job_use_case: RunExportJobUseCase):
+        self._run_export_job = run_export_job_use_case
+    
+    def enqueue(self, job_id: UUID) -> None:
+        self._run_export_job.execute(job_id)
+
+
+class CeleryExportJobQueue(IExportJobQueue):
+    """
+    Confie le job au worker Celery, après le commit de la requête.
+    
+    `enqueue` note le job pour le thread courant ; `flush` (appelé
+    après le commit) l'envoie au broker. Envoyé plus tôt, le worker
+    pourrait lire la base avant que le job n'y soit visible, ou exécuter
+    un job dont la requête a finalement été annulée.
+    """
+    
+    def __init__(self, task_sender: Callable[[str], object] = None):
+        if task_sender is None:
+            from src.infrastructure.tasks.export_tasks import run_export_job
+            task_sender = run_export_job.delay
+        self._send = task_sender
+        self._local = threading.local()
+    
+    def enqueue(self, job_id: UUID) -> None:
+        self._pending().append(job_id)
+    
+    def flush(self) -> None:
+        pending = self._pending()
+        self._local.pending = []
+        for job_id in pending:
+            self._send(str(job_id))
+    
+    def discard(self) -> None:
+        self._local.pending = []
+    
+    def _pending(self) -> List[UUID]:
+        """Jobs mis en file par le thread courant."""
+        if not hasattr(self._local, 'pending'):
+            self._local.pending = []
+        return self._local.pending
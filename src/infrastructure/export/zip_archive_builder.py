@@ -0,0 +1,100 @@
+# src/infrastructure/export/zip_archive_builder.py
+"""Production des archives zip d'export RGPD."""
+
+import os
+import zipfile
+from pathlib import Path
+from typing import Iterator, Optional
+from uuid import UUID
+
+from src.domain.collaboration.repositories.comment_repository import ICommentRepository
+from src.domain.collaboration.repositories.letter_repository import ILetterRepository
+from src.domain.export.entities.export_job import ExportJob
+from src.domain.shared.page_cursor import PageCursor
+from src.application.dtos.export_dto import ExportArchive
+from src.application.interfaces.export_archive_builder import IExportArchiveBuilder
+from src.application.use_cases.user.export_user_data import ExportUserDataUseCase
+from src.infrastructure.storage.file_storage import FileStorageService
+
+
+class ZipExportArchiveBuilder(IExportArchiveBuilder):
+    """
+    Écrit `<export_folder>/<job_id>.zip` contenant :
+    - data.json : le document produit par ExportUserDataUseCase
+    - files/    : les fichiers uploadés joints aux lettres et commentaires
+    
+    Le JSON et les fichiers sont écrits en flux dans l'archive ; l'archive
+    est écrite sous un nom temporaire puis renommée, pour qu'une archive
+    partielle ne soit jamais servie.
+    """
+    
+    DATA_FILE = "data.json"
+    FILES_DIR = "files"
+    CHUNK_SIZE = 500
+    
+    def __init__(
+        self,
+        export_data_use_case: ExportUserDataUseCase,
+        letter_repository: ILetterRepository,
+        comment_repository: ICommentRepository,
+        file_storage: FileStorageService,
+        export_folder: str
+    ):
+        self._export_data = export_data_use_case
+        self._letter_repo = letter_repository
+        self._comment_repo = comment_repository
+        self._file_storage = file_storage
+        self._export_folder = export_folder
+    
+    def build(self, job: ExportJob) -> ExportArchive:
+        """Écrit l'archive du job."""
+        Path(self._export_folder).mkdir(parents=True, exist_ok=True)
+        final_path = os.path.abspath(os.path.join(self._export_folder, f"{job.id}.zip"))
+        partial_path = f"{final_path}.part"
+        
+        try:
+            with zipfile.ZipFile(partial_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+                with archive.open(self.DATA_FILE, "w", force_zip64=True) as data:
+                    for chunk in self._export_data.execute(job.user_id):
+                        data.write(chunk.encode("utf-8"))
+                for path in self._user_files(job.user_id):
+                    archive.write(path, arcname=f"{self.FILES_DIR}/{os.path.basename(path)}")
+            os.replace(partial_path, final_path)
+        except BaseException:
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+            raise
+        
+        return ExportArchive(path=final_path, size=os.path.getsize(final_path))
+    
+    def delete(self, archive_path: str) -> None:
+        """Supprime l'archive, si elle existe encore."""
+        if os.path.exists(archive_path):
+            os.remove(archive_path)
+    
+    def _user_files(self, user_id: UUID) -> Iterator[str]:
+        """Chemins des fichiers stockés joints par l'utilisateur, sans doublon."""
+        seen = set()
+        for url in self._attachment_urls(user_id):
+            file_id = self._file_storage.file_id_from_url(url)
+            if not file_id or file_id in seen:
+                continue
+            seen.add(file_id)
+            path = self._file_storage.get_path(file_id)
+            if path:
+                yield path
+    
+    def _attachment_urls(self, user_id: UUID) -> Iterator[Optional[str]]:
+        """URLs des pièces jointes (lettres puis commentaires), par lots keyset."""
+        for find, attribute in (
+            (self._letter_repo.find_by_sender, "file_url"),
+            (self._comment_repo.find_by_sender, "attachment_url"),
+        ):
+            cursor = None
+            while True:
+                items = find(user_id, limit=self.CHUNK_SIZE, cursor=cursor)
+                for item in items:
+                    yield getattr(item, attribute)
+                if len(items) < self.CHUNK_SIZE:
+                    break
+                cursor = PageCursor.from_entity(items[-1])
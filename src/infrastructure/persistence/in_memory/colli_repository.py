@@ -1,11 +1,16 @@
 # src/infrastructure/persistence/in_memory/colli_repository.py
 """Implémentation In-Memory du repository Colli pour les tests."""
 
-from typing import Optional, List, Dict
+from datetime import datetime
+from typing import Optional, List, Dict, Iterable
 from uuid import UUID
 
+from src.domain.shared.page_cursor import PageCursor
 from src.domain.collaboration.entities.colli import Colli
 from src.domain.collaboration.value_objects.colli_status import ColliStatus
+from src.domain.collaboration.value_objects.colli_summary import ColliSummary
+from src.domain.collaboration.value_objects.member_role import MemberRole
+from src.domain.collaboration.value_objects.colli_role_filter import ColliRoleFilter
 from src.domain.collaboration.repositories.colli_repository import IColliRepository
 
 
@@ -22,6 +27,10 @@ class InMemoryColliRepository(IColliRepository):
     def __init__(self):
         self._store: Dict[UUID, Colli] = {}
     
+    def add(self, colli: Colli) -> Colli:
+        """Persiste un nouveau Colli."""
+        return self.save(colli)
+    
     def save(self, colli: Colli) -> Colli:
         """Persiste un Colli en mémoire."""
         self._store[colli.id] = colli
@@ -31,24 +40,115 @@ class InMemoryColliRepository(IColliRepository):
         """Récupère un Colli par son ID."""
         return self._store.get(colli_id)
     
-    def find_all(self, page: int = 1, per_page: int = 20) -> List[Colli]:
+    def find_all(
+        self,
+        page: int = 1,
+        per_page: int = 20,
+        cursor: Optional[PageCursor] = None
+    ) -> List[Colli]:
         """Récupère tous les Collis avec pagination."""
-        all_collis = list(self._store.values())
-        start = (page - 1) * per_page
-        end = start + per_page
-        return all_collis[start:end]
+        return self._paginate(list(self._store.values()), page, per_page, cursor)
     
-    def find_by_status(self, status: ColliStatus, page: int = 1, per_page: int = 20) -> List[Colli]:
+    def find_by_status(
+        self,
+        status: ColliStatus,
+        page: int = 1,
+        per_page: int = 20,
+        cursor: Optional[PageCursor] = None
+    ) -> List[Colli]:
         """Récupère les Collis par statut avec pagination."""
         filtered = [c for c in self._store.values() if c.status == status]
-        start = (page - 1) * per_page
-        end = start + per_page
-        return filtered[start:end]
+        return self._paginate(filtered, page, per_page, cursor)
+    
+    def find_summaries(
+        self,
+        status: Optional[ColliStatus] = None,
+        page: int = 1,
+        per_page: int = 20,
+        cursor: Optional[PageCursor] = None
+    ) -> List[ColliSummary]:
+        """Récupère une page de projections de liste."""
+        collis = [c for c in self._store.values() if status is None or c.status == status]
+        return [ColliSummary.from_entity(c) for c in self._paginate(collis, page, per_page, cursor)]
+    
+    def find_summaries_by_ids(self, colli_ids: Iterable[UUID]) -> Dict[UUID, ColliSummary]:
+        """Récupère les projections de plusieurs Collis."""
+        return {
+            colli_id: ColliSummary.from_entity(self._store[colli_id])
+            for colli_id in colli_ids if colli_id in self._store
+        }
     
     def find_by_creator(self, creator_id: UUID) -> List[Colli]:
         """Récupère les Collis d'un créateur."""
         return [c for c in self._store.values() if c.creator_id == creator_id]
     
+    def find_by_member(
+        self,
+        user_id: UUID,
+        role_filter: ColliRoleFilter = ColliRoleFilter.ALL,
+        page: int = 1,
+        per_page: int = 20
+    ) -> List[Colli]:
+        """Récupère les Collis d'un utilisateur avec pagination."""
+        collis = [c for c in self._store.values() if self._matches_member(c, user_id, role_filter)]
+        return self._paginate(collis, page, per_page, None)
+    
+    def count_by_member(
+        self,
+        user_id: UUID,
+        role_filter: ColliRoleFilter = ColliRoleFilter.ALL
+    ) -> int:
+        """Compte les Collis d'un utilisateur."""
+        return len([c for c in self._store.values() if self._matches_member(c, user_id, role_filter)])
+    
+    @staticmethod
+    def _matches_member(colli: Colli, user_id: UUID, role_filter: ColliRoleFilter) -> bool:
+        """Applique le filtre créateur/membre."""
+        is_creator = colli.creator_id == user_id
+        if role_filter == ColliRoleFilter.CREATOR:
+            return is_creator
+        if role_filter == ColliRoleFilter.MEMBER:
+            return colli.has_membership(user_id) and not is_creator
+        return is_creator or colli.has_membership(user_id)
+    
+    def is_accepted_member(
+        self,
+        colli_id: UUID,
+        user_id: UUID,
+        role: Optional[MemberRole] = None
+    ) -> bool:
+        """Vérifie l'appartenance (créateur ou ACCEPTED, ou rôle exigé)."""
+        colli = self._store.get(colli_id)
+        if colli is None:
+            return False
+        if role is None:
+            return colli.is_member(user_id)
+        member = colli.get_member(user_id)
+        return member is not None and member.role == role
+    
+    def find_accepted_member_ids(self, colli_ids: Iterable[UUID]) -> Dict[UUID, List[UUID]]:
+        """Récupère les membres ACCEPTED de plusieurs Collis."""
+        return {
+            colli_id: [m.user_id for m in self._store[colli_id].accepted_members]
+            if colli_id in self._store else []
+            for colli_id in colli_ids
+        }
+    
+    def update_activity(
+        self,
+        colli_id: UUID,
+        letter_delta: int = 0,
+        active_at: Optional[datetime] = None,
+        member_delta: int = 0
+    ) -> None:
+        """Ajuste les compteurs d'activité du Colli stocké (member_count se calcule sur ses membres)."""
+        colli = self._store.get(colli_id)
+        if colli is None:
+            return
+        colli.letter_count += letter_delta
+        if active_at is not None:
+            colli.last_activity_at = active_at
+    
     def delete(self, colli: Colli) -> bool:
         """Supprime un Colli."""
         if colli.id in self._store:
@@ -64,6 +164,21 @@ class InMemoryColliRepository(IColliRepository):
         """Compte les Collis par statut."""
         return len([c for c in self._store.values() if c.status == status])
     
+    @staticmethod
+    def _paginate(
+        collis: List[Colli],
+        page: int,
+        per_page: int,
+        cursor: Optional[PageCursor]
+    ) -> List[Colli]:
+        """Trie du plus récent au plus ancien puis pagine, comme en SQL."""
+        collis.sort(key=lambda c: (c.created_at, c.id), reverse=True)
+        if cursor:
+            position = (cursor.created_at, cursor.id)
+            return [c for c in collis if (c.created_at, c.id) < position][:per_page]
+        start = (page - 1) * per_page
+        return collis[start:start + per_page]
+    
     def clear(self) -> None:
         """Vide le store (utile pour les tests)."""
         self._store.clear()
@@ -1,9 +1,10 @@
 # src/infrastructure/persistence/in_memory/comment_repository.py
 """Implémentation In-Memory du repository Comment."""
 
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Iterable
 from uuid import UUID
 
+from src.domain.shared.page_cursor import PageCursor
 from src.domain.collaboration.entities.comment import Comment
 from src.domain.collaboration.repositories.comment_repository import ICommentRepository
 
@@ -14,6 +15,10 @@ class InMemoryCommentRepository(ICommentRepository):
     def __init__(self):
         self._store: Dict[UUID, Comment] = {}
     
+    def add(self, comment: Comment) -> Comment:
+        """Persiste un nouveau commentaire."""
+        return self.save(comment)
+    
     def save(self, comment: Comment) -> Comment:
         """Persiste un commentaire."""
         self._store[comment.id] = comment
@@ -23,16 +28,65 @@ class InMemoryCommentRepository(ICommentRepository):
         """Récupère un commentaire par ID."""
         return self._store.get(comment_id)
     
-    def find_by_letter(self, letter_id: UUID, page: int = 1, per_page: int = 50) -> List[Comment]:
+    def find_by_letter(
+        self,
+        letter_id: UUID,
+        page: int = 1,
+        per_page: int = 50,
+        cursor: Optional[PageCursor] = None
+    ) -> List[Comment]:
         """Récupère les commentaires d'une lettre."""
         comments = [c for c in self._store.values() if c.letter_id == letter_id]
-        comments.sort(key=lambda c: c.created_at)
+        comments.sort(key=lambda c: (c.created_at, c.id))
+        if cursor:
+            position = (cursor.created_at, cursor.id)
+            return [c for c in comments if (c.created_at, c.id) > position][:per_page]
         start = (page - 1) * per_page
         return comments[start:start + per_page]
     
-    def find_by_sender(self, sender_id: UUID) -> List[Comment]:
+    def find_thread(
+        self,
+        letter_id: UUID,
+        parent_comment_id: Optional[UUID] = None,
+        max_depth: Optional[int] = None,
+        page: int = 1,
+        per_page: int = 20,
+        cursor: Optional[PageCursor] = None
+    ) -> List[Comment]:
+        """Récupère une page de fils de discussion d'une lettre, en liste plate."""
+        comments = [c for c in self._store.values() if c.letter_id == letter_id]
+        comments.sort(key=lambda c: (c.created_at, c.id))
+        level = [c for c in comments if c.parent_comment_id == parent_comment_id]
+        if cursor:
+            position = (cursor.created_at, cursor.id)
+            level = [c for c in level if (c.created_at, c.id) > position][:per_page]
+        else:
+            start = (page - 1) * per_page
+            level = level[start:start + per_page]
+        
+        thread = list(level)
+        depth = 0
+        while level and (max_depth is None or depth < max_depth):
+            ids = {c.id for c in level}
+            level = [c for c in comments if c.parent_comment_id in ids]
+            thread.extend(level)
+            depth += 1
+        thread.sort(key=lambda c: (c.created_at, c.id))
+        return thread
+    
+    def find_by_sender(
+        self,
+        sender_id: UUID,
+        limit: Optional[int] = None,
+        cursor: Optional[PageCursor] = None
+    ) -> List[Comment]:
         """Récupère les commentaires d'un utilisateur."""
-        return [c for c in self._store.values() if c.sender_id == sender_id]
+        items = [c for c in self._store.values() if c.sender_id == sender_id]
+        items.sort(key=lambda c: (c.created_at, c.id), reverse=True)
+        if cursor:
+            position = (cursor.created_at, cursor.id)
+            items = [c for c in items if (c.created_at, c.id) < position]
+        return items[:limit] if limit is not None else items
     
     def delete(self, comment: Comment) -> bool:
         """Supprime un commentaire."""
@@ -45,6 +99,25 @@ class InMemoryCommentRepository(ICommentRepository):
         """Compte les commentaires d'une lettre."""
         return len([c for c in self._store.values() if c.letter_id == letter_id])
     
+    def find_by_letters(
+        self,
+        letter_ids: Iterable[UUID],
+        per_letter: int = 50
+    ) -> Dict[UUID, List[Comment]]:
+        """Récupère les premiers commentaires de plusieurs lettres."""
+        return {
+            letter_id: self.find_by_letter(letter_id, per_page=per_letter)
+            for letter_id in letter_ids
+        }
+    
+    def count_by_letters(self, letter_ids: Iterable[UUID]) -> Dict[UUID, int]:
+        """Compte les commentaires de plusieurs lettres."""
+        counts = {letter_id: 0 for letter_id in letter_ids}
+        for comment in self._store.values():
+            if comment.letter_id in counts:
+                counts[comment.letter_id] += 1
+        return counts
+    
     def clear(self) -> None:
         """Vide le store."""
         self._store.clear()
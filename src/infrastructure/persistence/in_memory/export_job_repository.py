@@ -0,0 +1,61 @@
+# src/infrastructure/persistence/in_memory/export_job_repository.py
+"""Implémentation In-Memory du repository ExportJob pour les tests."""
+
+from datetime import datetime
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from src.domain.export.entities.export_job import ExportJob, ExportJobStatus
+from src.domain.export.repositories.export_job_repository import IExportJobRepository
+
+
+class InMemoryExportJobRepository(IExportJobRepository):
+    """
+    Implémentation In-Memory du repository ExportJob.
+    """
+    
+    def __init__(self):
+        self._store: Dict[UUID, ExportJob] = {}
+    
+    def save(self, job: ExportJob) -> ExportJob:
+        """Persiste un job d'export."""
+        self._store[job.id] = job
+        return job
+    
+    def find_by_id(self, job_id: UUID) -> Optional[ExportJob]:
+        """Récupère un job par son ID."""
+        return self._store.get(job_id)
+    
+    def claim(self, job_id: UUID, started_at: datetime) -> bool:
+        """Passe un job en attente à RUNNING."""
+        job = self._store.get(job_id)
+        if not job or job.status != ExportJobStatus.PENDING:
+            return False
+        job.start(now=started_at)
+        return True
+    
+    def find_active_for_user(self, user_id: UUID) -> Optional[ExportJob]:
+        """Récupère le job en attente ou en cours d'un utilisateur."""
+        active = [
+            j for j in self._store.values()
+            if j.user_id == user_id and not j.is_finished
+        ]
+        return max(active, key=lambda j: j.created_at, default=None)
+    
+    def find_stale(self, before: datetime) -> List[ExportJob]:
+        """Récupère les jobs actifs démarrés (ou créés) avant `before`."""
+        return [
+            j for j in self._store.values()
+            if not j.is_finished and (j.started_at or j.created_at) < before
+        ]
+    
+    def find_completed_before(self, before: datetime) -> List[ExportJob]:
+        """Récupère les jobs terminés avec succès avant `before`."""
+        return [
+            j for j in self._store.values()
+            if j.status == ExportJobStatus.COMPLETED and j.completed_at < before
+        ]
+    
+    def clear(self) -> None:
+        """Vide le store."""
+        self._store.clear()
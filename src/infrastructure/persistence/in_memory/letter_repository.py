@@ -1,9 +1,10 @@
 # src/infrastructure/persistence/in_memory/letter_repository.py
 """Implémentation In-Memory du repository Letter."""
 
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Iterable
 from uuid import UUID
 
+from src.domain.shared.page_cursor import PageCursor
 from src.domain.collaboration.entities.letter import Letter
 from src.domain.collaboration.repositories.letter_repository import ILetterRepository
 
@@ -14,6 +15,10 @@ class InMemoryLetterRepository(ILetterRepository):
     def __init__(self):
         self._store: Dict[UUID, Letter] = {}
     
+    def add(self, letter: Letter) -> Letter:
+        """Persiste une nouvelle lettre."""
+        return self.save(letter)
+    
     def save(self, letter: Letter) -> Letter:
         """Persiste une lettre."""
         self._store[letter.id] = letter
@@ -23,16 +28,45 @@ class InMemoryLetterRepository(ILetterRepository):
         """Récupère une lettre par ID."""
         return self._store.get(letter_id)
     
-    def find_by_colli(self, colli_id: UUID, page: int = 1, per_page: int = 20) -> List[Letter]:
+    def find_by_ids(self, letter_ids: Iterable[UUID]) -> Dict[UUID, Letter]:
+        """Récupère plusieurs lettres."""
+        return {i: self._store[i] for i in letter_ids if i in self._store}
+    
+    def find_by_colli(
+        self,
+        colli_id: UUID,
+        page: int = 1,
+        per_page: int = 20,
+        cursor: Optional[PageCursor] = None
+    ) -> List[Letter]:
         """Récupère les lettres d'un COLLI."""
         letters = [l for l in self._store.values() if l.colli_id == colli_id]
-        letters.sort(key=lambda l: l.created_at, reverse=True)
+        letters.sort(key=lambda l: (l.created_at, l.id), reverse=True)
+        if cursor:
+            position = (cursor.created_at, cursor.id)
+            return [l for l in letters if (l.created_at, l.id) < position][:per_page]
         start = (page - 1) * per_page
         return letters[start:start + per_page]
     
-    def find_by_sender(self, sender_id: UUID) -> List[Letter]:
+    def find_by_sender(
+        self,
+        sender_id: UUID,
+        limit: Optional[int] = None,
+        cursor: Optional[PageCursor] = None
+    ) -> List[Letter]:
         """Récupère les lettres d'un utilisateur."""
-        return [l for l in self._store.values() if l.sender_id == sender_id]
+        items = [l for l in self._store.values() if l.sender_id == sender_id]
+        items.sort(key=lambda l: (l.created_at, l.id), reverse=True)
+        if cursor:
+            position = (cursor.created_at, cursor.id)
+            items = [l for l in items if (l.created_at, l.id) < position]
+        return items[:limit] if limit is not None else items
+    
+    def update_comment_count(self, letter_id: UUID, delta: int) -> None:
+        """Ajuste le compteur de commentaires de la lettre stockée."""
+        letter = self._store.get(letter_id)
+        if letter is not None:
+            letter.comment_count += delta
     
     def delete(self, letter: Letter) -> bool:
         """Supprime une lettre."""
@@ -0,0 +1,60 @@
+# src/infrastructure/persistence/in_memory/membership_repository.py
+"""Implémentation In-Memory du repository Membership."""
+
+from dataclasses import replace
+from typing import Optional
+from uuid import UUID
+
+from src.domain.collaboration.entities.membership import Membership
+from src.domain.collaboration.repositories.membership_repository import IMembershipRepository
+from src.infrastructure.persistence.in_memory.colli_repository import InMemoryColliRepository
+from src.application.exceptions import ConflictException
+
+
+class InMemoryMembershipRepository(IMembershipRepository):
+    """
+    Repository In-Memory pour Membership.
+
+    Les adhésions vivent dans les COLLIs du repository Colli en mémoire :
+    les deux repositories voient ainsi les mêmes membres.
+    """
+
+    def __init__(self, colli_repository: InMemoryColliRepository):
+        self._collis = colli_repository
+
+    def find(self, colli_id: UUID, user_id: UUID) -> Optional[Membership]:
+        """Récupère une copie de l'adhésion, comme une lecture en base."""
+        membership = next((m for m in self._members(colli_id) if m.user_id == user_id), None)
+        return replace(membership) if membership else None
+
+    def add(self, membership: Membership) -> Membership:
+        """Persiste une nouvelle adhésion."""
+        if self.find(membership.colli_id, membership.user_id):
+            raise ConflictException("L'utilisateur a déjà une adhésion à ce COLLI")
+        self._members(membership.colli_id).append(membership)
+        return membership
+
+    def save(self, membership: Membership) -> Membership:
+        """Met à jour une adhésion existante."""
+        members = self._members(membership.colli_id)
+        for index, member in enumerate(members):
+            if member.id == membership.id:
+                if member.version != membership.version:
+                    raise ConflictException("L'adhésion a été modifiée par une autre requête")
+                membership.version += 1
+                members[index] = membership
+                return membership
+        raise ConflictException("L'adhésion a été modifiée par une autre requête")
+
+    def delete(self, membership: Membership) -> bool:
+        """Supprime une adhésion."""
+        members = self._members(membership.colli_id)
+        if membership in members:
+            members.remove(membership)
+            return True
+        return False
+
+    def _members(self, colli_id: UUID) -> list:
+        """Liste (mutable) des adhésions du COLLI en mémoire."""
+        colli = self._collis.find_by_id(colli_id)
+        return colli._members if colli else []
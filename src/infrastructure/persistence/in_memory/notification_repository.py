@@ -1,81 +1,153 @@
 # src/infrastructure/persistence/in_memory/notification_repository.py
 """Repository in-memory pour les notifications."""
 
-from typing import List, Optional
+import bisect
+import threading
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+from datetime import datetime
 from uuid import UUID
 
 from src.domain.notification.entities.notification import Notification
+from src.domain.notification.repositories.notification_repository import INotificationRepository
 
 
-class InMemoryNotificationRepository:
+class InMemoryNotificationRepository(INotificationRepository):
     """
     Implementation in-memory du repository de notifications.
-    
-    Pour le developpement et les tests.
+
+    Pour le developpement, les tests et le deploiement mono-processus.
+    Les notifications sont rangees par utilisateur :
+    - un bucket trie par (created_at, id) pour les listes ;
+    - l'ensemble des IDs non lus, pour le compteur et « tout lire ».
+    Aucune operation ne parcourt les notifications des autres utilisateurs.
+
+    Au-dela de `max_per_user` notifications, les plus anciennes d'un
+    utilisateur sont oubliees (None ou 0 : pas de limite).
     """
-    
-    def __init__(self):
-        self._notifications: dict[UUID, Notification] = {}
-    
+
+    DEFAULT_MAX_PER_USER = 500
+
+    def __init__(self, max_per_user: Optional[int] = DEFAULT_MAX_PER_USER):
+        self._max_per_user = max_per_user
+        self._notifications: Dict[UUID, Notification] = {}
+        self._buckets: Dict[UUID, List[Tuple[datetime, UUID]]] = {}
+        self._unread: Dict[UUID, Set[UUID]] = {}
+        self._lock = threading.RLock()
+
     def save(self, notification: Notification) -> None:
         """Sauvegarde une notification."""
-        self._notifications[notification.id] = notification
-    
+        with self._lock:
+            if notification.id in self._notifications:
+                self._detach(self._notifications[notification.id])
+            self._attach(notification)
+            self._enforce_retention(notification.user_id)
+
+    def save_many(self, notifications: Sequence[Notification]) -> None:
+        """Sauvegarde des notifications en une seule prise de verrou."""
+        with self._lock:
+            for notification in notifications:
+                if notification.id in self._notifications:
+                    self._detach(self._notifications[notification.id])
+                self._attach(notification)
+            for user_id in {n.user_id for n in notifications}:
+                self._enforce_retention(user_id)
+
     def find_by_id(self, notification_id: UUID) -> Optional[Notification]:
         """Trouve une notification par son ID."""
         return self._notifications.get(notification_id)
-    
+
     def find_by_user(
-        self, 
-        user_id: UUID, 
+        self,
+        user_id: UUID,
         unread_only: bool = False,
         limit: int = 50
     ) -> List[Notification]:
-        """Trouve les notifications d'un utilisateur."""
-        notifications = [
-            n for n in self._notifications.values()
-            if n.user_id == user_id
-        ]
-        
-        if unread_only:
-            notifications = [n for n in notifications if not n.read]
-        
-        # Trier par date (plus recent en premier)
-        notifications.sort(key=lambda n: n.created_at, reverse=True)
-        
-        return notifications[:limit]
-    
+        """Trouve les notifications d'un utilisateur (plus recentes en premier)."""
+        with self._lock:
+            unread = self._unread.get(user_id, set())
+            result = []
+            for _, notification_id in reversed(self._buckets.get(user_id, [])):
+                if len(result) >= limit:
+                    break
+                if unread_only and notification_id not in unread:
+                    continue
+                result.append(self._notifications[notification_id])
+            return result
+
     def count_unread(self, user_id: UUID) -> int:
         """Compte les notifications non lues."""
-        return len([
-            n for n in self._notifications.values()
-            if n.user_id == user_id and not n.read
-        ])
-    
+        return len(self._unread.get(user_id, ()))
+
     def mark_as_read(self, notification_id: UUID) -> bool:
         """Marque une notification comme lue."""
-        notification = self.find_by_id(notification_id)
-        if notification:
+        with self._lock:
+            notification = self._notifications.get(notification_id)
+            if not notification:
+                return False
             notification.mark_as_read()
+            self._unread.get(notification.user_id, set()).discard(notification_id)
             return True
-        return False
-    
+
     def mark_all_as_read(self, user_id: UUID) -> int:
         """Marque toutes les notifications d'un utilisateur comme lues."""
-        count = 0
-        for notification in self._notifications.values():
-            if notification.user_id == user_id and not notification.read:
-                notification.mark_as_read()
-                count += 1
-        return count
-    
+        with self._lock:
+            unread = self._unread.pop(user_id, set())
+            for notification_id in unread:
+                self._notifications[notification_id].mark_as_read()
+            return len(unread)
+
     def delete(self, notification_id: UUID) -> bool:
         """Supprime une notification."""
-        if notification_id in self._notifications:
-            del self._notifications[notification_id]
+        with self._lock:
+            notification = self._notifications.get(notification_id)
+            if not notification:
+                return False
+            self._detach(notification)
             return True
-        return False
-    
+
     def find_all(self) -> List[Notification]:
         """Retourne toutes les notifications."""
         return list(self._notifications.values())
+
+    # =========================================================================
+    # Index par utilisateur (appelés sous verrou)
+    # =========================================================================
+
+    def _attach(self, notification: Notification) -> None:
+        """Ajoute la notification au stockage et aux index de son utilisateur."""
+        self._notifications[notification.id] = notification
+        bisect.insort(
+            self._buckets.setdefault(notification.user_id, []),
+            (notification.created_at, notification.id)
+        )
+        if not notification.read:
+            self._unread.setdefault(notification.user_id, set()).add(notification.id)
+
+    def _detach(self, notification: Notification) -> None:
+        """Retire une notification du stockage et des index de son utilisateur."""
+        stored = self._notifications.pop(notification.id)
+        bucket = self._buckets.get(stored.user_id, [])
+        key = (stored.created_at, stored.id)
+        position = bisect.bisect_left(bucket, key)
+        if position < len(bucket) and bucket[position] == key:
+            del bucket[position]
+        else:
+            # created_at modifié en place : recherche linéaire dans le bucket
+            bucket[:] = [entry for entry in bucket if entry[1] != stored.id]
+        if not bucket:
+            self._buckets.pop(stored.user_id, None)
+
+        unread = self._unread.get(stored.user_id)
+        if unread is not None:
+            unread.discard(stored.id)
+            if not unread:
+                del self._unread[stored.user_id]
+
+    def _enforce_retention(self, user_id: UUID) -> None:
+        """Oublie les plus anciennes notifications au-delà du plafond."""
+        if not self._max_per_user:
+            return
+        bucket = self._buckets.get(user_id, [])
+        excess = len(bucket) - self._max_per_user
+        for _, notification_id in bucket[:max(excess, 0)]:
+            self._detach(self._notifications[notification_id])
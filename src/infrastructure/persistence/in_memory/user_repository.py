@@ -1,11 +1,12 @@
 # src/infrastructure/persistence/in_memory/user_repository.py
 """Implémentation In-Memory du repository User pour les tests."""
 
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Iterable
 from uuid import UUID
 
 from src.domain.identity.entities.user import User
 from src.domain.identity.value_objects.email import Email
+from src.domain.identity.value_objects.user_summary import UserSummary
 from src.domain.identity.repositories.user_repository import IUserRepository
 
 
@@ -20,6 +21,10 @@ class InMemoryUserRepository(IUserRepository):
         self._store: Dict[UUID, User] = {}
         self._email_index: Dict[str, UUID] = {}  # Index pour recherche par email
     
+    def add(self, user: User) -> User:
+        """Persiste un nouvel utilisateur."""
+        return self.save(user)
+    
     def save(self, user: User) -> User:
         """Persiste un utilisateur."""
         self._store[user.id] = user
@@ -30,6 +35,25 @@ class InMemoryUserRepository(IUserRepository):
         """Récupère un utilisateur par ID."""
         return self._store.get(user_id)
     
+    def find_by_ids(self, user_ids: Iterable[UUID]) -> Dict[UUID, UserSummary]:
+        """Récupère les données d'affichage de plusieurs utilisateurs."""
+        summaries: Dict[UUID, UserSummary] = {}
+        for user_id in user_ids:
+            user = self._store.get(user_id)
+            if user:
+                summaries[user_id] = UserSummary(
+                    id=user.id,
+                    first_name=user.first_name,
+                    last_name=user.last_name,
+                    email=str(user.email),
+                    created_at=user.created_at
+                )
+        return summaries
+    
+    def find_entities_by_ids(self, user_ids: Iterable[UUID]) -> Dict[UUID, User]:
+        """Récupère plusieurs utilisateurs complets."""
+        return {i: self._store[i] for i in user_ids if i in self._store}
+    
     def find_by_email(self, email: Email) -> Optional[User]:
         """Récupère un utilisateur par Email (Value Object)."""
         user_id = self._email_index.get(str(email).lower())
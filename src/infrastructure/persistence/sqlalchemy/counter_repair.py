@@ -0,0 +1,144 @@
+# src/infrastructure/persistence/sqlalchemy/counter_repair.py
+"""Recalcul des compteurs dénormalisés des COLLIs et des lettres."""
+
+from typing import Callable, Dict, Iterator, List, Optional
+from uuid import UUID
+
+from sqlalchemy import bindparam, func, select, update
+from sqlalchemy.orm import Session
+
+from src.domain.collaboration.value_objects.membership_status import MembershipStatus
+from src.infrastructure.persistence.sqlalchemy.models.colli_model import ColliModel, MembershipModel
+from src.infrastructure.persistence.sqlalchemy.models.comment_model import CommentModel
+from src.infrastructure.persistence.sqlalchemy.models.letter_model import LetterModel
+
+
+class CounterRepairer:
+    """
+    Recalcule member_count, letter_count, last_activity_at (collis) et
+    comment_count (letters) à partir des tables sources.
+
+    Les compteurs sont tenus à jour par les use cases ; ce recalcul sert
+    après une migration, un import ou une écriture hors application.
+    Chaque lot coûte quelques GROUP BY et un UPDATE groupé (executemany).
+    """
+
+    CHUNK_SIZE = 500
+
+    def __init__(self, session: Session):
+        self._session = session
+
+    def repair_all(
+        self,
+        chunk_size: int = CHUNK_SIZE,
+        on_chunk: Optional[Callable[[str, int], None]] = None
+    ) -> Dict[str, int]:
+        """
+        Recalcule tous les compteurs par lots de `chunk_size` lignes.
+
+        Args:
+            chunk_size: Nombre de COLLIs ou de lettres par lot.
+            on_chunk: Appelé après chaque lot avec (type, taille du lot),
+                par exemple pour valider la transaction.
+
+        Returns:
+            Dict[str, int]: Nombre de lignes recalculées par type.
+        """
+        notify = on_chunk or (lambda kind, count: None)
+        totals = {'collis': 0, 'letters': 0}
+
+        for colli_ids in self._id_chunks(ColliModel.id, chunk_size):
+            self.repair_collis(colli_ids)
+            totals['collis'] += len(colli_ids)
+            notify('collis', len(colli_ids))
+
+        for letter_ids in self._id_chunks(LetterModel.id, chunk_size):
+            self.repair_letters(letter_ids)
+            totals['letters'] += len(letter_ids)
+            notify('letters', len(letter_ids))
+
+        return totals
+
+    def repair_collis(self, colli_ids: List[UUID]) -> None:
+        """Recalcule les compteurs des COLLIs donnés."""
+        members = dict(self._session.execute(
+            select(MembershipModel.colli_id, func.count(MembershipModel.id))
+            .where(MembershipModel.colli_id.in_(colli_ids))
+            .where(MembershipModel.status == MembershipStatus.ACCEPTED.value)
+            .group_by(MembershipModel.colli_id)
+        ).all())
+        letters = {
+            row.colli_id: row
+            for row in self._session.execute(
+                select(
+                    LetterModel.colli_id,
+                    func.count(LetterModel.id).label('count'),
+                    func.max(LetterModel.created_at).label('last_at')
+                )
+                .where(LetterModel.colli_id.in_(colli_ids))
+                .group_by(LetterModel.colli_id)
+            )
+        }
+        last_comments = dict(self._session.execute(
+            select(LetterModel.colli_id, func.max(CommentModel.created_at))
+            .join(CommentModel, CommentModel.letter_id == LetterModel.id)
+            .where(LetterModel.colli_id.in_(colli_ids))
+            .group_by(LetterModel.colli_id)
+        ).all())
+
+        rows = []
+        for colli_id in colli_ids:
+            letter_row = letters.get(colli_id)
+            activity = [
+                at for at in (letter_row.last_at if letter_row else None, last_comments.get(colli_id))
+                if at is not None
+            ]
+            rows.append({
+                'b_id': colli_id,
+                'b_member_count': members.get(colli_id, 0),
+                'b_letter_count': letter_row.count if letter_row else 0,
+                'b_last_activity_at': max(activity) if activity else None,
+            })
+
+        collis = ColliModel.__table__
+        self._session.execute(
+            update(collis)
+            .where(collis.c.id == bindparam('b_id'))
+            .values(
+                member_count=bindparam('b_member_count'),
+                letter_count=bindparam('b_letter_count'),
+                last_activity_at=bindparam('b_last_activity_at'),
+                updated_at=collis.c.updated_at
+            ),
+            rows
+        )
+
+    def repair_letters(self, letter_ids: List[UUID]) -> None:
+        """Recalcule comment_count pour les lettres données."""
+        counts = dict(self._session.execute(
+            select(CommentModel.letter_id, func.count(CommentModel.id))
+            .where(CommentModel.letter_id.in_(letter_ids))
+            .group_by(CommentModel.letter_id)
+        ).all())
+
+        letters = LetterModel.__table__
+        self._session.execute(
+            update(letters)
+            .where(letters.c.id == bindparam('b_id'))
+            .values(comment_count=bindparam('b_comment_count'), updated_at=letters.c.updated_at),
+            [{'b_id': letter_id, 'b_comment_count': counts.get(letter_id, 0)} for letter_id in letter_ids]
+        )
+
+    def _id_chunks(self, column, chunk_size: int) -> Iterator[List[UUID]]:
+        """Parcourt les identifiants d'une table par lots (pagination keyset)."""
+        last_id = None
+        while True:
+            stmt = select(column).order_by(column).limit(chunk_size)
+            if last_id is not None:
+                stmt = stmt.where(column > last_id)
+            ids = list(self._session.scalars(stmt))
+            if ids:
+                yield ids
+            if len(ids) < chunk_size:
+                return
+            last_id = ids[-1]
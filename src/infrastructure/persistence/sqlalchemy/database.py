@@ -1,51 +1,161 @@
 # src/infrastructure/persistence/sqlalchemy/database.py
 """Configuration de la base de données SQLAlchemy."""
 
+import itertools
+from contextvars import ContextVar
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, scoped_session, declarative_base
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker, scoped_session, declarative_base
+from sqlalchemy.sql.dml import UpdateBase
 from contextlib import contextmanager
-from typing import Generator
+from typing import Generator, List, Optional, Sequence
 
 from src.infrastructure.config.settings import get_settings
+from src.infrastructure.persistence.sqlalchemy.pool_metrics import InstrumentedQueuePool, instrument_engine
+from src.infrastructure.persistence.sqlalchemy.query_counter import instrument_queries
 
 
 # Base pour tous les modèles SQLAlchemy
 Base = declarative_base()
 
 
-def create_engine_from_config():
-    """Crée l'engine SQLAlchemy depuis la configuration."""
-    settings = get_settings()
-    
-    # Configuration selon le type de base
-    if settings.DATABASE_URL.startswith('sqlite'):
+# Lectures du contexte courant autorisées sur un réplica (voir replica_reads)
+_replica_reads: ContextVar[bool] = ContextVar("replica_reads", default=False)
+
+
+def _create_engine(url: str, settings):
+    """
+    Crée un engine avec les options de pool de la configuration.
+
+    Le pool est instrumenté (voir pool_metrics) sauf pour SQLite en
+    mémoire, qui garde son pool à connexion unique. Les requêtes sont
+    comptées dans les blocs track_queries (voir query_counter).
+    """
+    if url.startswith('sqlite') and ':memory:' in url:
         engine = create_engine(
-            settings.DATABASE_URL,
+            url,
             connect_args={"check_same_thread": False},
             echo=settings.DEBUG
         )
     else:
-        # PostgreSQL ou autre
+        connect_args = {"check_same_thread": False} if url.startswith('sqlite') else {}
         engine = create_engine(
-            settings.DATABASE_URL,
-            pool_size=5,
-            max_overflow=10,
-            pool_pre_ping=True,
+            url,
+            connect_args=connect_args,
+            poolclass=InstrumentedQueuePool,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+            pool_pre_ping=settings.DB_POOL_PRE_PING,
             echo=settings.DEBUG
         )
-    
+        instrument_engine(engine)
+    instrument_queries(engine)
     return engine
 
 
-def create_session_factory(engine=None):
-    """Crée une factory de sessions."""
+def create_engine_from_config():
+    """Crée l'engine SQLAlchemy depuis la configuration."""
+    settings = get_settings()
+    return _create_engine(settings.DATABASE_URL, settings)
+
+
+class ReplicaSet:
+    """Engines des réplicas en lecture, choisis à tour de rôle."""
+
+    def __init__(self, engines: Sequence[Engine] = ()):
+        self._engines = list(engines)
+        self._counter = itertools.count()
+
+    def __bool__(self) -> bool:
+        return bool(self._engines)
+
+    @property
+    def engines(self) -> List[Engine]:
+        return list(self._engines)
+
+    def next_engine(self) -> Engine:
+        """Réplica suivant (round-robin partagé par toutes les sessions)."""
+        return self._engines[next(self._counter) % len(self._engines)]
+
+
+def create_replica_set() -> ReplicaSet:
+    """Crée les engines des réplicas déclarés dans DATABASE_REPLICA_URLS."""
+    settings = get_settings()
+    return ReplicaSet([
+        _create_engine(url, settings)
+        for url in settings.DATABASE_REPLICA_URLS
+    ])
+
+
+@contextmanager
+def replica_reads() -> Generator:
+    """
+    Autorise les lectures du bloc à partir d'un réplica.
+
+    Sans effet si aucun réplica n'est configuré ou si la session a déjà
+    écrit (ses lectures restent alors sur le primaire).
+    """
+    token = _replica_reads.set(True)
+    try:
+        yield
+    finally:
+        _replica_reads.reset(token)
+
+
+class RoutingSession(Session):
+    """
+    Session qui route les lectures vers les réplicas.
+
+    Une requête part sur un réplica seulement :
+    - à l'intérieur d'un bloc `replica_reads()` ;
+    - si la session n'a rien écrit (flush, INSERT/UPDATE/DELETE en masse)
+      et n'a aucune modification en attente.
+    Tout le reste (écritures, lectures après écriture) va au primaire.
+    Une session lit toujours le même réplica : ses lectures voient un
+    état cohérent et elle ne retient qu'une connexion.
+    """
+
+    def __init__(self, replicas: Optional[ReplicaSet] = None, **kwargs):
+        super().__init__(**kwargs)
+        self._replicas = replicas or ReplicaSet()
+        self._replica: Optional[Engine] = None
+
+    @property
+    def has_written(self) -> bool:
+        """True si la session a écrit sur le primaire depuis son ouverture."""
+        return self.info.get("has_written", False)
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self._flushing or isinstance(clause, UpdateBase):
+            self.info["has_written"] = True
+        elif (
+            self._replicas
+            and _replica_reads.get()
+            and not self.has_written
+            and not (self.new or self.dirty or self.deleted)
+        ):
+            if self._replica is None:
+                self._replica = self._replicas.next_engine()
+            return self._replica
+        return super().get_bind(mapper=mapper, clause=clause, **kwargs)
+
+
+def create_session_factory(engine=None, replicas: Optional[ReplicaSet] = None):
+    """Crée une factory de sessions (routée vers les réplicas s'il y en a)."""
     if engine is None:
         engine = create_engine_from_config()
     
+    options = {}
+    if replicas:
+        options = {"class_": RoutingSession, "replicas": replicas}
+    
     session_factory = sessionmaker(
         bind=engine,
         autocommit=False,
-        autoflush=False
+        autoflush=False,
+        **options
     )
     
     return session_factory
@@ -86,7 +196,10 @@ def init_db(engine=None):
         engine = create_engine_from_config()
     
     # Import des modèles pour que SQLAlchemy les détecte
-    from src.infrastructure.persistence.sqlalchemy.models import colli_model, user_model, letter_model, comment_model
+    from src.infrastructure.persistence.sqlalchemy.models import (
+        colli_model, user_model, letter_model, comment_model, search_document_model,
+        export_job_model, notification_model
+    )
     
     Base.metadata.create_all(bind=engine)
     return engine
@@ -0,0 +1,21 @@
+# src/infrastructure/persistence/sqlalchemy/identity_map.py
+"""Rétention des modèles chargés dans l'identity map d'une session."""
+
+from sqlalchemy.orm import Session
+
+
+_RETAINED_KEY = "retained_models"
+
+
+def retain(session: Session, model):
+    """
+    Garde `model` dans l'identity map jusqu'à la fin de la session.
+
+    L'identity map ne tient que des références faibles : un modèle
+    converti en entité puis abandonné en sort aussitôt, et le
+    `session.get` suivant (save() de la même entité, autre repository de
+    la même requête) repart en base. Référencé dans `session.info`, il y
+    reste jusqu'au `remove()` de fin de requête.
+    """
+    session.info.setdefault(_RETAINED_KEY, {})[(type(model), model.id)] = model
+    return model
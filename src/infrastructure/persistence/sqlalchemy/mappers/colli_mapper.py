@@ -6,6 +6,7 @@ from typing import List
 from src.domain.collaboration.entities.colli import Colli
 from src.domain.collaboration.entities.membership import Membership
 from src.domain.collaboration.value_objects.colli_status import ColliStatus
+from src.domain.collaboration.value_objects.colli_summary import ColliSummary
 from src.domain.collaboration.value_objects.member_role import MemberRole
 from src.domain.collaboration.value_objects.membership_status import MembershipStatus
 from src.infrastructure.persistence.sqlalchemy.models.colli_model import ColliModel, MembershipModel
@@ -23,7 +24,8 @@ class MembershipMapper:
             colli_id=model.colli_id,
             role=MemberRole(model.role),
             status=MembershipStatus(model.status),
-            joined_at=model.joined_at
+            joined_at=model.joined_at,
+            version=model.version
         )
     
     @staticmethod
@@ -67,7 +69,9 @@ class ColliMapper:
             status=ColliStatus(model.status),
             rejection_reason=model.rejection_reason,
             created_at=model.created_at,
-            updated_at=model.updated_at
+            updated_at=model.updated_at,
+            letter_count=model.letter_count or 0,
+            last_activity_at=model.last_activity_at
         )
         
         # Charger les membres si demandé
@@ -98,7 +102,10 @@ class ColliMapper:
             status=entity.status.value,
             rejection_reason=entity.rejection_reason,
             created_at=entity.created_at,
-            updated_at=entity.updated_at
+            updated_at=entity.updated_at,
+            member_count=entity.member_count,
+            letter_count=entity.letter_count,
+            last_activity_at=entity.last_activity_at
         )
         
         # Convertir les membres
@@ -147,8 +154,37 @@ class ColliMapper:
                 existing_model.status = member.status.value
                 existing_model.role = member.role.value
 
+        # L'agrégat, chargé avec tous ses membres, fait foi pour member_count
+        model.member_count = entity.member_count
+
         return model
     
+    @staticmethod
+    def to_summary(row) -> ColliSummary:
+        """
+        Convertit une ligne de projection (colonnes de collis).
+        
+        Args:
+            row: Ligne de SELECT exposant les colonnes par nom.
+            
+        Returns:
+            ColliSummary: La projection de liste.
+        """
+        return ColliSummary(
+            id=row.id,
+            name=row.name,
+            theme=row.theme,
+            description=row.description,
+            creator_id=row.creator_id,
+            status=ColliStatus(row.status),
+            rejection_reason=row.rejection_reason,
+            member_count=row.member_count,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+            letter_count=row.letter_count,
+            last_activity_at=row.last_activity_at
+        )
+    
     @staticmethod
     def to_entity_list(models: List[ColliModel]) -> List[Colli]:
         """Convertit une liste de modèles en entités."""
@@ -0,0 +1,49 @@
+# src/infrastructure/persistence/sqlalchemy/mappers/export_job_mapper.py
+"""Mapper pour convertir entre ExportJob entity et ExportJobModel."""
+
+from src.domain.export.entities.export_job import ExportJob, ExportJobStatus
+from src.infrastructure.persistence.sqlalchemy.models.export_job_model import ExportJobModel
+
+
+class ExportJobMapper:
+    """
+    Mapper bidirectionnel ExportJob Entity ↔ ExportJobModel ORM.
+    """
+    
+    @staticmethod
+    def to_entity(model: ExportJobModel) -> ExportJob:
+        """
+        Convertit un modèle ORM en entité du domaine.
+        """
+        return ExportJob(
+            id=model.id,
+            user_id=model.user_id,
+            status=ExportJobStatus(model.status),
+            archive_path=model.archive_path,
+            archive_size=model.archive_size,
+            error=model.error,
+            created_at=model.created_at,
+            started_at=model.started_at,
+            completed_at=model.completed_at
+        )
+    
+    @staticmethod
+    def to_model(entity: ExportJob) -> ExportJobModel:
+        """
+        Convertit une entité du domaine en modèle ORM.
+        """
+        model = ExportJobModel(id=entity.id, user_id=entity.user_id, created_at=entity.created_at)
+        return ExportJobMapper.update_model(model, entity)
+    
+    @staticmethod
+    def update_model(model: ExportJobModel, entity: ExportJob) -> ExportJobModel:
+        """
+        Met à jour un modèle existant avec les données d'une entité.
+        """
+        model.status = entity.status.value
+        model.archive_path = entity.archive_path
+        model.archive_size = entity.archive_size
+        model.error = entity.error
+        model.started_at = entity.started_at
+        model.completed_at = entity.completed_at
+        return model
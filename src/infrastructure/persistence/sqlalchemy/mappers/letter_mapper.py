@@ -26,7 +26,8 @@ class LetterMapper:
             colli_id=model.colli_id,
             sender_id=model.sender_id,
             created_at=model.created_at,
-            updated_at=model.updated_at
+            updated_at=model.updated_at,
+            comment_count=model.comment_count or 0
         )
     
     @staticmethod
@@ -44,7 +45,8 @@ class LetterMapper:
             colli_id=entity.colli_id,
             sender_id=entity.sender_id,
             created_at=entity.created_at,
-            updated_at=entity.updated_at
+            updated_at=entity.updated_at,
+            comment_count=entity.comment_count
         )
     
     @staticmethod
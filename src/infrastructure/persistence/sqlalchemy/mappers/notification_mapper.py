@@ -0,0 +1,76 @@
+# src/infrastructure/persistence/sqlalchemy/mappers/notification_mapper.py
+"""Mapper pour convertir entre Notification entity et NotificationModel."""
+
+from src.domain.notification.entities.notification import Notification, NotificationType
+from src.infrastructure.persistence.sqlalchemy.models.notification_model import NotificationModel
+
+
+class NotificationMapper:
+    """
+    Mapper bidirectionnel Notification Entity ↔ NotificationModel ORM.
+    """
+    
+    @staticmethod
+    def to_entity(model: NotificationModel) -> Notification:
+        """
+        Convertit un modèle ORM en entité du domaine.
+        """
+        return Notification(
+            id=model.id,
+            user_id=model.user_id,
+            type=NotificationType(model.type),
+            title=model.title,
+            message=model.message,
+            data=model.data,
+            related_entity_id=model.related_entity_id,
+            related_entity_type=model.related_entity_type,
+            read=model.read,
+            read_at=model.read_at,
+            created_at=model.created_at
+        )
+    
+    @staticmethod
+    def to_model(entity: Notification) -> NotificationModel:
+        """
+        Convertit une entité du domaine en modèle ORM.
+        """
+        model = NotificationModel(
+            id=entity.id,
+            user_id=entity.user_id,
+            type=entity.type.value,
+            related_entity_id=entity.related_entity_id,
+            related_entity_type=entity.related_entity_type,
+            created_at=entity.created_at
+        )
+        return NotificationMapper.update_model(model, entity)
+    
+    @staticmethod
+    def to_row(entity: Notification) -> dict:
+        """
+        Convertit une entité en ligne (colonne → valeur) pour un insert en masse.
+        """
+        return {
+            'id': entity.id,
+            'user_id': entity.user_id,
+            'type': entity.type.value,
+            'title': entity.title,
+            'message': entity.message,
+            'data': entity.data,
+            'related_entity_id': entity.related_entity_id,
+            'related_entity_type': entity.related_entity_type,
+            'read': entity.read,
+            'read_at': entity.read_at,
+            'created_at': entity.created_at
+        }
+    
+    @staticmethod
+    def update_model(model: NotificationModel, entity: Notification) -> NotificationModel:
+        """
+        Met à jour un modèle existant avec les données d'une entité.
+        """
+        model.title = entity.title
+        model.message = entity.message
+        model.data = entity.data
+        model.read = entity.read
+        model.read_at = entity.read_at
+        return model
@@ -3,5 +3,13 @@
 
 from src.infrastructure.persistence.sqlalchemy.models.user_model import UserModel
 from src.infrastructure.persistence.sqlalchemy.models.colli_model import ColliModel, MembershipModel
+from src.infrastructure.persistence.sqlalchemy.models.letter_model import LetterModel
+from src.infrastructure.persistence.sqlalchemy.models.comment_model import CommentModel
+from src.infrastructure.persistence.sqlalchemy.models.search_document_model import SearchDocumentModel
+from src.infrastructure.persistence.sqlalchemy.models.export_job_model import ExportJobModel
+from src.infrastructure.persistence.sqlalchemy.models.notification_model import NotificationModel
 
-__all__ = ['UserModel', 'ColliModel', 'MembershipModel']
+__all__ = [
+    'UserModel', 'ColliModel', 'MembershipModel', 'LetterModel', 'CommentModel',
+    'SearchDocumentModel', 'ExportJobModel', 'NotificationModel'
+]
@@ -1,7 +1,7 @@
 # src/infrastructure/persistence/sqlalchemy/models/colli_model.py
 """Modèle SQLAlchemy pour les COLLIs et Memberships."""
 
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Enum as SQLEnum, Uuid
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index, Enum as SQLEnum, Uuid
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import uuid
@@ -14,17 +14,30 @@ class ColliModel(Base):
     Modèle ORM pour la table collis.
     """
     __tablename__ = 'collis'
+    __table_args__ = (
+        # Listes par statut, triées comme la pagination (created_at, id)
+        Index('ix_collis_status_created_at', 'status', 'created_at', 'id'),
+    )
     
     id = Column(Uuid, primary_key=True, default=uuid.uuid4)
     name = Column(String(100), nullable=False)
     theme = Column(String(100), nullable=False)
     description = Column(Text, nullable=True)
-    creator_id = Column(Uuid, ForeignKey('users.id'), nullable=False)
-    status = Column(String(20), nullable=False, default='pending', index=True)
+    creator_id = Column(Uuid, ForeignKey('users.id'), nullable=False, index=True)
+    status = Column(String(20), nullable=False, default='pending')
     rejection_reason = Column(Text, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
+    # Compteurs dénormalisés (voir scripts/repair_counters.py)
+    member_count = Column(Integer, nullable=False, default=0, server_default='0')
+    letter_count = Column(Integer, nullable=False, default=0, server_default='0')
+    last_activity_at = Column(DateTime(timezone=True), nullable=True)
+    
+    # Verrouillage optimiste : UPDATE ... WHERE version = <version lue>
+    version = Column(Integer, nullable=False, default=1, server_default='1')
+    __mapper_args__ = {'version_id_col': version}
+    
     # Relations
     creator = relationship("UserModel", backref="created_collis")
     members = relationship("MembershipModel", back_populates="colli", cascade="all, delete-orphan")
@@ -38,6 +51,14 @@ class MembershipModel(Base):
     Modèle ORM pour la table memberships (appartenance à un COLLI).
     """
     __tablename__ = 'memberships'
+    __table_args__ = (
+        # Index inverse pour "mes COLLIs" : adhésions d'un utilisateur par statut
+        Index('ix_memberships_user_id_status', 'user_id', 'status'),
+        # Contrôle d'appartenance (EXISTS) et comptage des membres d'un COLLI
+        Index('ix_memberships_colli_id_user_id_status', 'colli_id', 'user_id', 'status'),
+        # Une adhésion au plus par utilisateur et par COLLI
+        Index('uq_memberships_colli_id_user_id', 'colli_id', 'user_id', unique=True),
+    )
     
     id = Column(Uuid, primary_key=True, default=uuid.uuid4)
     user_id = Column(Uuid, ForeignKey('users.id'), nullable=False)
@@ -46,6 +67,10 @@ class MembershipModel(Base):
     status = Column(String(20), nullable=False, default='pending')
     joined_at = Column(DateTime(timezone=True), server_default=func.now())
     
+    # Verrouillage optimiste : UPDATE ... WHERE version = <version lue>
+    version = Column(Integer, nullable=False, default=1, server_default='1')
+    __mapper_args__ = {'version_id_col': version}
+    
     # Relations
     user = relationship("UserModel", backref="memberships")
     colli = relationship("ColliModel", back_populates="members")
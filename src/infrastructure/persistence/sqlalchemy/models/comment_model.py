@@ -1,7 +1,7 @@
 # src/infrastructure/persistence/sqlalchemy/models/comment_model.py
 """Modèle SQLAlchemy pour les Comments."""
 
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Uuid
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index, Uuid
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import uuid
@@ -14,16 +14,24 @@ class CommentModel(Base):
     Modèle ORM pour la table comments.
     """
     __tablename__ = 'comments'
+    __table_args__ = (
+        # Commentaires d'une lettre, triés comme la pagination (created_at, id)
+        Index('ix_comments_letter_id_created_at', 'letter_id', 'created_at', 'id'),
+    )
     
     id = Column(Uuid, primary_key=True, default=uuid.uuid4)
     content = Column(Text, nullable=False)
-    letter_id = Column(Uuid, ForeignKey('letters.id'), nullable=False, index=True)
+    letter_id = Column(Uuid, ForeignKey('letters.id'), nullable=False)
     sender_id = Column(Uuid, ForeignKey('users.id'), nullable=False, index=True)
-    parent_comment_id = Column(Uuid, ForeignKey('comments.id'), nullable=True)
+    parent_comment_id = Column(Uuid, ForeignKey('comments.id'), nullable=True, index=True)
     attachment_url = Column(String(500), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+    # Verrouillage optimiste : UPDATE ... WHERE version = <version lue>
+    version = Column(Integer, nullable=False, default=1, server_default='1')
+    __mapper_args__ = {'version_id_col': version}
+
     # Relations
     sender = relationship("UserModel", backref="comments")
     letter = relationship("LetterModel", back_populates="comments")
@@ -0,0 +1,33 @@
+# src/infrastructure/persistence/sqlalchemy/models/export_job_model.py
+"""Modèle SQLAlchemy pour les jobs d'export RGPD."""
+
+from sqlalchemy import Column, String, Text, DateTime, BigInteger, ForeignKey, Index, Uuid
+from sqlalchemy.sql import func
+import uuid
+
+from src.infrastructure.persistence.sqlalchemy.database import Base
+
+
+class ExportJobModel(Base):
+    """
+    Modèle ORM pour la table export_jobs.
+    
+    Sert de file d'état partagée entre l'API et le worker.
+    """
+    __tablename__ = 'export_jobs'
+    __table_args__ = (
+        Index('ix_export_jobs_user_id_status', 'user_id', 'status'),
+    )
+    
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    user_id = Column(Uuid, ForeignKey('users.id'), nullable=False)
+    status = Column(String(20), nullable=False, default='pending')
+    archive_path = Column(String(500), nullable=True)
+    archive_size = Column(BigInteger, nullable=True)
+    error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    completed_at = Column(DateTime(timezone=True), nullable=True)
+    
+    def __repr__(self):
+        return f"<ExportJobModel(id={self.id}, status={self.status})>"
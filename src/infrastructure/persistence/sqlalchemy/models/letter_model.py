@@ -1,7 +1,7 @@
 # src/infrastructure/persistence/sqlalchemy/models/letter_model.py
 """Modèle SQLAlchemy pour les Letters."""
 
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Uuid
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index, Uuid
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import uuid
@@ -14,6 +14,10 @@ class LetterModel(Base):
     Modèle ORM pour la table letters.
     """
     __tablename__ = 'letters'
+    __table_args__ = (
+        # Lettres d'un COLLI, triées comme la pagination (created_at, id)
+        Index('ix_letters_colli_id_created_at', 'colli_id', 'created_at', 'id'),
+    )
     
     id = Column(Uuid, primary_key=True, default=uuid.uuid4)
     letter_type = Column(String(20), nullable=False, default='text')
@@ -21,11 +25,18 @@ class LetterModel(Base):
     content = Column(Text, nullable=True)
     file_url = Column(String(255), nullable=True)
     file_name = Column(String(255), nullable=True)
-    colli_id = Column(Uuid, ForeignKey('collis.id'), nullable=False, index=True)
+    colli_id = Column(Uuid, ForeignKey('collis.id'), nullable=False)
     sender_id = Column(Uuid, ForeignKey('users.id'), nullable=False, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
+    # Compteur dénormalisé (voir scripts/repair_counters.py)
+    comment_count = Column(Integer, nullable=False, default=0, server_default='0')
+    
+    # Verrouillage optimiste : UPDATE ... WHERE version = <version lue>
+    version = Column(Integer, nullable=False, default=1, server_default='1')
+    __mapper_args__ = {'version_id_col': version}
+    
     # Relations
     sender = relationship("UserModel", backref="letters")
     colli = relationship("ColliModel", backref="letters")
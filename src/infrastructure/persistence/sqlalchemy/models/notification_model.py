@@ -0,0 +1,44 @@
+# src/infrastructure/persistence/sqlalchemy/models/notification_model.py
+"""Modèle SQLAlchemy pour les Notifications."""
+
+from sqlalchemy import Column, String, Text, Boolean, DateTime, ForeignKey, Index, JSON, Uuid, false
+from sqlalchemy.sql import func
+import uuid
+
+from src.infrastructure.persistence.sqlalchemy.database import Base
+
+
+class NotificationModel(Base):
+    """
+    Modèle ORM pour la table notifications.
+    
+    Index:
+    - (user_id, created_at DESC) : liste des notifications d'un utilisateur
+    - (user_id) WHERE NOT read : index partiel pour le compteur de non-lues
+      et « tout marquer comme lu », qui ne touchent que les lignes non lues
+    """
+    __tablename__ = 'notifications'
+    
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    user_id = Column(Uuid, ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
+    type = Column(String(30), nullable=False)
+    title = Column(String(255), nullable=False)
+    message = Column(Text, nullable=False)
+    data = Column(JSON, nullable=True)
+    related_entity_id = Column(Uuid, nullable=True)
+    related_entity_type = Column(String(30), nullable=True)
+    read = Column(Boolean, nullable=False, default=False, server_default=false())
+    read_at = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    __table_args__ = (
+        Index('ix_notifications_user_id_created_at', user_id, created_at.desc()),
+        Index(
+            'ix_notifications_user_id_unread', user_id,
+            postgresql_where=read.is_(False),
+            sqlite_where=read.is_(False)
+        ),
+    )
+    
+    def __repr__(self):
+        return f"<NotificationModel(id={self.id}, user_id={self.user_id}, read={self.read})>"
@@ -0,0 +1,79 @@
+# src/infrastructure/persistence/sqlalchemy/models/search_document_model.py
+"""Modèle SQLAlchemy pour l'index de recherche plein texte."""
+
+from sqlalchemy import (
+    Column, Integer, String, Text, DateTime, Uuid, Index, UniqueConstraint, DDL, event
+)
+
+from src.infrastructure.persistence.sqlalchemy.database import Base
+
+
+class SearchDocumentModel(Base):
+    """
+    Modèle ORM pour la table search_documents.
+    
+    Table de documents dénormalisés. L'index plein texte dépend du SGBD :
+    - SQLite : table virtuelle FTS5 `search_documents_fts` (external
+      content) synchronisée par triggers ;
+    - PostgreSQL : colonne générée `search_vector` (tsvector) + index GIN.
+    """
+    __tablename__ = 'search_documents'
+    __table_args__ = (
+        UniqueConstraint('doc_type', 'doc_id', name='uq_search_documents_doc'),
+        Index('ix_search_documents_type_colli', 'doc_type', 'colli_id'),
+    )
+    
+    # rowid entier requis par FTS5 (content_rowid)
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    doc_type = Column(String(20), nullable=False)
+    doc_id = Column(Uuid, nullable=False)
+    colli_id = Column(Uuid, nullable=True)
+    status = Column(String(20), nullable=True)
+    title = Column(String(255), nullable=False, default='')
+    body = Column(Text, nullable=False, default='')
+    created_at = Column(DateTime(timezone=True), nullable=True)
+    
+    def __repr__(self):
+        return f"<SearchDocumentModel(doc_type={self.doc_type}, doc_id={self.doc_id})>"
+
+
+# =============================================================================
+# DDL spécifique au SGBD
+# =============================================================================
+
+_table = SearchDocumentModel.__table__
+
+_SQLITE_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS search_documents_fts USING fts5("
+    "title, body, content='search_documents', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER IF NOT EXISTS search_documents_ai AFTER INSERT ON search_documents BEGIN "
+    "INSERT INTO search_documents_fts(rowid, title, body) VALUES (new.id, new.title, new.body); END",
+    "CREATE TRIGGER IF NOT EXISTS search_documents_ad AFTER DELETE ON search_documents BEGIN "
+    "INSERT INTO search_documents_fts(search_documents_fts, rowid, title, body) "
+    "VALUES ('delete', old.id, old.title, old.body); END",
+    "CREATE TRIGGER IF NOT EXISTS search_documents_au AFTER UPDATE ON search_documents BEGIN "
+    "INSERT INTO search_documents_fts(search_documents_fts, rowid, title, body) "
+    "VALUES ('delete', old.id, old.title, old.body); "
+    "INSERT INTO search_documents_fts(rowid, title, body) VALUES (new.id, new.title, new.body); END",
+]
+
+_POSTGRES_DDL = [
+    "ALTER TABLE search_documents ADD COLUMN IF NOT EXISTS search_vector tsvector "
+    "GENERATED ALWAYS AS ("
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(body, '')), 'B')) STORED",
+    "CREATE INDEX IF NOT EXISTS ix_search_documents_search_vector "
+    "ON search_documents USING GIN (search_vector)",
+]
+
+for _statement in _SQLITE_DDL:
+    event.listen(_table, 'after_create', DDL(_statement).execute_if(dialect='sqlite'))
+for _statement in _POSTGRES_DDL:
+    event.listen(_table, 'after_create', DDL(_statement).execute_if(dialect='postgresql'))
+
+# La table virtuelle FTS5 n'est pas connue de la metadata : la supprimer avec la table
+event.listen(
+    _table, 'before_drop',
+    DDL("DROP TABLE IF EXISTS search_documents_fts").execute_if(dialect='sqlite')
+)
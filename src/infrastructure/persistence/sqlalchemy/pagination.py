@@ -0,0 +1,45 @@
+# src/infrastructure/persistence/sqlalchemy/pagination.py
+"""Helpers SQLAlchemy pour la pagination offset/keyset."""
+
+from typing import Optional
+
+from sqlalchemy import Select, and_, or_
+
+from src.domain.shared.page_cursor import PageCursor
+
+
+def paginate(
+    query: Select,
+    model,
+    page: int = 1,
+    per_page: int = 20,
+    cursor: Optional[PageCursor] = None,
+    descending: bool = True
+) -> Select:
+    """
+    Trie une requête sur (created_at, id) et applique la pagination.
+
+    Avec un curseur, la requête reprend strictement après la position
+    (created_at, id) encodée : le coût est indépendant de la profondeur
+    de la page, contrairement à OFFSET. L'id sert de départage pour les
+    créations simultanées.
+    """
+    if descending:
+        query = query.order_by(model.created_at.desc(), model.id.desc())
+    else:
+        query = query.order_by(model.created_at.asc(), model.id.asc())
+
+    if cursor is None:
+        return query.offset((page - 1) * per_page).limit(per_page)
+
+    if descending:
+        after = or_(
+            model.created_at < cursor.created_at,
+            and_(model.created_at == cursor.created_at, model.id < cursor.id)
+        )
+    else:
+        after = or_(
+            model.created_at > cursor.created_at,
+            and_(model.created_at == cursor.created_at, model.id > cursor.id)
+        )
+    return query.where(after).limit(per_page)
@@ -0,0 +1,140 @@
+# src/infrastructure/persistence/sqlalchemy/pool_metrics.py
+"""Statistiques des pools de connexions SQLAlchemy."""
+
+import bisect
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+
+class PoolMetrics:
+    """
+    Compteurs d'un pool de connexions, alimentés par les événements du pool.
+
+    L'attente d'une connexion est répartie dans un histogramme cumulatif
+    (bornes en millisecondes, à la Prometheus) : une dérive des buckets
+    hauts signale un pool sous-dimensionné avant les `QueuePool limit`.
+    """
+
+    WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._wait_counts = [0] * (len(self.WAIT_BUCKETS_MS) + 1)
+        self._wait_sum = 0.0
+        self.connects = 0
+        self.checkouts = 0
+        self.invalidations = 0
+        self.timeouts = 0
+
+    def listen(self, pool) -> None:
+        """Abonne les compteurs aux événements du pool."""
+        event.listen(pool, "connect", self._on_connect)
+        event.listen(pool, "checkout", self._on_checkout)
+        event.listen(pool, "invalidate", self._on_invalidate)
+
+    def record_wait(self, seconds: float) -> None:
+        """Enregistre le temps d'obtention d'une connexion."""
+        index = bisect.bisect_left(self.WAIT_BUCKETS_MS, seconds * 1000)
+        with self._lock:
+            self._wait_counts[index] += 1
+            self._wait_sum += seconds
+
+    def record_timeout(self) -> None:
+        """Enregistre une attente abandonnée (pool_timeout dépassé)."""
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Compteurs et histogramme d'attente (cumulatif)."""
+        with self._lock:
+            counts = list(self._wait_counts)
+            buckets: List[Dict[str, Any]] = []
+            total = 0
+            for bound, count in zip(self.WAIT_BUCKETS_MS + ("+Inf",), counts):
+                total += count
+                buckets.append({"le_ms": bound, "count": total})
+            return {
+                "connects": self.connects,
+                "checkouts": self.checkouts,
+                "invalidations": self.invalidations,
+                "timeouts": self.timeouts,
+                "wait": {
+                    "count": total,
+                    "sum_ms": round(self._wait_sum * 1000, 3),
+                    "buckets": buckets,
+                },
+            }
+
+    def _on_connect(self, dbapi_connection, connection_record) -> None:
+        with self._lock:
+            self.connects += 1
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        with self._lock:
+            self.checkouts += 1
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception) -> None:
+        with self._lock:
+            self.invalidations += 1
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    QueuePool qui chronomètre l'obtention des connexions.
+
+    Aucun événement SQLAlchemy ne précède l'attente d'une connexion :
+    seul le pool lui-même peut la mesurer.
+    """
+
+    metrics: Optional[PoolMetrics] = None
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            if self.metrics is not None:
+                self.metrics.record_timeout()
+            raise
+        finally:
+            if self.metrics is not None:
+                self.metrics.record_wait(time.perf_counter() - started)
+
+    def recreate(self):
+        # dispose()/invalidation : le nouveau pool garde les mêmes compteurs
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+def instrument_engine(engine: Engine) -> Optional[PoolMetrics]:
+    """Branche des compteurs sur le pool de l'engine (InstrumentedQueuePool)."""
+    pool = engine.pool
+    if not isinstance(pool, InstrumentedQueuePool):
+        return None
+    pool.metrics = PoolMetrics()
+    pool.metrics.listen(pool)
+    return pool.metrics
+
+
+def pool_status(engine: Engine) -> Dict[str, Any]:
+    """État courant du pool d'un engine, et ses compteurs s'il est instrumenté."""
+    pool = engine.pool
+    status: Dict[str, Any] = {"pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update({
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": max(pool.overflow(), 0),
+            "timeout": pool.timeout(),
+        })
+    metrics = getattr(pool, "metrics", None)
+    if metrics is not None:
+        status.update(metrics.snapshot())
+    return status
@@ -0,0 +1,55 @@
+# src/infrastructure/persistence/sqlalchemy/queries/admin_stats_query.py
+"""Implémentation SQLAlchemy des statistiques admin."""
+
+from sqlalchemy import func, literal, union_all, select
+from sqlalchemy.orm import Session
+
+from src.application.dtos.admin_stats_dto import AdminStatsDTO
+from src.application.interfaces.admin_stats_query import IAdminStatsQuery
+from src.infrastructure.persistence.sqlalchemy.models.user_model import UserModel
+from src.infrastructure.persistence.sqlalchemy.models.colli_model import ColliModel
+from src.infrastructure.persistence.sqlalchemy.models.letter_model import LetterModel
+from src.infrastructure.persistence.sqlalchemy.models.comment_model import CommentModel
+
+
+class SQLAlchemyAdminStatsQuery(IAdminStatsQuery):
+    """
+    Calcule toutes les statistiques en un seul aller-retour.
+    
+    Une requête UNION ALL regroupe les COUNT(*) GROUP BY role (users),
+    GROUP BY status (collis) et les totaux lettres/commentaires.
+    """
+    
+    def __init__(self, session: Session):
+        self._session = session
+    
+    def get_stats(self) -> AdminStatsDTO:
+        """Exécute la requête agrégée et construit le DTO."""
+        query = union_all(
+            select(literal('users').label('kind'), UserModel.role.label('key'), func.count())
+                .group_by(UserModel.role),
+            select(literal('collis').label('kind'), ColliModel.status.label('key'), func.count())
+                .group_by(ColliModel.status),
+            select(literal('letters').label('kind'), literal('').label('key'), func.count())
+                .select_from(LetterModel),
+            select(literal('comments').label('kind'), literal('').label('key'), func.count())
+                .select_from(CommentModel),
+        )
+        
+        users_by_role = {}
+        collis_by_status = {}
+        totals = {'letters': 0, 'comments': 0}
+        for kind, key, count in self._session.execute(query):
+            if kind == 'users':
+                users_by_role[key] = count
+            elif kind == 'collis':
+                collis_by_status[key] = count
+            else:
+                totals[kind] = count
+        
+        return AdminStatsDTO(
+            users_by_role=users_by_role,
+            collis_by_status=collis_by_status,
+            total_letters=totals['letters'],
+            total_comments=totals['comments'],
+        )
@@ -0,0 +1,114 @@
+# src/infrastructure/persistence/sqlalchemy/query_counter.py
+"""Comptage des requêtes SQL exécutées dans un contexte (requête HTTP, test)."""
+
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Generator, List, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+# Comptages actifs du contexte courant (imbriqués : requête HTTP dans un test)
+_active: ContextVar[Tuple["QueryStats", ...]] = ContextVar("query_stats", default=())
+
+_WHITESPACE = re.compile(r"\s+")
+_NUMBER = re.compile(r"\b\d+(\.\d+)?\b")
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*(\?|%\(\w+\)s|:\w+)(\s*,\s*(\?|%\(\w+\)s|:\w+))*\s*\)")
+
+
+def normalize_statement(statement: str) -> str:
+    """
+    Forme canonique d'une requête : littéraux et listes IN (...) remplacés.
+
+    Deux exécutions du même code avec des paramètres différents donnent
+    la même forme, ce qui révèle les boucles N+1.
+    """
+    statement = _STRING.sub("?", statement)
+    statement = _NUMBER.sub("?", statement)
+    statement = _PLACEHOLDER_LIST.sub("(?)", statement)
+    return _WHITESPACE.sub(" ", statement).strip()
+
+
+class QueryStats:
+    """Nombre de requêtes, temps base cumulé et répétitions par forme."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.statements: Counter = Counter()
+
+    def record(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+        self.statements[normalize_statement(statement)] += 1
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """Formes exécutées plus de `threshold` fois, les plus fréquentes d'abord."""
+        return [
+            (statement, count)
+            for statement, count in self.statements.most_common()
+            if count > threshold
+        ]
+
+
+@contextmanager
+def track_queries() -> Generator[QueryStats, None, None]:
+    """
+    Compte les requêtes exécutées dans le bloc.
+
+    Usage:
+        with track_queries() as stats:
+            repository.find_all()
+        print(stats.count, stats.duration)
+    """
+    stats = QueryStats()
+    token = _active.set(_active.get() + (stats,))
+    try:
+        yield stats
+    finally:
+        _active.reset(token)
+
+
+def start_tracking() -> Tuple[QueryStats, object]:
+    """Variante sans bloc de track_queries (hooks Flask) ; voir stop_tracking."""
+    stats = QueryStats()
+    return stats, _active.set(_active.get() + (stats,))
+
+
+def stop_tracking(token) -> None:
+    """Termine un comptage ouvert par start_tracking."""
+    _active.reset(token)
+
+
+def instrument_queries(engine: Engine) -> None:
+    """Branche le comptage sur les exécutions de l'engine."""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _active.get():
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    active = _active.get()
+    started = conn.info.get("query_started")
+    if not active or not started:
+        return
+    duration = time.perf_counter() - started.pop()
+    for stats in active:
+        stats.record(statement, duration)
+
+
+def _handle_error(exception_context):
+    connection = exception_context.connection
+    started = connection.info.get("query_started") if connection is not None else None
+    if started:
+        started.pop()
@@ -1,111 +1,280 @@
 # src/infrastructure/persistence/sqlalchemy/repositories/colli_repository.py
 """Implémentation SQLAlchemy du repository Colli."""
 
-from typing import Optional, List
+from datetime import datetime
+from typing import Optional, List, Dict, Iterable
 from uuid import UUID
 
+from sqlalchemy import Select, select, update, and_, or_, exists, func, lambda_stmt
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm.exc import StaleDataError
 
+from src.domain.shared.page_cursor import PageCursor
 from src.domain.collaboration.entities.colli import Colli
 from src.domain.collaboration.value_objects.colli_status import ColliStatus
+from src.domain.collaboration.value_objects.colli_summary import ColliSummary
+from src.domain.collaboration.value_objects.membership_status import MembershipStatus
+from src.domain.collaboration.value_objects.member_role import MemberRole
+from src.domain.collaboration.value_objects.colli_role_filter import ColliRoleFilter
 from src.domain.collaboration.repositories.colli_repository import IColliRepository
-from src.infrastructure.persistence.sqlalchemy.models.colli_model import ColliModel
+from src.infrastructure.persistence.sqlalchemy.identity_map import retain
+from src.infrastructure.persistence.sqlalchemy.models.colli_model import ColliModel, MembershipModel
 from src.infrastructure.persistence.sqlalchemy.mappers.colli_mapper import ColliMapper
-from src.application.exceptions import PersistenceException
+from src.infrastructure.persistence.sqlalchemy.pagination import paginate
+from src.application.exceptions import ConflictException, PersistenceException
 
 
 class SQLAlchemyColliRepository(IColliRepository):
     """
     Implémentation SQLAlchemy du repository Colli.
     
-    Utilise joinedload pour éviter les problèmes N+1.
+    Utilise joinedload pour éviter les problèmes N+1 (d'où `unique()`
+    sur les résultats). Les requêtes de forme fixe sont des `lambda_stmt` :
+    construites une fois, puis réutilisées depuis le cache.
     """
     
     def __init__(self, session: Session):
         self._session = session
     
+    def add(self, colli: Colli) -> Colli:
+        """Persiste un nouveau Colli : INSERT direct, sans SELECT préalable."""
+        try:
+            model = ColliMapper.to_model(colli)
+            self._session.add(model)
+            self._session.flush()
+            retain(self._session, model)
+            return colli
+        except IntegrityError as e:
+            self._session.rollback()
+            raise PersistenceException(f"Erreur d'intégrité: {e}")
+    
     def save(self, colli: Colli) -> Colli:
-        """Persiste un Colli."""
+        """
+        Persiste un Colli : UPDATE de la ligne existante, INSERT à défaut.
+        
+        Une version lue périmée (écriture concurrente) lève ConflictException.
+        """
+        existing = self._get_model(colli.id)
+        if not existing:
+            return self.add(colli)
         try:
-            existing = self._session.query(ColliModel)\
-                .options(joinedload(ColliModel.members))\
-                .filter_by(id=colli.id)\
-                .first()
-            
-            if existing:
-                # Update
-                ColliMapper.update_model(existing, colli)
-                self._session.flush()
-                return colli
-            else:
-                # Create
-                model = ColliMapper.to_model(colli)
-                self._session.add(model)
-                self._session.flush()
-                return colli
-                
+            ColliMapper.update_model(existing, colli)
+            self._session.flush()
+            return colli
+        except StaleDataError:
+            self._session.rollback()
+            raise ConflictException(f"Le COLLI {colli.id} a été modifié par une autre requête")
         except IntegrityError as e:
             self._session.rollback()
             raise PersistenceException(f"Erreur d'intégrité: {e}")
     
     def find_by_id(self, colli_id: UUID) -> Optional[Colli]:
         """Récupère un Colli avec ses membres (eager loading)."""
-        model = self._session.query(ColliModel)\
-            .options(joinedload(ColliModel.members))\
-            .filter_by(id=colli_id)\
-            .first()
+        model = self._get_model(colli_id)
         if model:
             return ColliMapper.to_entity(model)
         return None
     
-    def find_all(self, page: int = 1, per_page: int = 20) -> List[Colli]:
-        """Récupère tous les Collis avec pagination."""
-        offset = (page - 1) * per_page
-        models = self._session.query(ColliModel)\
-            .options(joinedload(ColliModel.members))\
-            .order_by(ColliModel.created_at.desc())\
-            .offset(offset)\
-            .limit(per_page)\
-            .all()
+    def find_all(
+        self,
+        page: int = 1,
+        per_page: int = 20,
+        cursor: Optional[PageCursor] = None
+    ) -> List[Colli]:
+        """Récupère tous les Collis avec pagination (offset ou curseur)."""
+        query = paginate(self._with_members(), ColliModel, page, per_page, cursor)
+        models = self._session.scalars(query).unique().all()
         return ColliMapper.to_entity_list(models)
     
-    def find_by_status(self, status: ColliStatus, page: int = 1, per_page: int = 20) -> List[Colli]:
-        """Récupère les Collis par statut avec pagination."""
-        offset = (page - 1) * per_page
-        models = self._session.query(ColliModel)\
-            .options(joinedload(ColliModel.members))\
-            .filter_by(status=status.value)\
-            .order_by(ColliModel.created_at.desc())\
-            .offset(offset)\
-            .limit(per_page)\
-            .all()
+    def find_by_status(
+        self,
+        status: ColliStatus,
+        page: int = 1,
+        per_page: int = 20,
+        cursor: Optional[PageCursor] = None
+    ) -> List[Colli]:
+        """Récupère les Collis par statut avec pagination (offset ou curseur)."""
+        query = self._with_members().where(ColliModel.status == status.value)
+        query = paginate(query, ColliModel, page, per_page, cursor)
+        models = self._session.scalars(query).unique().all()
         return ColliMapper.to_entity_list(models)
     
+    def find_summaries(
+        self,
+        status: Optional[ColliStatus] = None,
+        page: int = 1,
+        per_page: int = 20,
+        cursor: Optional[PageCursor] = None
+    ) -> List[ColliSummary]:
+        """Récupère une page de projections (une ligne par Colli, sans jointure)."""
+        query = self._summaries()
+        if status is not None:
+            query = query.where(ColliModel.status == status.value)
+        rows = self._session.execute(paginate(query, ColliModel, page, per_page, cursor)).all()
+        return [ColliMapper.to_summary(row) for row in rows]
+    
+    def find_summaries_by_ids(self, colli_ids: Iterable[UUID]) -> Dict[UUID, ColliSummary]:
+        """Récupère les projections de plusieurs Collis via IN (...)."""
+        ids = list(dict.fromkeys(colli_ids))
+        if not ids:
+            return {}
+        rows = self._session.execute(self._summaries().where(ColliModel.id.in_(ids))).all()
+        return {row.id: ColliMapper.to_summary(row) for row in rows}
+    
     def find_by_creator(self, creator_id: UUID) -> List[Colli]:
         """Récupère les Collis d'un créateur."""
-        models = self._session.query(ColliModel)\
-            .options(joinedload(ColliModel.members))\
-            .filter_by(creator_id=creator_id)\
-            .order_by(ColliModel.created_at.desc())\
-            .all()
+        stmt = lambda_stmt(
+            lambda: select(ColliModel)
+            .options(joinedload(ColliModel.members))
+            .where(ColliModel.creator_id == creator_id)
+            .order_by(ColliModel.created_at.desc())
+        )
+        models = self._session.scalars(stmt).unique().all()
+        return ColliMapper.to_entity_list(models)
+    
+    def find_by_member(
+        self,
+        user_id: UUID,
+        role_filter: ColliRoleFilter = ColliRoleFilter.ALL,
+        page: int = 1,
+        per_page: int = 20
+    ) -> List[Colli]:
+        """Récupère les Collis d'un utilisateur, filtrés et paginés en SQL."""
+        query = self._with_members().where(self._member_criterion(user_id, role_filter))
+        models = self._session.scalars(paginate(query, ColliModel, page, per_page)).unique().all()
         return ColliMapper.to_entity_list(models)
     
+    def count_by_member(
+        self,
+        user_id: UUID,
+        role_filter: ColliRoleFilter = ColliRoleFilter.ALL
+    ) -> int:
+        """Compte les Collis d'un utilisateur pour un filtre de rôle."""
+        return self._session.scalar(
+            select(func.count(ColliModel.id)).where(self._member_criterion(user_id, role_filter))
+        )
+    
+    @staticmethod
+    def _member_criterion(user_id: UUID, role_filter: ColliRoleFilter):
+        """Construit le filtre créateur/membre (adhésions via l'index memberships(user_id, status))."""
+        is_creator = ColliModel.creator_id == user_id
+        has_membership = ColliModel.id.in_(
+            select(MembershipModel.colli_id).where(MembershipModel.user_id == user_id)
+        )
+        if role_filter == ColliRoleFilter.CREATOR:
+            return is_creator
+        if role_filter == ColliRoleFilter.MEMBER:
+            return and_(has_membership, ColliModel.creator_id != user_id)
+        return or_(is_creator, has_membership)
+    
+    def is_accepted_member(
+        self,
+        colli_id: UUID,
+        user_id: UUID,
+        role: Optional[MemberRole] = None
+    ) -> bool:
+        """
+        Vérifie l'appartenance par un EXISTS sur l'index
+        memberships(colli_id, user_id, status) (et collis.id pour le créateur).
+        """
+        membership = select(MembershipModel.id)\
+            .where(MembershipModel.colli_id == colli_id)\
+            .where(MembershipModel.user_id == user_id)\
+            .where(MembershipModel.status == MembershipStatus.ACCEPTED.value)
+        if role is not None:
+            return self._session.scalar(
+                select(exists(membership.where(MembershipModel.role == role.value)))
+            )
+        is_creator = select(ColliModel.id)\
+            .where(ColliModel.id == colli_id)\
+            .where(ColliModel.creator_id == user_id)
+        return self._session.scalar(select(or_(exists(membership), exists(is_creator))))
+    
+    def find_accepted_member_ids(self, colli_ids: Iterable[UUID]) -> Dict[UUID, List[UUID]]:
+        """Sélectionne (colli_id, user_id) des adhésions ACCEPTED via IN (...), sans jointure."""
+        ids = list(dict.fromkeys(colli_ids))
+        members: Dict[UUID, List[UUID]] = {colli_id: [] for colli_id in ids}
+        if not ids:
+            return members
+        rows = self._session.execute(
+            select(MembershipModel.colli_id, MembershipModel.user_id)
+            .where(MembershipModel.colli_id.in_(ids))
+            .where(MembershipModel.status == MembershipStatus.ACCEPTED.value)
+        ).all()
+        for colli_id, user_id in rows:
+            members[colli_id].append(user_id)
+        return members
+    
+    def update_activity(
+        self,
+        colli_id: UUID,
+        letter_delta: int = 0,
+        active_at: Optional[datetime] = None,
+        member_delta: int = 0
+    ) -> None:
+        """
+        Ajuste les compteurs par un UPDATE relatif (letter_count + delta),
+        sans relire le Colli ni toucher à updated_at.
+        """
+        values = {
+            'letter_count': ColliModel.letter_count + letter_delta,
+            'updated_at': ColliModel.updated_at,
+        }
+        if member_delta:
+            # update_model réécrit member_count : un agrégat chargé avant
+            # cette adhésion doit échouer en conflit plutôt que l'écraser
+            values['member_count'] = ColliModel.member_count + member_delta
+            values['version'] = ColliModel.version + 1
+        if active_at is not None:
+            values['last_activity_at'] = active_at
+        self._session.execute(
+            update(ColliModel).where(ColliModel.id == colli_id).values(**values)
+        )
+    
     def delete(self, colli: Colli) -> bool:
         """Supprime un Colli."""
-        model = self._session.query(ColliModel).filter_by(id=colli.id).first()
-        if model:
+        model = self._get_model(colli.id)
+        if not model:
+            return False
+        try:
             self._session.delete(model)
             self._session.flush()
             return True
-        return False
+        except StaleDataError:
+            self._session.rollback()
+            raise ConflictException(f"Le COLLI {colli.id} a été modifié par une autre requête")
     
     def count(self) -> int:
         """Compte les Collis."""
-        return self._session.query(ColliModel).count()
+        return self._session.scalar(select(func.count(ColliModel.id)))
     
     def count_by_status(self, status: ColliStatus) -> int:
         """Compte les Collis par statut."""
-        return self._session.query(ColliModel)\
-            .filter_by(status=status.value)\
-            .count()
+        status_value = status.value
+        stmt = lambda_stmt(
+            lambda: select(func.count(ColliModel.id)).where(ColliModel.status == status_value)
+        )
+        return self._session.scalar(stmt)
+    
+    @staticmethod
+    def _summaries() -> Select:
+        """SELECT des colonnes des Collis, compteurs dénormalisés compris."""
+        return select(*ColliModel.__table__.columns)
+    
+    @staticmethod
+    def _with_members() -> Select:
+        """SELECT des Collis avec leurs membres en jointure."""
+        return select(ColliModel).options(joinedload(ColliModel.members))
+    
+    def _get_model(self, colli_id: UUID) -> Optional[ColliModel]:
+        """
+        Charge le modèle d'un Colli avec ses membres.
+        
+        `session.get` consulte d'abord l'identity map : un Colli déjà
+        chargé dans la requête ne coûte pas de second aller-retour.
+        """
+        model = self._session.get(ColliModel, colli_id, options=[joinedload(ColliModel.members)])
+        if model is not None:
+            retain(self._session, model)
+        return model
@@ -1,81 +1,212 @@
 # src/infrastructure/persistence/sqlalchemy/repositories/comment_repository.py
 """Implémentation SQLAlchemy du repository Comment."""
 
-from typing import Optional, List
+from typing import Optional, List, Dict, Iterable
 from uuid import UUID
 
+from sqlalchemy import Integer, func, lambda_stmt, literal, select
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm.exc import StaleDataError
 
+from src.domain.shared.page_cursor import PageCursor
 from src.domain.collaboration.entities.comment import Comment
 from src.domain.collaboration.repositories.comment_repository import ICommentRepository
+from src.infrastructure.persistence.sqlalchemy.identity_map import retain
 from src.infrastructure.persistence.sqlalchemy.models.comment_model import CommentModel
 from src.infrastructure.persistence.sqlalchemy.mappers.comment_mapper import CommentMapper
-from src.application.exceptions import PersistenceException
+from src.infrastructure.persistence.sqlalchemy.pagination import paginate
+from src.application.exceptions import ConflictException, PersistenceException
 
 
 class SQLAlchemyCommentRepository(ICommentRepository):
     """
     Implémentation SQLAlchemy du repository Comment.
+    
+    Les requêtes de forme fixe sont des `lambda_stmt` : construites une
+    fois, puis réutilisées depuis le cache avec de nouveaux paramètres.
     """
     
     def __init__(self, session: Session):
         self._session = session
     
+    def add(self, comment: Comment) -> Comment:
+        """Persiste un nouveau commentaire : INSERT direct, sans SELECT préalable."""
+        try:
+            model = CommentMapper.to_model(comment)
+            self._session.add(model)
+            self._session.flush()
+            retain(self._session, model)
+            return comment
+        except IntegrityError as e:
+            self._session.rollback()
+            raise PersistenceException(f"Erreur d'intégrité: {e}")
+    
     def save(self, comment: Comment) -> Comment:
-        """Persiste un commentaire."""
+        """
+        Persiste un commentaire : UPDATE de la ligne existante, INSERT à défaut.
+        
+        Une version lue périmée (écriture concurrente) lève ConflictException.
+        """
+        existing = self._get_model(comment.id)
+        if not existing:
+            return self.add(comment)
         try:
-            existing = self._session.query(CommentModel).filter_by(id=comment.id).first()
-            
-            if existing:
-                CommentMapper.update_model(existing, comment)
-                self._session.flush()
-                return comment
-            else:
-                model = CommentMapper.to_model(comment)
-                self._session.add(model)
-                self._session.flush()
-                return comment
-                
+            CommentMapper.update_model(existing, comment)
+            self._session.flush()
+            return comment
+        except StaleDataError:
+            self._session.rollback()
+            raise ConflictException(f"Le commentaire {comment.id} a été modifié par une autre requête")
         except IntegrityError as e:
             self._session.rollback()
             raise PersistenceException(f"Erreur d'intégrité: {e}")
     
     def find_by_id(self, comment_id: UUID) -> Optional[Comment]:
         """Récupère un commentaire par ID."""
-        model = self._session.query(CommentModel).filter_by(id=comment_id).first()
+        model = self._get_model(comment_id)
         if model:
             return CommentMapper.to_entity(model)
         return None
     
-    def find_by_letter(self, letter_id: UUID, page: int = 1, per_page: int = 50) -> List[Comment]:
-        """Récupère les commentaires d'une lettre avec pagination."""
-        offset = (page - 1) * per_page
-        models = self._session.query(CommentModel)\
-            .filter_by(letter_id=letter_id)\
-            .order_by(CommentModel.created_at.asc())\
-            .offset(offset)\
-            .limit(per_page)\
-            .all()
+    def find_by_letter(
+        self,
+        letter_id: UUID,
+        page: int = 1,
+        per_page: int = 50,
+        cursor: Optional[PageCursor] = None
+    ) -> List[Comment]:
+        """Récupère les commentaires d'une lettre avec pagination (offset ou curseur)."""
+        query = select(CommentModel).where(CommentModel.letter_id == letter_id)
+        query = paginate(query, CommentModel, page, per_page, cursor, descending=False)
+        models = self._session.scalars(query).all()
         return [CommentMapper.to_entity(m) for m in models]
     
-    def find_by_sender(self, sender_id: UUID) -> List[Comment]:
-        """Récupère les commentaires d'un utilisateur."""
-        models = self._session.query(CommentModel)\
-            .filter_by(sender_id=sender_id)\
-            .order_by(CommentModel.created_at.desc())\
-            .all()
+    def find_by_letters(
+        self,
+        letter_ids: Iterable[UUID],
+        per_letter: int = 50
+    ) -> Dict[UUID, List[Comment]]:
+        """Premiers commentaires de plusieurs lettres : ROW_NUMBER() par lettre, filtré sur le rang."""
+        ids = list(dict.fromkeys(letter_ids))
+        comments: Dict[UUID, List[Comment]] = {letter_id: [] for letter_id in ids}
+        if not ids:
+            return comments
+        ranked = (
+            select(
+                CommentModel.id,
+                func.row_number().over(
+                    partition_by=CommentModel.letter_id,
+                    order_by=(CommentModel.created_at, CommentModel.id)
+                ).label('rank')
+            )
+            .where(CommentModel.letter_id.in_(ids))
+            .subquery()
+        )
+        models = self._session.scalars(
+            select(CommentModel)
+            .join(ranked, ranked.c.id == CommentModel.id)
+            .where(ranked.c.rank <= per_letter)
+            .order_by(CommentModel.created_at, CommentModel.id)
+        ).all()
+        for model in models:
+            comments[model.letter_id].append(CommentMapper.to_entity(model))
+        return comments
+    
+    def find_thread(
+        self,
+        letter_id: UUID,
+        parent_comment_id: Optional[UUID] = None,
+        max_depth: Optional[int] = None,
+        page: int = 1,
+        per_page: int = 20,
+        cursor: Optional[PageCursor] = None
+    ) -> List[Comment]:
+        """
+        Récupère une page de fils de discussion en une requête (CTE récursive).
+        
+        L'ancre est la page des têtes de fil ; la partie récursive descend
+        par parent_comment_id (indexé) en comptant les niveaux, ce qui borne
+        la profondeur sans parcourir le reste de la lettre.
+        """
+        heads = select(CommentModel.id).where(CommentModel.letter_id == letter_id)
+        if parent_comment_id is None:
+            heads = heads.where(CommentModel.parent_comment_id.is_(None))
+        else:
+            heads = heads.where(CommentModel.parent_comment_id == parent_comment_id)
+        heads = paginate(heads, CommentModel, page, per_page, cursor, descending=False).subquery('heads')
+        
+        thread = select(
+            heads.c.id, literal(0, Integer).label('depth')
+        ).cte('comment_thread', recursive=True)
+        replies = (
+            select(CommentModel.id, (thread.c.depth + 1).label('depth'))
+            .join(thread, CommentModel.parent_comment_id == thread.c.id)
+        )
+        if max_depth is not None:
+            replies = replies.where(thread.c.depth < max_depth)
+        thread = thread.union_all(replies)
+        
+        query = (
+            select(CommentModel)
+            .join(thread, CommentModel.id == thread.c.id)
+            .order_by(CommentModel.created_at.asc(), CommentModel.id.asc())
+        )
+        models = self._session.scalars(query).all()
+        return [CommentMapper.to_entity(m) for m in models]
+    
+    def find_by_sender(
+        self,
+        sender_id: UUID,
+        limit: Optional[int] = None,
+        cursor: Optional[PageCursor] = None
+    ) -> List[Comment]:
+        """Récupère les commentaires d'un utilisateur, en entier ou par lots keyset."""
+        query = select(CommentModel).where(CommentModel.sender_id == sender_id)
+        if limit is None and cursor is None:
+            query = query.order_by(CommentModel.created_at.desc(), CommentModel.id.desc())
+        else:
+            query = paginate(query, CommentModel, per_page=limit, cursor=cursor)
+        models = self._session.scalars(query).all()
         return [CommentMapper.to_entity(m) for m in models]
     
     def delete(self, comment: Comment) -> bool:
         """Supprime un commentaire."""
-        model = self._session.query(CommentModel).filter_by(id=comment.id).first()
-        if model:
+        model = self._get_model(comment.id)
+        if not model:
+            return False
+        try:
             self._session.delete(model)
             self._session.flush()
             return True
-        return False
+        except StaleDataError:
+            self._session.rollback()
+            raise ConflictException(f"Le commentaire {comment.id} a été modifié par une autre requête")
     
     def count_by_letter(self, letter_id: UUID) -> int:
         """Compte les commentaires d'une lettre."""
-        return self._session.query(CommentModel).filter_by(letter_id=letter_id).count()
+        stmt = lambda_stmt(
+            lambda: select(func.count(CommentModel.id)).where(CommentModel.letter_id == letter_id)
+        )
+        return self._session.scalar(stmt)
+    
+    def count_by_letters(self, letter_ids: Iterable[UUID]) -> Dict[UUID, int]:
+        """Compte les commentaires de plusieurs lettres en un seul GROUP BY."""
+        ids = list(dict.fromkeys(letter_ids))
+        if not ids:
+            return {}
+        rows = self._session.execute(
+            select(CommentModel.letter_id, func.count(CommentModel.id))
+            .where(CommentModel.letter_id.in_(ids))
+            .group_by(CommentModel.letter_id)
+        ).all()
+        counts = {letter_id: 0 for letter_id in ids}
+        counts.update({letter_id: count for letter_id, count in rows})
+        return counts
+    
+    def _get_model(self, comment_id: UUID) -> Optional[CommentModel]:
+        """Charge le modèle d'un commentaire par ID, depuis l'identity map si possible."""
+        model = self._session.get(CommentModel, comment_id)
+        if model is not None:
+            retain(self._session, model)
+        return model
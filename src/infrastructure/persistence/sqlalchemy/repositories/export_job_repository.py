@@ -0,0 +1,76 @@
+# src/infrastructure/persistence/sqlalchemy/repositories/export_job_repository.py
+"""Implémentation SQLAlchemy du repository ExportJob."""
+
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from sqlalchemy import func, update
+from sqlalchemy.orm import Session
+
+from src.domain.export.entities.export_job import ExportJob, ExportJobStatus
+from src.domain.export.repositories.export_job_repository import IExportJobRepository
+from src.infrastructure.persistence.sqlalchemy.models.export_job_model import ExportJobModel
+from src.infrastructure.persistence.sqlalchemy.mappers.export_job_mapper import ExportJobMapper
+
+
+class SQLAlchemyExportJobRepository(IExportJobRepository):
+    """
+    Implémentation SQLAlchemy du repository ExportJob.
+    """
+    
+    _ACTIVE_STATUSES = (ExportJobStatus.PENDING.value, ExportJobStatus.RUNNING.value)
+    
+    def __init__(self, session: Session):
+        self._session = session
+    
+    def save(self, job: ExportJob) -> ExportJob:
+        """Persiste un job d'export."""
+        existing = self._session.get(ExportJobModel, job.id)
+        if existing:
+            ExportJobMapper.update_model(existing, job)
+        else:
+            self._session.add(ExportJobMapper.to_model(job))
+        self._session.flush()
+        return job
+    
+    def find_by_id(self, job_id: UUID) -> Optional[ExportJob]:
+        """Récupère un job par son ID."""
+        model = self._session.get(ExportJobModel, job_id)
+        return ExportJobMapper.to_entity(model) if model else None
+    
+    def claim(self, job_id: UUID, started_at: datetime) -> bool:
+        """UPDATE conditionnel sur status = 'pending' : une seule exécution obtient la ligne."""
+        result = self._session.execute(
+            update(ExportJobModel)
+            .where(ExportJobModel.id == job_id)
+            .where(ExportJobModel.status == ExportJobStatus.PENDING.value)
+            .values(status=ExportJobStatus.RUNNING.value, started_at=started_at)
+        )
+        return result.rowcount == 1
+    
+    def find_active_for_user(self, user_id: UUID) -> Optional[ExportJob]:
+        """Récupère le job en attente ou en cours d'un utilisateur (index user_id, status)."""
+        model = self._session.query(ExportJobModel)\
+            .filter(ExportJobModel.user_id == user_id)\
+            .filter(ExportJobModel.status.in_(self._ACTIVE_STATUSES))\
+            .order_by(ExportJobModel.created_at.desc())\
+            .first()
+        return ExportJobMapper.to_entity(model) if model else None
+    
+    def find_stale(self, before: datetime) -> List[ExportJob]:
+        """Récupère les jobs actifs démarrés (ou, en attente, créés) avant `before`."""
+        since = func.coalesce(ExportJobModel.started_at, ExportJobModel.created_at)
+        models = self._session.query(ExportJobModel)\
+            .filter(ExportJobModel.status.in_(self._ACTIVE_STATUSES))\
+            .filter(since < before)\
+            .all()
+        return [ExportJobMapper.to_entity(m) for m in models]
+    
+    def find_completed_before(self, before: datetime) -> List[ExportJob]:
+        """Récupère les jobs terminés avec succès avant `before`."""
+        models = self._session.query(ExportJobModel)\
+            .filter(ExportJobModel.status == ExportJobStatus.COMPLETED.value)\
+            .filter(ExportJobModel.completed_at < before)\
+            .all()
+        return [ExportJobMapper.to_entity(m) for m in models]
@@ -1,81 +1,150 @@
 # src/infrastructure/persistence/sqlalchemy/repositories/letter_repository.py
 """Implémentation SQLAlchemy du repository Letter."""
 
-from typing import Optional, List
+from typing import Dict, Iterable, Optional, List
 from uuid import UUID
 
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import func, lambda_stmt, select, update
+from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm.exc import StaleDataError
 
+from src.domain.shared.page_cursor import PageCursor
 from src.domain.collaboration.entities.letter import Letter
 from src.domain.collaboration.repositories.letter_repository import ILetterRepository
+from src.infrastructure.persistence.sqlalchemy.identity_map import retain
 from src.infrastructure.persistence.sqlalchemy.models.letter_model import LetterModel
 from src.infrastructure.persistence.sqlalchemy.mappers.letter_mapper import LetterMapper
-from src.application.exceptions import PersistenceException
+from src.infrastructure.persistence.sqlalchemy.pagination import paginate
+from src.application.exceptions import ConflictException, PersistenceException
 
 
 class SQLAlchemyLetterRepository(ILetterRepository):
     """
     Implémentation SQLAlchemy du repository Letter.
+    
+    Les requêtes de forme fixe sont des `lambda_stmt` : construites une
+    fois, puis réutilisées depuis le cache avec de nouveaux paramètres.
     """
     
+    IN_CLAUSE_CHUNK_SIZE = 500
+    
     def __init__(self, session: Session):
         self._session = session
     
+    def add(self, letter: Letter) -> Letter:
+        """Persiste une nouvelle lettre : INSERT direct, sans SELECT préalable."""
+        try:
+            model = LetterMapper.to_model(letter)
+            self._session.add(model)
+            self._session.flush()
+            retain(self._session, model)
+            return letter
+        except IntegrityError as e:
+            self._session.rollback()
+            raise PersistenceException(f"Erreur d'intégrité: {e}")
+    
     def save(self, letter: Letter) -> Letter:
-        """Persiste une lettre."""
+        """
+        Persiste une lettre : UPDATE de la ligne existante, INSERT à défaut.
+        
+        Une version lue périmée (écriture concurrente) lève ConflictException.
+        """
+        existing = self._get_model(letter.id)
+        if not existing:
+            return self.add(letter)
         try:
-            existing = self._session.query(LetterModel).filter_by(id=letter.id).first()
-            
-            if existing:
-                LetterMapper.update_model(existing, letter)
-                self._session.flush()
-                return letter
-            else:
-                model = LetterMapper.to_model(letter)
-                self._session.add(model)
-                self._session.flush()
-                return letter
-                
+            LetterMapper.update_model(existing, letter)
+            self._session.flush()
+            return letter
+        except StaleDataError:
+            self._session.rollback()
+            raise ConflictException(f"La lettre {letter.id} a été modifiée par une autre requête")
         except IntegrityError as e:
             self._session.rollback()
             raise PersistenceException(f"Erreur d'intégrité: {e}")
     
     def find_by_id(self, letter_id: UUID) -> Optional[Letter]:
         """Récupère une lettre par ID."""
-        model = self._session.query(LetterModel).filter_by(id=letter_id).first()
+        model = self._get_model(letter_id)
         if model:
             return LetterMapper.to_entity(model)
         return None
     
-    def find_by_colli(self, colli_id: UUID, page: int = 1, per_page: int = 20) -> List[Letter]:
-        """Récupère les lettres d'un COLLI avec pagination."""
-        offset = (page - 1) * per_page
-        models = self._session.query(LetterModel)\
-            .filter_by(colli_id=colli_id)\
-            .order_by(LetterModel.created_at.desc())\
-            .offset(offset)\
-            .limit(per_page)\
-            .all()
+    def find_by_ids(self, letter_ids: Iterable[UUID]) -> Dict[UUID, Letter]:
+        """Récupère plusieurs lettres via IN (...), par lots."""
+        ids = list(dict.fromkeys(letter_ids))
+        letters: Dict[UUID, Letter] = {}
+        # Découpage pour rester sous la limite de paramètres des SGBD
+        for start in range(0, len(ids), self.IN_CLAUSE_CHUNK_SIZE):
+            chunk = ids[start:start + self.IN_CLAUSE_CHUNK_SIZE]
+            models = self._session.scalars(
+                select(LetterModel).where(LetterModel.id.in_(chunk))
+            ).all()
+            letters.update((m.id, LetterMapper.to_entity(m)) for m in models)
+        return letters
+    
+    def find_by_colli(
+        self,
+        colli_id: UUID,
+        page: int = 1,
+        per_page: int = 20,
+        cursor: Optional[PageCursor] = None
+    ) -> List[Letter]:
+        """Récupère les lettres d'un COLLI avec pagination (offset ou curseur)."""
+        query = select(LetterModel).where(LetterModel.colli_id == colli_id)
+        models = self._session.scalars(paginate(query, LetterModel, page, per_page, cursor)).all()
         return [LetterMapper.to_entity(m) for m in models]
     
-    def find_by_sender(self, sender_id: UUID) -> List[Letter]:
-        """Récupère les lettres d'un utilisateur."""
-        models = self._session.query(LetterModel)\
-            .filter_by(sender_id=sender_id)\
-            .order_by(LetterModel.created_at.desc())\
-            .all()
+    def find_by_sender(
+        self,
+        sender_id: UUID,
+        limit: Optional[int] = None,
+        cursor: Optional[PageCursor] = None
+    ) -> List[Letter]:
+        """Récupère les lettres d'un utilisateur, en entier ou par lots keyset."""
+        query = select(LetterModel).where(LetterModel.sender_id == sender_id)
+        if limit is None and cursor is None:
+            query = query.order_by(LetterModel.created_at.desc(), LetterModel.id.desc())
+        else:
+            query = paginate(query, LetterModel, per_page=limit, cursor=cursor)
+        models = self._session.scalars(query).all()
         return [LetterMapper.to_entity(m) for m in models]
     
+    def update_comment_count(self, letter_id: UUID, delta: int) -> None:
+        """Ajuste comment_count par un UPDATE relatif, sans toucher à updated_at."""
+        self._session.execute(
+            update(LetterModel)
+            .where(LetterModel.id == letter_id)
+            .values(
+                comment_count=LetterModel.comment_count + delta,
+                updated_at=LetterModel.updated_at
+            )
+        )
+    
     def delete(self, letter: Letter) -> bool:
         """Supprime une lettre."""
-        model = self._session.query(LetterModel).filter_by(id=letter.id).first()
-        if model:
+        model = self._get_model(letter.id)
+        if not model:
+            return False
+        try:
             self._session.delete(model)
             self._session.flush()
             return True
-        return False
+        except StaleDataError:
+            self._session.rollback()
+            raise ConflictException(f"La lettre {letter.id} a été modifiée par une autre requête")
     
     def count_by_colli(self, colli_id: UUID) -> int:
         """Compte les lettres d'un COLLI."""
-        return self._session.query(LetterModel).filter_by(colli_id=colli_id).count()
+        stmt = lambda_stmt(
+            lambda: select(func.count(LetterModel.id)).where(LetterModel.colli_id == colli_id)
+        )
+        return self._session.scalar(stmt)
+    
+    def _get_model(self, letter_id: UUID) -> Optional[LetterModel]:
+        """Charge le modèle d'une lettre par ID, depuis l'identity map si possible."""
+        model = self._session.get(LetterModel, letter_id)
+        if model is not None:
+            retain(self._session, model)
+        return model
@@ -0,0 +1,76 @@
+# src/infrastructure/persistence/sqlalchemy/repositories/membership_repository.py
+"""Implémentation SQLAlchemy du repository Membership."""
+
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import delete, lambda_stmt, select, update
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
+
+from src.domain.collaboration.entities.membership import Membership
+from src.domain.collaboration.repositories.membership_repository import IMembershipRepository
+from src.infrastructure.persistence.sqlalchemy.models.colli_model import MembershipModel
+from src.infrastructure.persistence.sqlalchemy.mappers.colli_mapper import MembershipMapper
+from src.application.exceptions import ConflictException
+
+
+class SQLAlchemyMembershipRepository(IMembershipRepository):
+    """
+    Implémentation SQLAlchemy du repository Membership.
+
+    Chaque écriture est un INSERT, UPDATE ou DELETE ciblé sur une ligne
+    de memberships, quel que soit le nombre de membres du COLLI. L'unicité
+    (colli_id, user_id) est garantie par l'index uq_memberships_colli_id_user_id.
+    """
+
+    def __init__(self, session: Session):
+        self._session = session
+
+    def find(self, colli_id: UUID, user_id: UUID) -> Optional[Membership]:
+        """Récupère l'adhésion d'un utilisateur à un COLLI."""
+        stmt = lambda_stmt(
+            lambda: select(MembershipModel)
+            .where(MembershipModel.colli_id == colli_id, MembershipModel.user_id == user_id)
+        )
+        model = self._session.scalars(stmt).first()
+        return MembershipMapper.to_entity(model) if model else None
+
+    def add(self, membership: Membership) -> Membership:
+        """Insère une adhésion ; une adhésion concurrente au même COLLI est un conflit."""
+        try:
+            self._session.add(MembershipMapper.to_model(membership))
+            self._session.flush()
+            return membership
+        except IntegrityError:
+            self._session.rollback()
+            raise ConflictException("L'utilisateur a déjà une adhésion à ce COLLI")
+
+    def save(self, membership: Membership) -> Membership:
+        """
+        Met à jour le statut et le rôle par un UPDATE ciblé, sans charger la ligne.
+
+        L'UPDATE ne porte que sur la version lue : si une autre requête a
+        modifié l'adhésion entre-temps, aucune ligne ne change et
+        ConflictException est levée.
+        """
+        result = self._session.execute(
+            update(MembershipModel)
+            .where(MembershipModel.id == membership.id, MembershipModel.version == membership.version)
+            .values(
+                role=membership.role.value,
+                status=membership.status.value,
+                version=MembershipModel.version + 1
+            )
+        )
+        if result.rowcount == 0:
+            raise ConflictException("L'adhésion a été modifiée par une autre requête")
+        membership.version += 1
+        return membership
+
+    def delete(self, membership: Membership) -> bool:
+        """Supprime une adhésion par un DELETE ciblé."""
+        result = self._session.execute(
+            delete(MembershipModel).where(MembershipModel.id == membership.id)
+        )
+        return result.rowcount > 0
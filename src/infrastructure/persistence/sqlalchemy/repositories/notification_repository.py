@@ -0,0 +1,106 @@
+# src/infrastructure/persistence/sqlalchemy/repositories/notification_repository.py
+"""Implémentation SQLAlchemy du repository Notification."""
+
+from datetime import datetime
+from typing import List, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import func, insert
+from sqlalchemy.orm import Session
+
+from src.domain.notification.entities.notification import Notification
+from src.domain.notification.repositories.notification_repository import INotificationRepository
+from src.infrastructure.persistence.sqlalchemy.models.notification_model import NotificationModel
+from src.infrastructure.persistence.sqlalchemy.mappers.notification_mapper import NotificationMapper
+
+
+class SQLAlchemyNotificationRepository(INotificationRepository):
+    """
+    Implémentation SQLAlchemy du repository Notification.
+    
+    Le compteur de non-lues et « tout marquer comme lu » sont chacun
+    une seule instruction servie par l'index partiel des non-lues.
+    """
+    
+    def __init__(self, session: Session):
+        self._session = session
+    
+    def save(self, notification: Notification) -> None:
+        """Persiste une notification."""
+        existing = self._session.get(NotificationModel, notification.id)
+        if existing:
+            NotificationMapper.update_model(existing, notification)
+        else:
+            self._session.add(NotificationMapper.to_model(notification))
+        self._session.flush()
+    
+    def save_many(self, notifications: Sequence[Notification]) -> None:
+        """
+        Insère des notifications nouvelles en une seule exécution.
+        
+        Insert ORM en masse : aucun objet n'est ajouté à la session et
+        les lignes partent en un executemany, que psycopg2 regroupe en
+        INSERT ... VALUES (...), (...) multi-lignes.
+        """
+        if not notifications:
+            return
+        rows = [NotificationMapper.to_row(n) for n in notifications]
+        self._session.execute(insert(NotificationModel), rows)
+    
+    def find_by_id(self, notification_id: UUID) -> Optional[Notification]:
+        """Récupère une notification par son ID."""
+        model = self._session.get(NotificationModel, notification_id)
+        return NotificationMapper.to_entity(model) if model else None
+    
+    def find_by_user(
+        self,
+        user_id: UUID,
+        unread_only: bool = False,
+        limit: int = 50
+    ) -> List[Notification]:
+        """Récupère les notifications d'un utilisateur (index user_id, created_at DESC)."""
+        query = self._session.query(NotificationModel)\
+            .filter(NotificationModel.user_id == user_id)
+        if unread_only:
+            query = query.filter(NotificationModel.read.is_(False))
+        models = query.order_by(NotificationModel.created_at.desc(), NotificationModel.id.desc())\
+            .limit(limit)\
+            .all()
+        return [NotificationMapper.to_entity(m) for m in models]
+    
+    def count_unread(self, user_id: UUID) -> int:
+        """Compte les notifications non lues (index partiel)."""
+        return self._session.query(func.count(NotificationModel.id))\
+            .filter(NotificationModel.user_id == user_id)\
+            .filter(NotificationModel.read.is_(False))\
+            .scalar()
+    
+    def mark_as_read(self, notification_id: UUID) -> bool:
+        """Marque une notification comme lue, sans la charger."""
+        updated = self._session.query(NotificationModel)\
+            .filter(NotificationModel.id == notification_id)\
+            .update(
+                {
+                    NotificationModel.read: True,
+                    NotificationModel.read_at: func.coalesce(NotificationModel.read_at, datetime.utcnow())
+                },
+                synchronize_session='fetch'
+            )
+        return updated > 0
+    
+    def mark_all_as_read(self, user_id: UUID) -> int:
+        """Marque toutes les notifications non lues comme lues, en une instruction."""
+        return self._session.query(NotificationModel)\
+            .filter(NotificationModel.user_id == user_id)\
+            .filter(NotificationModel.read.is_(False))\
+            .update(
+                {NotificationModel.read: True, NotificationModel.read_at: datetime.utcnow()},
+                synchronize_session='evaluate'
+            )
+    
+    def delete(self, notification_id: UUID) -> bool:
+        """Supprime une notification."""
+        deleted = self._session.query(NotificationModel)\
+            .filter(NotificationModel.id == notification_id)\
+            .delete(synchronize_session='evaluate')
+        return deleted > 0
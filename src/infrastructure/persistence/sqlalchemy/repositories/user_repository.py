@@ -1,15 +1,18 @@
 # src/infrastructure/persistence/sqlalchemy/repositories/user_repository.py
 """Implémentation SQLAlchemy du repository User."""
 
-from typing import Optional, List
+from typing import Optional, List, Dict, Iterable
 from uuid import UUID
 
+from sqlalchemy import exists, func, lambda_stmt, select
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
 from src.domain.identity.entities.user import User
 from src.domain.identity.value_objects.email import Email
+from src.domain.identity.value_objects.user_summary import UserSummary
 from src.domain.identity.repositories.user_repository import IUserRepository
+from src.infrastructure.persistence.sqlalchemy.identity_map import retain
 from src.infrastructure.persistence.sqlalchemy.models.user_model import UserModel
 from src.infrastructure.persistence.sqlalchemy.mappers.user_mapper import UserMapper
 from src.application.exceptions import PersistenceException
@@ -20,73 +23,119 @@ class SQLAlchemyUserRepository(IUserRepository):
     Implémentation SQLAlchemy du repository User.
     
     Utilise le UserMapper pour la conversion Entity ↔ Model.
+    Les requêtes de forme fixe sont des `lambda_stmt` : construites une
+    fois, puis réutilisées depuis le cache avec de nouveaux paramètres.
     """
     
+    IN_CLAUSE_CHUNK_SIZE = 500
+    
     def __init__(self, session: Session):
         self._session = session
     
+    def add(self, user: User) -> User:
+        """Persiste un nouvel utilisateur : INSERT direct, sans SELECT préalable."""
+        try:
+            model = UserMapper.to_model(user)
+            self._session.add(model)
+            self._session.flush()
+            retain(self._session, model)
+            return user
+        except IntegrityError as e:
+            self._session.rollback()
+            raise PersistenceException(f"Erreur d'intégrité: {e}")
+    
     def save(self, user: User) -> User:
-        """Persiste un utilisateur."""
+        """Persiste un utilisateur : UPDATE de la ligne existante, INSERT à défaut."""
+        existing = self._get_model(user.id)
+        if not existing:
+            return self.add(user)
         try:
-            existing = self._session.query(UserModel).filter_by(id=user.id).first()
-            
-            if existing:
-                # Update
-                UserMapper.update_model(existing, user)
-                self._session.flush()
-                return user
-            else:
-                # Create
-                model = UserMapper.to_model(user)
-                self._session.add(model)
-                self._session.flush()
-                return user
-                
+            UserMapper.update_model(existing, user)
+            self._session.flush()
+            return user
         except IntegrityError as e:
             self._session.rollback()
             raise PersistenceException(f"Erreur d'intégrité: {e}")
     
     def find_by_id(self, user_id: UUID) -> Optional[User]:
         """Récupère un utilisateur par ID."""
-        model = self._session.query(UserModel).filter_by(id=user_id).first()
+        model = self._get_model(user_id)
         if model:
             return UserMapper.to_entity(model)
         return None
     
+    def find_by_ids(self, user_ids: Iterable[UUID]) -> Dict[UUID, UserSummary]:
+        """Récupère les données d'affichage de plusieurs utilisateurs via IN (...)."""
+        ids = list(dict.fromkeys(user_ids))
+        summaries: Dict[UUID, UserSummary] = {}
+        # Découpage pour rester sous la limite de paramètres des SGBD
+        for start in range(0, len(ids), self.IN_CLAUSE_CHUNK_SIZE):
+            chunk = ids[start:start + self.IN_CLAUSE_CHUNK_SIZE]
+            rows = self._session.execute(
+                select(
+                    UserModel.id,
+                    UserModel.first_name,
+                    UserModel.last_name,
+                    UserModel.email,
+                    UserModel.created_at
+                ).where(UserModel.id.in_(chunk))
+            ).all()
+            for row in rows:
+                summaries[row.id] = UserSummary(
+                    id=row.id,
+                    first_name=row.first_name,
+                    last_name=row.last_name,
+                    email=row.email,
+                    created_at=row.created_at
+                )
+        return summaries
+    
+    def find_entities_by_ids(self, user_ids: Iterable[UUID]) -> Dict[UUID, User]:
+        """Récupère plusieurs utilisateurs complets via IN (...), par lots."""
+        ids = list(dict.fromkeys(user_ids))
+        users: Dict[UUID, User] = {}
+        for start in range(0, len(ids), self.IN_CLAUSE_CHUNK_SIZE):
+            chunk = ids[start:start + self.IN_CLAUSE_CHUNK_SIZE]
+            models = self._session.scalars(
+                select(UserModel).where(UserModel.id.in_(chunk))
+            ).all()
+            users.update((m.id, UserMapper.to_entity(m)) for m in models)
+        return users
+    
     def find_by_email(self, email: Email) -> Optional[User]:
         """Récupère un utilisateur par Email."""
         return self.find_by_email_str(str(email))
     
     def find_by_email_str(self, email: str) -> Optional[User]:
         """Récupère un utilisateur par email (string)."""
-        model = self._session.query(UserModel).filter(
-            UserModel.email.ilike(email)
-        ).first()
+        stmt = lambda_stmt(lambda: select(UserModel).where(UserModel.email.ilike(email)).limit(1))
+        model = self._session.scalars(stmt).first()
         if model:
+            # Connexion : save() met ensuite à jour last_login_at
+            retain(self._session, model)
             return UserMapper.to_entity(model)
         return None
     
     def email_exists(self, email: str) -> bool:
         """Vérifie si un email existe."""
-        return self._session.query(
-            self._session.query(UserModel).filter(
-                UserModel.email.ilike(email)
-            ).exists()
-        ).scalar()
+        stmt = lambda_stmt(lambda: select(exists().where(UserModel.email.ilike(email))))
+        return self._session.scalar(stmt)
     
     def find_all(self, page: int = 1, per_page: int = 20) -> List[User]:
         """Récupère tous les utilisateurs avec pagination."""
         offset = (page - 1) * per_page
-        models = self._session.query(UserModel)\
-            .order_by(UserModel.created_at.desc())\
-            .offset(offset)\
-            .limit(per_page)\
-            .all()
+        stmt = lambda_stmt(
+            lambda: select(UserModel)
+            .order_by(UserModel.created_at.desc())
+            .offset(offset)
+            .limit(per_page)
+        )
+        models = self._session.scalars(stmt).all()
         return [UserMapper.to_entity(m) for m in models]
     
     def delete(self, user: User) -> bool:
         """Supprime un utilisateur."""
-        model = self._session.query(UserModel).filter_by(id=user.id).first()
+        model = self._get_model(user.id)
         if model:
             self._session.delete(model)
             self._session.flush()
@@ -95,4 +144,11 @@ class SQLAlchemyUserRepository(IUserRepository):
     
     def count(self) -> int:
         """Compte les utilisateurs."""
-        return self._session.query(UserModel).count()
+        return self._session.scalar(select(func.count(UserModel.id)))
+    
+    def _get_model(self, user_id: UUID) -> Optional[UserModel]:
+        """Charge le modèle d'un utilisateur par ID, depuis l'identity map si possible."""
+        model = self._session.get(UserModel, user_id)
+        if model is not None:
+            retain(self._session, model)
+        return model
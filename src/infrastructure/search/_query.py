@@ -0,0 +1,30 @@
+# src/infrastructure/search/_query.py
+"""Analyse des termes de recherche saisis par l'utilisateur."""
+
+import re
+from typing import List
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+# Au-delà, la requête n'apporte plus de pertinence et coûte cher
+MAX_TERMS = 8
+
+
+def words(value: str) -> List[str]:
+    """Découpe un texte en mots (minuscules, sans ponctuation)."""
+    return _TOKEN_RE.findall(value.lower())
+
+
+def tokenize(query: str) -> List[str]:
+    """Découpe la requête en termes, sans opérateurs FTS, limitée à MAX_TERMS."""
+    return words(query)[:MAX_TERMS]
+
+
+def to_fts5_match(terms: List[str]) -> str:
+    """Requête MATCH FTS5 : tous les termes requis, en préfixe."""
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def to_pg_tsquery(terms: List[str]) -> str:
+    """Requête to_tsquery PostgreSQL : tous les termes requis, en préfixe."""
+    return " & ".join(f"{term}:*" for term in terms)
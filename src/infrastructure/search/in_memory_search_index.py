@@ -0,0 +1,99 @@
+# src/infrastructure/search/in_memory_search_index.py
+"""Implémentation In-Memory de l'index de recherche pour les tests."""
+
+from typing import Dict, Iterable, Optional, Tuple
+from uuid import UUID
+
+from src.application.dtos.search_dto import (
+    SearchCursor, SearchDocument, SearchDocumentType, SearchHit, SearchPage
+)
+from src.application.interfaces.search_index import ISearchIndex
+from src.domain.collaboration.repositories.colli_repository import IColliRepository
+from src.domain.collaboration.value_objects.colli_status import ColliStatus
+from src.infrastructure.search._query import tokenize, words
+
+
+class InMemorySearchIndex(ISearchIndex):
+    """
+    Index In-Memory : correspondance par préfixe de mots.
+    
+    Le rang imite bm25 (négatif, plus petit = plus pertinent) avec un
+    poids plus fort pour le titre.
+    """
+    
+    TITLE_WEIGHT = 10.0
+    BODY_WEIGHT = 1.0
+    
+    def __init__(self, colli_repository: IColliRepository):
+        self._colli_repo = colli_repository
+        self._store: Dict[Tuple[SearchDocumentType, UUID], SearchDocument] = {}
+    
+    def upsert_many(self, documents: Iterable[SearchDocument]) -> None:
+        """Ajoute ou remplace des documents."""
+        for document in documents:
+            self._store[(document.doc_type, document.doc_id)] = document
+    
+    def delete_many(self, doc_type: SearchDocumentType, doc_ids: Iterable[UUID]) -> None:
+        """Retire des documents."""
+        for doc_id in doc_ids:
+            self._store.pop((doc_type, doc_id), None)
+    
+    def search(
+        self,
+        query: str,
+        doc_type: SearchDocumentType,
+        user_id: UUID,
+        limit: int = 10,
+        cursor: Optional[str] = None
+    ) -> SearchPage:
+        """Recherche classée, filtrée par appartenance aux COLLIs."""
+        terms = tokenize(query)
+        if not terms:
+            return SearchPage()
+        after = SearchCursor.decode(cursor) if cursor else None
+        
+        hits = []
+        for (kind, doc_id), document in self._store.items():
+            if kind != doc_type or not self._is_visible(document, user_id):
+                continue
+            rank = self._rank(document, terms)
+            if rank is None:
+                continue
+            if after and (rank, doc_id) <= (after.rank, after.doc_id):
+                continue
+            hits.append(SearchHit(doc_type=kind, doc_id=doc_id, rank=rank))
+        
+        hits.sort(key=lambda h: (h.rank, h.doc_id))
+        page = hits[:limit]
+        next_cursor = None
+        if len(hits) > limit and page:
+            next_cursor = SearchCursor(rank=page[-1].rank, doc_id=page[-1].doc_id).encode()
+        return SearchPage(hits=page, next_cursor=next_cursor)
+    
+    def _rank(self, document: SearchDocument, terms) -> Optional[float]:
+        """Rang du document, ou None si un terme est absent."""
+        title_words = words(document.title or "")
+        body_words = words(document.body or "")
+        score = 0.0
+        for term in terms:
+            in_title = sum(1 for w in title_words if w.startswith(term))
+            in_body = sum(1 for w in body_words if w.startswith(term))
+            if not in_title and not in_body:
+                return None
+            score += self.TITLE_WEIGHT * in_title + self.BODY_WEIGHT * in_body
+        return -score
+    
+    def _is_visible(self, document: SearchDocument, user_id: UUID) -> bool:
+        """Applique les mêmes règles de visibilité que l'index SQL."""
+        if document.doc_type == SearchDocumentType.USER:
+            return True
+        colli = self._colli_repo.find_by_id(document.colli_id) if document.colli_id else None
+        if colli is None:
+            return False
+        if document.doc_type == SearchDocumentType.COLLI and colli.status == ColliStatus.ACTIVE:
+            return True
+        return colli.is_member(user_id)
+    
+    def clear(self) -> None:
+        """Vide l'index."""
+        self._store.clear()
@@ -0,0 +1,146 @@
+# src/infrastructure/search/search_indexer.py
+"""Construction des documents de recherche à partir des repositories."""
+
+from typing import Callable, Dict, Iterable, List, Optional
+from uuid import UUID
+
+from src.application.dtos.search_dto import SearchDocument, SearchDocumentType
+from src.application.interfaces.search_index import ISearchIndex
+from src.domain.collaboration.entities.letter import Letter
+from src.domain.collaboration.repositories.colli_repository import IColliRepository
+from src.domain.collaboration.repositories.comment_repository import ICommentRepository
+from src.domain.collaboration.repositories.letter_repository import ILetterRepository
+from src.domain.identity.repositories.user_repository import IUserRepository
+from src.domain.shared.page_cursor import PageCursor
+
+
+class SearchIndexer:
+    """
+    Met à jour l'index de recherche pour des entités données.
+    
+    Utilisé par le handler d'événements (mise à jour incrémentale) et par
+    la commande de réindexation (reconstruction complète par lots).
+    """
+    
+    CHUNK_SIZE = 500
+    
+    # Nombre maximum de commentaires indexés avec une lettre
+    MAX_COMMENTS_PER_LETTER = 200
+    
+    def __init__(
+        self,
+        search_index: ISearchIndex,
+        colli_repository: IColliRepository,
+        letter_repository: ILetterRepository,
+        comment_repository: ICommentRepository,
+        user_repository: IUserRepository
+    ):
+        self._search_index = search_index
+        self._colli_repo = colli_repository
+        self._letter_repo = letter_repository
+        self._comment_repo = comment_repository
+        self._user_repo = user_repository
+    
+    def index_collis(self, colli_ids: Iterable[UUID]) -> int:
+        """Réindexe les COLLIs donnés. Retourne le nombre de documents écrits."""
+        collis = self._colli_repo.find_summaries_by_ids(colli_ids)
+        self._search_index.upsert_many(SearchDocument.from_colli(c) for c in collis.values())
+        return len(collis)
+    
+    def index_letters(self, letter_ids: Iterable[UUID]) -> int:
+        """Réindexe les lettres données. Retourne le nombre de documents écrits."""
+        letters = list(self._letter_repo.find_by_ids(letter_ids).values())
+        self._search_index.upsert_many(self._letter_documents(letters))
+        return len(letters)
+    
+    def index_users(self, user_ids: Iterable[UUID]) -> int:
+        """Réindexe les utilisateurs donnés. Retourne le nombre de documents écrits."""
+        users = self._user_repo.find_by_ids(user_ids)
+        self._search_index.upsert_many(SearchDocument.from_user(u) for u in users.values())
+        return len(users)
+    
+    def remove_letters(self, letter_ids: Iterable[UUID]) -> None:
+        """Retire des lettres de l'index."""
+        self._search_index.delete_many(SearchDocumentType.LETTER, letter_ids)
+    
+    def reindex_all(
+        self,
+        chunk_size: int = CHUNK_SIZE,
+        on_chunk: Optional[Callable[[str, int], None]] = None
+    ) -> Dict[str, int]:
+        """
+        Reconstruit l'index complet par lots de `chunk_size` entités.
+        
+        Args:
+            chunk_size: Taille des lots lus et écrits.
+            on_chunk: Appelé après chaque lot avec (type, taille du lot),
+                par exemple pour valider la transaction.
+        
+        Returns:
+            Dict[str, int]: Nombre de documents indexés par type.
+        """
+        notify = on_chunk or (lambda kind, count: None)
+        totals = {'collis': 0, 'letters': 0, 'users': 0}
+        
+        cursor = None
+        while True:
+            collis = self._colli_repo.find_all(per_page=chunk_size, cursor=cursor)
+            if not collis:
+                break
+            self._search_index.upsert_many(SearchDocument.from_colli(c) for c in collis)
+            totals['collis'] += len(collis)
+            notify('collis', len(collis))
+            
+            for colli in collis:
+                totals['letters'] += self._reindex_letters_of(colli.id, chunk_size, notify)
+            
+            if len(collis) < chunk_size:
+                break
+            cursor = PageCursor.from_entity(collis[-1])
+        
+        page = 1
+        while True:
+            users = self._user_repo.find_all(page=page, per_page=chunk_size)
+            if not users:
+                break
+            self._search_index.upsert_many(SearchDocument.from_user(u) for u in users)
+            totals['users'] += len(users)
+            notify('users', len(users))
+            if len(users) < chunk_size:
+                break
+            page += 1
+        
+        return totals
+    
+    def _reindex_letters_of(
+        self,
+        colli_id: UUID,
+        chunk_size: int,
+        notify: Callable[[str, int], None]
+    ) -> int:
+        """Réindexe les lettres d'un COLLI par lots (pagination keyset)."""
+        count = 0
+        cursor = None
+        while True:
+            letters = self._letter_repo.find_by_colli(colli_id, per_page=chunk_size, cursor=cursor)
+            if not letters:
+                break
+            self._search_index.upsert_many(self._letter_documents(letters))
+            count += len(letters)
+            notify('letters', len(letters))
+            if len(letters) < chunk_size:
+                break
+            cursor = PageCursor.from_entity(letters[-1])
+        return count
+    
+    def _letter_documents(self, letters: List[Letter]) -> List[SearchDocument]:
+        """Documents des lettres, commentaires inclus (chargés en une requête)."""
+        comments = self._comment_repo.find_by_letters(
+            [letter.id for letter in letters], per_letter=self.MAX_COMMENTS_PER_LETTER
+        )
+        return [
+            SearchDocument.from_letter(
+                letter, [c.content for c in comments[letter.id] if c.content]
+            )
+            for letter in letters
+        ]
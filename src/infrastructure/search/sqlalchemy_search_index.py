@@ -0,0 +1,172 @@
+# src/infrastructure/search/sqlalchemy_search_index.py
+"""Implémentation SQLAlchemy de l'index de recherche (FTS5 / tsvector)."""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import Float, Integer, and_, column, func, literal_column, or_, select, text, union
+from sqlalchemy.orm import Session
+
+from src.application.dtos.search_dto import (
+    SearchCursor, SearchDocument, SearchDocumentType, SearchHit, SearchPage
+)
+from src.application.interfaces.search_index import ISearchIndex
+from src.domain.collaboration.value_objects.colli_status import ColliStatus
+from src.domain.collaboration.value_objects.membership_status import MembershipStatus
+from src.infrastructure.persistence.sqlalchemy.models.colli_model import ColliModel, MembershipModel
+from src.infrastructure.persistence.sqlalchemy.models.search_document_model import SearchDocumentModel
+from src.infrastructure.search._query import tokenize, to_fts5_match, to_pg_tsquery
+
+
+class SQLAlchemySearchIndex(ISearchIndex):
+    """
+    Index de recherche stocké dans la table search_documents.
+    
+    Le classement utilise bm25 (SQLite FTS5) ou ts_rank (PostgreSQL),
+    normalisé pour que le rang le plus petit soit le plus pertinent.
+    La pagination est un keyset sur (rank, doc_id).
+    """
+    
+    BATCH_SIZE = 500
+    
+    # Poids title / body pour bm25 (équivalent des poids A / B de tsvector)
+    _BM25_WEIGHTS = "10.0, 1.0"
+    
+    def __init__(self, session: Session):
+        self._session = session
+    
+    # =========================================================================
+    # ÉCRITURE
+    # =========================================================================
+    
+    def upsert_many(self, documents: Iterable[SearchDocument]) -> None:
+        """Ajoute ou remplace des documents, par lots de BATCH_SIZE."""
+        batch: List[SearchDocument] = []
+        for document in documents:
+            batch.append(document)
+            if len(batch) >= self.BATCH_SIZE:
+                self._upsert_batch(batch)
+                batch = []
+        if batch:
+            self._upsert_batch(batch)
+    
+    def _upsert_batch(self, documents: List[SearchDocument]) -> None:
+        """Une requête pour charger les existants, puis insert/update en un flush."""
+        by_key: Dict[Tuple[str, UUID], SearchDocument] = {
+            (d.doc_type.value, d.doc_id): d for d in documents
+        }
+        existing: Dict[Tuple[str, UUID], SearchDocumentModel] = {}
+        for doc_type in {key[0] for key in by_key}:
+            ids = [doc_id for kind, doc_id in by_key if kind == doc_type]
+            models = self._session.query(SearchDocumentModel)\
+                .filter(SearchDocumentModel.doc_type == doc_type)\
+                .filter(SearchDocumentModel.doc_id.in_(ids))\
+                .all()
+            existing.update({(m.doc_type, m.doc_id): m for m in models})
+        
+        for key, document in by_key.items():
+            model = existing.get(key)
+            if model is None:
+                model = SearchDocumentModel(doc_type=key[0], doc_id=document.doc_id)
+                self._session.add(model)
+            model.colli_id = document.colli_id
+            model.status = document.status
+            model.title = (document.title or '')[:255]
+            model.body = document.body or ''
+            model.created_at = document.created_at
+        self._session.flush()
+    
+    def delete_many(self, doc_type: SearchDocumentType, doc_ids: Iterable[UUID]) -> None:
+        """Retire des documents de l'index."""
+        ids = list(doc_ids)
+        for start in range(0, len(ids), self.BATCH_SIZE):
+            self._session.query(SearchDocumentModel)\
+                .filter(SearchDocumentModel.doc_type == doc_type.value)\
+                .filter(SearchDocumentModel.doc_id.in_(ids[start:start + self.BATCH_SIZE]))\
+                .delete(synchronize_session=False)
+        self._session.flush()
+    
+    # =========================================================================
+    # LECTURE
+    # =========================================================================
+    
+    def search(
+        self,
+        query: str,
+        doc_type: SearchDocumentType,
+        user_id: UUID,
+        limit: int = 10,
+        cursor: Optional[str] = None
+    ) -> SearchPage:
+        """Recherche classée, filtrée par appartenance aux COLLIs."""
+        terms = tokenize(query)
+        if not terms:
+            return SearchPage()
+        after = SearchCursor.decode(cursor) if cursor else None
+        
+        ranked = self._ranked_matches(terms).subquery('ranked')
+        stmt = select(ranked.c.doc_id, ranked.c.rank)\
+            .where(ranked.c.doc_type == doc_type.value)
+        
+        visible = self._visible_collis(user_id)
+        if doc_type == SearchDocumentType.LETTER:
+            stmt = stmt.where(ranked.c.colli_id.in_(visible))
+        elif doc_type == SearchDocumentType.COLLI:
+            stmt = stmt.where(or_(
+                ranked.c.status == ColliStatus.ACTIVE.value,
+                ranked.c.doc_id.in_(visible)
+            ))
+        
+        if after is not None:
+            stmt = stmt.where(or_(
+                ranked.c.rank > after.rank,
+                and_(ranked.c.rank == after.rank, ranked.c.doc_id > after.doc_id)
+            ))
+        
+        rows = self._session.execute(
+            stmt.order_by(ranked.c.rank, ranked.c.doc_id).limit(limit + 1)
+        ).all()
+        
+        hits = [SearchHit(doc_type=doc_type, doc_id=row.doc_id, rank=row.rank) for row in rows[:limit]]
+        next_cursor = None
+        if len(rows) > limit and hits:
+            next_cursor = SearchCursor(rank=hits[-1].rank, doc_id=hits[-1].doc_id).encode()
+        return SearchPage(hits=hits, next_cursor=next_cursor)
+    
+    def _ranked_matches(self, terms: List[str]):
+        """SELECT des documents correspondants avec leur rang, selon le SGBD."""
+        doc = SearchDocumentModel
+        dialect = self._session.get_bind().dialect.name
+        
+        if dialect == 'postgresql':
+            tsquery = func.to_tsquery('simple', to_pg_tsquery(terms))
+            vector = literal_column('search_documents.search_vector')
+            return select(
+                doc.doc_type, doc.doc_id, doc.colli_id, doc.status,
+                (-func.ts_rank(vector, tsquery)).label('rank')
+            ).where(vector.op('@@')(tsquery))
+        
+        if dialect == 'sqlite':
+            fts = text(
+                "SELECT rowid AS id, bm25(search_documents_fts, "
+                f"{self._BM25_WEIGHTS}) AS rank "
+                "FROM search_documents_fts WHERE search_documents_fts MATCH :match"
+            ).bindparams(match=to_fts5_match(terms))\
+                .columns(column('id', Integer), column('rank', Float))\
+                .subquery('fts')
+            return select(
+                doc.doc_type, doc.doc_id, doc.colli_id, doc.status, fts.c.rank
+            ).join(fts, fts.c.id == doc.id)
+        
+        raise NotImplementedError(f"Recherche plein texte non supportée pour {dialect}")
+    
+    @staticmethod
+    def _visible_collis(user_id: UUID):
+        """Sous-requête des COLLIs dont l'utilisateur est membre accepté ou créateur."""
+        return union(
+            select(MembershipModel.colli_id).where(
+                MembershipModel.user_id == user_id,
+                MembershipModel.status == MembershipStatus.ACCEPTED.value
+            ),
+            select(ColliModel.id).where(ColliModel.creator_id == user_id)
+        )
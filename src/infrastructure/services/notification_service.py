@@ -1,11 +1,12 @@
 # src/infrastructure/services/notification_service.py
 """Service de notification integrant les push WebSocket."""
 
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 from datetime import datetime
 
 from src.domain.notification.entities.notification import Notification, NotificationType
+from src.domain.notification.repositories.notification_repository import INotificationRepository
 from src.infrastructure.persistence.in_memory.notification_repository import InMemoryNotificationRepository
 
 
@@ -16,7 +17,7 @@ class NotificationService:
     Cree les notifications en base ET les envoie en temps reel via WebSocket.
     """
     
-    def __init__(self, notification_repo: InMemoryNotificationRepository = None):
+    def __init__(self, notification_repo: INotificationRepository = None):
         self._repo = notification_repo or InMemoryNotificationRepository()
     
     def create_notification(
@@ -71,18 +72,74 @@ class NotificationService:
         colli_name: str,
         letter_id: UUID,
         author_name: str,
-        member_ids: list[UUID]
-    ):
-        """Notifie les membres d'un COLLI d'une nouvelle lettre."""
-        for member_id in member_ids:
-            self.create_notification(
+        member_ids: list[UUID],
+        push: bool = True
+    ) -> List[Notification]:
+        """
+        Notifie les membres d'un COLLI d'une nouvelle lettre.
+        
+        Les notifications sont ecrites en une seule insertion multi-lignes
+        et poussees par une seule diffusion sur la room du COLLI, au lieu
+        d'une ecriture et d'un emit par membre.
+        
+        Args:
+            push: False pour differer la diffusion (voir push_new_letter),
+                par exemple apres le commit de la transaction.
+        """
+        message = f"{author_name} a ecrit une nouvelle lettre dans {colli_name}"
+        notifications = [
+            Notification(
                 user_id=member_id,
-                notification_type=NotificationType.NEW_LETTER,
+                type=NotificationType.NEW_LETTER,
                 title="Nouvelle lettre",
-                message=f"{author_name} a ecrit une nouvelle lettre dans {colli_name}",
+                message=message,
                 related_entity_id=letter_id,
                 related_entity_type="letter"
             )
+            for member_id in member_ids
+        ]
+        if not notifications:
+            return notifications
+        
+        self._repo.save_many(notifications)
+        if push:
+            self.push_new_letter(colli_id, notifications)
+        return notifications
+    
+    def push_new_letter(
+        self,
+        colli_id: UUID,
+        notifications: List[Notification],
+        author_id: Optional[UUID] = None
+    ) -> None:
+        """
+        Diffuse en une fois les notifications de nouvelle lettre sur la room du COLLI.
+        
+        Le contenu est commun a tous les destinataires : contrairement a
+        `create_notification`, il ne porte ni `id` ni `is_read`, propres a
+        chaque destinataire. Le client recharge GET /api/v1/notifications
+        a reception pour obtenir ses notifications (et les marquer lues).
+        `author_id` permet au client de l'auteur d'ignorer la diffusion.
+        """
+        if not notifications:
+            return
+        sample = notifications[0]
+        try:
+            from src.infrastructure.websocket import emit_to_colli
+            emit_to_colli(str(colli_id), 'notification', {
+                'type': 'notification',
+                'notification_type': sample.type.value,
+                'title': sample.title,
+                'message': sample.message,
+                'colli_id': str(colli_id),
+                'related_entity_id': str(sample.related_entity_id),
+                'related_entity_type': sample.related_entity_type,
+                'author_id': str(author_id) if author_id else None,
+                'created_at': sample.created_at.isoformat()
+            })
+        except Exception:
+            # WebSocket peut ne pas etre disponible (tests, etc.)
+            pass
     
     def notify_new_comment(
         self,
@@ -155,13 +212,12 @@ class NotificationService:
         )
 
 
-# Instance globale
-_notification_service: Optional[NotificationService] = None
-
-
 def get_notification_service() -> NotificationService:
-    """Retourne l'instance du service de notifications."""
-    global _notification_service
-    if _notification_service is None:
-        _notification_service = NotificationService()
-    return _notification_service
+    """
+    Retourne le service de notifications.
+    
+    Le service écrit via le repository du container (table notifications),
+    dans la transaction de la requête courante.
+    """
+    from src.infrastructure.container import get_container
+    return get_container().notification_service()
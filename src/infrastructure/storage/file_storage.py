@@ -45,6 +45,7 @@ class FileStorageService:
     
     ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'webp', 'pdf', 'mp3', 'wav', 'm4a', 'doc', 'docx', 'txt'}
     MAX_SIZE = 16 * 1024 * 1024  # 16 MB
+    URL_PREFIX = "/api/v1/files/"
     
     def __init__(self, upload_folder: Optional[str] = None):
         settings = get_settings()
@@ -134,7 +135,7 @@ class FileStorageService:
         return StoredFile(
             file_id=file_id,
             file_name=safe_filename,
-            file_url=f"/api/v1/files/{file_id}",
+            file_url=f"{self.URL_PREFIX}{file_id}",
             mime_type=self._get_mime_type(extension),
             size=len(file_data),
             checksum=self._compute_checksum(file_data),
@@ -177,6 +178,23 @@ class FileStorageService:
     def exists(self, file_id: str) -> bool:
         """Verifie si un fichier existe."""
         return self.get_path(file_id) is not None
+    
+    def file_id_from_url(self, file_url: Optional[str]) -> Optional[str]:
+        """
+        Extrait l'ID d'un fichier stocke depuis son URL publique.
+        
+        Args:
+            file_url: URL telle que retournee par save()
+            
+        Returns:
+            L'ID du fichier, ou None pour une URL externe ou invalide
+        """
+        if not file_url or not file_url.startswith(self.URL_PREFIX):
+            return None
+        try:
+            return str(uuid.UUID(file_url[len(self.URL_PREFIX):]))
+        except ValueError:
+            return None
 
 
 # Instance singleton
@@ -0,0 +1,46 @@
+# src/infrastructure/tasks/celery_app.py
+"""
+Application Celery.
+
+Lancer un worker :
+    celery -A src.infrastructure.tasks.celery_app worker --loglevel=info
+
+Tâches périodiques (réconciliation des compteurs, purge des exports) :
+    celery -A src.infrastructure.tasks.celery_app beat --loglevel=info
+"""
+
+from celery import Celery
+
+from src.infrastructure.config.settings import get_settings
+
+
+def create_celery_app() -> Celery:
+    """Crée l'application Celery à partir des settings."""
+    settings = get_settings()
+    broker_url = settings.CELERY_BROKER_URL or settings.REDIS_URL or "memory://"
+    
+    app = Celery("alvs", broker=broker_url, include=[
+        "src.infrastructure.tasks.export_tasks",
+        "src.infrastructure.tasks.notification_tasks",
+    ])
+    app.conf.update(
+        task_serializer="json",
+        accept_content=["json"],
+        task_ignore_result=True,
+        task_acks_late=True,
+        worker_prefetch_multiplier=1,
+        beat_schedule={
+            "reconcile-unread-counters": {
+                "task": "src.infrastructure.tasks.notification_tasks.reconcile_unread_counters",
+                "schedule": settings.UNREAD_COUNTER_RECONCILE_INTERVAL,
+            },
+            "purge-export-jobs": {
+                "task": "src.infrastructure.tasks.export_tasks.purge_export_jobs",
+                "schedule": settings.EXPORT_PURGE_INTERVAL,
+            },
+        },
+    )
+    return app
+
+
+celery_app = create_celery_app()
@@ -0,0 +1,51 @@
+# src/infrastructure/tasks/export_tasks.py
+"""Tâches Celery des exports RGPD."""
+
+from uuid import UUID
+
+from src.infrastructure.tasks.celery_app import celery_app
+
+
+@celery_app.task
+def run_export_job(job_id: str) -> None:
+    """
+    Produit l'archive d'un job d'export.
+    
+    Le job est mis en file après le commit de la requête qui l'a créé
+    (voir CeleryExportJobQueue) : il est déjà visible en base. Son passage
+    à RUNNING est validé avant la construction de l'archive, le résultat
+    à la fin.
+    """
+    from src.infrastructure.container import get_container
+    
+    container = get_container()
+    session = container.db_session()
+    try:
+        container.run_export_job_use_case().execute(UUID(job_id), commit=session.commit)
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.remove()
+
+
+@celery_app.task
+def purge_export_jobs() -> dict:
+    """
+    Passe en échec les jobs perdus (worker arrêté) et supprime les
+    archives expirées. Retourne les nombres de jobs traités.
+    """
+    from src.infrastructure.container import get_container
+    
+    container = get_container()
+    session = container.db_session()
+    try:
+        result = container.purge_export_jobs_use_case().execute()
+        session.commit()
+        return result
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.remove()
@@ -0,0 +1,24 @@
+# src/infrastructure/tasks/notification_tasks.py
+"""Tâches Celery des notifications."""
+
+from src.infrastructure.tasks.celery_app import celery_app
+
+
+@celery_app.task
+def reconcile_unread_counters() -> int:
+    """
+    Corrige la dérive des compteurs Redis de non-lues depuis la table
+    notifications. Retourne le nombre de compteurs corrigés.
+    """
+    from src.infrastructure.container import get_container
+    
+    container = get_container()
+    counter = container.unread_counter()
+    if not counter.enabled:
+        return 0
+    
+    session = container.db_session()
+    try:
+        return counter.reconcile(container.sql_notification_repository().count_unread)
+    finally:
+        session.remove()
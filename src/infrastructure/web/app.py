@@ -11,6 +11,8 @@ from src.infrastructure.config.settings import get_settings
 from src.infrastructure.security.jwt_service import init_jwt, jwt
 from src.infrastructure.web.middlewares.error_handler import register_error_handlers
 from src.infrastructure.web.middlewares.rate_limiter import init_rate_limiter
+from src.infrastructure.web.middlewares.query_counter import init_query_counter
+from src.infrastructure.web.middlewares.replica_routing import remember_write
 
 
 # Configuration Swagger/OpenAPI
@@ -116,6 +118,35 @@ SWAGGER_TEMPLATE = {
                     "content": {"type": "string"},
                     "created_at": {"type": "string", "format": "date-time"}
                 }
+            },
+            "CommentThread": {
+                "allOf": [
+                    {"$ref": "#/components/schemas/Comment"},
+                    {
+                        "type": "object",
+                        "properties": {
+                            "depth": {"type": "integer"},
+                            "has_more_replies": {"type": "boolean"},
+                            "replies": {
+                                "type": "array",
+                                "items": {"$ref": "#/components/schemas/CommentThread"}
+                            }
+                        }
+                    }
+                ]
+            },
+            "ExportJob": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "string", "format": "uuid"},
+                    "status": {"type": "string", "enum": ["pending", "running", "completed", "failed", "expired"]},
+                    "created_at": {"type": "string", "format": "date-time"},
+                    "started_at": {"type": "string", "format": "date-time", "nullable": True},
+                    "completed_at": {"type": "string", "format": "date-time", "nullable": True},
+                    "archive_size": {"type": "integer", "nullable": True},
+                    "error": {"type": "string", "nullable": True},
+                    "download_url": {"type": "string", "nullable": True}
+                }
             }
         },
         "responses": {
@@ -205,7 +236,7 @@ def _seed_default_admin(container):
                 role=UserRole.ADMIN
             )
             repo = container.user_repository()
-            repo.save(admin)
+            repo.add(admin)
             session.commit()
             print(">>> Compte admin cree : admin@alvs.fr / Admin1234")
         else:
@@ -214,6 +245,48 @@ def _seed_default_admin(container):
         print(f">>> Seed admin skip: {e}")
 
 
+def _flush_search_index(handler, session, app: Flask) -> None:
+    """
+    Indexe les documents modifiés par la requête, après son commit.
+
+    Une erreur d'indexation n'annule pas les données déjà validées ;
+    le document sera corrigé par la prochaine modification ou par
+    scripts/reindex.py.
+    """
+    try:
+        handler.flush()
+        session.commit()
+    except Exception as e:
+        session.rollback()
+        app.logger.warning(f"Indexation de recherche échouée: {e}")
+
+
+def _send_letter_notifications(handler, session, app: Flask) -> None:
+    """
+    Notifie les membres des COLLIs ayant reçu une lettre, après le commit.
+
+    Un échec n'annule pas la lettre déjà validée : seules les
+    notifications sont perdues.
+    """
+    try:
+        handler.flush(commit=session.commit)
+    except Exception as e:
+        session.rollback()
+        app.logger.warning(f"Notifications de nouvelle lettre échouées: {e}")
+
+
+def _send_export_jobs(job_queue, app: Flask) -> None:
+    """
+    Transmet au worker les jobs d'export créés par la requête, après le commit.
+    
+    Un échec d'envoi n'annule pas le job déjà validé : il reste en attente.
+    """
+    try:
+        job_queue.flush()
+    except Exception as e:
+        app.logger.warning(f"Mise en file des exports échouée: {e}")
+
+
 def create_app(config_override: dict = None) -> Flask:
     """
     Factory pour créer l'application Flask.
@@ -256,6 +329,7 @@ def create_app(config_override: dict = None) -> Flask:
     CORS(app, origins=cors_origins, supports_credentials=True)
     init_jwt(app)
     init_rate_limiter(app)
+    init_query_counter(app, settings.DB_QUERY_REPEAT_THRESHOLD)
     
     # Initialiser Swagger (documentation API)
     Swagger(app, config=SWAGGER_CONFIG, template=SWAGGER_TEMPLATE)
@@ -273,24 +347,46 @@ def create_app(config_override: dict = None) -> Flask:
     from src.infrastructure.container import init_container, container
     init_container(app)
 
-    # Créer les tables SQLAlchemy
-    from src.infrastructure.persistence.sqlalchemy.database import init_db
-    init_db(container.engine())
+    # Créer les tables SQLAlchemy (dev/tests ; en production : alembic upgrade head)
+    if settings.DB_CREATE_TABLES:
+        from src.infrastructure.persistence.sqlalchemy.database import init_db
+        init_db(container.engine())
 
     # Seeder un admin par défaut s'il n'en existe aucun
     _seed_default_admin(container)
 
+    # Maintenance incrémentale de l'index de recherche
+    search_index_handler = container.search_index_handler()
+    search_index_handler.subscribe(container.event_publisher())
+
+    # Notifications de nouvelle lettre, écrites et diffusées après le commit
+    letter_notification_handler = container.letter_notification_handler()
+    letter_notification_handler.subscribe(container.event_publisher())
+
+    # Jobs d'export transmis au worker après le commit
+    export_job_queue = container.export_job_queue()
+
     # Nettoyage de session après chaque requête
     @app.teardown_appcontext
     def cleanup_session(exception=None):
         session = container.db_session()
         if exception:
+            search_index_handler.discard()
+            letter_notification_handler.discard()
+            export_job_queue.discard()
             session.rollback()
         else:
             try:
                 session.commit()
+                remember_write(session)
             except Exception:
+                search_index_handler.discard()
+                letter_notification_handler.discard()
+                export_job_queue.discard()
                 session.rollback()
+            _flush_search_index(search_index_handler, session, app)
+            _send_letter_notifications(letter_notification_handler, session, app)
+            _send_export_jobs(export_job_queue, app)
         session.remove()
 
     # Enregistrer les middlewares
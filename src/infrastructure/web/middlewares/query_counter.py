@@ -0,0 +1,43 @@
+# src/infrastructure/web/middlewares/query_counter.py
+"""Comptage des requêtes SQL par requête HTTP et détection des N+1."""
+
+from flask import Flask, Response, g, request
+
+from src.infrastructure.persistence.sqlalchemy.query_counter import start_tracking, stop_tracking
+
+
+def init_query_counter(app: Flask, repeat_threshold: int) -> None:
+    """
+    Compte les requêtes SQL et le temps base de chaque requête HTTP.
+
+    - en mode debug, les réponses portent X-DB-Queries et X-DB-Time (ms) ;
+    - une même requête normalisée exécutée plus de `repeat_threshold`
+      fois (0 = désactivé) est journalisée : signe d'une boucle N+1.
+
+    Le commit de fin de requête (teardown) n'est pas compté.
+    """
+    @app.before_request
+    def _start_query_tracking():
+        g.query_stats, g.query_stats_token = start_tracking()
+
+    @app.after_request
+    def _report_queries(response: Response) -> Response:
+        stats = g.get('query_stats')
+        if stats is None:
+            return response
+        if app.debug:
+            response.headers['X-DB-Queries'] = str(stats.count)
+            response.headers['X-DB-Time'] = f"{stats.duration * 1000:.1f}"
+        if repeat_threshold > 0:
+            for statement, count in stats.repeated(repeat_threshold):
+                app.logger.warning(
+                    f"N+1 probable sur {request.method} {request.path}: "
+                    f"{count} exécutions de « {statement[:200]} »"
+                )
+        return response
+
+    @app.teardown_request
+    def _stop_query_tracking(exception=None):
+        token = g.pop('query_stats_token', None)
+        if token is not None:
+            stop_tracking(token)
@@ -0,0 +1,49 @@
+# src/infrastructure/web/middlewares/replica_routing.py
+"""Routage des routes en lecture seule vers les réplicas."""
+
+from functools import wraps
+from typing import Callable
+from flask import g
+
+from src.infrastructure.persistence.sqlalchemy.database import replica_reads
+
+
+def read_from_replica(fn: Callable) -> Callable:
+    """
+    Décorateur qui autorise une route en lecture seule à lire un réplica.
+
+    À placer sous @require_auth ou @require_role : un utilisateur ayant
+    écrit récemment (fenêtre REPLICA_STICKINESS_SECONDS) reste sur le
+    primaire pour relire ses propres écritures.
+
+    Usage:
+        @colli_bp.get('')
+        @require_auth
+        @read_from_replica
+        @inject
+        def list_collis():
+            ...
+    """
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        from src.infrastructure.container import container
+        user_id = getattr(g, 'current_user_id', None)
+        if user_id is not None and container.write_stickiness().is_sticky(user_id):
+            return fn(*args, **kwargs)
+
+        with replica_reads():
+            return fn(*args, **kwargs)
+
+    return wrapper
+
+
+def remember_write(session) -> None:
+    """
+    Ouvre la fenêtre de lecture sur le primaire si la requête a écrit.
+
+    Appelé après le commit de la requête.
+    """
+    from src.infrastructure.container import container
+    user_id = getattr(g, 'current_user_id', None)
+    if user_id is not None and session.info.get("has_written"):
+        container.write_stickiness().mark(user_id)
@@ -7,9 +7,11 @@ from uuid import UUID
 from dependency_injector.wiring import inject, Provide
 
 from src.infrastructure.web.middlewares.auth_middleware import require_role, get_current_user_id
+from src.infrastructure.web.middlewares.replica_routing import read_from_replica
 from src.domain.identity.value_objects.user_role import UserRole
 from src.application.exceptions import ValidationException, NotFoundException
 from src.infrastructure.container import Container
+from src.infrastructure.persistence.sqlalchemy.pool_metrics import pool_status
 
 
 admin_bp = Blueprint('admin', __name__, url_prefix='/api/v1/admin')
@@ -17,6 +19,7 @@ admin_bp = Blueprint('admin', __name__, url_prefix='/api/v1/admin')
 
 @admin_bp.get('/users')
 @require_role([UserRole.ADMIN])
+@read_from_replica
 @inject
 def list_users(
     user_repo = Provide[Container.user_repository]
@@ -235,12 +238,10 @@ def update_user_role(
 
 @admin_bp.get('/stats')
 @require_role([UserRole.ADMIN])
+@read_from_replica
 @inject
 def get_stats(
-    user_repo = Provide[Container.user_repository],
-    colli_repo = Provide[Container.colli_repository],
-    letter_repo = Provide[Container.letter_repository],
-    comment_repo = Provide[Container.comment_repository]
+    stats_query = Provide[Container.admin_stats_query]
 ):
     """
     Statistiques dashboard
@@ -250,6 +251,9 @@ def get_stats(
     summary: Recuperer les statistiques globales (admin uniquement)
     security:
       - BearerAuth: []
+    description: |
+      Compteurs agrégés en SQL (une requête), mis en cache
+      ADMIN_STATS_CACHE_TTL secondes.
     responses:
       200:
         description: Statistiques
@@ -258,54 +262,86 @@ def get_stats(
             schema:
               type: object
               properties:
-                users:
+                total_users:
+                  type: integer
+                total_collis:
+                  type: integer
+                active_collis:
+                  type: integer
+                pending_collis:
+                  type: integer
+                total_letters:
+                  type: integer
+                total_comments:
+                  type: integer
+                users_by_role:
                   type: object
-                  properties:
-                    total:
-                      type: integer
-                    by_role:
-                      type: object
-                collis:
+                collis_by_status:
+                  type: object
+      401:
+        $ref: '#/components/responses/Unauthorized'
+      403:
+        $ref: '#/components/responses/Forbidden'
+    """
+    return jsonify(stats_query.get_stats().to_dict()), HTTPStatus.OK
+
+
+@admin_bp.get('/metrics/db-pool')
+@require_role([UserRole.ADMIN])
+@inject
+def get_db_pool_metrics(
+    engine = Provide[Container.engine],
+    replica_set = Provide[Container.replica_set]
+):
+    """
+    Statistiques des pools de connexions
+    ---
+    tags:
+      - Admin
+    summary: État des pools de connexions du processus (admin uniquement)
+    security:
+      - BearerAuth: []
+    description: |
+      Valeurs du worker qui répond (un pool par processus gunicorn).
+      `wait` est l'histogramme cumulatif du temps d'obtention d'une
+      connexion ; `timeouts` compte les attentes au-delà de DB_POOL_TIMEOUT.
+    responses:
+      200:
+        description: Statistiques du primaire et des réplicas
+        content:
+          application/json:
+            schema:
+              type: object
+              properties:
+                primary:
                   type: object
                   properties:
-                    total:
+                    pool:
+                      type: string
+                    size:
+                      type: integer
+                    checked_in:
                       type: integer
-                    by_status:
+                    checked_out:
+                      type: integer
+                    overflow:
+                      type: integer
+                    timeouts:
+                      type: integer
+                    wait:
                       type: object
-                letters:
-                  type: integer
-                comments:
-                  type: integer
+                replicas:
+                  type: array
+                  items:
+                    type: object
       401:
         $ref: '#/components/responses/Unauthorized'
       403:
         $ref: '#/components/responses/Forbidden'
     """
-    # Comptage utilisateurs
-    all_users = user_repo.find_all() if hasattr(user_repo, 'find_all') else []
-    users_by_role = {}
-    for user in all_users:
-        role = user.role.value
-        users_by_role[role] = users_by_role.get(role, 0) + 1
-    
-    # Comptage COLLIs
-    all_collis = colli_repo.find_all() if hasattr(colli_repo, 'find_all') else []
-    collis_by_status = {}
-    for colli in all_collis:
-        status = colli.status.value
-        collis_by_status[status] = collis_by_status.get(status, 0) + 1
-    
-    # Comptage lettres et commentaires
-    all_letters = letter_repo.find_all() if hasattr(letter_repo, 'find_all') else []
-    all_comments = comment_repo.find_all() if hasattr(comment_repo, 'find_all') else []
-    
     return jsonify({
-        'total_users': len(all_users),
-        'total_collis': len(all_collis),
-        'active_collis': collis_by_status.get('active', 0),
-        'pending_collis': collis_by_status.get('pending', 0),
-        'total_letters': len(all_letters),
-        'total_comments': len(all_comments),
+        'primary': pool_status(engine),
+        'replicas': [pool_status(replica) for replica in replica_set.engines]
     }), HTTPStatus.OK
 
 
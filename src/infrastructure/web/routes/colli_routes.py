@@ -20,6 +20,7 @@ from src.infrastructure.web.middlewares.auth_middleware import (
     require_role,
     get_current_user_id
 )
+from src.infrastructure.web.middlewares.replica_routing import read_from_replica
 from src.domain.identity.value_objects.user_role import UserRole
 from src.application.exceptions import ValidationException
 from src.application.use_cases.colli.create_colli import CreateColliUseCase, CreateColliCommand
@@ -100,6 +101,7 @@ def create_colli(
 
 @colli_bp.get('')
 @require_auth
+@read_from_replica
 @inject
 def list_collis(
     use_case: ListCollisUseCase = Provide[Container.list_collis_use_case]
@@ -124,6 +126,11 @@ def list_collis(
           type: integer
           default: 20
           maximum: 100
+      - name: cursor
+        in: query
+        description: Curseur opaque (next_cursor de la page précédente), prioritaire sur page
+        schema:
+          type: string
     responses:
       200:
         description: Liste paginée des COLLIs
@@ -142,6 +149,9 @@ def list_collis(
                   type: integer
                 per_page:
                   type: integer
+                next_cursor:
+                  type: string
+                  nullable: true
       401:
         $ref: '#/components/responses/Unauthorized'
     """
@@ -154,8 +164,9 @@ def list_collis(
     page = params.get('page', 1)
     per_page = params.get('per_page', 20)
     status = params.get('status')
+    cursor = params.get('cursor')
 
-    result = use_case.execute(page, per_page, status=status)
+    result = use_case.execute(page, per_page, status=status, cursor=cursor)
     return jsonify(result), HTTPStatus.OK
 
 
@@ -285,7 +296,7 @@ def approve_colli(
         from src.infrastructure.security.audit_logger import log_audit_event, AuditEvent
 
         colli_name = result.name if hasattr(result, 'name') else str(colli_id)
-        creator_id = result.creator_id if hasattr(result, 'creator_id') else None
+        creator_id = UUID(result.creator_id) if hasattr(result, 'creator_id') else None
 
         if creator_id:
             get_notification_service().notify_colli_approved(
@@ -708,7 +719,7 @@ def reject_colli(
         from src.infrastructure.security.audit_logger import log_audit_event, AuditEvent
 
         colli_name = result.name if hasattr(result, 'name') else str(colli_id)
-        creator_id = result.creator_id if hasattr(result, 'creator_id') else None
+        creator_id = UUID(result.creator_id) if hasattr(result, 'creator_id') else None
 
         if creator_id:
             get_notification_service().notify_colli_rejected(
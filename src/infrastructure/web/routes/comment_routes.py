@@ -9,10 +9,12 @@ from dependency_injector.wiring import inject, Provide
 from flask_jwt_extended import jwt_required, get_jwt_identity
 
 from src.infrastructure.web.middlewares.auth_middleware import require_auth, get_current_user_id
+from src.infrastructure.web.middlewares.replica_routing import read_from_replica
 from src.application.exceptions import ValidationException
 from src.application.dtos.comment_dto import CreateCommentCommand
 from src.application.use_cases.comment.create_comment import CreateCommentUseCase
 from src.application.use_cases.comment.get_comments import GetCommentsForLetterUseCase
+from src.application.use_cases.comment.get_comment_thread import GetCommentThreadUseCase
 from src.application.use_cases.comment.delete_comment import DeleteCommentUseCase
 from src.infrastructure.container import Container
 
@@ -104,6 +106,7 @@ def create_comment(
 
 @comment_bp.get('')
 @require_auth
+@read_from_replica
 @inject
 def list_comments(
     letter_id: UUID,
@@ -136,6 +139,11 @@ def list_comments(
           type: integer
           default: 50
           maximum: 100
+      - name: cursor
+        in: query
+        description: Curseur opaque (next_cursor de la page précédente), prioritaire sur page
+        schema:
+          type: string
     responses:
       200:
         description: Liste paginée des commentaires
@@ -150,6 +158,9 @@ def list_comments(
                     $ref: '#/components/schemas/Comment'
                 total:
                   type: integer
+                next_cursor:
+                  type: string
+                  nullable: true
       401:
         $ref: '#/components/responses/Unauthorized'
       404:
@@ -158,22 +169,130 @@ def list_comments(
     user_id = get_current_user_id()
     page = request.args.get('page', 1, type=int)
     per_page = min(request.args.get('per_page', 50, type=int), 100)
+    cursor = request.args.get('cursor')
+
+    result = use_case.execute(letter_id, user_id, page, per_page, cursor=cursor)
+
+    # Enrichir chaque commentaire avec le nom du sender (une seule requête)
+    users = user_repo.find_by_ids({UUID(item.sender_id) for item in result.items})
+    for item in result.items:
+        user = users.get(UUID(item.sender_id))
+        item.sender_name = user.full_name if user else None
+
+    return jsonify(result.to_dict()), HTTPStatus.OK
 
-    result = use_case.execute(letter_id, user_id, page, per_page)
 
-    # Enrichir chaque commentaire avec le nom du sender
-    sender_ids = {item.sender_id for item in result.items}
-    sender_names = {}
-    for sid in sender_ids:
+@comment_bp.get('/thread')
+@require_auth
+@read_from_replica
+@inject
+def list_comment_threads(
+    letter_id: UUID,
+    use_case: GetCommentThreadUseCase = Provide[Container.get_comment_thread_use_case],
+    user_repo = Provide[Container.user_repository]
+):
+    """
+    Lister les fils de commentaires
+    ---
+    tags:
+      - Comments
+    summary: Récupérer les commentaires d'une lettre sous forme d'arbre
+    description: >
+      Une page de fils de tête, chacun avec ses réponses imbriquées jusqu'à
+      max_depth niveaux, chargée en une requête. Avec parent_comment_id,
+      les fils de tête sont les réponses de ce commentaire (sous-arbre).
+    security:
+      - BearerAuth: []
+    parameters:
+      - name: letter_id
+        in: path
+        required: true
+        schema:
+          type: string
+          format: uuid
+      - name: parent_comment_id
+        in: query
+        description: Charger le sous-arbre de ce commentaire
+        schema:
+          type: string
+          format: uuid
+      - name: max_depth
+        in: query
+        description: Niveaux de réponses sous les fils de tête (0 - têtes seules)
+        schema:
+          type: integer
+          default: 10
+          maximum: 10
+      - name: page
+        in: query
+        schema:
+          type: integer
+          default: 1
+      - name: per_page
+        in: query
+        schema:
+          type: integer
+          default: 20
+          maximum: 100
+      - name: cursor
+        in: query
+        description: Curseur opaque (next_cursor de la page précédente), prioritaire sur page
+        schema:
+          type: string
+    responses:
+      200:
+        description: Page de fils de commentaires
+        content:
+          application/json:
+            schema:
+              type: object
+              properties:
+                items:
+                  type: array
+                  items:
+                    $ref: '#/components/schemas/CommentThread'
+                has_more:
+                  type: boolean
+                next_cursor:
+                  type: string
+                  nullable: true
+      400:
+        $ref: '#/components/responses/ValidationError'
+      401:
+        $ref: '#/components/responses/Unauthorized'
+      403:
+        $ref: '#/components/responses/Forbidden'
+      404:
+        $ref: '#/components/responses/NotFound'
+    """
+    user_id = get_current_user_id()
+    page = request.args.get('page', 1, type=int)
+    per_page = min(request.args.get('per_page', 20, type=int), 100)
+    max_depth = request.args.get('max_depth', type=int)
+    cursor = request.args.get('cursor')
+
+    parent_comment_id = None
+    if request.args.get('parent_comment_id'):
         try:
-            user = user_repo.find_by_id(UUID(sid))
-            if user:
-                sender_names[sid] = f"{user.first_name} {user.last_name}"
-        except (ValueError, Exception):
-            pass
+            parent_comment_id = UUID(request.args['parent_comment_id'])
+        except ValueError:
+            raise ValidationException("parent_comment_id invalide")
 
-    for item in result.items:
-        item.sender_name = sender_names.get(item.sender_id)
+    result = use_case.execute(
+        letter_id, user_id,
+        parent_comment_id=parent_comment_id,
+        max_depth=max_depth,
+        page=page,
+        per_page=per_page,
+        cursor=cursor
+    )
+
+    # Enrichir tous les nœuds de l'arbre avec le nom du sender (une seule requête)
+    nodes = [node for item in result.items for node in item.walk()]
+    users = user_repo.find_by_ids({UUID(node.sender_id) for node in nodes})
+    for node in nodes:
+        user = users.get(UUID(node.sender_id))
+        node.sender_name = user.full_name if user else None
 
     return jsonify(result.to_dict()), HTTPStatus.OK
 
@@ -1,13 +1,16 @@
 # src/infrastructure/web/routes/export_routes.py
 """Routes pour l'export des donnees RGPD."""
 
-from flask import Blueprint, jsonify, Response
+from flask import Blueprint, jsonify, Response, stream_with_context, send_file
 from http import HTTPStatus
 from datetime import datetime
-import json
+from uuid import UUID
 from dependency_injector.wiring import inject, Provide
 
 from src.infrastructure.web.middlewares.auth_middleware import require_auth, get_current_user_id
+from src.application.use_cases.user.export_user_data import ExportUserDataUseCase
+from src.application.use_cases.export.request_export_job import RequestExportJobUseCase
+from src.application.use_cases.export.get_export_job import GetExportJobUseCase, GetExportArchiveUseCase
 from src.infrastructure.container import Container
 
 
@@ -18,11 +21,7 @@ export_bp = Blueprint('export', __name__, url_prefix='/api/v1/export')
 @require_auth
 @inject
 def export_my_data(
-    user_repo = Provide[Container.user_repository],
-    colli_repo = Provide[Container.colli_repository],
-    letter_repo = Provide[Container.letter_repository],
-    comment_repo = Provide[Container.comment_repository],
-    notification_repo = Provide[Container.notification_repository]
+    use_case: ExportUserDataUseCase = Provide[Container.export_user_data_use_case]
 ):
     """
     Exporter toutes mes donnees (RGPD)
@@ -33,7 +32,8 @@ def export_my_data(
     description: >
       Conformement au RGPD (Art. 20 - Droit a la portabilite),
       cet endpoint permet de telecharger toutes vos donnees
-      dans un format structure (JSON).
+      dans un format structure (JSON). Le document est transmis en flux
+      (Transfer-Encoding chunked), au fur et a mesure de sa lecture en base.
     security:
       - BearerAuth: []
     responses:
@@ -59,77 +59,159 @@ def export_my_data(
                   type: array
       401:
         $ref: '#/components/responses/Unauthorized'
+      404:
+        $ref: '#/components/responses/NotFound'
     """
-    from src.application.dtos.user_dto import UserResponseDTO
-    from src.application.dtos.colli_dto import ColliResponseDTO
-    from src.application.dtos.letter_dto import LetterResponseDTO
-    from src.application.dtos.comment_dto import CommentResponseDTO
-    
     user_id = get_current_user_id()
     
-    # Recuperer l'utilisateur
-    user = user_repo.find_by_id(user_id)
-    if not user:
-        return jsonify({'error': 'Utilisateur non trouve'}), HTTPStatus.NOT_FOUND
-    
-    # Recuperer les COLLIs (crees ou membre)
-    all_collis = colli_repo.find_all() if hasattr(colli_repo, 'find_all') else []
-    my_collis = [
-        c for c in all_collis 
-        if c.creator_id == user_id or c.has_membership(user_id)
-    ]
-    
-    # Recuperer les lettres
-    all_letters = letter_repo.find_all() if hasattr(letter_repo, 'find_all') else []
-    my_letters = [l for l in all_letters if l.sender_id == user_id]
-    
-    # Recuperer les commentaires
-    all_comments = comment_repo.find_all() if hasattr(comment_repo, 'find_all') else []
-    my_comments = [c for c in all_comments if c.author_id == user_id]
-    
-    # Recuperer les notifications
-    my_notifications = notification_repo.find_by_user(user_id, limit=1000)
-    
-    # Construire l'export
-    export_data = {
-        'export_date': datetime.utcnow().isoformat(),
-        'rgpd_notice': 'Export conforme au RGPD Article 20 - Droit a la portabilite des donnees',
-        'user': {
-            'id': str(user.id),
-            'email': user.email,
-            'first_name': user.first_name,
-            'last_name': user.last_name,
-            'role': user.role.value,
-            'created_at': user.created_at.isoformat() if hasattr(user, 'created_at') and user.created_at else None,
-            'avatar_url': user.avatar_url if hasattr(user, 'avatar_url') else None
-        },
-        'collis': {
-            'created': [ColliResponseDTO.from_entity(c).to_dict() for c in my_collis if c.creator_id == user_id],
-            'member_of': [ColliResponseDTO.from_entity(c).to_dict() for c in my_collis if c.creator_id != user_id]
-        },
-        'letters': [LetterResponseDTO.from_entity(l).to_dict() for l in my_letters],
-        'comments': [CommentResponseDTO.from_entity(c).to_dict() for c in my_comments],
-        'notifications': [n.to_dict() for n in my_notifications],
-        'statistics': {
-            'total_collis': len(my_collis),
-            'total_letters': len(my_letters),
-            'total_comments': len(my_comments),
-            'total_notifications': len(my_notifications)
-        }
-    }
+    # Vérifie l'utilisateur avant de commencer le flux (404 possible)
+    chunks = use_case.execute(user_id)
     
-    # Retourner comme fichier telechargeable
-    response = Response(
-        json.dumps(export_data, indent=2, ensure_ascii=False),
+    # Retourner comme fichier telechargeable, en flux
+    return Response(
+        stream_with_context(chunks),
         mimetype='application/json',
         headers={
             'Content-Disposition': f'attachment; filename=alvs_export_{user_id}_{datetime.utcnow().strftime("%Y%m%d")}.json'
         }
     )
+
+
+@export_bp.post('/my-data/jobs')
+@require_auth
+@inject
+def request_export_job(
+    use_case: RequestExportJobUseCase = Provide[Container.request_export_job_use_case]
+):
+    """
+    Demander une archive de mes donnees (RGPD)
+    ---
+    tags:
+      - Export
+    summary: Lancer l'export de vos donnees et fichiers en arriere-plan
+    description: >
+      Cree un job qui produit une archive zip (data.json et fichiers
+      uploades). Suivre son etat via l'URL du header Location, puis
+      telecharger l'archive via download_url. Si un export est deja
+      en attente ou en cours, ce job est retourne.
+    security:
+      - BearerAuth: []
+    responses:
+      202:
+        description: Job d'export cree (ou deja en cours)
+        headers:
+          Location:
+            description: URL de suivi du job
+            schema:
+              type: string
+        content:
+          application/json:
+            schema:
+              $ref: '#/components/schemas/ExportJob'
+      401:
+        $ref: '#/components/responses/Unauthorized'
+      404:
+        $ref: '#/components/responses/NotFound'
+    """
+    job = use_case.execute(get_current_user_id())
     
+    response = jsonify(job.to_dict())
+    response.status_code = HTTPStatus.ACCEPTED
+    response.headers['Location'] = f'/api/v1/export/my-data/jobs/{job.id}'
     return response
 
 
+@export_bp.get('/my-data/jobs/<uuid:job_id>')
+@require_auth
+@inject
+def get_export_job(
+    job_id: UUID,
+    use_case: GetExportJobUseCase = Provide[Container.get_export_job_use_case]
+):
+    """
+    Etat d'un export
+    ---
+    tags:
+      - Export
+    summary: Consulter l'etat d'un job d'export
+    security:
+      - BearerAuth: []
+    parameters:
+      - name: job_id
+        in: path
+        required: true
+        schema:
+          type: string
+          format: uuid
+    responses:
+      200:
+        description: Etat du job (pending, running, completed, failed, expired)
+        content:
+          application/json:
+            schema:
+              $ref: '#/components/schemas/ExportJob'
+      401:
+        $ref: '#/components/responses/Unauthorized'
+      404:
+        $ref: '#/components/responses/NotFound'
+    """
+    job = use_case.execute(job_id, get_current_user_id())
+    return jsonify(job.to_dict()), HTTPStatus.OK
+
+
+@export_bp.get('/my-data/jobs/<uuid:job_id>/download')
+@require_auth
+@inject
+def download_export_archive(
+    job_id: UUID,
+    use_case: GetExportArchiveUseCase = Provide[Container.get_export_archive_use_case]
+):
+    """
+    Telecharger l'archive d'un export
+    ---
+    tags:
+      - Export
+    summary: Telecharger l'archive zip d'un export termine
+    description: >
+      L'archive est servie en flux depuis le disque. Les requetes
+      Range (reprise de telechargement) et conditionnelles sont supportees.
+    security:
+      - BearerAuth: []
+    parameters:
+      - name: job_id
+        in: path
+        required: true
+        schema:
+          type: string
+          format: uuid
+    responses:
+      200:
+        description: Archive zip
+        content:
+          application/zip:
+            schema:
+              type: string
+              format: binary
+      206:
+        description: Partie de l'archive (requete Range)
+      401:
+        $ref: '#/components/responses/Unauthorized'
+      404:
+        $ref: '#/components/responses/NotFound'
+      409:
+        description: Export pas encore termine ou en echec
+    """
+    archive = use_case.execute(job_id, get_current_user_id())
+    
+    return send_file(
+        archive.path,
+        mimetype='application/zip',
+        as_attachment=True,
+        download_name=f'alvs_export_{job_id}.zip',
+        conditional=True
+    )
+
+
 @export_bp.delete('/my-data')
 @require_auth
 @inject
@@ -11,6 +11,8 @@ from dependency_injector.wiring import inject, Provide
 from src.infrastructure.web.middlewares.auth_middleware import require_auth, require_role, get_current_user_id
 from src.domain.identity.value_objects.user_role import UserRole
 from src.application.exceptions import ValidationException, NotFoundException, ForbiddenException
+from src.domain.collaboration.entities.membership import Membership
+from src.domain.collaboration.entities.colli import InactiveColliException
 from src.infrastructure.container import Container
 
 
@@ -171,7 +173,8 @@ def get_invitation(code: str):
 @inject
 def accept_invitation(
     code: str,
-    colli_repo = Provide[Container.colli_repository]
+    colli_repo = Provide[Container.colli_repository],
+    membership_repo = Provide[Container.membership_repository]
 ):
     """
     Accepter une invitation
@@ -218,20 +221,22 @@ def accept_invitation(
     user_id = get_current_user_id()
     colli_id = UUID(invitation['colli_id'])
     
-    colli = colli_repo.find_by_id(colli_id)
+    colli = colli_repo.find_summaries_by_ids([colli_id]).get(colli_id)
     if not colli:
         raise NotFoundException(f"COLLI non trouve")
     
     # Verifier si deja membre
-    if colli.has_membership(user_id) or user_id == colli.creator_id:
+    if user_id == colli.creator_id or membership_repo.find(colli_id, user_id):
         return jsonify({
             'message': 'Vous etes deja membre de ce COLLI',
             'colli_id': str(colli_id)
         }), HTTPStatus.OK
     
-    # Ajouter comme membre
-    colli.add_member(user_id)
-    colli_repo.save(colli)
+    if not colli.is_active:
+        raise InactiveColliException(f"Le COLLI {colli_id} n'est pas actif")
+    
+    # Ajouter comme membre (une seule ligne, sans recharger le COLLI)
+    membership_repo.add(Membership.create(user_id=user_id, colli_id=colli_id))
     
     # Marquer l'invitation comme utilisee
     invitation['used'] = True
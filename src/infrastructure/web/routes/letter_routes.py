@@ -8,6 +8,7 @@ from dependency_injector.wiring import inject, Provide
 from flask_jwt_extended import jwt_required, get_jwt_identity
 
 from src.infrastructure.web.middlewares.auth_middleware import require_auth, get_current_user_id
+from src.infrastructure.web.middlewares.replica_routing import read_from_replica
 from src.application.exceptions import ValidationException
 from src.application.dtos.letter_dto import CreateTextLetterCommand, CreateFileLetterCommand
 from src.application.use_cases.letter.create_letter import CreateTextLetterUseCase, CreateFileLetterUseCase
@@ -113,6 +114,7 @@ def create_letter(
 
 @letter_bp.get('')
 @require_auth
+@read_from_replica
 @inject
 def list_letters(
     colli_id: UUID,
@@ -144,6 +146,11 @@ def list_letters(
           type: integer
           default: 20
           maximum: 100
+      - name: cursor
+        in: query
+        description: Curseur opaque (next_cursor de la page précédente), prioritaire sur page
+        schema:
+          type: string
     responses:
       200:
         description: Liste paginée des lettres
@@ -158,6 +165,9 @@ def list_letters(
                     $ref: '#/components/schemas/Letter'
                 total:
                   type: integer
+                next_cursor:
+                  type: string
+                  nullable: true
       401:
         $ref: '#/components/responses/Unauthorized'
       404:
@@ -166,8 +176,9 @@ def list_letters(
     user_id = get_current_user_id()
     page = request.args.get('page', 1, type=int)
     per_page = min(request.args.get('per_page', 20, type=int), 100)
+    cursor = request.args.get('cursor')
     
-    result = use_case.execute(colli_id, user_id, page, per_page)
+    result = use_case.execute(colli_id, user_id, page, per_page, cursor=cursor)
     return jsonify(result.to_dict()), HTTPStatus.OK
 
 
@@ -84,3 +84,7 @@ class ColliListQuerySchema(Schema):
             error="Statut invalide"
         )
     )
+    cursor = fields.String(
+        required=False,
+        validate=validate.Length(max=256, error="Curseur trop long")
+    )
@@ -109,12 +109,22 @@ def register_handlers(sio: SocketIO):
     
     @sio.on('join_colli')
     def handle_join_colli(data):
-        """Rejoindre la room d'un COLLI pour recevoir les updates."""
+        """
+        Rejoindre la room d'un COLLI pour recevoir les updates.
+        
+        Reserve aux membres acceptes : la room diffuse les nouvelles
+        lettres et commentaires du COLLI.
+        """
         colli_id = data.get('colli_id')
-        if colli_id:
-            join_room(f"colli_{colli_id}")
-            emit('joined_colli', {'colli_id': colli_id})
-            logger.info(f"Client {request.sid} rejoint le COLLI {colli_id}")
+        if not colli_id:
+            return
+        user_id = _user_for_sid(request.sid)
+        if not user_id or not _is_colli_member(colli_id, user_id):
+            emit('error', {'message': 'Acces refuse a ce COLLI'})
+            return
+        join_room(f"colli_{colli_id}")
+        emit('joined_colli', {'colli_id': colli_id})
+        logger.info(f"Client {request.sid} rejoint le COLLI {colli_id}")
     
     @sio.on('leave_colli')
     def handle_leave_colli(data):
@@ -130,6 +140,29 @@ def register_handlers(sio: SocketIO):
         emit('pong')
 
 
+def _user_for_sid(sid: str) -> Optional[str]:
+    """Utilisateur authentifie d'une session WebSocket, s'il y en a un."""
+    for user_id, sessions in _connected_users.items():
+        if sid in sessions:
+            return user_id
+    return None
+
+
+def _is_colli_member(colli_id: str, user_id: str) -> bool:
+    """Verifie l'appartenance (EXISTS, sans charger le COLLI)."""
+    from src.infrastructure.container import get_container
+    
+    try:
+        colli_uuid, user_uuid = UUID(str(colli_id)), UUID(str(user_id))
+    except ValueError:
+        return False
+    container = get_container()
+    try:
+        return container.colli_repository().is_accepted_member(colli_uuid, user_uuid)
+    finally:
+        container.db_session().remove()
+
+
 def is_user_online(user_id: str) -> bool:
     """Verifie si un utilisateur est connecte."""
     return user_id in _connected_users and len(_connected_users[user_id]) > 0
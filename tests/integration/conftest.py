@@ -0,0 +1,28 @@
+# tests/integration/conftest.py
+"""Fixtures partagées par les tests d'intégration."""
+
+from contextlib import contextmanager
+
+import pytest
+
+from src.infrastructure.persistence.sqlalchemy.query_counter import track_queries
+
+
+@pytest.fixture
+def assert_max_queries(app):
+    """
+    Vérifie qu'un bloc n'exécute pas plus de `n` requêtes SQL.
+
+    Usage:
+        def test_list(client, auth_headers, assert_max_queries):
+            with assert_max_queries(3):
+                client.get('/api/v1/collis', headers=auth_headers)
+    """
+    @contextmanager
+    def _assert_max_queries(n: int):
+        with track_queries() as stats:
+            yield stats
+        details = "\n".join(f"  {count}× {statement}" for statement, count in stats.statements.most_common())
+        assert stats.count <= n, f"{stats.count} requêtes SQL exécutées (maximum {n}):\n{details}"
+
+    return _assert_max_queries
@@ -72,6 +72,11 @@ class TestAdminStatsRoutes:
         response = client.get('/api/v1/admin/stats', headers=auth_headers)
         assert response.status_code == 403
 
+    def test_get_db_pool_metrics_not_admin(self, client, auth_headers):
+        """Test: les statistiques de pool sont réservées aux admins."""
+        response = client.get('/api/v1/admin/metrics/db-pool', headers=auth_headers)
+        assert response.status_code == 403
+
 
 class TestAdminWithAdminRole:
     """Tests pour les endpoints admin avec le role admin."""
@@ -86,3 +91,29 @@ class TestAdminWithAdminRole:
         """Test: obtenir les stats en tant qu'admin."""
         response = client.get('/api/v1/admin/stats', headers=admin_headers)
         assert response.status_code in [200, 401]
+
+    def test_get_db_pool_metrics_as_admin(self, client, admin_headers):
+        """Test: état du pool primaire et liste (vide) des réplicas."""
+        response = client.get('/api/v1/admin/metrics/db-pool', headers=admin_headers)
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data['replicas'] == []
+        assert 'pool' in data['primary']
+
+    def test_stats_aggregated_in_sql(self, app):
+        """Test: les compteurs couvrent toutes les lignes, pas une page de 20."""
+        from src.infrastructure.container import container
+        from src.domain.collaboration.entities.colli import Colli
+        from src.infrastructure.persistence.sqlalchemy.queries.admin_stats_query import SQLAlchemyAdminStatsQuery
+
+        with app.app_context():
+            colli_repo = container.colli_repository()
+            for i in range(25):
+                colli_repo.save(Colli.create(name=f"COLLI {i}", theme="Test", creator_id=uuid4()))
+
+            stats = SQLAlchemyAdminStatsQuery(container.db_session()).get_stats()
+
+        assert stats.total_collis == 25
+        assert stats.collis_by_status == {'pending': 25}
+        assert stats.total_letters == 0
+        assert stats.users_by_role.get('admin', 0) >= 1
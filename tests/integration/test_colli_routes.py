@@ -87,6 +87,30 @@ class TestColliRoutes:
         data = response.get_json()
         assert 'items' in data
         assert 'total' in data
+
+    def test_list_collis_member_count_without_loading_members(self, client, app, assert_max_queries):
+        """GET /api/v1/collis - member_count lu sur le compteur, requêtes indépendantes du nombre de COLLIs."""
+        member_id = uuid4()
+        with app.app_context():
+            creator_token = create_access_token(identity=str(uuid4()), additional_claims={'role': 'teacher'})
+            admin_token = create_access_token(identity=str(uuid4()), additional_claims={'role': 'admin'})
+            member_token = create_access_token(identity=str(member_id), additional_claims={'role': 'student'})
+        creator = {'Authorization': f'Bearer {creator_token}'}
+
+        colli_ids = [
+            client.post('/api/v1/collis', json={'name': f'COLLI {i}', 'theme': 'Test'}, headers=creator).get_json()['id']
+            for i in range(3)
+        ]
+        client.patch(f'/api/v1/collis/{colli_ids[0]}/approve', headers={'Authorization': f'Bearer {admin_token}'})
+        client.post(f'/api/v1/collis/{colli_ids[0]}/join', headers={'Authorization': f'Bearer {member_token}'})
+        client.patch(f'/api/v1/collis/{colli_ids[0]}/members/{member_id}/accept', headers=creator)
+
+        with assert_max_queries(3):
+            response = client.get('/api/v1/collis', headers=creator)
+
+        counts = {item['id']: item['member_count'] for item in response.get_json()['items']}
+        # Créateur (ajouté à l'approbation) et membre acceptés ; COLLIs en attente : aucun membre
+        assert counts == {colli_ids[0]: 2, colli_ids[1]: 0, colli_ids[2]: 0}
     
     def test_get_colli_not_found(self, client, auth_headers):
         """GET /api/v1/collis/<id> - Doit retourner 404."""
@@ -231,3 +255,58 @@ class TestColliMembershipRoutes:
         data = members_res.get_json()
         assert 'members' in data
         assert data['total'] >= 1  # Au moins le créateur
+
+
+class TestMyCollisRoutes:
+    """Tests pour la route /mine."""
+
+    def test_get_my_collis_by_role(self, client, app):
+        """GET /api/v1/collis/mine - Filtre créateur/membre en SQL."""
+        teacher_id = uuid4()
+        member_id = uuid4()
+
+        with app.app_context():
+            teacher_token = create_access_token(
+                identity=str(teacher_id),
+                additional_claims={'role': 'teacher'}
+            )
+            admin_token = create_access_token(
+                identity=str(uuid4()),
+                additional_claims={'role': 'admin'}
+            )
+            member_token = create_access_token(
+                identity=str(member_id),
+                additional_claims={'role': 'student'}
+            )
+
+        colli_ids = []
+        for i in range(3):
+            res = client.post(
+                '/api/v1/collis',
+                json={'name': f'COLLI {i}', 'theme': 'Test'},
+                headers={'Authorization': f'Bearer {teacher_token}'}
+            )
+            colli_ids.append(res.get_json()['id'])
+
+        client.patch(
+            f'/api/v1/collis/{colli_ids[0]}/approve',
+            headers={'Authorization': f'Bearer {admin_token}'}
+        )
+        client.post(
+            f'/api/v1/collis/{colli_ids[0]}/join',
+            headers={'Authorization': f'Bearer {member_token}'}
+        )
+
+        created = client.get(
+            '/api/v1/collis/mine?role=creator&per_page=2',
+            headers={'Authorization': f'Bearer {teacher_token}'}
+        ).get_json()
+        joined = client.get(
+            '/api/v1/collis/mine?role=member',
+            headers={'Authorization': f'Bearer {member_token}'}
+        ).get_json()
+
+        assert created['total'] == 3
+        assert len(created['items']) == 2
+        assert joined['total'] == 1
+        assert joined['items'][0]['id'] == colli_ids[0]
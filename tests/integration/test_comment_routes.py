@@ -165,6 +165,39 @@ class TestCommentRoutes:
         assert len(data['items']) == 2
         assert data['has_more'] is True
     
+    def test_list_comment_threads_in_one_query(self, client, setup_letter, assert_max_queries):
+        """GET /api/v1/letters/<id>/comments/thread - Arbre chargé en une requête."""
+        url = f'/api/v1/letters/{setup_letter["letter_id"]}/comments'
+        headers = {'Authorization': f'Bearer {setup_letter["member_token"]}'}
+        parent_id = None
+        for i in range(4):
+            res = client.post(
+                url,
+                json={'content': f'Niveau {i}', 'parent_comment_id': parent_id},
+                headers=headers
+            )
+            parent_id = res.get_json()['id']
+        client.post(url, json={'content': 'Autre fil'}, headers=headers)
+
+        # Utilisateur authentifié, lettre, appartenance, arbre (CTE), senders
+        with assert_max_queries(5):
+            response = client.get(f'{url}/thread?max_depth=2', headers=headers)
+
+        assert response.status_code == 200
+        data = response.get_json()
+        assert [item['content'] for item in data['items']] == ['Niveau 0', 'Autre fil']
+        deepest = data['items'][0]['replies'][0]['replies'][0]
+        assert deepest['content'] == 'Niveau 2'
+        assert deepest['depth'] == 2
+        assert deepest['replies'] == []
+        assert deepest['has_more_replies'] is True
+
+        subtree = client.get(
+            f'{url}/thread?parent_comment_id={deepest["id"]}',
+            headers=headers
+        )
+        assert [item['content'] for item in subtree.get_json()['items']] == ['Niveau 3']
+    
     def test_delete_comment_by_author(self, client, setup_letter):
         """DELETE /api/v1/letters/<id>/comments/<id> - Supprimer son commentaire."""
         # Créer
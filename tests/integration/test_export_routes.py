@@ -1,8 +1,11 @@
 # tests/integration/test_export_routes.py
 """Tests d'integration pour les routes d'export RGPD."""
 
-import pytest
+import io
 import json
+import zipfile
+
+import pytest
 
 
 class TestExportRoutes:
@@ -89,3 +92,73 @@ class TestDataDeletionRequest:
             data = response.get_json()
             assert 'deletion_date' in data
             assert 'notice' in data
+
+
+class TestStreamingExport:
+    """Tests pour l'export RGPD en flux."""
+    
+    def test_export_streams_valid_json(self, client, registered_user):
+        """L'export d'un utilisateur existant est un flux JSON valide."""
+        headers = {'Authorization': f"Bearer {registered_user['access_token']}"}
+        
+        response = client.get('/api/v1/export/my-data', headers=headers)
+        
+        assert response.status_code == 200
+        assert response.is_streamed
+        data = json.loads(response.get_data(as_text=True))
+        assert data['user']['email'] == registered_user['email']
+        assert data['collis'] == {'created': [], 'member_of': []}
+        assert data['statistics']['total_letters'] == 0
+    
+    def test_export_unknown_user(self, client, auth_headers):
+        """Un utilisateur inexistant obtient 404 avant tout envoi."""
+        response = client.get('/api/v1/export/my-data', headers=auth_headers)
+        
+        assert response.status_code == 404
+
+
+class TestExportJobs:
+    """Tests pour les exports en arrière-plan (exécuteur inline en test)."""
+    
+    def test_request_job_unauthorized(self, client):
+        """POST sans token refusé."""
+        response = client.post('/api/v1/export/my-data/jobs')
+        
+        assert response.status_code == 401
+    
+    def test_job_lifecycle_and_download(self, client, registered_user):
+        """Le job est créé, terminé, puis son archive se télécharge (y compris par plage)."""
+        headers = {'Authorization': f"Bearer {registered_user['access_token']}"}
+        
+        response = client.post('/api/v1/export/my-data/jobs', headers=headers)
+        
+        assert response.status_code == 202
+        job = response.get_json()
+        assert response.headers['Location'] == f"/api/v1/export/my-data/jobs/{job['id']}"
+        
+        status = client.get(response.headers['Location'], headers=headers).get_json()
+        assert status['status'] == 'completed'
+        assert status['download_url']
+        
+        download = client.get(status['download_url'], headers=headers)
+        assert download.status_code == 200
+        assert download.mimetype == 'application/zip'
+        archive = zipfile.ZipFile(io.BytesIO(download.data))
+        data = json.loads(archive.read('data.json'))
+        assert data['user']['email'] == registered_user['email']
+        assert int(download.headers['Content-Length']) == status['archive_size']
+        
+        partial = client.get(status['download_url'], headers={**headers, 'Range': 'bytes=0-9'})
+        assert partial.status_code == 206
+        assert partial.data == download.data[:10]
+    
+    def test_job_hidden_from_other_users(self, client, registered_user, auth_headers):
+        """Le job d'un autre utilisateur renvoie 404."""
+        headers = {'Authorization': f"Bearer {registered_user['access_token']}"}
+        job = client.post('/api/v1/export/my-data/jobs', headers=headers).get_json()
+        
+        status = client.get(f"/api/v1/export/my-data/jobs/{job['id']}", headers=auth_headers)
+        download = client.get(f"/api/v1/export/my-data/jobs/{job['id']}/download", headers=auth_headers)
+        
+        assert status.status_code == 404
+        assert download.status_code == 404
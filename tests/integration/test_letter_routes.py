@@ -145,7 +145,91 @@ class TestLetterRoutes:
         data = response.get_json()
         assert 'items' in data
         assert data['total'] >= 1
-    
+
+    def test_list_letters_with_cursor(self, client, setup_colli):
+        """GET /api/v1/collis/<id>/letters?cursor= - Parcours keyset sans doublon."""
+        url = f'/api/v1/collis/{setup_colli["colli_id"]}/letters'
+        headers = {'Authorization': f'Bearer {setup_colli["member_token"]}'}
+        for i in range(5):
+            client.post(url, json={'letter_type': 'text', 'content': f'Lettre de test {i}'}, headers=headers)
+
+        first = client.get(f'{url}?per_page=2', headers=headers).get_json()
+        assert len(first['items']) == 2
+        assert first['next_cursor']
+
+        seen = [item['id'] for item in first['items']]
+        cursor = first['next_cursor']
+        while cursor:
+            data = client.get(f'{url}?per_page=2&cursor={cursor}', headers=headers).get_json()
+            seen.extend(item['id'] for item in data['items'])
+            cursor = data['next_cursor']
+
+        assert len(seen) == 5
+        assert len(set(seen)) == 5
+
+    def test_list_letters_query_count_independent_of_size(self, client, setup_colli, assert_max_queries):
+        """GET /api/v1/collis/<id>/letters - Pas de requête par lettre (N+1)."""
+        url = f'/api/v1/collis/{setup_colli["colli_id"]}/letters'
+        headers = {'Authorization': f'Bearer {setup_colli["member_token"]}'}
+        for i in range(5):
+            client.post(url, json={'letter_type': 'text', 'content': f'Lettre de test {i}'}, headers=headers)
+
+        with assert_max_queries(5):
+            response = client.get(url, headers=headers)
+
+        assert len(response.get_json()['items']) == 5
+
+    def test_counters_follow_letters_and_comments(self, client, setup_colli):
+        """letter_count, last_activity_at et comment_count suivent créations et suppressions."""
+        colli_id = setup_colli["colli_id"]
+        headers = {'Authorization': f'Bearer {setup_colli["member_token"]}'}
+        letter_ids = [
+            client.post(
+                f'/api/v1/collis/{colli_id}/letters',
+                json={'letter_type': 'text', 'content': f'Lettre de test {i}'},
+                headers=headers
+            ).get_json()['id']
+            for i in range(2)
+        ]
+        comment_ids = [
+            client.post(
+                f'/api/v1/letters/{letter_ids[0]}/comments',
+                json={'content': f'Commentaire {i}'},
+                headers=headers
+            ).get_json()['id']
+            for i in range(2)
+        ]
+        client.delete(f'/api/v1/letters/{letter_ids[0]}/comments/{comment_ids[0]}', headers=headers)
+        client.delete(f'/api/v1/collis/{colli_id}/letters/{letter_ids[1]}', headers=headers)
+
+        colli = client.get(f'/api/v1/collis/{colli_id}', headers=headers).get_json()
+        letters = client.get(f'/api/v1/collis/{colli_id}/letters', headers=headers).get_json()
+
+        assert colli['letter_count'] == 1
+        assert colli['last_activity_at'] is not None
+        assert [(l['id'], l['comment_count']) for l in letters['items']] == [(letter_ids[0], 1)]
+
+    def test_list_letters_debug_query_headers(self, app, client, setup_colli):
+        """En mode debug, la réponse indique le nombre et le temps des requêtes SQL."""
+        app.debug = True
+
+        response = client.get(
+            f'/api/v1/collis/{setup_colli["colli_id"]}/letters',
+            headers={'Authorization': f'Bearer {setup_colli["member_token"]}'}
+        )
+
+        assert int(response.headers['X-DB-Queries']) >= 1
+        assert float(response.headers['X-DB-Time']) >= 0
+
+    def test_list_letters_invalid_cursor(self, client, setup_colli):
+        """GET /api/v1/collis/<id>/letters?cursor= - Curseur invalide."""
+        response = client.get(
+            f'/api/v1/collis/{setup_colli["colli_id"]}/letters?cursor=invalide',
+            headers={'Authorization': f'Bearer {setup_colli["member_token"]}'}
+        )
+
+        assert response.status_code == 400
+
     def test_get_letter_by_id(self, client, setup_colli):
         """GET /api/v1/collis/<id>/letters/<id> - Récupérer une lettre."""
         # Créer
@@ -165,6 +249,40 @@ class TestLetterRoutes:
         assert response.status_code == 200
         assert response.get_json()['id'] == letter_id
     
+    def test_get_letter_checks_membership_without_loading_colli(self, client, app, setup_colli, assert_max_queries):
+        """L'accès se vérifie par un EXISTS, sans charger le COLLI ni ses membres."""
+        url = f'/api/v1/collis/{setup_colli["colli_id"]}/letters'
+        create_res = client.post(
+            url,
+            json={'letter_type': 'text', 'content': 'Contenu valide pour test'},
+            headers={'Authorization': f'Bearer {setup_colli["member_token"]}'}
+        )
+        letter_id = create_res.get_json()['id']
+        with app.app_context():
+            outsider_token = create_access_token(
+                identity=str(uuid4()),
+                additional_claims={'role': 'student'}
+            )
+
+        # Utilisateur authentifié, lettre, appartenance, commentaires, sender
+        with assert_max_queries(5):
+            response = client.get(
+                f'{url}/{letter_id}',
+                headers={'Authorization': f'Bearer {setup_colli["member_token"]}'}
+            )
+        forbidden = client.get(
+            f'{url}/{letter_id}',
+            headers={'Authorization': f'Bearer {outsider_token}'}
+        )
+        missing = client.get(
+            f'/api/v1/collis/{uuid4()}/letters',
+            headers={'Authorization': f'Bearer {outsider_token}'}
+        )
+
+        assert response.status_code == 200
+        assert forbidden.status_code == 403
+        assert missing.status_code == 404
+    
     def test_delete_letter_by_author(self, client, setup_colli):
         """DELETE /api/v1/collis/<id>/letters/<id> - Supprimer sa lettre."""
         # Créer
@@ -200,3 +318,23 @@ class TestLetterRoutes:
         )
         
         assert response.status_code == 204
+    
+    def test_create_letter_notifies_other_members(self, client, setup_colli):
+        """Les autres membres sont notifiés de la nouvelle lettre, pas l'auteur."""
+        client.post(
+            f'/api/v1/collis/{setup_colli["colli_id"]}/letters',
+            json={'letter_type': 'text', 'content': 'Lettre pour tous les membres'},
+            headers={'Authorization': f'Bearer {setup_colli["member_token"]}'}
+        )
+        
+        teacher = client.get(
+            '/api/v1/notifications',
+            headers={'Authorization': f'Bearer {setup_colli["teacher_token"]}'}
+        ).get_json()
+        member = client.get(
+            '/api/v1/notifications',
+            headers={'Authorization': f'Bearer {setup_colli["member_token"]}'}
+        ).get_json()
+        
+        assert [item['type'] for item in teacher['items']].count('new_letter') == 1
+        assert 'new_letter' not in [item['type'] for item in member['items']]
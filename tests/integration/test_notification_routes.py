@@ -2,7 +2,9 @@
 """Tests d'integration pour les routes de notifications."""
 
 import pytest
-from uuid import uuid4
+from uuid import UUID, uuid4
+
+from src.domain.notification.entities.notification import Notification, NotificationType
 
 
 class TestNotificationRoutes:
@@ -73,3 +75,71 @@ class TestNotificationFiltering:
             headers=auth_headers
         )
         assert response.status_code == 200
+
+
+class TestPersistedNotifications:
+    """Tests pour les notifications stockées en base."""
+    
+    @pytest.fixture
+    def seeded(self, app, registered_user):
+        """Trois notifications (une déjà lue) pour l'utilisateur, une pour un autre."""
+        from src.infrastructure.container import container
+        
+        user_id = UUID(registered_user['user_id'])
+        with app.app_context():
+            repo = container.notification_repository()
+            notifications = [
+                Notification(user_id=user_id, type=NotificationType.SYSTEM, title=f"Info {i}", message="Message")
+                for i in range(3)
+            ]
+            notifications[0].mark_as_read()
+            for notification in notifications:
+                repo.save(notification)
+            repo.save(Notification(user_id=uuid4(), type=NotificationType.SYSTEM, title="Autre", message="Message"))
+            container.db_session().commit()
+        
+        return {
+            'headers': {'Authorization': f"Bearer {registered_user['access_token']}"},
+            'ids': [str(n.id) for n in notifications]
+        }
+    
+    def test_list_and_count_only_own_notifications(self, client, seeded):
+        """La liste et le compteur ne portent que sur l'utilisateur."""
+        data = client.get('/api/v1/notifications', headers=seeded['headers']).get_json()
+        unread = client.get('/api/v1/notifications?unread_only=true', headers=seeded['headers']).get_json()
+        
+        assert sorted(item['id'] for item in data['items']) == sorted(seeded['ids'])
+        assert data['unread_count'] == 2
+        assert len(unread['items']) == 2
+    
+    def test_mark_one_then_all_as_read(self, client, seeded):
+        """Marquer une puis toutes les notifications met à jour le compteur."""
+        response = client.patch(f"/api/v1/notifications/{seeded['ids'][1]}/read", headers=seeded['headers'])
+        assert response.status_code == 200
+        assert client.get('/api/v1/notifications/count', headers=seeded['headers']).get_json()['unread_count'] == 1
+        
+        response = client.post('/api/v1/notifications/read-all', headers=seeded['headers'])
+        assert response.get_json()['marked_count'] == 1
+        assert client.get('/api/v1/notifications/count', headers=seeded['headers']).get_json()['unread_count'] == 0
+    
+    def test_delete_own_notification(self, client, seeded):
+        """Supprimer une notification la retire de la liste."""
+        response = client.delete(f"/api/v1/notifications/{seeded['ids'][2]}", headers=seeded['headers'])
+        
+        assert response.status_code == 204
+        data = client.get('/api/v1/notifications', headers=seeded['headers']).get_json()
+        assert seeded['ids'][2] not in [item['id'] for item in data['items']]
+    
+    def test_colli_approval_notification_is_persisted(self, client, app, auth_headers, admin_auth_headers):
+        """La notification d'approbation est enregistrée en base pour le créateur."""
+        colli_id = client.post(
+            '/api/v1/collis',
+            json={'name': 'COLLI notifie', 'theme': 'Theme'},
+            headers=auth_headers
+        ).get_json()['id']
+        client.patch(f'/api/v1/collis/{colli_id}/approve', headers=admin_auth_headers)
+        
+        data = client.get('/api/v1/notifications', headers=auth_headers).get_json()
+        
+        assert [item['type'] for item in data['items']] == ['colli_approved']
+        assert data['unread_count'] == 1
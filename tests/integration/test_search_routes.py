@@ -2,6 +2,9 @@
 """Tests d'integration pour les routes de recherche."""
 
 import pytest
+from uuid import uuid4
+from flask_jwt_extended import create_access_token
+
 
 
 class TestSearchRoutes:
@@ -62,3 +65,132 @@ class TestSearchResultsStructure:
         if response.status_code == 200:
             data = response.get_json()
             assert 'query' in data
+
+
+class TestFullTextSearch:
+    """Tests de la recherche plein texte sur l'index SQL."""
+    
+    @pytest.fixture
+    def indexed_colli(self, client, app):
+        """COLLI actif avec des lettres, indexés via les événements domaine."""
+        teacher_id = uuid4()
+        with app.app_context():
+            teacher_token = create_access_token(
+                identity=str(teacher_id),
+                additional_claims={'role': 'teacher'}
+            )
+            admin_token = create_access_token(
+                identity=str(uuid4()),
+                additional_claims={'role': 'admin'}
+            )
+        headers = {'Authorization': f'Bearer {teacher_token}'}
+        
+        colli_id = client.post(
+            '/api/v1/collis',
+            json={'name': 'Atelier Astronomie', 'theme': 'Sciences'},
+            headers=headers
+        ).get_json()['id']
+        client.patch(
+            f'/api/v1/collis/{colli_id}/approve',
+            headers={'Authorization': f'Bearer {admin_token}'}
+        )
+        for content in [
+            'Observation des planetes ce soir',
+            'Les planetes et les etoiles filantes',
+            'Compte rendu de la sortie',
+        ]:
+            client.post(
+                f'/api/v1/collis/{colli_id}/letters',
+                json={'letter_type': 'text', 'content': content},
+                headers=headers
+            )
+        
+        return {'colli_id': colli_id, 'headers': headers}
+    
+    def test_search_letters_as_member(self, client, indexed_colli):
+        """Un membre trouve les lettres correspondantes, par préfixe."""
+        response = client.get(
+            '/api/v1/search?q=planete&type=letters',
+            headers=indexed_colli['headers']
+        )
+        
+        assert response.status_code == 200
+        data = response.get_json()
+        assert len(data['letters']) == 2
+        assert data['next_cursor'] is None
+    
+    def test_search_letters_hidden_from_stranger(self, client, indexed_colli, auth_headers):
+        """Un non-membre ne voit pas les lettres du COLLI."""
+        response = client.get('/api/v1/search?q=planetes&type=letters', headers=auth_headers)
+        
+        assert response.status_code == 200
+        assert response.get_json()['letters'] == []
+    
+    def test_search_active_colli_visible(self, client, indexed_colli, auth_headers):
+        """Un COLLI actif est trouvé par tout utilisateur."""
+        response = client.get('/api/v1/search?q=astro&type=collis', headers=auth_headers)
+        
+        assert response.status_code == 200
+        assert [c['id'] for c in response.get_json()['collis']] == [indexed_colli['colli_id']]
+    
+    def test_search_with_cursor(self, client, indexed_colli):
+        """La pagination par curseur parcourt les résultats sans doublon."""
+        url = '/api/v1/search?q=planetes&type=letters&limit=1'
+        headers = indexed_colli['headers']
+        
+        first = client.get(url, headers=headers).get_json()
+        assert len(first['letters']) == 1
+        assert first['next_cursor']
+        
+        second = client.get(f"{url}&cursor={first['next_cursor']}", headers=headers).get_json()
+        assert len(second['letters']) == 1
+        assert second['letters'][0]['id'] != first['letters'][0]['id']
+    
+    def test_search_cursor_without_type(self, client, indexed_colli):
+        """Un curseur sans type de recherche est refusé."""
+        response = client.get(
+            '/api/v1/search?q=planetes&cursor=abc',
+            headers=indexed_colli['headers']
+        )
+        
+        assert response.status_code == 400
+    
+    def test_updated_letter_is_reindexed(self, client, indexed_colli):
+        """Une lettre modifiée est retrouvée par son nouveau contenu."""
+        url = f"/api/v1/collis/{indexed_colli['colli_id']}/letters"
+        headers = indexed_colli['headers']
+        letter_id = client.post(
+            url, json={'letter_type': 'text', 'content': 'Brouillon sans interet'}, headers=headers
+        ).get_json()['id']
+        
+        client.patch(f'{url}/{letter_id}', json={'content': 'Eclipse lunaire prevue demain'}, headers=headers)
+        
+        data = client.get('/api/v1/search?q=eclipse&type=letters', headers=headers).get_json()
+        assert [l['id'] for l in data['letters']] == [letter_id]
+    
+    def test_deleted_letter_is_removed(self, client, indexed_colli):
+        """Une lettre supprimée disparaît des résultats."""
+        url = f"/api/v1/collis/{indexed_colli['colli_id']}/letters"
+        headers = indexed_colli['headers']
+        letter_id = client.post(
+            url, json={'letter_type': 'text', 'content': 'Nebuleuse du crabe'}, headers=headers
+        ).get_json()['id']
+        assert client.get('/api/v1/search?q=nebuleuse&type=letters', headers=headers).get_json()['letters']
+        
+        client.delete(f'{url}/{letter_id}', headers=headers)
+        
+        data = client.get('/api/v1/search?q=nebuleuse&type=letters', headers=headers).get_json()
+        assert data['letters'] == []
+    
+    def test_comment_makes_letter_searchable(self, client, indexed_colli):
+        """Le texte des commentaires est indexé avec la lettre."""
+        url = f"/api/v1/collis/{indexed_colli['colli_id']}/letters"
+        headers = indexed_colli['headers']
+        letter_id = client.post(
+            url, json={'letter_type': 'text', 'content': 'Compte rendu du club'}, headers=headers
+        ).get_json()['id']
+        
+        client.post(f'/api/v1/letters/{letter_id}/comments', json={'content': 'Superbe telescope'}, headers=headers)
+        
+        data = client.get('/api/v1/search?q=telescope&type=letters', headers=headers).get_json()
+        assert [l['id'] for l in data['letters']] == [letter_id]
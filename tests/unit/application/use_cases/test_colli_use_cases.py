@@ -8,10 +8,19 @@ from src.application.use_cases.colli.create_colli import CreateColliUseCase, Cre
 from src.application.use_cases.colli.approve_colli import ApproveColliUseCase, ApproveColliCommand
 from src.application.use_cases.colli.get_colli import GetColliByIdUseCase, ListCollisUseCase
 from src.application.use_cases.colli.delete_colli import DeleteColliUseCase
-from src.application.use_cases.colli.membership import JoinColliUseCase, LeaveColliUseCase, AcceptMemberUseCase
+from src.application.use_cases.colli.membership import (
+    MAX_ATTEMPTS,
+    AcceptMemberUseCase,
+    JoinColliUseCase,
+    LeaveColliUseCase,
+)
 from src.application.use_cases.colli.list_members import ListMembersUseCase
-from src.application.exceptions import NotFoundException, ForbiddenException
+from src.application.use_cases.colli.get_user_collis import GetUserCollisUseCase, ColliRoleFilter
+from src.application.exceptions import ConflictException, NotFoundException, ForbiddenException, ValidationException
 from src.infrastructure.persistence.in_memory.colli_repository import InMemoryColliRepository
+from src.infrastructure.persistence.in_memory.membership_repository import InMemoryMembershipRepository
+from src.infrastructure.persistence.in_memory.user_repository import InMemoryUserRepository
+from src.domain.identity.entities.user import User
 
 
 class ColliTestEventPublisher:
@@ -19,6 +28,21 @@ class ColliTestEventPublisher:
     def publish_all(self, events): pass
 
 
+class ConflictingMembershipRepository(InMemoryMembershipRepository):
+    """Simule `conflicts` écritures concurrentes avant de laisser passer save()."""
+
+    def __init__(self, colli_repository, conflicts):
+        super().__init__(colli_repository)
+        self.conflicts = conflicts
+        self.saves = 0
+
+    def save(self, membership):
+        self.saves += 1
+        if self.saves <= self.conflicts:
+            raise ConflictException("L'adhésion a été modifiée par une autre requête")
+        return super().save(membership)
+
+
 def to_uuid(id_str):
     """Convertit un ID string en UUID si nécessaire."""
     if isinstance(id_str, UUID):
@@ -168,6 +192,81 @@ class TestListCollisUseCase:
         assert len(result['items']) == 2
         assert result['has_more'] is True
 
+    def test_list_with_cursor(self):
+        """Doit parcourir tous les COLLIs via next_cursor, sans doublon."""
+        repo = InMemoryColliRepository()
+        create_uc = CreateColliUseCase(repo)
+        use_case = ListCollisUseCase(repo)
+
+        for i in range(5):
+            create_uc.execute(CreateColliCommand(
+                name=f"COLLI {i}", theme="Test", description=None, creator_id=uuid4()
+            ))
+
+        result = use_case.execute(page=1, per_page=2)
+        seen = [item['id'] for item in result['items']]
+        while result['next_cursor']:
+            result = use_case.execute(per_page=2, cursor=result['next_cursor'])
+            seen.extend(item['id'] for item in result['items'])
+
+        assert len(seen) == 5
+        assert len(set(seen)) == 5
+        assert result['has_more'] is False
+
+    def test_list_invalid_cursor(self):
+        """Doit lever ValidationException pour un curseur malformé."""
+        use_case = ListCollisUseCase(InMemoryColliRepository())
+
+        with pytest.raises(ValidationException):
+            use_case.execute(cursor="pas-un-curseur")
+
+
+class TestGetUserCollisUseCase:
+    """Tests pour GetUserCollisUseCase."""
+
+    def test_more_than_one_page_of_collis(self):
+        """Doit retrouver les COLLIs de l'utilisateur au-delà des 20 premiers."""
+        repo = InMemoryColliRepository()
+        create_uc = CreateColliUseCase(repo)
+        creator_id = uuid4()
+
+        for i in range(25):
+            create_uc.execute(CreateColliCommand(
+                name=f"Autre {i}", theme="Test", description=None, creator_id=uuid4()
+            ))
+        for i in range(3):
+            create_uc.execute(CreateColliCommand(
+                name=f"Mien {i}", theme="Test", description=None, creator_id=creator_id
+            ))
+
+        result = GetUserCollisUseCase(repo).execute(creator_id, ColliRoleFilter.CREATOR, page=1, per_page=2)
+
+        assert result['total'] == 3
+        assert len(result['items']) == 2
+
+    def test_member_filter_excludes_created(self):
+        """Le filtre MEMBER ne doit retourner que les adhésions hors création."""
+        repo = InMemoryColliRepository()
+        create_uc = CreateColliUseCase(repo)
+        approve_uc = ApproveColliUseCase(repo, ColliTestEventPublisher())
+        user_id = uuid4()
+
+        create_uc.execute(CreateColliCommand(
+            name="Mien", theme="Test", description=None, creator_id=user_id
+        ))
+        other = create_uc.execute(CreateColliCommand(
+            name="Autre", theme="Test", description=None, creator_id=uuid4()
+        ))
+        approve_uc.execute(ApproveColliCommand(colli_id=to_uuid(other.id), approver_id=uuid4()))
+        JoinColliUseCase(repo, InMemoryMembershipRepository(repo)).execute(to_uuid(other.id), user_id)
+
+        use_case = GetUserCollisUseCase(repo)
+        members = use_case.execute(user_id, ColliRoleFilter.MEMBER)
+        everything = use_case.execute(user_id, ColliRoleFilter.ALL)
+
+        assert [c['id'] for c in members['items']] == [other.id]
+        assert everything['total'] == 2
+
 
 class TestDeleteColliUseCase:
     """Tests pour DeleteColliUseCase."""
@@ -222,7 +321,7 @@ class TestJoinColliUseCase:
         """Un utilisateur peut rejoindre un COLLI actif."""
         repo = InMemoryColliRepository()
         colli, _ = self._create_active_colli(repo)
-        join_uc = JoinColliUseCase(repo)
+        join_uc = JoinColliUseCase(repo, InMemoryMembershipRepository(repo))
         
         result = join_uc.execute(to_uuid(colli.id), uuid4())
         
@@ -232,7 +331,7 @@ class TestJoinColliUseCase:
         """Ne peut pas rejoindre un COLLI inactif."""
         repo = InMemoryColliRepository()
         create_uc = CreateColliUseCase(repo)
-        join_uc = JoinColliUseCase(repo)
+        join_uc = JoinColliUseCase(repo, InMemoryMembershipRepository(repo))
         
         colli = create_uc.execute(CreateColliCommand(
             name="Test", theme="Test", description=None, creator_id=uuid4()
@@ -250,9 +349,9 @@ class TestLeaveColliUseCase:
         repo = InMemoryColliRepository()
         create_uc = CreateColliUseCase(repo)
         approve_uc = ApproveColliUseCase(repo, ColliTestEventPublisher())
-        join_uc = JoinColliUseCase(repo)
-        accept_uc = AcceptMemberUseCase(repo)
-        leave_uc = LeaveColliUseCase(repo)
+        join_uc = JoinColliUseCase(repo, InMemoryMembershipRepository(repo))
+        accept_uc = AcceptMemberUseCase(repo, InMemoryMembershipRepository(repo))
+        leave_uc = LeaveColliUseCase(repo, InMemoryMembershipRepository(repo))
 
         creator_id = uuid4()
         member_id = uuid4()
@@ -274,7 +373,7 @@ class TestLeaveColliUseCase:
         repo = InMemoryColliRepository()
         create_uc = CreateColliUseCase(repo)
         approve_uc = ApproveColliUseCase(repo, ColliTestEventPublisher())
-        leave_uc = LeaveColliUseCase(repo)
+        leave_uc = LeaveColliUseCase(repo, InMemoryMembershipRepository(repo))
         
         creator_id = uuid4()
         colli = create_uc.execute(CreateColliCommand(
@@ -288,6 +387,63 @@ class TestLeaveColliUseCase:
             leave_uc.execute(colli_uuid, creator_id)
 
 
+class TestMembershipConflictRetry:
+    """Tests pour le rejeu des actions d'adhésion sur conflit."""
+
+    def _pending_request(self, repo):
+        colli = CreateColliUseCase(repo).execute(CreateColliCommand(
+            name="Test", theme="Test", description=None, creator_id=uuid4()
+        ))
+        colli_uuid = to_uuid(colli.id)
+        ApproveColliUseCase(repo, ColliTestEventPublisher()).execute(
+            ApproveColliCommand(colli_id=colli_uuid, approver_id=uuid4())
+        )
+        member_id = uuid4()
+        JoinColliUseCase(repo, InMemoryMembershipRepository(repo)).execute(colli_uuid, member_id)
+        return colli_uuid, to_uuid(colli.creator_id), member_id
+
+    def test_accept_retries_after_conflict(self):
+        """Un conflit isolé est rejoué, sans erreur pour l'appelant."""
+        repo = InMemoryColliRepository()
+        colli_uuid, creator_id, member_id = self._pending_request(repo)
+        memberships = ConflictingMembershipRepository(repo, conflicts=1)
+
+        result = AcceptMemberUseCase(repo, memberships).execute(colli_uuid, member_id, creator_id)
+
+        assert memberships.saves == 2
+        assert result.member_count == 2
+
+    def test_accept_gives_up_after_max_attempts(self):
+        """Au-delà de MAX_ATTEMPTS, le conflit remonte (409)."""
+        repo = InMemoryColliRepository()
+        colli_uuid, creator_id, member_id = self._pending_request(repo)
+        memberships = ConflictingMembershipRepository(repo, conflicts=MAX_ATTEMPTS)
+
+        with pytest.raises(ConflictException):
+            AcceptMemberUseCase(repo, memberships).execute(colli_uuid, member_id, creator_id)
+
+        assert memberships.saves == MAX_ATTEMPTS
+
+    def test_concurrent_join_replays_as_pending_request(self):
+        """Une double demande concurrente devient « demande déjà en attente »."""
+        repo = InMemoryColliRepository()
+        colli_uuid, _, member_id = self._pending_request(repo)
+        memberships = InMemoryMembershipRepository(repo)
+        join_uc = JoinColliUseCase(repo, memberships)
+        find = memberships.find
+        calls = []
+
+        def find_missing_first(colli_id, user_id):
+            # La première lecture précède l'insertion concurrente
+            calls.append(user_id)
+            return None if len(calls) == 1 else find(colli_id, user_id)
+
+        memberships.find = find_missing_first
+
+        with pytest.raises(ValidationException, match="en attente"):
+            join_uc.execute(colli_uuid, member_id)
+
+
 class TestListMembersUseCase:
     """Tests pour ListMembersUseCase."""
     
@@ -296,9 +452,9 @@ class TestListMembersUseCase:
         repo = InMemoryColliRepository()
         create_uc = CreateColliUseCase(repo)
         approve_uc = ApproveColliUseCase(repo, ColliTestEventPublisher())
-        join_uc = JoinColliUseCase(repo)
-        accept_uc = AcceptMemberUseCase(repo)
-        list_uc = ListMembersUseCase(repo)
+        join_uc = JoinColliUseCase(repo, InMemoryMembershipRepository(repo))
+        accept_uc = AcceptMemberUseCase(repo, InMemoryMembershipRepository(repo))
+        list_uc = ListMembersUseCase(repo, InMemoryUserRepository())
 
         creator_id = uuid4()
         colli = create_uc.execute(CreateColliCommand(
@@ -317,3 +473,25 @@ class TestListMembersUseCase:
 
         assert result['total'] == 3  # creator + 2 members
 
+    def test_list_members_with_user_details(self):
+        """Doit enrichir les membres avec les données utilisateur."""
+        repo = InMemoryColliRepository()
+        user_repo = InMemoryUserRepository()
+        creator = user_repo.save(User.create(
+            email="prof@example.com", password="Password123!", first_name="Marie", last_name="Curie"
+        ))
+        colli = CreateColliUseCase(repo).execute(CreateColliCommand(
+            name="Test", theme="Test", description=None, creator_id=creator.id
+        ))
+        ApproveColliUseCase(repo, ColliTestEventPublisher()).execute(
+            ApproveColliCommand(colli_id=to_uuid(colli.id), approver_id=uuid4())
+        )
+
+        result = ListMembersUseCase(repo, user_repo).execute(to_uuid(colli.id), creator.id)
+
+        assert result['members'][0]['user'] == {
+            'id': str(creator.id),
+            'first_name': "Marie",
+            'last_name': "Curie",
+            'email': "prof@example.com",
+        }
@@ -6,6 +6,7 @@ from uuid import uuid4, UUID
 
 from src.application.use_cases.comment.create_comment import CreateCommentUseCase
 from src.application.use_cases.comment.get_comments import GetCommentsForLetterUseCase
+from src.application.use_cases.comment.get_comment_thread import GetCommentThreadUseCase
 from src.application.use_cases.comment.delete_comment import DeleteCommentUseCase
 from src.application.dtos.comment_dto import CreateCommentCommand
 from src.application.dtos.letter_dto import CreateTextLetterCommand
@@ -17,6 +18,7 @@ from src.application.exceptions import NotFoundException, ForbiddenException
 from src.infrastructure.persistence.in_memory.letter_repository import InMemoryLetterRepository
 from src.infrastructure.persistence.in_memory.comment_repository import InMemoryCommentRepository
 from src.infrastructure.persistence.in_memory.colli_repository import InMemoryColliRepository
+from src.infrastructure.persistence.in_memory.membership_repository import InMemoryMembershipRepository
 
 
 class MockEventPublisher:
@@ -45,8 +47,8 @@ class CommentTestBase:
 
         create_colli = CreateColliUseCase(colli_repo)
         approve_colli = ApproveColliUseCase(colli_repo, MockEventPublisher())
-        join_colli = JoinColliUseCase(colli_repo)
-        accept_colli = AcceptMemberUseCase(colli_repo)
+        join_colli = JoinColliUseCase(colli_repo, InMemoryMembershipRepository(colli_repo))
+        accept_colli = AcceptMemberUseCase(colli_repo, InMemoryMembershipRepository(colli_repo))
 
         colli = create_colli.execute(CreateColliCommand(
             name="Test COLLI", theme="Test", description=None, creator_id=creator_id
@@ -190,6 +192,98 @@ class TestGetCommentsForLetterUseCase(CommentTestBase):
             use_case.execute(to_uuid(ctx['letter'].id), uuid4(), page=1, per_page=50)
 
 
+class TestGetCommentThreadUseCase(CommentTestBase):
+    """Tests pour GetCommentThreadUseCase."""
+    
+    def _comment(self, ctx, parent=None):
+        create_uc = CreateCommentUseCase(ctx['comment_repo'], ctx['letter_repo'], ctx['colli_repo'])
+        return create_uc.execute(CreateCommentCommand(
+            letter_id=to_uuid(ctx['letter'].id),
+            sender_id=ctx['member_id'],
+            content="Commentaire du fil",
+            parent_comment_id=to_uuid(parent.id) if parent else None
+        ))
+    
+    def _use_case(self, ctx):
+        return GetCommentThreadUseCase(ctx['comment_repo'], ctx['letter_repo'], ctx['colli_repo'])
+    
+    def test_get_thread_nests_replies(self):
+        """Doit imbriquer les réponses sous leur parent."""
+        ctx = self._setup()
+        root = self._comment(ctx)
+        reply = self._comment(ctx, root)
+        nested = self._comment(ctx, reply)
+        other = self._comment(ctx)
+        
+        result = self._use_case(ctx).execute(to_uuid(ctx['letter'].id), ctx['member_id'])
+        
+        assert [item.id for item in result.items] == [root.id, other.id]
+        assert result.items[0].replies[0].id == reply.id
+        assert result.items[0].replies[0].replies[0].id == nested.id
+        assert result.items[0].replies[0].replies[0].depth == 2
+        assert result.has_more is False
+    
+    def test_get_thread_depth_limit(self):
+        """Doit couper les réponses au-delà de max_depth et le signaler."""
+        ctx = self._setup()
+        root = self._comment(ctx)
+        reply = self._comment(ctx, root)
+        self._comment(ctx, reply)
+        
+        result = self._use_case(ctx).execute(to_uuid(ctx['letter'].id), ctx['member_id'], max_depth=1)
+        
+        child = result.items[0].replies[0]
+        assert child.replies == []
+        assert child.has_more_replies is True
+        assert result.items[0].has_more_replies is False
+    
+    def test_get_thread_subtree(self):
+        """Doit charger le sous-arbre d'un commentaire."""
+        ctx = self._setup()
+        root = self._comment(ctx)
+        reply = self._comment(ctx, root)
+        self._comment(ctx)
+        
+        result = self._use_case(ctx).execute(
+            to_uuid(ctx['letter'].id), ctx['member_id'], parent_comment_id=to_uuid(root.id)
+        )
+        
+        assert [item.id for item in result.items] == [reply.id]
+    
+    def test_get_thread_pages_top_level_threads(self):
+        """Doit paginer les fils de tête avec leurs réponses."""
+        ctx = self._setup()
+        roots = [self._comment(ctx) for _ in range(3)]
+        self._comment(ctx, roots[0])
+        letter_uuid = to_uuid(ctx['letter'].id)
+        use_case = self._use_case(ctx)
+        
+        first = use_case.execute(letter_uuid, ctx['member_id'], per_page=2)
+        second = use_case.execute(letter_uuid, ctx['member_id'], per_page=2, cursor=first.next_cursor)
+        
+        assert [item.id for item in first.items] == [roots[0].id, roots[1].id]
+        assert len(first.items[0].replies) == 1
+        assert first.has_more is True
+        assert [item.id for item in second.items] == [roots[2].id]
+        assert second.has_more is False
+    
+    def test_get_thread_unknown_parent(self):
+        """Doit lever NotFoundException si le parent n'est pas dans la lettre."""
+        ctx = self._setup()
+        
+        with pytest.raises(NotFoundException):
+            self._use_case(ctx).execute(
+                to_uuid(ctx['letter'].id), ctx['member_id'], parent_comment_id=uuid4()
+            )
+    
+    def test_get_thread_not_member(self):
+        """Doit lever ForbiddenException si non-membre."""
+        ctx = self._setup()
+        
+        with pytest.raises(ForbiddenException):
+            self._use_case(ctx).execute(to_uuid(ctx['letter'].id), uuid4())
+
+
 class TestDeleteCommentUseCase(CommentTestBase):
     """Tests pour DeleteCommentUseCase."""
     
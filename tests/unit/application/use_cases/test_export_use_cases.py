@@ -0,0 +1,253 @@
+# tests/unit/application/use_cases/test_export_use_cases.py
+"""Tests unitaires pour les Use Cases d'export RGPD."""
+
+import json
+import pytest
+from datetime import datetime, timedelta
+from uuid import UUID, uuid4
+
+from src.application.dtos.export_dto import ExportArchive
+from src.application.interfaces.export_archive_builder import IExportArchiveBuilder
+from src.application.interfaces.export_job_queue import IExportJobQueue
+from src.application.use_cases.export.get_export_job import GetExportArchiveUseCase, GetExportJobUseCase
+from src.application.use_cases.export.purge_export_jobs import PurgeExportJobsUseCase
+from src.application.use_cases.export.request_export_job import RequestExportJobUseCase
+from src.application.use_cases.export.run_export_job import RunExportJobUseCase
+from src.application.use_cases.user.export_user_data import ExportUserDataUseCase
+from src.application.exceptions import ConflictException, NotFoundException
+from src.domain.collaboration.entities.colli import Colli
+from src.domain.collaboration.entities.comment import Comment
+from src.domain.collaboration.entities.letter import Letter
+from src.domain.identity.entities.user import User
+from src.domain.identity.value_objects.user_role import UserRole
+from src.infrastructure.persistence.in_memory.colli_repository import InMemoryColliRepository
+from src.infrastructure.persistence.in_memory.comment_repository import InMemoryCommentRepository
+from src.infrastructure.persistence.in_memory.export_job_repository import InMemoryExportJobRepository
+from src.infrastructure.persistence.in_memory.letter_repository import InMemoryLetterRepository
+from src.infrastructure.persistence.in_memory.notification_repository import InMemoryNotificationRepository
+from src.infrastructure.persistence.in_memory.user_repository import InMemoryUserRepository
+
+
+class TestExportUserDataUseCase:
+    """Tests pour ExportUserDataUseCase."""
+
+    @pytest.fixture
+    def setup(self):
+        user_repo = InMemoryUserRepository()
+        colli_repo = InMemoryColliRepository()
+        letter_repo = InMemoryLetterRepository()
+        comment_repo = InMemoryCommentRepository()
+        use_case = ExportUserDataUseCase(
+            user_repo, colli_repo, letter_repo, comment_repo, InMemoryNotificationRepository()
+        )
+
+        user = User.create("alice@example.com", "Password123!", "Alice", "Martin", UserRole.TEACHER)
+        user_repo.save(user)
+
+        own = Colli.create(name="Mon COLLI", theme="Poesie", creator_id=user.id)
+        own.approve()
+        colli_repo.save(own)
+        other = Colli.create(name="Autre COLLI", theme="Prose", creator_id=uuid4())
+        other.approve()
+        other.add_member(user.id)
+        colli_repo.save(other)
+
+        for i in range(7):
+            letter = Letter.create_text_letter(own.id, user.id, f"Lettre numero {i} d'Alice")
+            letter_repo.save(letter)
+            comment_repo.save(Comment.create(letter.id, user.id, f"Commentaire {i}"))
+        letter_repo.save(Letter.create_text_letter(own.id, uuid4(), "Lettre d'un autre membre"))
+
+        return {'use_case': use_case, 'user': user, 'own': own, 'other': other}
+
+    def test_export_only_user_rows_in_chunks(self, setup, monkeypatch):
+        """Le flux parcourt les lots et ne contient que les données de l'utilisateur."""
+        monkeypatch.setattr(ExportUserDataUseCase, 'CHUNK_SIZE', 3)
+        monkeypatch.setattr(ExportUserDataUseCase, 'FLUSH_ITEMS', 2)
+
+        chunks = list(setup['use_case'].execute(setup['user'].id))
+        data = json.loads(''.join(chunks))
+
+        assert len(chunks) > 10
+        assert data['user']['email'] == "alice@example.com"
+        assert [c['id'] for c in data['collis']['created']] == [str(setup['own'].id)]
+        assert [c['id'] for c in data['collis']['member_of']] == [str(setup['other'].id)]
+        assert len(data['letters']) == 7
+        assert len({l['id'] for l in data['letters']}) == 7
+        assert all(l['sender_id'] == str(setup['user'].id) for l in data['letters'])
+        assert len(data['comments']) == 7
+        assert data['notifications'] == []
+        assert data['statistics'] == {
+            'total_collis': 2, 'total_letters': 7,
+            'total_comments': 7, 'total_notifications': 0
+        }
+
+    def test_export_unknown_user(self, setup):
+        """Un utilisateur inexistant lève NotFoundException immédiatement."""
+        with pytest.raises(NotFoundException):
+            setup['use_case'].execute(uuid4())
+
+
+class _RecordingQueue(IExportJobQueue):
+    """File qui mémorise les jobs mis en file sans les exécuter."""
+
+    def __init__(self):
+        self.enqueued = []
+
+    def enqueue(self, job_id):
+        self.enqueued.append(job_id)
+
+
+class _FakeArchiveBuilder(IExportArchiveBuilder):
+    """Builder qui retourne une archive factice, ou échoue."""
+
+    def __init__(self, error=None):
+        self._error = error
+
+        self.deleted = []
+
+    def build(self, job):
+        if self._error:
+            raise self._error
+        return ExportArchive(path=f"/tmp/{job.id}.zip", size=42)
+
+    def delete(self, archive_path):
+        self.deleted.append(archive_path)
+
+
+class TestExportJobUseCases:
+    """Tests pour les jobs d'export en arrière-plan."""
+
+    @pytest.fixture
+    def setup(self):
+        user_repo = InMemoryUserRepository()
+        job_repo = InMemoryExportJobRepository()
+        user = User.create("bob@example.com", "Password123!", "Bob", "Durand", UserRole.MEMBER)
+        user_repo.save(user)
+        queue = _RecordingQueue()
+        return {
+            'user': user,
+            'job_repo': job_repo,
+            'queue': queue,
+            'request': RequestExportJobUseCase(job_repo, user_repo, queue),
+        }
+
+    def test_request_enqueues_pending_job(self, setup):
+        """Une demande crée un job en attente et le met en file."""
+        job = setup['request'].execute(setup['user'].id)
+
+        assert job.status == 'pending'
+        assert job.download_url is None
+        assert setup['queue'].enqueued == [UUID(job.id)]
+
+    def test_request_returns_active_job(self, setup):
+        """Une seconde demande pendant un export actif ne crée pas de job."""
+        first = setup['request'].execute(setup['user'].id)
+        second = setup['request'].execute(setup['user'].id)
+
+        assert second.id == first.id
+        assert len(setup['queue'].enqueued) == 1
+
+    def test_request_unknown_user(self, setup):
+        """Un utilisateur inexistant lève NotFoundException."""
+        with pytest.raises(NotFoundException):
+            setup['request'].execute(uuid4())
+
+    def test_run_completes_job(self, setup):
+        """L'exécution produit l'archive et rend le job téléchargeable."""
+        job = setup['request'].execute(setup['user'].id)
+        runner = RunExportJobUseCase(setup['job_repo'], _FakeArchiveBuilder())
+
+        assert runner.execute(UUID(job.id)) is True
+        assert runner.execute(UUID(job.id)) is False
+
+        status = GetExportJobUseCase(setup['job_repo']).execute(UUID(job.id), setup['user'].id)
+        assert status.status == 'completed'
+        assert status.archive_size == 42
+        assert status.download_url.endswith(f"/jobs/{job.id}/download")
+
+        archive = GetExportArchiveUseCase(setup['job_repo']).execute(UUID(job.id), setup['user'].id)
+        assert archive.path == f"/tmp/{job.id}.zip"
+
+    def test_run_commits_claim_before_build(self, setup):
+        """Le passage à RUNNING est validé avant la construction ; une seconde livraison n'exporte rien."""
+        job = setup['request'].execute(setup['user'].id)
+        commits = []
+        builder = _FakeArchiveBuilder()
+        original_build = builder.build
+
+        def build(running_job):
+            assert commits == ['claim']
+            assert running_job.status.value == 'running'
+            duplicate = RunExportJobUseCase(setup['job_repo'], _FakeArchiveBuilder(AssertionError("double export")))
+            assert duplicate.execute(running_job.id) is False
+            return original_build(running_job)
+        builder.build = build
+
+        runner = RunExportJobUseCase(setup['job_repo'], builder)
+        assert runner.execute(UUID(job.id), commit=lambda: commits.append('claim')) is True
+        assert setup['job_repo'].find_by_id(UUID(job.id)).status.value == 'completed'
+
+    def test_run_records_failure(self, setup):
+        """Un échec de production est enregistré sur le job, sans être propagé."""
+        job = setup['request'].execute(setup['user'].id)
+        runner = RunExportJobUseCase(setup['job_repo'], _FakeArchiveBuilder(OSError("disque plein")))
+
+        assert runner.execute(UUID(job.id)) is True
+
+        status = GetExportJobUseCase(setup['job_repo']).execute(UUID(job.id), setup['user'].id)
+        assert status.status == 'failed'
+        assert status.error == "disque plein"
+        with pytest.raises(ConflictException):
+            GetExportArchiveUseCase(setup['job_repo']).execute(UUID(job.id), setup['user'].id)
+
+    def test_job_hidden_from_other_users(self, setup):
+        """Le job d'un autre utilisateur est introuvable."""
+        job = setup['request'].execute(setup['user'].id)
+
+        with pytest.raises(NotFoundException):
+            GetExportJobUseCase(setup['job_repo']).execute(UUID(job.id), uuid4())
+
+    def test_archive_unavailable_while_pending(self, setup):
+        """L'archive d'un job non terminé n'est pas disponible."""
+        job = setup['request'].execute(setup['user'].id)
+
+        with pytest.raises(ConflictException):
+            GetExportArchiveUseCase(setup['job_repo']).execute(UUID(job.id), setup['user'].id)
+
+    def test_request_replaces_stale_job(self, setup):
+        """Un job resté actif au-delà du délai (worker arrêté) ne bloque plus l'export."""
+        first = setup['request'].execute(setup['user'].id)
+        stuck = setup['job_repo'].find_by_id(UUID(first.id))
+        stuck.start()
+        stuck.started_at = datetime.utcnow() - timedelta(hours=2)
+
+        second = setup['request'].execute(setup['user'].id)
+
+        assert second.id != first.id
+        assert setup['job_repo'].find_by_id(UUID(first.id)).status.value == 'failed'
+        assert len(setup['queue'].enqueued) == 2
+
+    def test_archive_expires_after_ttl(self, setup):
+        """Passé sa durée de conservation, l'archive n'est plus servie."""
+        job = setup['request'].execute(setup['user'].id)
+        RunExportJobUseCase(setup['job_repo'], _FakeArchiveBuilder()).execute(UUID(job.id))
+        setup['job_repo'].find_by_id(UUID(job.id)).completed_at = datetime.utcnow() - timedelta(days=8)
+
+        with pytest.raises(ConflictException):
+            GetExportArchiveUseCase(setup['job_repo']).execute(UUID(job.id), setup['user'].id)
+
+    def test_purge_fails_stale_jobs_and_deletes_expired_archives(self, setup):
+        """La maintenance solde les jobs perdus et supprime les archives expirées."""
+        builder = _FakeArchiveBuilder()
+        done = setup['request'].execute(setup['user'].id)
+        RunExportJobUseCase(setup['job_repo'], builder).execute(UUID(done.id))
+        pending = setup['request'].execute(setup['user'].id)
+        now = datetime.utcnow() + timedelta(days=8)
+
+        result = PurgeExportJobsUseCase(setup['job_repo'], builder).execute(now=now)
+
+        assert result == {"failed": 1, "expired": 1}
+        assert builder.deleted == [f"/tmp/{done.id}.zip"]
+        assert setup['job_repo'].find_by_id(UUID(done.id)).status.value == 'expired'
+        assert setup['job_repo'].find_by_id(UUID(pending.id)).status.value == 'failed'
@@ -15,7 +15,11 @@ from src.application.exceptions import NotFoundException, ForbiddenException
 from src.infrastructure.persistence.in_memory.letter_repository import InMemoryLetterRepository
 from src.infrastructure.persistence.in_memory.comment_repository import InMemoryCommentRepository
 from src.infrastructure.persistence.in_memory.colli_repository import InMemoryColliRepository
+from src.infrastructure.persistence.in_memory.membership_repository import InMemoryMembershipRepository
 from src.infrastructure.persistence.in_memory.user_repository import InMemoryUserRepository
+from src.application.use_cases.comment.create_comment import CreateCommentUseCase
+from src.application.use_cases.comment.delete_comment import DeleteCommentUseCase
+from src.application.dtos.comment_dto import CreateCommentCommand
 
 
 class MockEventPublisher:
@@ -40,8 +44,8 @@ class TestCreateTextLetterUseCase:
 
         create_uc = CreateColliUseCase(colli_repo)
         approve_uc = ApproveColliUseCase(colli_repo, MockEventPublisher())
-        join_uc = JoinColliUseCase(colli_repo)
-        accept_uc = AcceptMemberUseCase(colli_repo)
+        join_uc = JoinColliUseCase(colli_repo, InMemoryMembershipRepository(colli_repo))
+        accept_uc = AcceptMemberUseCase(colli_repo, InMemoryMembershipRepository(colli_repo))
 
         colli = create_uc.execute(CreateColliCommand(
             name="Test COLLI", theme="Test", description=None, creator_id=creator_id
@@ -126,8 +130,8 @@ class TestCreateFileLetterUseCase:
 
         create_uc = CreateColliUseCase(colli_repo)
         approve_uc = ApproveColliUseCase(colli_repo, MockEventPublisher())
-        join_uc = JoinColliUseCase(colli_repo)
-        accept_uc = AcceptMemberUseCase(colli_repo)
+        join_uc = JoinColliUseCase(colli_repo, InMemoryMembershipRepository(colli_repo))
+        accept_uc = AcceptMemberUseCase(colli_repo, InMemoryMembershipRepository(colli_repo))
 
         colli = create_uc.execute(CreateColliCommand(
             name="Test COLLI", theme="Test", description=None, creator_id=creator_id
@@ -169,8 +173,8 @@ class TestGetLettersForColliUseCase:
 
         create_uc = CreateColliUseCase(colli_repo)
         approve_uc = ApproveColliUseCase(colli_repo, MockEventPublisher())
-        join_uc = JoinColliUseCase(colli_repo)
-        accept_uc = AcceptMemberUseCase(colli_repo)
+        join_uc = JoinColliUseCase(colli_repo, InMemoryMembershipRepository(colli_repo))
+        accept_uc = AcceptMemberUseCase(colli_repo, InMemoryMembershipRepository(colli_repo))
 
         colli = create_uc.execute(CreateColliCommand(
             name="Test COLLI", theme="Test", description=None, creator_id=creator_id
@@ -186,10 +190,9 @@ class TestGetLettersForColliUseCase:
         """Doit retourner une liste vide."""
         colli_repo = InMemoryColliRepository()
         letter_repo = InMemoryLetterRepository()
-        comment_repo = InMemoryCommentRepository()
         colli, creator_id, member_id = self._setup_colli(colli_repo)
         
-        use_case = GetLettersForColliUseCase(letter_repo, comment_repo, colli_repo, InMemoryUserRepository())
+        use_case = GetLettersForColliUseCase(letter_repo, colli_repo, InMemoryUserRepository())
         result = use_case.execute(to_uuid(colli.id), member_id, page=1, per_page=20)
         
         assert result.total == 0
@@ -199,7 +202,6 @@ class TestGetLettersForColliUseCase:
         """Doit lister les lettres."""
         colli_repo = InMemoryColliRepository()
         letter_repo = InMemoryLetterRepository()
-        comment_repo = InMemoryCommentRepository()
         colli, creator_id, member_id = self._setup_colli(colli_repo)
         colli_uuid = to_uuid(colli.id)
         
@@ -211,24 +213,65 @@ class TestGetLettersForColliUseCase:
                 content=f"Lettre de test numéro {i} suffisamment longue"
             ))
         
-        get_uc = GetLettersForColliUseCase(letter_repo, comment_repo, colli_repo, InMemoryUserRepository())
+        get_uc = GetLettersForColliUseCase(letter_repo, colli_repo, InMemoryUserRepository())
         result = get_uc.execute(colli_uuid, member_id, page=1, per_page=20)
         
         assert result.total == 3
         assert len(result.items) == 3
     
+    def test_get_letters_comment_counts(self):
+        """Doit renseigner comment_count depuis le compteur tenu par les use cases."""
+        colli_repo = InMemoryColliRepository()
+        letter_repo = InMemoryLetterRepository()
+        comment_repo = InMemoryCommentRepository()
+        colli, creator_id, member_id = self._setup_colli(colli_repo)
+        colli_uuid = to_uuid(colli.id)
+
+        create_uc = CreateTextLetterUseCase(letter_repo, colli_repo)
+        commented = create_uc.execute(CreateTextLetterCommand(
+            colli_id=colli_uuid, sender_id=member_id, content="Lettre avec commentaires"
+        ))
+        create_uc.execute(CreateTextLetterCommand(
+            colli_id=colli_uuid, sender_id=member_id, content="Lettre sans commentaire"
+        ))
+        comment_uc = CreateCommentUseCase(comment_repo, letter_repo, colli_repo)
+        comments = [
+            comment_uc.execute(CreateCommentCommand(
+                letter_id=to_uuid(commented.id), sender_id=creator_id, content=f"Commentaire {i}"
+            ))
+            for i in range(3)
+        ]
+        DeleteCommentUseCase(comment_repo, letter_repo, colli_repo).execute(
+            to_uuid(comments[0].id), creator_id
+        )
+
+        get_uc = GetLettersForColliUseCase(letter_repo, colli_repo, InMemoryUserRepository())
+        result = get_uc.execute(colli_uuid, member_id, page=1, per_page=20)
+
+        counts = {item.id: item.comment_count for item in result.items}
+        assert counts[str(commented.id)] == 2
+        assert sorted(counts.values()) == [0, 2]
+
     def test_get_letters_not_member(self):
         """Doit lever ForbiddenException si non-membre."""
         colli_repo = InMemoryColliRepository()
         letter_repo = InMemoryLetterRepository()
-        comment_repo = InMemoryCommentRepository()
         colli, creator_id, member_id = self._setup_colli(colli_repo)
         
-        use_case = GetLettersForColliUseCase(letter_repo, comment_repo, colli_repo, InMemoryUserRepository())
+        use_case = GetLettersForColliUseCase(letter_repo, colli_repo, InMemoryUserRepository())
         
         with pytest.raises(ForbiddenException):
             use_case.execute(to_uuid(colli.id), uuid4(), page=1, per_page=20)
 
+    def test_get_letters_nonexistent_colli(self):
+        """Doit lever NotFoundException si le COLLI n'existe pas."""
+        use_case = GetLettersForColliUseCase(
+            InMemoryLetterRepository(), InMemoryColliRepository(), InMemoryUserRepository()
+        )
+
+        with pytest.raises(NotFoundException):
+            use_case.execute(uuid4(), uuid4(), page=1, per_page=20)
+
 
 class TestGetLetterByIdUseCase:
     """Tests pour GetLetterByIdUseCase."""
@@ -239,8 +282,8 @@ class TestGetLetterByIdUseCase:
 
         create_uc = CreateColliUseCase(colli_repo)
         approve_uc = ApproveColliUseCase(colli_repo, MockEventPublisher())
-        join_uc = JoinColliUseCase(colli_repo)
-        accept_uc = AcceptMemberUseCase(colli_repo)
+        join_uc = JoinColliUseCase(colli_repo, InMemoryMembershipRepository(colli_repo))
+        accept_uc = AcceptMemberUseCase(colli_repo, InMemoryMembershipRepository(colli_repo))
 
         colli = create_uc.execute(CreateColliCommand(
             name="Test COLLI", theme="Test", description=None, creator_id=creator_id
@@ -256,7 +299,6 @@ class TestGetLetterByIdUseCase:
         """Doit récupérer une lettre."""
         colli_repo = InMemoryColliRepository()
         letter_repo = InMemoryLetterRepository()
-        comment_repo = InMemoryCommentRepository()
         colli, creator_id, member_id = self._setup_colli(colli_repo)
         
         create_uc = CreateTextLetterUseCase(letter_repo, colli_repo)
@@ -266,7 +308,7 @@ class TestGetLetterByIdUseCase:
             content="Ceci est un contenu suffisamment long."
         ))
         
-        get_uc = GetLetterByIdUseCase(letter_repo, comment_repo, colli_repo, InMemoryUserRepository())
+        get_uc = GetLetterByIdUseCase(letter_repo, colli_repo, InMemoryUserRepository())
         result = get_uc.execute(to_uuid(letter.id), member_id)
         
         assert result.id == letter.id
@@ -275,9 +317,8 @@ class TestGetLetterByIdUseCase:
         """Doit lever NotFoundException."""
         colli_repo = InMemoryColliRepository()
         letter_repo = InMemoryLetterRepository()
-        comment_repo = InMemoryCommentRepository()
         
-        use_case = GetLetterByIdUseCase(letter_repo, comment_repo, colli_repo, InMemoryUserRepository())
+        use_case = GetLetterByIdUseCase(letter_repo, colli_repo, InMemoryUserRepository())
         
         with pytest.raises(NotFoundException):
             use_case.execute(uuid4(), uuid4())
@@ -292,8 +333,8 @@ class TestDeleteLetterUseCase:
 
         create_uc = CreateColliUseCase(colli_repo)
         approve_uc = ApproveColliUseCase(colli_repo, MockEventPublisher())
-        join_uc = JoinColliUseCase(colli_repo)
-        accept_uc = AcceptMemberUseCase(colli_repo)
+        join_uc = JoinColliUseCase(colli_repo, InMemoryMembershipRepository(colli_repo))
+        accept_uc = AcceptMemberUseCase(colli_repo, InMemoryMembershipRepository(colli_repo))
 
         colli = create_uc.execute(CreateColliCommand(
             name="Test COLLI", theme="Test", description=None, creator_id=creator_id
@@ -0,0 +1,133 @@
+# tests/unit/application/use_cases/test_search_use_cases.py
+"""Tests unitaires pour le Use Case de recherche globale."""
+
+import pytest
+from uuid import uuid4
+
+from src.application.use_cases.search.global_search import GlobalSearchUseCase
+from src.application.dtos.search_dto import SearchDocument
+from src.application.exceptions import ValidationException
+from src.domain.collaboration.entities.colli import Colli
+from src.domain.collaboration.entities.letter import Letter
+from src.domain.identity.entities.user import User
+from src.infrastructure.persistence.in_memory.colli_repository import InMemoryColliRepository
+from src.infrastructure.persistence.in_memory.letter_repository import InMemoryLetterRepository
+from src.infrastructure.persistence.in_memory.user_repository import InMemoryUserRepository
+from src.infrastructure.search.in_memory_search_index import InMemorySearchIndex
+
+
+class TestGlobalSearchUseCase:
+    """Tests pour GlobalSearchUseCase."""
+
+    @pytest.fixture
+    def setup(self):
+        colli_repo = InMemoryColliRepository()
+        letter_repo = InMemoryLetterRepository()
+        user_repo = InMemoryUserRepository()
+        index = InMemorySearchIndex(colli_repo)
+        use_case = GlobalSearchUseCase(index, colli_repo, letter_repo, user_repo)
+
+        creator_id = uuid4()
+        colli = Colli.create(name="Correspondance Lyon", theme="Voyage", creator_id=creator_id)
+        colli.approve()
+        colli_repo.save(colli)
+
+        letters = [
+            Letter.create_text_letter(colli.id, creator_id, "Un voyage en montagne cet hiver", title="Montagne"),
+            Letter.create_text_letter(colli.id, creator_id, "Nous parlons de la montagne", title="Souvenirs"),
+            Letter.create_text_letter(colli.id, creator_id, "Rien a voir avec le sujet"),
+        ]
+        for letter in letters:
+            letter_repo.save(letter)
+        index.upsert_many([SearchDocument.from_colli(colli)])
+        index.upsert_many(SearchDocument.from_letter(letter) for letter in letters)
+
+        return {
+            'use_case': use_case,
+            'creator_id': creator_id,
+            'colli': colli,
+            'letters': letters,
+            'index': index,
+            'letter_repo': letter_repo,
+            'user_repo': user_repo,
+        }
+
+    def test_search_ranks_title_matches_first(self, setup):
+        """Une correspondance dans le titre passe devant le contenu."""
+        result = setup['use_case'].execute("Montagne", setup['creator_id'], search_type='letters')
+
+        assert result['query'] == "montagne"
+        assert [l['id'] for l in result['letters']] == [
+            str(setup['letters'][0].id), str(setup['letters'][1].id)
+        ]
+        assert result['next_cursor'] is None
+
+    def test_search_letters_hidden_from_non_members(self, setup):
+        """Les lettres d'un COLLI ne sont visibles que de ses membres."""
+        result = setup['use_case'].execute("montagne", uuid4())
+
+        assert result['letters'] == []
+        assert result['collis'] == []
+        assert 'next_cursor' not in result
+
+    def test_search_active_collis_visible_to_all(self, setup):
+        """Un COLLI actif apparaît dans les résultats de tous."""
+        result = setup['use_case'].execute("lyon", uuid4(), search_type='collis')
+
+        assert [c['id'] for c in result['collis']] == [str(setup['colli'].id)]
+
+    def test_search_with_cursor(self, setup):
+        """Le curseur parcourt tous les résultats sans doublon."""
+        use_case = setup['use_case']
+        first = use_case.execute("montagne", setup['creator_id'], search_type='letters', limit=1)
+        assert len(first['letters']) == 1
+        assert first['next_cursor']
+
+        second = use_case.execute(
+            "montagne", setup['creator_id'], search_type='letters', limit=1,
+            cursor=first['next_cursor']
+        )
+        assert len(second['letters']) == 1
+        assert second['letters'][0]['id'] != first['letters'][0]['id']
+        assert second['next_cursor'] is None
+
+    def test_search_hydrates_page_in_bulk(self, setup, monkeypatch):
+        """Les lettres et utilisateurs de la page sont chargés en un seul appel, dans l'ordre du classement."""
+        users = [
+            User.create(email=f"{name.lower()}@example.com", password="Password123!",
+                        first_name=name, last_name="Montagne")
+            for name in ("Alice", "Bruno")
+        ]
+        for user in users:
+            setup['user_repo'].add(user)
+        setup['index'].upsert_many(SearchDocument.from_user(u) for u in users)
+
+        def unexpected(entity_id):
+            raise AssertionError("lookup par entité")
+        monkeypatch.setattr(setup['letter_repo'], 'find_by_id', unexpected)
+        monkeypatch.setattr(setup['user_repo'], 'find_by_id', unexpected)
+
+        result = setup['use_case'].execute("montagne", setup['creator_id'])
+
+        assert [l['id'] for l in result['letters']] == [
+            str(setup['letters'][0].id), str(setup['letters'][1].id)
+        ]
+        assert {u['id'] for u in result['users']} == {str(u.id) for u in users}
+        assert all(u['role'] for u in result['users'])
+
+    def test_search_query_too_short(self, setup):
+        """Un terme de moins de 2 caractères est refusé."""
+        with pytest.raises(ValidationException):
+            setup['use_case'].execute("a", setup['creator_id'])
+
+    def test_search_cursor_requires_type(self, setup):
+        """Le curseur n'est accepté qu'avec un type de recherche."""
+        with pytest.raises(ValidationException):
+            setup['use_case'].execute("montagne", setup['creator_id'], cursor="abc")
+
+    def test_search_invalid_cursor(self, setup):
+        """Un curseur malformé lève une erreur de validation."""
+        with pytest.raises(ValidationException):
+            setup['use_case'].execute(
+                "montagne", setup['creator_id'], search_type='letters', cursor="invalide"
+            )
@@ -2,10 +2,13 @@
 """Tests unitaires pour les Value Objects du domaine Collaboration."""
 
 import pytest
+from uuid import uuid4
 
 from src.domain.collaboration.value_objects.colli_status import ColliStatus
 from src.domain.collaboration.value_objects.member_role import MemberRole
 from src.domain.collaboration.value_objects.file_attachment import FileAttachment, FileType
+from src.domain.collaboration.value_objects.comment_thread import build_comment_threads
+from src.domain.collaboration.entities.comment import Comment
 
 
 class TestColliStatus:
@@ -104,3 +107,50 @@ class TestFileAttachment:
         )
         
         assert attachment.size_mb == 5.0
+
+
+class TestBuildCommentThreads:
+    """Tests pour build_comment_threads."""
+    
+    def _reply(self, letter_id, parent=None):
+        return Comment.create(
+            letter_id=letter_id, sender_id=uuid4(), content="Réponse",
+            parent_comment_id=parent.id if parent else None
+        )
+    
+    def test_nests_replies_and_keeps_order(self):
+        """Les réponses sont rattachées à leur parent, dans l'ordre reçu."""
+        letter_id = uuid4()
+        first = self._reply(letter_id)
+        second = self._reply(letter_id)
+        reply = self._reply(letter_id, first)
+        nested = self._reply(letter_id, reply)
+        
+        roots = build_comment_threads([first, second, reply, nested])
+        
+        assert [node.id for node in roots] == [first.id, second.id]
+        assert [node.id for node in roots[0].replies] == [reply.id]
+        assert roots[0].replies[0].replies[0].depth == 2
+        assert roots[1].replies == []
+    
+    def test_orphan_becomes_root(self):
+        """Un commentaire dont le parent est absent est une tête de fil."""
+        letter_id = uuid4()
+        parent = self._reply(letter_id)
+        reply = self._reply(letter_id, parent)
+        
+        roots = build_comment_threads([reply])
+        
+        assert [(node.id, node.depth) for node in roots] == [(reply.id, 0)]
+    
+    def test_max_depth_marks_truncated_nodes(self):
+        """Au-delà de max_depth, les réponses sont coupées et signalées."""
+        letter_id = uuid4()
+        root = self._reply(letter_id)
+        reply = self._reply(letter_id, root)
+        
+        roots = build_comment_threads([root, reply], max_depth=0)
+        
+        assert roots[0].replies == []
+        assert roots[0].has_more_replies is True
+
@@ -0,0 +1,91 @@
+# tests/unit/infrastructure/cache/test_ttl_cache.py
+"""Tests pour le cache TTL et le cache des statistiques admin."""
+
+from src.application.dtos.admin_stats_dto import AdminStatsDTO
+from src.application.interfaces.admin_stats_query import IAdminStatsQuery
+from src.infrastructure.cache.ttl_cache import TTLCache
+from src.infrastructure.cache.cached_admin_stats_query import CachedAdminStatsQuery
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class CountingStatsQuery(IAdminStatsQuery):
+    def __init__(self):
+        self.calls = 0
+
+    def get_stats(self) -> AdminStatsDTO:
+        self.calls += 1
+        return AdminStatsDTO(users_by_role={'admin': 1, 'member': self.calls})
+
+
+class TestTTLCache:
+    """Tests pour TTLCache."""
+
+    def test_value_expires_after_ttl(self):
+        clock = FakeClock()
+        cache = TTLCache(ttl=10, clock=clock)
+        cache.set('k', 'v')
+
+        clock.now = 9.9
+        assert cache.get('k') == 'v'
+        clock.now = 10
+        assert cache.get('k') is None
+
+    def test_zero_ttl_disables_cache(self):
+        cache = TTLCache(ttl=0)
+        cache.set('k', 'v')
+
+        assert cache.get('k') is None
+
+    def test_invalidate(self):
+        cache = TTLCache(ttl=10)
+        cache.set('a', 1)
+        cache.set('b', 2)
+
+        cache.invalidate('a')
+        assert cache.get('a') is None
+        assert cache.get('b') == 2
+
+        cache.invalidate()
+        assert cache.get('b') is None
+
+
+class TestCachedAdminStatsQuery:
+    """Tests pour CachedAdminStatsQuery."""
+
+    def test_stats_computed_once_per_ttl(self):
+        clock = FakeClock()
+        inner = CountingStatsQuery()
+        query = CachedAdminStatsQuery(inner, TTLCache(ttl=30, clock=clock))
+
+        first = query.get_stats()
+        second = query.get_stats()
+        clock.now = 31
+        third = query.get_stats()
+
+        assert first is second
+        assert inner.calls == 2
+        assert third.total_users == 3
+
+    def test_stats_dto_keeps_dashboard_keys(self):
+        stats = AdminStatsDTO(
+            users_by_role={'admin': 1, 'teacher': 2},
+            collis_by_status={'active': 3, 'pending': 1, 'rejected': 1},
+            total_letters=7,
+            total_comments=4,
+        )
+
+        data = stats.to_dict()
+
+        assert data['total_users'] == 3
+        assert data['total_collis'] == 5
+        assert data['active_collis'] == 3
+        assert data['pending_collis'] == 1
+        assert data['total_letters'] == 7
+        assert data['total_comments'] == 4
@@ -0,0 +1,147 @@
+# tests/unit/infrastructure/cache/test_unread_counter.py
+"""Tests pour les compteurs Redis de notifications non lues."""
+
+import fnmatch
+from uuid import uuid4
+
+import redis
+
+from src.domain.notification.entities.notification import Notification, NotificationType
+from src.infrastructure.cache.counted_notification_repository import CountedNotificationRepository
+from src.infrastructure.cache.unread_counter import RedisUnreadCounter
+from src.infrastructure.persistence.in_memory.notification_repository import InMemoryNotificationRepository
+
+
+class FakeRedis:
+    """Sous-ensemble de redis.Redis utilisé par RedisUnreadCounter."""
+
+    def __init__(self):
+        self.data = {}
+        self.down = False
+
+    def _check(self):
+        if self.down:
+            raise redis.ConnectionError("Redis indisponible")
+
+    def get(self, key):
+        self._check()
+        value = self.data.get(key)
+        return str(value).encode() if value is not None else None
+
+    def set(self, key, value, ex=None, nx=False):
+        self._check()
+        if nx and key in self.data:
+            return None
+        self.data[key] = int(value)
+        return True
+
+    def delete(self, key):
+        self._check()
+        return int(self.data.pop(key, None) is not None)
+
+    def scan_iter(self, match=None, count=None):
+        self._check()
+        return [k.encode() for k in list(self.data) if fnmatch.fnmatch(k, match)]
+
+    def register_script(self, source):
+        def adjust(keys, args):
+            self._check()
+            if keys[0] not in self.data:
+                return None
+            self.data[keys[0]] = max(self.data[keys[0]] + int(args[0]), 0)
+            return self.data[keys[0]]
+        return adjust
+
+
+class CountingInner(InMemoryNotificationRepository):
+    """Repository de référence qui compte les comptages en base."""
+
+    def __init__(self):
+        super().__init__()
+        self.count_calls = 0
+
+    def count_unread(self, user_id):
+        self.count_calls += 1
+        return super().count_unread(user_id)
+
+
+def _notification(user_id):
+    return Notification(user_id=user_id, type=NotificationType.SYSTEM, title="Info", message="Test")
+
+
+def _setup():
+    client = FakeRedis()
+    inner = CountingInner()
+    repo = CountedNotificationRepository(inner, RedisUnreadCounter(client))
+    return client, inner, repo
+
+
+class TestCountedNotificationRepository:
+    """Tests pour CountedNotificationRepository."""
+
+    def test_count_served_from_redis_after_first_read(self):
+        client, inner, repo = _setup()
+        user_id = uuid4()
+        repo.save(_notification(user_id))
+
+        assert repo.count_unread(user_id) == 1
+        assert repo.count_unread(user_id) == 1
+        assert inner.count_calls == 1
+
+    def test_counter_follows_writes(self):
+        client, inner, repo = _setup()
+        user_id = uuid4()
+        first = _notification(user_id)
+        repo.save(first)
+        repo.count_unread(user_id)
+
+        repo.save_many([_notification(user_id) for _ in range(3)])
+        assert repo.count_unread(user_id) == 4
+
+        repo.mark_as_read(first.id)
+        repo.mark_as_read(first.id)
+        assert repo.count_unread(user_id) == 3
+
+        second = repo.find_by_user(user_id, unread_only=True)[0]
+        repo.delete(second.id)
+        assert repo.count_unread(user_id) == 2
+
+        assert repo.mark_all_as_read(user_id) == 2
+        assert repo.count_unread(user_id) == 0
+        assert inner.count_calls == 1
+
+    def test_no_counter_created_by_adjustments(self):
+        """Un ajustement sans compteur amorcé ne crée pas de valeur fausse."""
+        client, inner, repo = _setup()
+        user_id = uuid4()
+        inner.save(_notification(user_id))
+
+        repo.save(_notification(user_id))
+
+        assert client.data == {}
+        assert repo.count_unread(user_id) == 2
+
+    def test_falls_back_to_repository_when_redis_down(self):
+        client, inner, repo = _setup()
+        user_id = uuid4()
+        client.down = True
+
+        repo.save(_notification(user_id))
+        repo.save(_notification(user_id))
+
+        assert repo.count_unread(user_id) == 2
+        assert repo.count_unread(user_id) == 2
+        assert inner.count_calls == 2
+
+    def test_reconcile_fixes_drift(self):
+        client, inner, repo = _setup()
+        user_id = uuid4()
+        repo.save(_notification(user_id))
+        repo.count_unread(user_id)
+        # Dérive : écriture hors décorateur
+        inner.save(_notification(user_id))
+
+        counter = RedisUnreadCounter(client)
+        assert counter.reconcile(inner.count_unread) == 1
+        assert repo.count_unread(user_id) == 2
+        assert counter.reconcile(inner.count_unread) == 0
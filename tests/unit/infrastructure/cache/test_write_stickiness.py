@@ -0,0 +1,67 @@
+# tests/unit/infrastructure/cache/test_write_stickiness.py
+"""Tests pour la fenêtre de lecture sur le primaire."""
+
+from uuid import uuid4
+
+import redis
+
+from src.infrastructure.cache.write_stickiness import WriteStickiness
+
+
+class FakeRedis:
+    """Sous-ensemble de redis.Redis utilisé par WriteStickiness."""
+
+    def __init__(self):
+        self.store = {}
+        self.failing = False
+
+    def set(self, key, value, ex=None):
+        self._check()
+        self.store[key] = (value, ex)
+
+    def exists(self, key):
+        self._check()
+        return int(key in self.store)
+
+    def _check(self):
+        if self.failing:
+            raise redis.ConnectionError("down")
+
+
+class TestWriteStickiness:
+    """Tests pour WriteStickiness."""
+
+    def test_marked_user_is_sticky(self):
+        stickiness = WriteStickiness(window=5)
+        user_id = uuid4()
+
+        stickiness.mark(user_id)
+
+        assert stickiness.is_sticky(user_id)
+        assert not stickiness.is_sticky(uuid4())
+
+    def test_zero_window_disables_stickiness(self):
+        stickiness = WriteStickiness(window=0)
+        user_id = uuid4()
+
+        stickiness.mark(user_id)
+
+        assert not stickiness.is_sticky(user_id)
+
+    def test_window_is_shared_through_redis(self):
+        client = FakeRedis()
+        user_id = uuid4()
+
+        WriteStickiness(window=5, client=client).mark(user_id)
+
+        assert client.store[f"db:primary:{user_id}"] == (1, 5)
+        assert WriteStickiness(window=5, client=client).is_sticky(user_id)
+
+    def test_redis_outage_keeps_reads_on_primary(self):
+        client = FakeRedis()
+        client.failing = True
+        stickiness = WriteStickiness(window=5, client=client)
+
+        stickiness.mark(uuid4())
+
+        assert stickiness.is_sticky(uuid4())
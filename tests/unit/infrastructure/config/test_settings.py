@@ -204,6 +204,7 @@ class TestProductionConfig:
         assert config.JWT_SECRET_KEY == "prod-jwt-secret-key-32-characters"
         assert config.DEBUG is False
         assert config.JWT_COOKIE_SECURE is True  # HTTPS obligatoire
+        assert config.DB_CREATE_TABLES is False  # Schéma géré par Alembic
     
     @patch.dict(os.environ, {}, clear=True)
     def test_production_config_missing_secret_key(self):
@@ -253,4 +254,16 @@ class TestProductionConfig:
         config = ProductionConfig()
         
         assert config.JWT_ACCESS_TOKEN_EXPIRES == 1800  # 30 min
-        assert config.JWT_REFRESH_TOKEN_EXPIRES == 604800  # 7 jours
\ No newline at end of file
+        assert config.JWT_REFRESH_TOKEN_EXPIRES == 604800  # 7 jours
+    
+    @patch.dict(os.environ, {
+        "SECRET_KEY": "prod-secret-key-32-characters-long",
+        "JWT_SECRET_KEY": "prod-jwt-secret-key-32-characters",
+        "DATABASE_REPLICA_URLS": "postgresql://replica1, postgresql://replica2,"
+    })
+    def test_production_config_replica_urls(self):
+        """Test ProductionConfig avec des réplicas en lecture."""
+        config = ProductionConfig()
+        
+        assert config.DATABASE_REPLICA_URLS == ("postgresql://replica1", "postgresql://replica2")
+        assert config.REPLICA_STICKINESS_SECONDS == 5
@@ -0,0 +1,105 @@
+# tests/unit/infrastructure/event_handlers/test_letter_notification_handler.py
+"""Tests unitaires pour les notifications de nouvelle lettre."""
+
+import pytest
+from uuid import uuid4
+
+import src.infrastructure.websocket as websocket
+from src.domain.collaboration.entities.colli import Colli
+from src.domain.collaboration.events import LetterCreated
+from src.domain.identity.entities.user import User
+from src.domain.identity.value_objects.user_role import UserRole
+from src.infrastructure.event_handlers.in_memory_publisher import InMemoryEventPublisher
+from src.infrastructure.event_handlers.letter_notification_handler import LetterNotificationHandler
+from src.infrastructure.persistence.in_memory.colli_repository import InMemoryColliRepository
+from src.infrastructure.persistence.in_memory.notification_repository import InMemoryNotificationRepository
+from src.infrastructure.persistence.in_memory.user_repository import InMemoryUserRepository
+from src.infrastructure.services.notification_service import NotificationService
+
+
+class RecordingNotificationRepository(InMemoryNotificationRepository):
+    """Repository In-Memory qui trace les écritures."""
+    
+    def __init__(self, log):
+        super().__init__()
+        self._log = log
+    
+    def save(self, notification):
+        self._log.append(('save', 1))
+        super().save(notification)
+    
+    def save_many(self, notifications):
+        self._log.append(('save_many', len(notifications)))
+        super().save_many(notifications)
+
+
+@pytest.fixture
+def ctx(monkeypatch):
+    log = []
+    monkeypatch.setattr(
+        websocket, 'emit_to_colli',
+        lambda colli_id, event, data: log.append(('emit', colli_id, event, data))
+    )
+    
+    colli_repo = InMemoryColliRepository()
+    user_repo = InMemoryUserRepository()
+    repo = RecordingNotificationRepository(log)
+    handler = LetterNotificationHandler(
+        lambda: NotificationService(repo), lambda: colli_repo, lambda: user_repo
+    )
+    publisher = InMemoryEventPublisher()
+    handler.subscribe(publisher)
+    
+    author = User.create("auteur@example.com", "Password123!", "Lea", "Roux", UserRole.MEMBER)
+    user_repo.save(author)
+    creator_id, reader_id, pending_id = uuid4(), uuid4(), uuid4()
+    colli = Colli.create(name="Club Lecture", theme="Romans", creator_id=creator_id)
+    colli.approve()
+    for member_id in (author.id, reader_id, pending_id):
+        colli.add_member(member_id)
+    colli.accept_member(author.id)
+    colli.accept_member(reader_id)
+    colli_repo.save(colli)
+    
+    return {
+        'log': log, 'repo': repo, 'handler': handler, 'publisher': publisher,
+        'colli': colli, 'author': author, 'recipients': {creator_id, reader_id},
+    }
+
+
+def _publish_letter(ctx):
+    letter_id = uuid4()
+    ctx['publisher'].publish(LetterCreated(
+        letter_id=letter_id, colli_id=ctx['colli'].id, sender_id=ctx['author'].id
+    ))
+    return letter_id
+
+
+def test_notifications_written_in_bulk_after_commit(ctx):
+    """Une insertion, un commit, puis une seule diffusion sur la room du COLLI."""
+    letter_id = _publish_letter(ctx)
+    assert ctx['log'] == []
+    
+    ctx['handler'].flush(commit=lambda: ctx['log'].append(('commit',)))
+    
+    assert [entry[0] for entry in ctx['log']] == ['save_many', 'commit', 'emit']
+    assert ctx['log'][0] == ('save_many', 2)
+    _, colli_id, event, data = ctx['log'][2]
+    assert (colli_id, event) == (str(ctx['colli'].id), 'notification')
+    assert 'recipient_ids' not in data
+    assert data['author_id'] == str(ctx['author'].id)
+    assert data['related_entity_id'] == str(letter_id)
+    assert "Lea Roux" in data['message']
+    for recipient in ctx['recipients']:
+        assert ctx['repo'].count_unread(recipient) == 1
+    assert ctx['repo'].count_unread(ctx['author'].id) == 0
+
+
+def test_discard_drops_pending_letters(ctx):
+    """Une requête en échec ne notifie personne."""
+    _publish_letter(ctx)
+    
+    ctx['handler'].discard()
+    ctx['handler'].flush(commit=lambda: ctx['log'].append(('commit',)))
+    
+    assert ctx['log'] == []
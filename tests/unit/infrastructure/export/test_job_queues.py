@@ -0,0 +1,34 @@
+# tests/unit/infrastructure/export/test_job_queues.py
+"""Tests unitaires pour les files de jobs d'export."""
+
+from uuid import uuid4
+
+from src.infrastructure.export.job_queues import CeleryExportJobQueue
+
+
+def test_celery_queue_sends_jobs_on_flush_only():
+    """Le job n'est transmis au worker qu'après le commit (flush)."""
+    sent = []
+    queue = CeleryExportJobQueue(task_sender=sent.append)
+    job_id = uuid4()
+
+    queue.enqueue(job_id)
+    assert sent == []
+
+    queue.flush()
+    assert sent == [str(job_id)]
+
+    queue.flush()
+    assert sent == [str(job_id)]
+
+
+def test_celery_queue_discards_jobs_of_failed_request():
+    """Une requête annulée n'envoie pas ses jobs."""
+    sent = []
+    queue = CeleryExportJobQueue(task_sender=sent.append)
+
+    queue.enqueue(uuid4())
+    queue.discard()
+    queue.flush()
+
+    assert sent == []
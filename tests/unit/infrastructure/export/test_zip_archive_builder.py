@@ -0,0 +1,85 @@
+# tests/unit/infrastructure/export/test_zip_archive_builder.py
+"""Tests unitaires pour ZipExportArchiveBuilder."""
+
+import json
+import os
+import zipfile
+from uuid import uuid4
+
+from src.application.use_cases.user.export_user_data import ExportUserDataUseCase
+from src.domain.collaboration.entities.colli import Colli
+from src.domain.collaboration.entities.comment import Comment
+from src.domain.collaboration.entities.letter import Letter
+from src.domain.export.entities.export_job import ExportJob
+from src.domain.identity.entities.user import User
+from src.domain.identity.value_objects.user_role import UserRole
+from src.infrastructure.export.zip_archive_builder import ZipExportArchiveBuilder
+from src.infrastructure.persistence.in_memory.colli_repository import InMemoryColliRepository
+from src.infrastructure.persistence.in_memory.comment_repository import InMemoryCommentRepository
+from src.infrastructure.persistence.in_memory.letter_repository import InMemoryLetterRepository
+from src.infrastructure.persistence.in_memory.notification_repository import InMemoryNotificationRepository
+from src.infrastructure.persistence.in_memory.user_repository import InMemoryUserRepository
+from src.infrastructure.storage.file_storage import FileStorageService
+
+
+def test_archive_contains_data_and_uploaded_files(tmp_path):
+    """L'archive contient data.json et les seuls fichiers stockés de l'utilisateur."""
+    user_repo = InMemoryUserRepository()
+    letter_repo = InMemoryLetterRepository()
+    comment_repo = InMemoryCommentRepository()
+    storage = FileStorageService(upload_folder=str(tmp_path / "uploads"))
+
+    user = User.create("carla@example.com", "Password123!", "Carla", "Petit", UserRole.MEMBER)
+    user_repo.save(user)
+    colli = Colli.create(name="COLLI", theme="Theme", creator_id=uuid4())
+
+    scan = storage.save(b"%PDF-1.4 scan", "scan.pdf")
+    note = storage.save(b"note vocale", "note.txt")
+    foreign = storage.save(b"autre", "autre.txt")
+
+    letter_repo.save(Letter.create_file_letter(colli.id, user.id, scan.file_url, "scan.pdf"))
+    letter_repo.save(Letter.create_file_letter(colli.id, user.id, "https://example.com/x.pdf", "x.pdf"))
+    letter_repo.save(Letter.create_file_letter(colli.id, uuid4(), foreign.file_url, "autre.txt"))
+    letter = Letter.create_text_letter(colli.id, user.id, "Lettre avec commentaire")
+    letter_repo.save(letter)
+    comment = Comment.create(letter.id, user.id, "Ma note", attachment_url=note.file_url)
+    comment_repo.save(comment)
+
+    builder = ZipExportArchiveBuilder(
+        ExportUserDataUseCase(
+            user_repo, InMemoryColliRepository(), letter_repo, comment_repo,
+            InMemoryNotificationRepository()
+        ),
+        letter_repo,
+        comment_repo,
+        storage,
+        str(tmp_path / "exports")
+    )
+    job = ExportJob.create(user.id)
+
+    archive = builder.build(job)
+
+    assert archive.path == str(tmp_path / "exports" / f"{job.id}.zip")
+    assert archive.size == os.path.getsize(archive.path)
+    assert not os.path.exists(f"{archive.path}.part")
+    with zipfile.ZipFile(archive.path) as zf:
+        data = json.loads(zf.read("data.json"))
+        files = sorted(name for name in zf.namelist() if name.startswith("files/"))
+        assert data['user']['email'] == "carla@example.com"
+        assert data['statistics']['total_letters'] == 3
+        assert files == sorted([
+            f"files/{os.path.basename(storage.get_path(scan.file_id))}",
+            f"files/{os.path.basename(storage.get_path(note.file_id))}",
+        ])
+        assert {zf.read(name) for name in files} == {b"%PDF-1.4 scan", b"note vocale"}
+
+
+def test_file_id_from_url_rejects_foreign_urls(tmp_path):
+    """Seules les URLs de stockage local avec un UUID valide sont reconnues."""
+    storage = FileStorageService(upload_folder=str(tmp_path))
+    file_id = str(uuid4())
+
+    assert storage.file_id_from_url(f"/api/v1/files/{file_id}") == file_id
+    assert storage.file_id_from_url("https://example.com/doc.pdf") is None
+    assert storage.file_id_from_url("/api/v1/files/../../etc/passwd") is None
+    assert storage.file_id_from_url(None) is None
@@ -0,0 +1,99 @@
+# tests/unit/infrastructure/persistence/test_counter_repair.py
+"""Tests pour les compteurs dénormalisés et leur recalcul."""
+
+import pytest
+from uuid import uuid4
+from sqlalchemy import create_engine, update
+from sqlalchemy.orm import Session
+
+from src.domain.collaboration.entities.colli import Colli
+from src.domain.collaboration.entities.comment import Comment
+from src.domain.collaboration.entities.letter import Letter
+from src.infrastructure.persistence.sqlalchemy.counter_repair import CounterRepairer
+from src.infrastructure.persistence.sqlalchemy.database import init_db
+from src.infrastructure.persistence.sqlalchemy.models.colli_model import ColliModel
+from src.infrastructure.persistence.sqlalchemy.models.letter_model import LetterModel
+from src.infrastructure.persistence.sqlalchemy.repositories.colli_repository import SQLAlchemyColliRepository
+from src.infrastructure.persistence.sqlalchemy.repositories.comment_repository import SQLAlchemyCommentRepository
+from src.infrastructure.persistence.sqlalchemy.repositories.letter_repository import SQLAlchemyLetterRepository
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    init_db(engine)
+    with Session(engine) as session:
+        yield session
+
+
+def _seed(session, letters=3, comments=2):
+    """Un COLLI actif (son créateur pour seul membre), des lettres et des commentaires sur la première."""
+    colli = Colli.create(name="COLLI de test", theme="Test", creator_id=uuid4())
+    colli.approve()
+    member_id = colli.creator_id
+    colli_repo = SQLAlchemyColliRepository(session)
+    colli_repo.save(colli)
+
+    letter_repo = SQLAlchemyLetterRepository(session)
+    comment_repo = SQLAlchemyCommentRepository(session)
+    saved = [
+        letter_repo.save(Letter.create_text_letter(
+            colli_id=colli.id, sender_id=member_id, content=f"Lettre de test numéro {i}"
+        ))
+        for i in range(letters)
+    ]
+    for i in range(comments):
+        comment_repo.save(Comment.create(
+            letter_id=saved[0].id, sender_id=member_id, content=f"Commentaire {i}"
+        ))
+    session.commit()
+    return colli, saved
+
+
+def _counters(session, colli_id, letter_id):
+    colli = session.get(ColliModel, colli_id)
+    letter = session.get(LetterModel, letter_id)
+    session.refresh(colli)
+    session.refresh(letter)
+    return colli.member_count, colli.letter_count, colli.last_activity_at, letter.comment_count
+
+
+class TestCounterRepairer:
+    """Tests pour CounterRepairer."""
+
+    def test_repair_recomputes_counters_from_source_tables(self, session):
+        colli, letters = _seed(session)
+
+        result = CounterRepairer(session).repair_all(chunk_size=2)
+        session.commit()
+
+        member_count, letter_count, last_activity_at, comment_count = _counters(session, colli.id, letters[0].id)
+        assert result == {'collis': 1, 'letters': 3}
+        assert (member_count, letter_count, comment_count) == (1, 3, 2)
+        assert last_activity_at is not None
+
+    def test_repair_fixes_drifted_counters(self, session):
+        colli, letters = _seed(session)
+        session.execute(update(ColliModel).values(member_count=42, letter_count=-1))
+        session.execute(update(LetterModel).values(comment_count=7))
+        session.commit()
+
+        CounterRepairer(session).repair_all()
+        session.commit()
+
+        member_count, letter_count, _, comment_count = _counters(session, colli.id, letters[0].id)
+        assert (member_count, letter_count, comment_count) == (1, 3, 2)
+        assert _counters(session, colli.id, letters[1].id)[3] == 0
+
+    def test_repair_keeps_updated_at(self, session):
+        colli, letters = _seed(session)
+        before = session.get(ColliModel, colli.id).updated_at
+
+        CounterRepairer(session).repair_all()
+        session.commit()
+        session.expire_all()
+
+        assert session.get(ColliModel, colli.id).updated_at == before
+
+    def test_repair_empty_database(self, session):
+        assert CounterRepairer(session).repair_all() == {'collis': 0, 'letters': 0}
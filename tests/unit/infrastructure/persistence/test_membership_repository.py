@@ -0,0 +1,208 @@
+# tests/unit/infrastructure/persistence/test_membership_repository.py
+"""Tests pour SQLAlchemyMembershipRepository (écritures ligne à ligne)."""
+
+import pytest
+from uuid import uuid4
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from src.application.exceptions import ConflictException
+from src.application.use_cases.colli.membership import AcceptMemberUseCase, JoinColliUseCase, LeaveColliUseCase
+from src.domain.collaboration.entities.colli import Colli
+from src.domain.collaboration.entities.membership import Membership
+from src.domain.collaboration.value_objects.membership_status import MembershipStatus
+from src.infrastructure.persistence.sqlalchemy.database import init_db
+from src.infrastructure.persistence.sqlalchemy.query_counter import instrument_queries, track_queries
+from src.infrastructure.persistence.sqlalchemy.repositories.colli_repository import SQLAlchemyColliRepository
+from src.infrastructure.persistence.sqlalchemy.repositories.membership_repository import SQLAlchemyMembershipRepository
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    init_db(engine)
+    instrument_queries(engine)
+    with Session(engine) as session:
+        yield session
+
+
+@pytest.fixture
+def colli(session):
+    colli = Colli.create(name="COLLI de test", theme="Test", creator_id=uuid4())
+    colli.approve()
+    for _ in range(20):
+        colli.add_member(uuid4())
+    SQLAlchemyColliRepository(session).add(colli)
+    session.commit()
+    session.expunge_all()
+    return colli
+
+
+@pytest.fixture
+def shared_engine(tmp_path):
+    """Base fichier : deux sessions y jouent deux requêtes concurrentes."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'concurrency.db'}")
+    init_db(engine)
+    return engine
+
+
+def _kinds(stats):
+    return sorted(statement.split()[0] for statement in stats.statements.elements())
+
+
+def _member_count(session, colli_id):
+    return SQLAlchemyColliRepository(session).find_summaries_by_ids([colli_id])[colli_id].member_count
+
+
+class TestSQLAlchemyMembershipRepository:
+    """Tests pour le repository Membership."""
+
+    def test_add_inserts_one_row(self, session, colli):
+        with track_queries() as stats:
+            SQLAlchemyMembershipRepository(session).add(Membership.create(uuid4(), colli.id))
+
+        assert _kinds(stats) == ["INSERT"]
+
+    def test_add_duplicate_raises_conflict(self, session, colli):
+        user_id = uuid4()
+        repo = SQLAlchemyMembershipRepository(session)
+        repo.add(Membership.create(user_id, colli.id))
+        session.commit()
+
+        with pytest.raises(ConflictException):
+            repo.add(Membership.create(user_id, colli.id))
+
+    def test_save_updates_status(self, session, colli):
+        repo = SQLAlchemyMembershipRepository(session)
+        user_id = uuid4()
+        repo.add(Membership.create(user_id, colli.id))
+        session.commit()
+
+        membership = repo.find(colli.id, user_id)
+        membership.accept()
+        with track_queries() as stats:
+            repo.save(membership)
+
+        assert _kinds(stats) == ["UPDATE"]
+        assert repo.find(colli.id, user_id).status == MembershipStatus.ACCEPTED
+
+    def test_delete_removes_one_row(self, session, colli):
+        repo = SQLAlchemyMembershipRepository(session)
+        membership = repo.find(colli.id, colli.creator_id)
+
+        assert repo.delete(membership) is True
+        assert repo.find(colli.id, colli.creator_id) is None
+        assert repo.delete(membership) is False
+
+
+    def test_find_accepted_member_ids_reads_user_ids_only(self, session, colli):
+        """Une seule requête sur memberships, membres PENDING exclus."""
+        unknown_id = uuid4()
+
+        with track_queries() as stats:
+            members = SQLAlchemyColliRepository(session).find_accepted_member_ids([colli.id, unknown_id])
+
+        assert members == {colli.id: [colli.creator_id], unknown_id: []}
+        assert stats.count == 1
+        assert "JOIN" not in next(iter(stats.statements))
+
+
+class TestMembershipUseCases:
+    """Rejoindre, accepter, quitter : sans charger les membres du COLLI."""
+
+    def _use_cases(self, session):
+        colli_repo = SQLAlchemyColliRepository(session)
+        membership_repo = SQLAlchemyMembershipRepository(session)
+        return (
+            JoinColliUseCase(colli_repo, membership_repo),
+            AcceptMemberUseCase(colli_repo, membership_repo),
+            LeaveColliUseCase(colli_repo, membership_repo),
+        )
+
+    def test_join_accept_leave_keep_member_count(self, session, colli):
+        join, accept, leave = self._use_cases(session)
+        user_id = uuid4()
+        before = _member_count(session, colli.id)
+
+        join.execute(colli.id, user_id)
+        response = accept.execute(colli.id, user_id, colli.creator_id)
+        session.commit()
+
+        assert response.member_count == before + 1
+        assert _member_count(session, colli.id) == before + 1
+
+        leave.execute(colli.id, user_id)
+        session.commit()
+
+        assert _member_count(session, colli.id) == before
+
+    def test_accept_does_not_rewrite_other_members(self, session, colli):
+        join, accept, _ = self._use_cases(session)
+        user_id = uuid4()
+        join.execute(colli.id, user_id)
+        session.commit()
+        session.expunge_all()
+
+        with track_queries() as stats:
+            accept.execute(colli.id, user_id, colli.creator_id)
+
+        # Projection, contrôle du manager, demande ; puis adhésion et compteur
+        assert _kinds(stats) == ["SELECT", "SELECT", "SELECT", "UPDATE", "UPDATE"]
+
+
+class TestOptimisticConcurrency:
+    """Deux requêtes lisent la même version : la seconde écriture est un conflit."""
+
+    def test_stale_membership_save_raises_conflict(self, shared_engine):
+        colli = Colli.create(name="COLLI de test", theme="Test", creator_id=uuid4())
+        colli.approve()
+        user_id = uuid4()
+        colli.add_member(user_id)
+        with Session(shared_engine) as setup:
+            SQLAlchemyColliRepository(setup).add(colli)
+            setup.commit()
+
+        with Session(shared_engine) as first, Session(shared_engine) as second:
+            mine = SQLAlchemyMembershipRepository(first).find(colli.id, user_id)
+            theirs = SQLAlchemyMembershipRepository(second).find(colli.id, user_id)
+            theirs.reject()
+            SQLAlchemyMembershipRepository(second).save(theirs)
+            second.commit()
+
+            mine.accept()
+            with pytest.raises(ConflictException):
+                SQLAlchemyMembershipRepository(first).save(mine)
+
+    def test_stale_colli_save_raises_conflict(self, shared_engine):
+        colli = Colli.create(name="COLLI de test", theme="Test", creator_id=uuid4())
+        with Session(shared_engine) as setup:
+            SQLAlchemyColliRepository(setup).add(colli)
+            setup.commit()
+
+        with Session(shared_engine) as first, Session(shared_engine) as second:
+            mine = SQLAlchemyColliRepository(first).find_by_id(colli.id)
+            theirs = SQLAlchemyColliRepository(second).find_by_id(colli.id)
+            theirs.description = "Modifiée ailleurs"
+            SQLAlchemyColliRepository(second).save(theirs)
+            second.commit()
+
+            mine.description = "Modifiée ici"
+            with pytest.raises(ConflictException):
+                SQLAlchemyColliRepository(first).save(mine)
+
+    def test_member_delta_invalidates_loaded_aggregate(self, shared_engine):
+        """update_model réécrit member_count : il ne doit pas écraser une acceptation."""
+        colli = Colli.create(name="COLLI de test", theme="Test", creator_id=uuid4())
+        colli.approve()
+        with Session(shared_engine) as setup:
+            SQLAlchemyColliRepository(setup).add(colli)
+            setup.commit()
+
+        with Session(shared_engine) as first, Session(shared_engine) as second:
+            mine = SQLAlchemyColliRepository(first).find_by_id(colli.id)
+            SQLAlchemyColliRepository(second).update_activity(colli.id, member_delta=1)
+            second.commit()
+
+            mine.description = "Modifiée ici"
+            with pytest.raises(ConflictException):
+                SQLAlchemyColliRepository(first).save(mine)
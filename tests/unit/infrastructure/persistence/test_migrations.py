@@ -0,0 +1,121 @@
+# tests/unit/infrastructure/persistence/test_migrations.py
+"""Tests pour les migrations Alembic."""
+
+import os
+
+import pytest
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from sqlalchemy import create_engine, inspect, text
+
+from src.infrastructure.persistence.sqlalchemy.database import Base
+from src.infrastructure.persistence.sqlalchemy import models  # noqa: F401 (metadata complète)
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+
+def _alembic_config(url):
+    # Sans alembic.ini : env.py ne reconfigure pas le logging des tests
+    config = Config()
+    config.set_main_option("script_location", os.path.join(ROOT, "migrations"))
+    config.set_main_option("sqlalchemy.url", url)
+    return config
+
+
+def _index_names(engine, table):
+    return {index["name"] for index in inspect(engine).get_indexes(table)}
+
+
+@pytest.fixture
+def database(tmp_path):
+    url = f"sqlite:///{tmp_path / 'migrations.db'}"
+    return url, create_engine(url)
+
+
+class TestMigrations:
+    """Tests pour la chaîne de migrations."""
+
+    def test_upgrade_head_matches_models(self, database):
+        url, engine = database
+
+        command.upgrade(_alembic_config(url), "head")
+
+        with engine.connect() as connection:
+            context = MigrationContext.configure(
+                connection, opts={"include_object": _managed_objects}
+            )
+            assert compare_metadata(context, Base.metadata) == []
+
+    def test_hot_path_indexes_replace_single_column_ones(self, database):
+        url, engine = database
+        config = _alembic_config(url)
+
+        command.upgrade(config, "0001_baseline")
+        assert "ix_letters_colli_id" in _index_names(engine, "letters")
+
+        command.upgrade(config, "head")
+        assert "ix_letters_colli_id_created_at" in _index_names(engine, "letters")
+        assert "ix_letters_colli_id" not in _index_names(engine, "letters")
+        assert "ix_comments_letter_id_created_at" in _index_names(engine, "comments")
+        assert "ix_memberships_colli_id_user_id_status" in _index_names(engine, "memberships")
+        assert "ix_collis_status_created_at" in _index_names(engine, "collis")
+
+    def test_membership_unique_index_drops_duplicates(self, database):
+        url, engine = database
+        config = _alembic_config(url)
+        command.upgrade(config, "0009_comment_parent_index")
+        with engine.begin() as connection:
+            connection.execute(text(
+                "INSERT INTO memberships (id, user_id, colli_id, role, status, joined_at) VALUES "
+                "('a', 'u', 'c', 'member', 'accepted', '2026-01-01'), "
+                "('b', 'u', 'c', 'member', 'pending', '2026-01-02')"
+            ))
+
+        command.upgrade(config, "0010_membership_unique")
+
+        assert "uq_memberships_colli_id_user_id" in _index_names(engine, "memberships")
+        with engine.connect() as connection:
+            assert connection.execute(text("SELECT id FROM memberships")).scalars().all() == ["a"]
+
+    def test_baseline_has_only_the_original_schema(self, database):
+        url, engine = database
+
+        command.upgrade(_alembic_config(url), "0001_baseline")
+
+        inspector = inspect(engine)
+        assert set(inspector.get_table_names()) == {
+            "alembic_version", "users", "collis", "memberships", "letters", "comments"
+        }
+        assert "member_count" not in {c["name"] for c in inspector.get_columns("collis")}
+        assert "comment_count" not in {c["name"] for c in inspector.get_columns("letters")}
+
+    def test_upgrade_on_stamped_baseline_database(self, database):
+        """Base create_all d'avant les migrations : stamp 0001_baseline, puis upgrade."""
+        url, engine = database
+        config = _alembic_config(url)
+        command.upgrade(config, "0001_baseline")
+        with engine.begin() as connection:
+            connection.execute(text("DROP TABLE alembic_version"))
+
+        command.stamp(config, "0001_baseline")
+        command.upgrade(config, "head")
+
+        assert "member_count" in {c["name"] for c in inspect(engine).get_columns("collis")}
+        assert {"search_documents", "export_jobs", "notifications"} <= set(inspect(engine).get_table_names())
+
+    def test_downgrade_to_base(self, database):
+        url, engine = database
+        config = _alembic_config(url)
+        command.upgrade(config, "head")
+
+        command.downgrade(config, "base")
+
+        assert set(inspect(engine).get_table_names()) == {"alembic_version"}
+
+
+def _managed_objects(obj, name, type_, reflected, compare_to):
+    """Ignore les tables de l'index FTS5, créées hors metadata."""
+    return not (reflected and name and name.startswith("search_documents_fts"))
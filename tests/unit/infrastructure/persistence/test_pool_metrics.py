@@ -0,0 +1,75 @@
+# tests/unit/infrastructure/persistence/test_pool_metrics.py
+"""Tests pour l'instrumentation des pools de connexions."""
+
+import pytest
+from sqlalchemy import create_engine, exc, text
+
+from src.infrastructure.persistence.sqlalchemy.pool_metrics import (
+    InstrumentedQueuePool, PoolMetrics, instrument_engine, pool_status
+)
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05
+    )
+    instrument_engine(engine)
+    yield engine
+    engine.dispose()
+
+
+class TestPoolMetrics:
+    """Tests pour PoolMetrics."""
+
+    def test_wait_histogram_is_cumulative(self):
+        metrics = PoolMetrics()
+
+        metrics.record_wait(0.0005)
+        metrics.record_wait(0.2)
+        metrics.record_wait(60)
+
+        wait = metrics.snapshot()["wait"]
+        counts = {bucket["le_ms"]: bucket["count"] for bucket in wait["buckets"]}
+        assert wait["count"] == 3
+        assert counts[1] == 1
+        assert counts[250] == 2
+        assert counts[10000] == 2
+        assert counts["+Inf"] == 3
+
+
+class TestInstrumentedQueuePool:
+    """Tests pour InstrumentedQueuePool et pool_status."""
+
+    def test_status_reports_checked_out_connections(self, engine):
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            status = pool_status(engine)
+            assert status["checked_out"] == 1
+
+        status = pool_status(engine)
+        assert status["pool"] == "InstrumentedQueuePool"
+        assert status["checked_out"] == 0
+        assert status["connects"] == 1
+        assert status["checkouts"] == 1
+        assert status["wait"]["count"] == 1
+
+    def test_exhausted_pool_counts_timeout(self, engine):
+        with engine.connect():
+            with pytest.raises(exc.TimeoutError):
+                engine.connect()
+
+        assert pool_status(engine)["timeouts"] == 1
+
+    def test_metrics_survive_dispose(self, engine):
+        with engine.connect():
+            pass
+        engine.dispose()
+        with engine.connect():
+            pass
+
+        assert pool_status(engine)["checkouts"] == 2
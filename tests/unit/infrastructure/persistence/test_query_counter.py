@@ -0,0 +1,55 @@
+# tests/unit/infrastructure/persistence/test_query_counter.py
+"""Tests pour le comptage des requêtes SQL."""
+
+from sqlalchemy import create_engine, text
+
+from src.infrastructure.persistence.sqlalchemy.query_counter import (
+    instrument_queries, normalize_statement, track_queries
+)
+
+
+def _engine():
+    engine = create_engine("sqlite://")
+    instrument_queries(engine)
+    return engine
+
+
+class TestNormalizeStatement:
+    """Tests pour normalize_statement."""
+
+    def test_literals_and_in_lists_are_replaced(self):
+        first = normalize_statement("SELECT * FROM users WHERE id IN (?, ?, ?) AND age > 18")
+        second = normalize_statement("SELECT *  FROM users\nWHERE id IN (?) AND age > 21")
+
+        assert first == second == "SELECT * FROM users WHERE id IN (?) AND age > ?"
+
+    def test_string_literals_are_replaced(self):
+        assert normalize_statement("SELECT 1 WHERE name = 'O''Brien'") == "SELECT ? WHERE name = ?"
+
+
+class TestTrackQueries:
+    """Tests pour track_queries."""
+
+    def test_counts_queries_in_block_only(self):
+        engine = _engine()
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            with track_queries() as stats:
+                for value in range(3):
+                    connection.execute(text(f"SELECT {value}"))
+
+        assert stats.count == 3
+        assert stats.duration >= 0
+        assert stats.repeated(2) == [("SELECT ?", 3)]
+        assert stats.repeated(3) == []
+
+    def test_nested_blocks_both_count(self):
+        engine = _engine()
+        with engine.connect() as connection:
+            with track_queries() as outer:
+                connection.execute(text("SELECT 1"))
+                with track_queries() as inner:
+                    connection.execute(text("SELECT 2"))
+
+        assert outer.count == 2
+        assert inner.count == 1
@@ -0,0 +1,86 @@
+# tests/unit/infrastructure/persistence/test_replica_routing.py
+"""Tests pour le routage des lectures vers les réplicas."""
+
+import pytest
+from sqlalchemy import Column, Integer, String, create_engine, text
+from sqlalchemy.orm import declarative_base
+
+from src.infrastructure.persistence.sqlalchemy.database import (
+    ReplicaSet, RoutingSession, create_session_factory, replica_reads
+)
+
+
+Base = declarative_base()
+
+
+class Item(Base):
+    __tablename__ = "items"
+    id = Column(Integer, primary_key=True)
+    origin = Column(String(20))
+
+
+def _database(tmp_path, name):
+    """Base SQLite marquée de son nom, pour savoir qui a répondu."""
+    engine = create_engine(f"sqlite:///{tmp_path / name}.db")
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(Item.__table__.insert(), {"id": 1, "origin": name})
+    return engine
+
+
+def _origin(session):
+    return session.execute(text("SELECT origin FROM items WHERE id = 1")).scalar()
+
+
+@pytest.fixture
+def factory(tmp_path):
+    primary = _database(tmp_path, "primary")
+    replicas = ReplicaSet([_database(tmp_path, "replica1"), _database(tmp_path, "replica2")])
+    return create_session_factory(engine=primary, replicas=replicas)
+
+
+class TestRoutingSession:
+    """Tests pour RoutingSession."""
+
+    def test_without_replicas_uses_plain_session(self, tmp_path):
+        factory = create_session_factory(engine=_database(tmp_path, "primary"))
+
+        session = factory()
+
+        assert not isinstance(session, RoutingSession)
+        with replica_reads():
+            assert _origin(session) == "primary"
+
+    def test_reads_outside_block_use_primary(self, factory):
+        assert _origin(factory()) == "primary"
+
+    def test_replica_reads_round_robin_across_sessions(self, factory):
+        with replica_reads():
+            origins = [_origin(factory()) for _ in range(4)]
+
+        assert origins == ["replica1", "replica2", "replica1", "replica2"]
+
+    def test_session_keeps_same_replica(self, factory):
+        session = factory()
+
+        with replica_reads():
+            assert _origin(session) == _origin(session) == "replica1"
+
+    def test_reads_after_flush_stay_on_primary(self, factory):
+        session = factory()
+
+        with replica_reads():
+            session.add(Item(id=2, origin="new"))
+            assert _origin(session) == "primary"
+            session.flush()
+            assert session.has_written
+            assert _origin(session) == "primary"
+            assert session.get(Item, 2).origin == "new"
+
+    def test_bulk_statement_goes_to_primary(self, factory):
+        session = factory()
+
+        with replica_reads():
+            session.execute(Item.__table__.update().values(origin="updated"))
+            session.commit()
+            assert _origin(session) == "updated"
@@ -0,0 +1,105 @@
+# tests/unit/infrastructure/persistence/test_repository_writes.py
+"""Tests pour le chemin d'écriture des repositories (add / save)."""
+
+import pytest
+from datetime import datetime
+from uuid import uuid4
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from src.domain.collaboration.entities.colli import Colli
+from src.domain.collaboration.entities.comment import Comment
+from src.domain.collaboration.entities.letter import Letter
+from src.domain.export.entities.export_job import ExportJob, ExportJobStatus
+from src.infrastructure.persistence.sqlalchemy.database import init_db
+from src.infrastructure.persistence.sqlalchemy.query_counter import instrument_queries, track_queries
+from src.infrastructure.persistence.sqlalchemy.repositories.colli_repository import SQLAlchemyColliRepository
+from src.infrastructure.persistence.sqlalchemy.repositories.comment_repository import SQLAlchemyCommentRepository
+from src.infrastructure.persistence.sqlalchemy.repositories.export_job_repository import SQLAlchemyExportJobRepository
+from src.infrastructure.persistence.sqlalchemy.repositories.letter_repository import SQLAlchemyLetterRepository
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    init_db(engine)
+    instrument_queries(engine)
+    with Session(engine) as session:
+        yield session
+
+
+@pytest.fixture
+def colli(session):
+    colli = Colli.create(name="COLLI de test", theme="Test", creator_id=uuid4())
+    colli.approve()
+    SQLAlchemyColliRepository(session).add(colli)
+    session.commit()
+    return colli
+
+
+def _letter(colli):
+    return Letter.create_text_letter(
+        colli_id=colli.id, sender_id=colli.creator_id, content="Lettre de test assez longue"
+    )
+
+
+def _kinds(stats):
+    return sorted(statement.split()[0] for statement in stats.statements.elements())
+
+
+class TestRepositoryWrites:
+    """Tests pour add() et save()."""
+
+    def test_add_inserts_without_select(self, session, colli):
+        with track_queries() as stats:
+            SQLAlchemyLetterRepository(session).add(_letter(colli))
+
+        assert _kinds(stats) == ["INSERT"]
+
+    def test_save_after_find_reuses_loaded_model(self, session, colli):
+        letter = _letter(colli)
+        SQLAlchemyLetterRepository(session).add(letter)
+        session.commit()
+
+        with track_queries() as stats:
+            repo = SQLAlchemyLetterRepository(session)
+            loaded = repo.find_by_id(letter.id)
+            loaded.update_content("Contenu modifié, toujours assez long", colli.creator_id)
+            repo.save(loaded)
+
+        assert _kinds(stats) == ["SELECT", "UPDATE"]
+
+    def test_loaded_model_shared_across_repositories(self, session, colli):
+        """Deux repositories de la même requête : le Colli n'est lu qu'une fois."""
+        session.expunge_all()
+
+        with track_queries() as stats:
+            loaded = SQLAlchemyColliRepository(session).find_by_id(colli.id)
+            loaded.description = "Nouvelle description"
+            SQLAlchemyColliRepository(session).save(loaded)
+
+        assert _kinds(stats) == ["SELECT", "UPDATE"]
+
+    def test_save_unknown_entity_inserts(self, session, colli):
+        letter = _letter(colli)
+        SQLAlchemyLetterRepository(session).add(letter)
+        comment = Comment.create(letter_id=letter.id, sender_id=colli.creator_id, content="Commentaire")
+
+        repo = SQLAlchemyCommentRepository(session)
+        repo.save(comment)
+        session.commit()
+
+        assert repo.find_by_id(comment.id).content == "Commentaire"
+
+    def test_export_job_claimed_once(self, session, colli):
+        """claim() est un UPDATE conditionnel : la seconde réservation échoue."""
+        repo = SQLAlchemyExportJobRepository(session)
+        job = repo.save(ExportJob.create(colli.creator_id))
+        session.commit()
+
+        assert repo.claim(job.id, datetime.utcnow()) is True
+        assert repo.claim(job.id, datetime.utcnow()) is False
+        session.commit()
+        session.expunge_all()
+
+        assert repo.find_by_id(job.id).status == ExportJobStatus.RUNNING
@@ -0,0 +1,236 @@
+# tests/unit/infrastructure/search/test_search_index_handler.py
+"""Tests unitaires pour l'indexation de recherche pilotée par événements."""
+
+import pytest
+from uuid import uuid4
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from src.domain.collaboration.entities.colli import Colli
+from src.domain.collaboration.entities.comment import Comment
+from src.domain.collaboration.entities.letter import Letter
+from src.domain.collaboration.events import (
+    ColliUpdated, CommentAdded, LetterCreated, LetterDeleted
+)
+from src.domain.identity.entities.user import User
+from src.domain.identity.events import UserProfileUpdated, UserRegistered
+from src.application.dtos.search_dto import SearchDocumentType
+from src.infrastructure.event_handlers.in_memory_publisher import InMemoryEventPublisher
+from src.infrastructure.event_handlers.search_index_handler import SearchIndexHandler
+from src.infrastructure.persistence.in_memory.colli_repository import InMemoryColliRepository
+from src.infrastructure.persistence.in_memory.comment_repository import InMemoryCommentRepository
+from src.infrastructure.persistence.in_memory.letter_repository import InMemoryLetterRepository
+from src.infrastructure.persistence.in_memory.user_repository import InMemoryUserRepository
+from src.infrastructure.persistence.sqlalchemy.database import init_db
+from src.infrastructure.persistence.sqlalchemy.query_counter import instrument_queries, track_queries
+from src.infrastructure.persistence.sqlalchemy.repositories.colli_repository import SQLAlchemyColliRepository
+from src.infrastructure.persistence.sqlalchemy.repositories.comment_repository import SQLAlchemyCommentRepository
+from src.infrastructure.persistence.sqlalchemy.repositories.letter_repository import SQLAlchemyLetterRepository
+from src.infrastructure.persistence.sqlalchemy.repositories.user_repository import SQLAlchemyUserRepository
+from src.infrastructure.search.in_memory_search_index import InMemorySearchIndex
+from src.infrastructure.search.search_indexer import SearchIndexer
+
+
+class CountingSearchIndex(InMemorySearchIndex):
+    """Index In-Memory qui compte les appels d'écriture."""
+    
+    def __init__(self, colli_repository):
+        super().__init__(colli_repository)
+        self.upsert_calls = 0
+    
+    def upsert_many(self, documents):
+        self.upsert_calls += 1
+        super().upsert_many(documents)
+
+
+@pytest.fixture
+def ctx():
+    colli_repo = InMemoryColliRepository()
+    letter_repo = InMemoryLetterRepository()
+    comment_repo = InMemoryCommentRepository()
+    user_repo = InMemoryUserRepository()
+    index = CountingSearchIndex(colli_repo)
+    indexer = SearchIndexer(index, colli_repo, letter_repo, comment_repo, user_repo)
+    handler = SearchIndexHandler(lambda: indexer)
+    publisher = InMemoryEventPublisher()
+    handler.subscribe(publisher)
+    
+    creator_id = uuid4()
+    colli = Colli.create(name="Club Lecture", theme="Romans", creator_id=creator_id)
+    colli.approve()
+    colli_repo.save(colli)
+    
+    return {
+        'index': index, 'indexer': indexer, 'handler': handler, 'publisher': publisher,
+        'colli_repo': colli_repo, 'letter_repo': letter_repo, 'comment_repo': comment_repo,
+        'user_repo': user_repo,
+        'colli': colli, 'creator_id': creator_id,
+    }
+
+
+def _letter(ctx, content):
+    letter = Letter.create_text_letter(ctx['colli'].id, ctx['creator_id'], content)
+    ctx['letter_repo'].save(letter)
+    return letter
+
+
+def _search(ctx, query, doc_type=SearchDocumentType.LETTER):
+    return [h.doc_id for h in ctx['index'].search(query, doc_type, ctx['creator_id']).hits]
+
+
+class TestSearchIndexHandler:
+    """Tests pour SearchIndexHandler."""
+    
+    def test_changes_are_batched_until_flush(self, ctx):
+        """Les événements sont regroupés en une écriture par type au flush."""
+        letter = _letter(ctx, "Premier chapitre du roman")
+        comment = Comment.create(letter.id, ctx['creator_id'], "Passionnant")
+        ctx['comment_repo'].save(comment)
+        
+        ctx['publisher'].publish(LetterCreated(
+            letter_id=letter.id, colli_id=letter.colli_id, sender_id=letter.sender_id
+        ))
+        ctx['publisher'].publish(CommentAdded(
+            comment_id=comment.id, letter_id=letter.id, author_id=ctx['creator_id']
+        ))
+        assert _search(ctx, "chapitre") == []
+        
+        ctx['handler'].flush()
+        
+        assert ctx['index'].upsert_calls == 1
+        assert _search(ctx, "chapitre") == [letter.id]
+        assert _search(ctx, "passionnant") == [letter.id]
+    
+    def test_deleted_letter_is_removed(self, ctx):
+        """LetterDeleted retire le document de l'index."""
+        letter = _letter(ctx, "Lettre vouee a disparaitre")
+        ctx['indexer'].index_letters([letter.id])
+        
+        ctx['publisher'].publish(LetterDeleted(letter_id=letter.id, colli_id=letter.colli_id))
+        ctx['handler'].flush()
+        
+        assert _search(ctx, "disparaitre") == []
+    
+    def test_discard_drops_pending_changes(self, ctx):
+        """Une requête en échec n'indexe rien."""
+        letter = _letter(ctx, "Modification abandonnee")
+        ctx['publisher'].publish(LetterCreated(
+            letter_id=letter.id, colli_id=letter.colli_id, sender_id=letter.sender_id
+        ))
+        
+        ctx['handler'].discard()
+        ctx['handler'].flush()
+        
+        assert ctx['index'].upsert_calls == 0
+    
+    def test_rejected_colli_is_reindexed(self, ctx):
+        """ColliRejected met à jour le statut indexé du COLLI."""
+        colli = Colli.create(name="Club Refuse", theme="Divers", creator_id=uuid4())
+        colli.reject("Hors sujet")
+        ctx['colli_repo'].save(colli)
+        ctx['publisher'].publish_all(colli.collect_events())
+        
+        ctx['handler'].flush()
+        
+        index = ctx['index']
+        creator_hits = index.search("refuse", SearchDocumentType.COLLI, colli.creator_id).hits
+        stranger_hits = index.search("refuse", SearchDocumentType.COLLI, uuid4()).hits
+        assert [h.doc_id for h in creator_hits] == [colli.id]
+        assert stranger_hits == []
+    
+    def test_created_and_updated_colli_are_indexed(self, ctx):
+        """ColliCreated puis ColliUpdated indexent le COLLI et ses modifications."""
+        colli = Colli.create(name="Club Nouveau", theme="Poesie", creator_id=ctx['creator_id'])
+        ctx['colli_repo'].save(colli)
+        ctx['publisher'].publish_all(colli.collect_events())
+        ctx['handler'].flush()
+        assert _search(ctx, "nouveau", SearchDocumentType.COLLI) == [colli.id]
+        
+        colli.description = "Haikus et sonnets"
+        ctx['colli_repo'].save(colli)
+        ctx['publisher'].publish(ColliUpdated(colli_id=colli.id))
+        ctx['handler'].flush()
+        assert _search(ctx, "sonnets", SearchDocumentType.COLLI) == [colli.id]
+    
+    def test_registered_and_updated_users_are_indexed(self, ctx):
+        """UserRegistered et UserProfileUpdated tiennent l'index des membres à jour."""
+        user = User.create(
+            email="camille@example.com", password="Password123!",
+            first_name="Camille", last_name="Durand"
+        )
+        ctx['user_repo'].add(user)
+        ctx['publisher'].publish(UserRegistered(user_id=user.id))
+        ctx['handler'].flush()
+        assert _search(ctx, "camille", SearchDocumentType.USER) == [user.id]
+        
+        user.last_name = "Martin"
+        ctx['user_repo'].save(user)
+        ctx['publisher'].publish(UserProfileUpdated(user_id=user.id))
+        ctx['handler'].flush()
+        assert _search(ctx, "martin", SearchDocumentType.USER) == [user.id]
+        assert _search(ctx, "durand", SearchDocumentType.USER) == []
+    
+    def test_subscribe_is_idempotent(self, ctx):
+        """Un second abonnement n'enregistre pas les handlers en double."""
+        ctx['handler'].subscribe(ctx['publisher'])
+        letter = _letter(ctx, "Une seule indexation")
+        ctx['publisher'].publish(LetterCreated(
+            letter_id=letter.id, colli_id=letter.colli_id, sender_id=letter.sender_id
+        ))
+        
+        assert ctx['publisher']._handlers[LetterCreated] == [ctx['handler'].on_letter_changed]
+
+
+class TestSearchIndexer:
+    """Tests pour la reconstruction complète de l'index."""
+    
+    def test_reindex_all_in_chunks(self, ctx):
+        """reindex_all parcourt toutes les entités par lots."""
+        letters = [_letter(ctx, f"Lettre numero {i} du club") for i in range(5)]
+        chunks = []
+        
+        totals = ctx['indexer'].reindex_all(
+            chunk_size=2, on_chunk=lambda kind, count: chunks.append((kind, count))
+        )
+        
+        assert totals == {'collis': 1, 'letters': 5, 'users': 0}
+        assert [c for c in chunks if c[0] == 'letters'] == [
+            ('letters', 2), ('letters', 2), ('letters', 1)
+        ]
+        assert set(_search(ctx, "club")) == {l.id for l in letters}
+    
+    def test_index_letters_loads_in_bulk(self, ctx):
+        """index_letters lit lettres et commentaires en un nombre fixe de requêtes."""
+        engine = create_engine("sqlite://")
+        init_db(engine)
+        instrument_queries(engine)
+        with Session(engine) as session:
+            colli_repo = SQLAlchemyColliRepository(session)
+            letter_repo = SQLAlchemyLetterRepository(session)
+            comment_repo = SQLAlchemyCommentRepository(session)
+            colli_repo.add(ctx['colli'])
+            letters = [
+                letter_repo.add(Letter.create_text_letter(
+                    ctx['colli'].id, ctx['creator_id'], f"Lettre numero {i} du club"
+                ))
+                for i in range(5)
+            ]
+            for letter in letters:
+                for text in ("Premier avis", "Second avis", "Troisieme avis"):
+                    comment_repo.add(Comment.create(letter.id, ctx['creator_id'], text))
+            session.commit()
+            session.expunge_all()
+            
+            index = InMemorySearchIndex(colli_repo)
+            indexer = SearchIndexer(
+                index, colli_repo, letter_repo, comment_repo, SQLAlchemyUserRepository(session)
+            )
+            indexer.MAX_COMMENTS_PER_LETTER = 2
+            with track_queries() as stats:
+                assert indexer.index_letters([l.id for l in letters]) == 5
+            
+            assert stats.count == 2
+            results = index.search("troisieme", SearchDocumentType.LETTER, ctx['creator_id']).hits
+            assert results == []
+            results = index.search("second", SearchDocumentType.LETTER, ctx['creator_id']).hits
+            assert {h.doc_id for h in results} == {l.id for l in letters}
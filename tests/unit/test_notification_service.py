@@ -177,3 +177,89 @@ class TestNotificationRepository:
         
         repo.delete(notification.id)
         assert repo.find_by_id(notification.id) is None
+    
+    def test_find_by_user_sorted_and_filtered(self):
+        """Test: plus recentes en premier, filtre non lues et limite."""
+        repo = InMemoryNotificationRepository()
+        user_id = uuid4()
+        
+        notifications = [
+            Notification(
+                user_id=user_id,
+                type=NotificationType.NEW_LETTER,
+                title=f"Notification {i}",
+                message="Test",
+                created_at=datetime(2024, 1, 1 + i)
+            )
+            for i in range(4)
+        ]
+        # Insertion dans le desordre
+        for notification in reversed(notifications):
+            repo.save(notification)
+        repo.mark_as_read(notifications[3].id)
+        
+        assert [n.title for n in repo.find_by_user(user_id)] == [
+            "Notification 3", "Notification 2", "Notification 1", "Notification 0"
+        ]
+        assert [n.title for n in repo.find_by_user(user_id, unread_only=True, limit=2)] == [
+            "Notification 2", "Notification 1"
+        ]
+    
+    def test_unread_counter_follows_save_and_delete(self):
+        """Test: le compteur de non lues suit save (re-sauvegarde) et delete."""
+        repo = InMemoryNotificationRepository()
+        user_id = uuid4()
+        first = Notification(user_id=user_id, type=NotificationType.SYSTEM, title="A", message="Test")
+        second = Notification(user_id=user_id, type=NotificationType.SYSTEM, title="B", message="Test")
+        repo.save(first)
+        repo.save(second)
+        
+        first.mark_as_read()
+        repo.save(first)
+        assert repo.count_unread(user_id) == 1
+        
+        repo.delete(second.id)
+        assert repo.count_unread(user_id) == 0
+        assert repo.mark_all_as_read(user_id) == 0
+        assert [n.id for n in repo.find_by_user(user_id)] == [first.id]
+    
+    def test_retention_cap_drops_oldest(self):
+        """Test: au-dela du plafond, les plus anciennes sont oubliees."""
+        repo = InMemoryNotificationRepository(max_per_user=3)
+        user_id = uuid4()
+        other_id = uuid4()
+        repo.save(Notification(user_id=other_id, type=NotificationType.SYSTEM, title="Autre", message="Test"))
+        
+        notifications = [
+            Notification(
+                user_id=user_id,
+                type=NotificationType.SYSTEM,
+                title=f"Notification {i}",
+                message="Test",
+                created_at=datetime(2024, 1, 1 + i)
+            )
+            for i in range(5)
+        ]
+        for notification in notifications:
+            repo.save(notification)
+        
+        assert [n.title for n in repo.find_by_user(user_id)] == [
+            "Notification 4", "Notification 3", "Notification 2"
+        ]
+        assert repo.count_unread(user_id) == 3
+        assert repo.find_by_id(notifications[0].id) is None
+        assert repo.count_unread(other_id) == 1
+    
+    def test_save_many(self):
+        """Test: sauvegarde en lot, avec compteurs par utilisateur."""
+        repo = InMemoryNotificationRepository()
+        first_user, second_user = uuid4(), uuid4()
+        
+        repo.save_many([
+            Notification(user_id=user_id, type=NotificationType.NEW_LETTER, title="Lettre", message="Test")
+            for user_id in (first_user, second_user, second_user)
+        ])
+        
+        assert repo.count_unread(first_user) == 1
+        assert repo.count_unread(second_user) == 2
+        assert len(repo.find_by_user(second_user)) == 2